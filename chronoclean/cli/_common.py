@@ -14,8 +14,8 @@ console = Console()
 
 # Load config at module level to generate dynamic help text
 # This allows --help to show actual defaults from config (or built-in if no config)
-_default_cfg = ConfigLoader.load(None)
-_has_config_file = any(p.exists() for p in ConfigLoader.DEFAULT_CONFIG_PATHS)
+_default_cfg = ConfigLoader.load_cached(None)
+_has_config_file = ConfigLoader.find_default_path() is not None
 _cfg_note = " via config" if _has_config_file else ""
 
 
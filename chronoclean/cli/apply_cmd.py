@@ -1,10 +1,11 @@
 """Apply command for ChronoClean CLI."""
 
+import os
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.table import Table
 
 from chronoclean.config import ConfigLoader
 from chronoclean.cli._common import (
@@ -18,15 +19,13 @@ from chronoclean.cli.helpers import (
     validate_source_dir,
     validate_destination_dir,
     resolve_bool,
+    resolve_jobs,
     build_renamer_context,
-    compute_destination_for_record,
+    compute_filename_for_record,
+)
+from chronoclean.cli.options import (
+    RecursiveOpt, VideosOpt, JobsOpt, ThreadsOpt, IoJobsOpt, FastOpt, CacheOpt, ConfigOpt,
 )
-from chronoclean.cli.options import RecursiveOpt, VideosOpt, ConfigOpt
-from chronoclean.core.sorter import Sorter
-from chronoclean.core.file_operations import FileOperations, BatchOperations, FileOperationError
-from chronoclean.core.models import OperationPlan
-from chronoclean.core.duplicate_checker import DuplicateChecker
-from chronoclean.core.run_record_writer import RunRecordWriter
 
 
 def register_apply(app: typer.Typer) -> None:
@@ -61,6 +60,15 @@ def register_apply(app: typer.Typer) -> None:
         ),
         force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
         limit: Optional[int] = typer.Option(None, "--limit", "-l", help="Limit files"),
+        jobs: JobsOpt = None,
+        threads: ThreadsOpt = None,
+        fast: FastOpt = None,
+        cache: CacheOpt = None,
+        io_jobs: IoJobsOpt = None,
+        from_scan: Optional[Path] = typer.Option(
+            None, "--from-scan",
+            help="Reuse records saved by 'scan --save-scan' (new and changed files are scanned)",
+        ),
         config: ConfigOpt = None,
         no_run_record: bool = typer.Option(
             False, "--no-run-record",
@@ -76,8 +84,20 @@ def register_apply(app: typer.Typer) -> None:
         Configuration can be provided via --config flag or by placing a chronoclean.yaml
         file in the current directory. CLI arguments override config file values.
         """
+        from chronoclean.core.sorter import Sorter
+        from chronoclean.core.file_operations import (
+            BatchOperations,
+            DestinationReservations,
+            FileOperationError,
+            FileOperations,
+        )
+        from chronoclean.core.models import MoveOperation, OperationPlan, ScanResult
+        from chronoclean.core.duplicate_checker import DuplicateChecker
+        from chronoclean.core.run_record_writer import RunRecordWriter
+        from rich.table import Table
+
         # Load configuration
-        cfg = ConfigLoader.load(config)
+        cfg = ConfigLoader.load_cached(config)
 
         # Resolve options: CLI overrides config
         use_dry_run = resolve_bool(dry_run, cfg.general.dry_run_default)
@@ -87,6 +107,10 @@ def register_apply(app: typer.Typer) -> None:
         use_videos = resolve_bool(videos, cfg.general.include_videos)
         use_structure = structure if structure is not None else cfg.sorting.folder_structure
         use_limit = limit if limit is not None else cfg.scan.limit
+        use_cache = resolve_bool(cache, cfg.performance.enable_cache)
+        use_io_jobs = io_jobs if io_jobs is not None else cfg.performance.io_workers
+        use_threads = threads if threads is not None else cfg.performance.scan_threads
+        use_jobs = resolve_jobs(jobs, cfg)
 
         # Validate paths using helpers
         source = validate_source_dir(source, console)
@@ -115,54 +139,87 @@ def register_apply(app: typer.Typer) -> None:
                 raise typer.Exit(0)
 
         # Create components from config using factory
-        components = create_scan_components(cfg)
-
-        # Scan files
-        console.print("[blue]Scanning files...[/blue]")
-        scanner = components.create_scanner(use_recursive, use_videos)
-        scan_result = scanner.scan(source, limit=use_limit)
+        components = create_scan_components(cfg, fast_exif=fast)
 
-        if not scan_result.files:
-            console.print("[yellow]No files found to process.[/yellow]")
-            raise typer.Exit(0)
+        # A scan snapshot stands in for the cache: the source is walked as
+        # usual and unchanged files reuse its records
+        snapshot = None
+        if from_scan:
+            from chronoclean.core.scan_snapshot import ScanSnapshotError, load_scan_snapshot
 
-        console.print(f"Found {len(scan_result.files)} files")
-        console.print()
+            try:
+                snapshot = load_scan_snapshot(from_scan)
+            except ScanSnapshotError as e:
+                console.print(f"[red]Error:[/red] {e}")
+                raise typer.Exit(1)
+            if snapshot.source_root != source.resolve():
+                console.print(
+                    f"[red]Error:[/red] Scan snapshot is for {snapshot.source_root}, not {source}"
+                )
+                raise typer.Exit(1)
+            if not snapshot.matches(components.settings_fingerprint(), use_recursive, use_videos):
+                console.print(
+                    "[yellow]Scan snapshot was saved with different settings; rescanning.[/yellow]"
+                )
+                snapshot = None
 
-        # Build operation plan
-        console.print("[blue]Building operation plan...[/blue]")
+        # Scan files and plan each one as its record streams in: undated
+        # records go to the skip list, dated ones straight to a move
+        console.print("[blue]Scanning files and building operation plan...[/blue]")
+        scan_result = ScanResult(source_root=source)
+        plan = OperationPlan()
         sorter = Sorter(destination, folder_structure=use_structure)
-        
         renamer, conflict_resolver = build_renamer_context(cfg, use_rename)
+        moves = []
+        if snapshot is not None:
+            cache_context = nullcontext(snapshot)
+        else:
+            cache_context = components.open_cache(use_cache)
+        with cache_context as scan_cache:
+            scanner = components.create_scanner(use_recursive, use_videos, cache=scan_cache)
+            for record in scanner.iter_scan(
+                source,
+                limit=use_limit,
+                jobs=use_jobs,
+                threads=use_threads,
+                result=scan_result,
+            ):
+                if not record.detected_date:
+                    plan.add_skip(record.source_path, "No date detected")
+                    continue
+                # Destination folders are memoized per distinct date
+                dest_folder = sorter.compute_destination_folder(record.detected_date)
+                new_filename, renamer = compute_filename_for_record(
+                    record,
+                    cfg,
+                    use_rename=use_rename,
+                    use_tag_names=use_tag_names,
+                    renamer=renamer,
+                    conflict_resolver=conflict_resolver,
+                )
+                moves.append(
+                    MoveOperation(
+                        record.source_path,
+                        dest_folder,
+                        new_filename,
+                        size_bytes=record.size_bytes,
+                    )
+                )
+        plan.add_moves_bulk(moves)
 
-        plan = OperationPlan()
-        files_with_dates = 0
-        files_without_dates = 0
-
-        for record in scan_result.files:
-            if not record.detected_date:
-                files_without_dates += 1
-                plan.add_skip(record.source_path, "No date detected")
-                continue
+        if snapshot is not None:
+            console.print(
+                f"[dim]Reused {snapshot.hits} records from {from_scan}, "
+                f"scanned {snapshot.misses} new or changed files[/dim]"
+            )
 
-            files_with_dates += 1
+        if not scan_result.files:
+            console.print("[yellow]No files found to process.[/yellow]")
+            raise typer.Exit(0)
 
-            dest_folder, new_filename, renamer = compute_destination_for_record(
-                record,
-                sorter,
-                cfg,
-                use_rename=use_rename,
-                use_tag_names=use_tag_names,
-                renamer=renamer,
-                conflict_resolver=conflict_resolver,
-            )
+        console.print(f"Found {len(scan_result.files)} files")
 
-            # Add to plan
-            plan.add_move(
-                source=record.source_path,
-                destination=dest_folder,
-                new_filename=new_filename,
-            )
+        files_without_dates = len(scan_result.files) - len(plan.moves)
 
         # Display plan summary
         console.print()
@@ -173,25 +230,26 @@ def register_apply(app: typer.Typer) -> None:
             console.print(f"  [yellow]Files without dates: {files_without_dates}[/yellow]")
         console.print()
 
-        # Show sample operations
-        if plan.moves and len(plan.moves) <= 20:
+        # Show sample operations (destinations shown relative to the root;
+        # every planned path starts with it, so slicing off the prefix suffices)
+        dest_prefix_len = len(os.fspath(destination).rstrip(os.sep) + os.sep)
+        show_table = len(plan.moves) <= 20
+        rows = [
+            (op.source.name, os.fspath(op.destination_path)[dest_prefix_len:])
+            for op in plan.moves[:20 if show_table else 10]
+        ]
+        if rows and show_table:
             table = Table(title="Planned Operations")
             table.add_column("Source", style="cyan", no_wrap=True)
             table.add_column("Destination", style="green")
-
-            for op in plan.moves[:20]:
-                src_name = op.source.name
-                dest_rel = str(op.destination_path.relative_to(destination))
-                table.add_row(src_name, dest_rel)
+            for row in rows:
+                table.add_row(*row)
 
             console.print(table)
             console.print()
-        elif plan.moves:
+        elif rows:
             console.print(f"[dim](Showing first 10 of {len(plan.moves)} operations)[/dim]")
-            for op in plan.moves[:10]:
-                src_name = op.source.name
-                dest_rel = str(op.destination_path.relative_to(destination))
-                console.print(f"  {src_name} → {dest_rel}")
+            console.print("\n".join(f"  {src_name} → {dest_rel}" for src_name, dest_rel in rows))
             console.print()
 
         # Execute operations
@@ -210,10 +268,8 @@ def register_apply(app: typer.Typer) -> None:
                     enabled=True,
                 ) as writer:
                     # Record what would have been done
-                    for op in plan.moves:
-                        writer.add_copy(op.source, op.destination_path)
-                    for skip_path, skip_reason in plan.skipped:
-                        writer.add_skip(skip_path, skip_reason)
+                    writer.add_copies((op.source, op.destination_path) for op in plan.moves)
+                    writer.add_skips(plan.skipped)
                 
                 console.print(f"[dim]Run record: {writer.output_path}[/dim]")
             
@@ -237,37 +293,43 @@ def register_apply(app: typer.Typer) -> None:
             # Track reserved destinations AND their source files for content comparison
             operations_to_execute = []
             skipped_operations = []  # v0.3.1: Track skipped for run record
-            reserved_destinations: set[Path] = set()
-            reserved_sources: dict[Path, Path] = {}  # dest_path -> source_path
+            reserved = DestinationReservations()
+            # Scanned size of each reserving source, so in-batch collisions
+            # with different sizes are told apart without touching the files
+            source_sizes: dict[Path, Optional[int]] = {}
             duplicates_skipped = 0
             collisions_renamed = 0
             
             try:
                 for op in plan.moves:
                     dest_path = op.destination_path
+                    on_disk = reserved.exists_on_disk(dest_path)
                     
                     # Check if destination already exists on disk OR is reserved by another operation
-                    if dest_path.exists() or dest_path in reserved_destinations:
+                    if on_disk or dest_path in reserved:
                         if duplicate_checker and cfg.duplicates.on_collision == "check_hash":
                             # Check if files are duplicates
-                            if dest_path.exists():
+                            if on_disk:
                                 # Compare against existing file on disk
-                                if duplicate_checker.are_duplicates(op.source, dest_path):
+                                if duplicate_checker.are_duplicates(op.source, dest_path, op.size_bytes):
                                     duplicates_skipped += 1
                                     skipped_operations.append((op.source, "duplicate of existing file"))
                                     continue
-                            elif dest_path in reserved_sources:
+                            else:
                                 # Compare against the source file that reserved this destination
-                                if duplicate_checker.are_duplicates(op.source, reserved_sources[dest_path]):
+                                other = reserved.source_for(dest_path)
+                                if duplicate_checker.are_duplicates(
+                                    op.source, other, op.size_bytes, source_sizes.get(other)
+                                ):
                                     duplicates_skipped += 1
                                     skipped_operations.append((op.source, "duplicate in batch"))
                                     continue
                             # Files have same name but different content - rename
-                            dest_path = file_ops.ensure_unique_path(dest_path, reserved_destinations)
+                            dest_path = file_ops.ensure_unique_path(dest_path, reserved)
                             collisions_renamed += 1
                         elif cfg.duplicates.on_collision == "rename":
                             # Always rename on collision
-                            dest_path = file_ops.ensure_unique_path(dest_path, reserved_destinations)
+                            dest_path = file_ops.ensure_unique_path(dest_path, reserved)
                             collisions_renamed += 1
                         elif cfg.duplicates.on_collision == "skip":
                             # Skip if destination exists or reserved
@@ -280,21 +342,24 @@ def register_apply(app: typer.Typer) -> None:
                         else:
                             # Default: check_hash behavior
                             if duplicate_checker:
-                                if dest_path.exists():
-                                    if duplicate_checker.are_duplicates(op.source, dest_path):
+                                if on_disk:
+                                    if duplicate_checker.are_duplicates(op.source, dest_path, op.size_bytes):
                                         duplicates_skipped += 1
                                         skipped_operations.append((op.source, "duplicate of existing file"))
                                         continue
-                                elif dest_path in reserved_sources:
-                                    if duplicate_checker.are_duplicates(op.source, reserved_sources[dest_path]):
+                                else:
+                                    other = reserved.source_for(dest_path)
+                                    if duplicate_checker.are_duplicates(
+                                        op.source, other, op.size_bytes, source_sizes.get(other)
+                                    ):
                                         duplicates_skipped += 1
                                         skipped_operations.append((op.source, "duplicate in batch"))
                                         continue
-                            dest_path = file_ops.ensure_unique_path(dest_path, reserved_destinations)
+                            dest_path = file_ops.ensure_unique_path(dest_path, reserved)
                             collisions_renamed += 1
                     
-                    reserved_destinations.add(dest_path)
-                    reserved_sources[dest_path] = op.source
+                    reserved.reserve(dest_path, op.source)
+                    source_sizes[op.source] = op.size_bytes
                     operations_to_execute.append((op.source, dest_path))
             except FileOperationError as e:
                 console.print(f"[red]Error:[/red] {e}", stderr=True)
@@ -312,24 +377,21 @@ def register_apply(app: typer.Typer) -> None:
                     enabled=True,
                 ) as writer:
                     # Record operations that will be executed
-                    for src, dest in operations_to_execute:
-                        if move:
-                            writer.add_move(src, dest)
-                        else:
-                            writer.add_copy(src, dest)
+                    if move:
+                        writer.add_moves(operations_to_execute)
+                    else:
+                        writer.add_copies(operations_to_execute)
                     
                     # Record skipped files (from plan.skipped + collision skips)
-                    for skip_path, skip_reason in plan.skipped:
-                        writer.add_skip(skip_path, skip_reason)
-                    for skip_path, skip_reason in skipped_operations:
-                        writer.add_skip(skip_path, skip_reason)
+                    writer.add_skips(plan.skipped)
+                    writer.add_skips(skipped_operations)
                     
                     # Execute the actual operations
                     if move:
-                        success, failed = batch.execute_moves(operations_to_execute)
+                        success, failed = batch.execute_moves(operations_to_execute, workers=use_io_jobs)
                         action_word = "moved"
                     else:
-                        success, failed = batch.execute_copies(operations_to_execute)
+                        success, failed = batch.execute_copies(operations_to_execute, workers=use_io_jobs)
                         action_word = "copied"
                     
                     # Track failures
@@ -340,10 +402,10 @@ def register_apply(app: typer.Typer) -> None:
             else:
                 # Execute without recording
                 if move:
-                    success, failed = batch.execute_moves(operations_to_execute)
+                    success, failed = batch.execute_moves(operations_to_execute, workers=use_io_jobs)
                     action_word = "moved"
                 else:
-                    success, failed = batch.execute_copies(operations_to_execute)
+                    success, failed = batch.execute_copies(operations_to_execute, workers=use_io_jobs)
                     action_word = "copied"
 
             console.print()
@@ -4,7 +4,6 @@ from pathlib import Path
 from typing import Optional
 
 import typer
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from chronoclean.config import ConfigLoader
 from chronoclean.cli._common import (
@@ -12,13 +11,7 @@ from chronoclean.cli._common import (
     _default_cfg,
     bool_show_default,
 )
-from chronoclean.cli.helpers import resolve_bool
-from chronoclean.core.run_discovery import (
-    discover_verification_reports,
-    load_verification_report,
-    find_verification_by_id,
-)
-from chronoclean.core.cleaner import Cleaner, format_bytes
+from chronoclean.cli.helpers import resolve_bool, throttled_progress
 
 
 def register_cleanup(app: typer.Typer) -> None:
@@ -79,6 +72,18 @@ def register_cleanup(app: typer.Typer) -> None:
             chronoclean cleanup --only ok --no-dry-run  # Actually delete files
             chronoclean cleanup --last --no-dry-run -f  # Delete without prompts
         """
+        # Lazy imports to keep CLI startup fast (rich.progress included)
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        from chronoclean.core.run_discovery import (
+            discover_verification_reports,
+            load_verification_header,
+            load_verification_report,
+            find_verification_by_id,
+        )
+        from chronoclean.core.cleaner import Cleaner, format_bytes
+        from chronoclean.core.verification import CONTENT_HASH_ALGORITHMS
+
         # Validate --only filter
         if only != "ok":
             console.print(f"[red]Error:[/red] Only 'ok' filter is supported for cleanup")
@@ -86,27 +91,19 @@ def register_cleanup(app: typer.Typer) -> None:
             raise typer.Exit(1)
         
         # Load configuration
-        cfg = ConfigLoader.load(config)
+        cfg = ConfigLoader.load_cached(config)
         
         # Resolve dry_run
         use_dry_run = resolve_bool(dry_run, cfg.general.dry_run_default)
         
         # Find the verification report
-        report = None
-        report_path = None
-        
         if verify_file:
             # Explicit file path
-            verify_file = verify_file.resolve()
-            if not verify_file.exists():
-                console.print(f"[red]Error:[/red] Verification file not found: {verify_file}")
-                raise typer.Exit(1)
-            
+            # Strict resolve checks existence in the same pass
             try:
-                report = load_verification_report(verify_file)
-                report_path = verify_file
-            except Exception as e:
-                console.print(f"[red]Error:[/red] Could not load verification file: {e}")
+                report_path = verify_file.resolve(strict=True)
+            except OSError:
+                console.print(f"[red]Error:[/red] Verification file not found: {verify_file.resolve()}")
                 raise typer.Exit(1)
         
         elif verify_id:
@@ -115,8 +112,6 @@ def register_cleanup(app: typer.Typer) -> None:
             if not found_path:
                 console.print(f"[red]Error:[/red] Verification ID not found: {verify_id}")
                 raise typer.Exit(1)
-            
-            report = load_verification_report(found_path)
             report_path = found_path
         
         else:
@@ -138,11 +133,10 @@ def register_cleanup(app: typer.Typer) -> None:
                 selected = verifications[0]
                 if yes and len(verifications) > 1:
                     console.print(f"[yellow]Warning:[/yellow] {len(verifications)} reports found, using most recent")
-                report = load_verification_report(selected.filepath)
                 report_path = selected.filepath
             else:
                 # Interactive selection
-                report, report_path = _select_verification_interactive(verifications)
+                report_path = _select_verification_interactive(verifications)
         
         # Create cleaner
         cleaner = Cleaner(
@@ -150,6 +144,16 @@ def register_cleanup(app: typer.Typer) -> None:
             require_sha256=not cfg.verify.allow_cleanup_on_quick,
         )
         
+        # A report verified without a content hash has no eligible entries;
+        # its header is enough to say so, without reading the entries
+        try:
+            report = load_verification_header(report_path)
+            if not cleaner.require_sha256 or report.hash_algorithm in CONTENT_HASH_ALGORITHMS:
+                report = load_verification_report(report_path)
+        except Exception as e:
+            console.print(f"[red]Error:[/red] Could not load verification file: {e}")
+            raise typer.Exit(1)
+        
         # Get eligible files
         eligible = cleaner.get_cleanup_eligible(report)
         
@@ -159,8 +163,8 @@ def register_cleanup(app: typer.Typer) -> None:
             console.print("Reasons:")
             console.print(f"  • OK entries: {report.summary.ok + report.summary.ok_existing_duplicate}")
             console.print(f"  • Mismatch/missing: {report.summary.mismatch + report.summary.missing_destination + report.summary.missing_source}")
-            if report.hash_algorithm != "sha256":
-                console.print(f"  • Algorithm: {report.hash_algorithm} (sha256 required for cleanup)")
+            if report.hash_algorithm not in CONTENT_HASH_ALGORITHMS:
+                console.print(f"  • Algorithm: {report.hash_algorithm} (sha256 or blake3 required for cleanup)")
             raise typer.Exit(0)
         
         # Display cleanup info
@@ -190,10 +194,11 @@ def register_cleanup(app: typer.Typer) -> None:
         ) as progress:
             task = progress.add_task("Cleaning up...", total=len(eligible))
             
-            def update_progress(current, total):
-                progress.update(task, completed=current, description=f"Deleting files ({current}/{total})...")
-            
-            result = cleaner.cleanup(report, progress_callback=update_progress)
+            result = cleaner.cleanup(
+                report,
+                progress_callback=throttled_progress(progress, task, "Deleting files"),
+                eligible=eligible,
+            )
         
         # Display results
         console.print()
@@ -216,7 +221,9 @@ def register_cleanup(app: typer.Typer) -> None:
 
 
 def _select_verification_interactive(verifications):
-    """Interactive selection of verification report."""
+    """Interactive selection of verification report; returns its path."""
+    from rich.prompt import IntPrompt
+
     if len(verifications) == 1:
         selected = verifications[0]
         console.print(f"Last verification: [cyan]{selected.age_description}[/cyan]")
@@ -230,34 +237,32 @@ def _select_verification_interactive(verifications):
         if not confirm:
             raise typer.Exit(0)
         
-        report = load_verification_report(selected.filepath)
-        return report, selected.filepath
+        return selected.filepath
     else:
         # Show list and ask to select
         console.print(f"[blue]Found {len(verifications)} verification reports:[/blue]")
         console.print()
         
-        for i, v in enumerate(verifications[:10], 1):
-            console.print(f"  {i}. {v.age_description}, ✅ {v.cleanup_eligible_count} OK / {v.total} total")
-            console.print(f"     {v.source_root}")
+        # One print for the whole listing rather than two per report
+        console.print("\n".join(
+            f"  {i}. {v.age_description}, ✅ {v.cleanup_eligible_count} OK / {v.total} total\n"
+            f"     {v.source_root}"
+            for i, v in enumerate(verifications[:10], 1)
+        ))
         
         if len(verifications) > 10:
             console.print(f"  ... and {len(verifications) - 10} more")
         
         console.print()
-        choice = typer.prompt("Select verification number (or 0 to cancel)", default="1")
+        # IntPrompt re-asks until the answer is one of the choices
+        choice_num = IntPrompt.ask(
+            "Select verification number (or 0 to cancel)",
+            console=console,
+            default=1,
+            choices=[str(i) for i in range(len(verifications) + 1)],
+            show_choices=False,
+        )
+        if choice_num == 0:
+            raise typer.Exit(0)
         
-        try:
-            choice_num = int(choice)
-            if choice_num == 0:
-                raise typer.Exit(0)
-            if choice_num < 1 or choice_num > len(verifications):
-                console.print("[red]Invalid selection[/red]")
-                raise typer.Exit(1)
-            
-            selected = verifications[choice_num - 1]
-            report = load_verification_report(selected.filepath)
-            return report, selected.filepath
-        except ValueError:
-            console.print("[red]Invalid input[/red]")
-            raise typer.Exit(1)
+        return verifications[choice_num - 1].filepath
@@ -1,5 +1,6 @@
 """Config commands for ChronoClean CLI."""
 
+import os
 from pathlib import Path
 from typing import Optional
 
@@ -7,6 +8,12 @@ import typer
 import yaml
 from dataclasses import asdict
 
+try:
+    # libyaml-backed dumper, many times faster than the pure-Python one
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper
+
 from chronoclean.config import ConfigLoader
 from chronoclean.config.templates import get_config_template
 from chronoclean.cli._common import console
@@ -45,7 +52,8 @@ def create_config_app() -> typer.Typer:
         Creates a chronoclean.yaml file in the current directory (or specified path).
         Use --full to generate a complete config with all options documented.
         """
-        output = output.resolve()
+        # A new file needs an absolute path, not symlink resolution
+        output = Path(os.path.abspath(output))
         
         # Check if file exists
         if output.exists() and not force:
@@ -93,8 +101,9 @@ def create_config_app() -> typer.Typer:
         
         Displays the effective configuration from config file merged with defaults.
         """
-        # Load config
-        cfg = ConfigLoader.load(config)
+        # Load config (one default-path search serves the load and the display)
+        source = config or ConfigLoader.find_default_path()
+        cfg = ConfigLoader.load_cached(source)
         
         # Convert to dict for display
         config_dict = asdict(cfg)
@@ -111,21 +120,17 @@ def create_config_app() -> typer.Typer:
         console.print("[bold]ChronoClean Configuration[/bold]")
         console.print()
         
-        if config:
-            console.print(f"[dim]Source: {config}[/dim]")
+        if source:
+            console.print(f"[dim]Source: {source}[/dim]")
         else:
-            # Check which file was found
-            for search_path in ConfigLoader.DEFAULT_CONFIG_PATHS:
-                if search_path.exists():
-                    console.print(f"[dim]Source: {search_path}[/dim]")
-                    break
-            else:
-                console.print("[dim]Source: built-in defaults[/dim]")
+            console.print("[dim]Source: built-in defaults[/dim]")
         
         console.print()
         
         # Pretty print as YAML
-        yaml_output = yaml.dump(config_dict, default_flow_style=False, sort_keys=False)
+        yaml_output = yaml.dump(
+            config_dict, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False
+        )
         console.print(yaml_output)
 
     @config_app.command("path")
@@ -138,7 +143,7 @@ def create_config_app() -> typer.Typer:
         
         found = False
         for i, search_path in enumerate(ConfigLoader.DEFAULT_CONFIG_PATHS, 1):
-            exists = search_path.exists()
+            exists = os.path.exists(search_path)
             if exists and not found:
                 status = "[green]✓ ACTIVE[/green]"
                 found = True
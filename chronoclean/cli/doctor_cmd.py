@@ -1,25 +1,21 @@
 """Doctor command for ChronoClean CLI."""
 
-import shutil
 import sys
 from pathlib import Path
 from typing import Optional
 
 import typer
 import yaml
-from rich.table import Table
+
+try:
+    # libyaml-backed loader/dumper, many times faster than the pure-Python ones
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
 
 from chronoclean import __version__
 from chronoclean.config import ConfigLoader
 from chronoclean.cli._common import console
-from chronoclean.core.video_metadata import (
-    is_ffprobe_available,
-    is_hachoir_available,
-    find_ffprobe_path,
-    get_ffprobe_version,
-    get_hachoir_version,
-)
-from chronoclean.core.exif_reader import is_exiftool_available, get_exifread_version
 
 
 def register_doctor(app: typer.Typer) -> None:
@@ -49,8 +45,21 @@ def register_doctor(app: typer.Typer) -> None:
             chronoclean doctor              # Check all dependencies
             chronoclean doctor --fix        # Check and offer to fix issues
         """
+        # Lazy imports to keep CLI startup fast (video_metadata pulls in the
+        # core models). Package versions come from installed metadata, so
+        # checking them doesn't import exifread and friends
+        from chronoclean.utils.deps import get_package_version, is_exiftool_available
+        from chronoclean.core.video_metadata import (
+            check_ffprobe,
+            find_ffprobe_path,
+            get_hachoir_version,
+            is_hachoir_available,
+        )
+        from rich.table import Table
+
         # Load configuration
-        cfg = ConfigLoader.load(config)
+        active_config = None if config else ConfigLoader.find_default_path()
+        cfg = ConfigLoader.load_cached(config or active_config)
         
         console.print()
         console.print("[bold blue]ChronoClean Doctor[/bold blue]")
@@ -72,11 +81,12 @@ def register_doctor(app: typer.Typer) -> None:
         
         # Check ffprobe
         configured_ffprobe = cfg.video_metadata.ffprobe_path
-        ffprobe_available = is_ffprobe_available(configured_ffprobe)
+        # One PATH lookup and one `ffprobe -version` for path and version
+        ffprobe_path, ffprobe_version = check_ffprobe(configured_ffprobe)
+        ffprobe_available = ffprobe_path is not None
         
         if ffprobe_available:
-            ffprobe_version = get_ffprobe_version(configured_ffprobe) or "version unknown"
-            ffprobe_path = shutil.which(configured_ffprobe) or configured_ffprobe
+            ffprobe_version = ffprobe_version or "version unknown"
             dep_table.add_row(
                 "ffprobe",
                 "[green]✓ found[/green]",
@@ -175,21 +185,15 @@ def register_doctor(app: typer.Typer) -> None:
         ]
         
         for pkg_name, purpose in packages:
-            try:
-                if pkg_name == "pyyaml":
-                    version = getattr(yaml, "__version__", "unknown")
-                elif pkg_name == "exifread":
-                    version = get_exifread_version()
-                else:
-                    pkg = __import__(pkg_name)
-                    version = getattr(pkg, "__version__", "unknown")
+            version = get_package_version(pkg_name, default="unknown")
+            if version is not None:
                 pkg_table.add_row(
                     pkg_name,
                     "[green]✓ installed[/green]",
                     version,
                     purpose,
                 )
-            except ImportError:
+            else:
                 pkg_table.add_row(
                     pkg_name,
                     "[red]✗ missing[/red]",
@@ -214,12 +218,6 @@ def register_doctor(app: typer.Typer) -> None:
         config_table.add_column("Status", style="dim")
         
         # Show active config file
-        active_config = None
-        for search_path in ConfigLoader.DEFAULT_CONFIG_PATHS:
-            if search_path.exists():
-                active_config = search_path
-                break
-        
         if config:
             config_table.add_row("Config file", str(config), "[green]specified via --config[/green]")
         elif active_config:
@@ -303,7 +301,7 @@ def _apply_config_fixes(
         config_path = existing_config
         try:
             with open(config_path, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f) or {}
+                config_data = yaml.load(f, Loader=_YamlLoader) or {}
         except Exception as e:
             console.print(f"[red]Error reading config:[/red] {e}")
             return
@@ -337,7 +335,7 @@ def _apply_config_fixes(
     # Write config
     try:
         with open(config_path, "w", encoding="utf-8") as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_data, f, Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
         console.print()
         console.print(f"[green]Config saved to:[/green] {config_path}")
     except Exception as e:
@@ -1,7 +1,9 @@
 """Export commands for ChronoClean CLI (v0.3.4: with destination computation support)."""
 
+import io
+import sys
 from pathlib import Path
-from typing import Annotated, Callable, Optional
+from typing import Annotated, Callable, Optional, TextIO
 
 import typer
 from rich.console import Console
@@ -23,9 +25,9 @@ from chronoclean.cli.options import (
     LimitOpt,
     ConfigOpt,
 )
-from chronoclean.core.exporter import Exporter
-from chronoclean.core.sorter import Sorter  # v0.3.4: for destination computation
-from chronoclean.core.renamer import Renamer, ConflictResolver  # v0.3.4
+
+# Write buffer for export files; records are streamed, so keep syscalls few (1MB)
+EXPORT_BUFFER_SIZE = 1 << 20
 
 OutputOpt = Annotated[
     Optional[Path],
@@ -124,27 +126,31 @@ def _compute_proposed_destinations(
     status_console: Console = console,
 ):
     """Compute proposed destinations for scan results (v0.3.4)."""
+    from itertools import islice
+
+    from chronoclean.core.sorter import Sorter
+    from chronoclean.core.renamer import Renamer
+
     # Create sorter with specified structure
     sorter = Sorter(
-        base_path=destination,
+        destination_root=destination,
         folder_structure=folder_structure,
     )
     
     # Create renamer if needed (uses shared helper)
     renamer, conflict_resolver = build_renamer_context(cfg, use_rename)
     
-    # Compute destinations
-    count = 0
+    # Compute destinations; folders are planned in one batch so records
+    # sharing a date bucket share one Path
+    dated = list(islice(
+        (record for record in result.files if record.detected_date), sample or None
+    ))
+    count = len(dated)
     with status_console.status("[bold blue]Computing proposed destinations..."):
-        for record in result.files:
-            if sample and count >= sample:
-                break
-            
-            if not record.detected_date:
-                continue
-            
-            # Compute destination folder
-            dest_folder = sorter.compute_destination_folder(record.detected_date)
+        dest_folders = sorter.compute_destinations_batch(
+            [record.detected_date for record in dated]
+        )
+        for record, dest_folder in zip(dated, dest_folders):
             record.proposed_destination_folder = dest_folder
             
             # Compute filename
@@ -167,17 +173,11 @@ def _compute_proposed_destinations(
             else:
                 # Keep original filename
                 record.proposed_filename = record.source_path.name
-            
-            count += 1
     
     if sample and count < len(result.files):
         status_console.print(f"[yellow]Note: Computed destinations for {count}/{len(result.files)} files (--sample limit)[/yellow]")
 
 
-def _print_plain(output: str) -> None:
-    print(output, end="")
-
-
 def _resolve_export_options(
     config: Optional[Path],
     rename: Optional[bool],
@@ -210,10 +210,10 @@ def _run_export(
     use_tag_names: bool,  # v0.3.4
     folder_structure: str,  # v0.3.4
     status_console: Console,
-    export_fn: Callable[[object, Optional[Path]], str],
-    output_writer: Callable[[str], None],
+    write_fn: Callable[[object, TextIO], None],
+    stdout_suffix: str = "",
 ) -> None:
-    cfg = ConfigLoader.load(config)
+    cfg = ConfigLoader.load_cached(config)
     
     status_console.print(f"[blue]Scanning:[/blue] {source}")
     if config:
@@ -235,13 +235,45 @@ def _run_export(
             status_console,
         )
     
-    output_str = export_fn(result, output)
-    
+    # Stream records straight to the file/stdout instead of building the
+    # whole export as one string first
     if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w", encoding="utf-8", newline="", buffering=EXPORT_BUFFER_SIZE) as f:
+            write_fn(result, f)
         status_console.print(f"[green]Exported to:[/green] {output}")
         status_console.print(f"[dim]Files: {len(result.files)}[/dim]")
     else:
-        output_writer(output_str)
+        _write_stdout(result, write_fn, stdout_suffix)
+
+
+def _write_stdout(
+    result: object,
+    write_fn: Callable[[object, TextIO], None],
+    suffix: str,
+) -> None:
+    """Stream an export to stdout without newline translation.
+
+    CSV rows end in CRLF; writing them through sys.stdout in text mode
+    would turn each into CR CR LF on Windows.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        write_fn(result, sys.stdout)
+        sys.stdout.write(suffix)
+        return
+
+    sys.stdout.flush()
+    stream = io.TextIOWrapper(
+        buffer, encoding=sys.stdout.encoding, errors=sys.stdout.errors, newline=""
+    )
+    try:
+        write_fn(result, stream)
+        stream.write(suffix)
+        stream.flush()
+    finally:
+        # Hand sys.stdout's buffer back instead of closing it with the wrapper
+        stream.detach()
 
 
 def create_export_app() -> typer.Typer:
@@ -277,6 +309,8 @@ def create_export_app() -> typer.Typer:
         
         v0.3.4: Use --destination to compute proposed target paths.
         """
+        from chronoclean.core.exporter import Exporter
+
         cfg, use_rename, use_tag_names, folder_structure = _resolve_export_options(
             config, rename, tag_names, structure
         )
@@ -298,8 +332,8 @@ def create_export_app() -> typer.Typer:
             use_tag_names=use_tag_names,
             folder_structure=folder_structure,
             status_console=console,
-            export_fn=exporter.to_json,
-            output_writer=console.print,
+            write_fn=exporter.write_json,
+            stdout_suffix="\n",
         )
 
     @export_app.command("csv")
@@ -324,6 +358,8 @@ def create_export_app() -> typer.Typer:
         
         v0.3.4: Use --destination to compute proposed target paths.
         """
+        from chronoclean.core.exporter import Exporter
+
         cfg, use_rename, use_tag_names, folder_structure = _resolve_export_options(
             config, rename, tag_names, structure
         )
@@ -344,8 +380,7 @@ def create_export_app() -> typer.Typer:
             use_tag_names=use_tag_names,
             folder_structure=folder_structure,
             status_console=stderr_console,
-            export_fn=exporter.to_csv,
-            output_writer=_print_plain,
+            write_fn=exporter.write_csv,
         )
 
     return export_app
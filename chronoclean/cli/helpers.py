@@ -5,23 +5,34 @@ This module provides shared utilities to reduce code duplication across CLI comm
 # pylint: disable=too-many-branches
 # Helper dispatch functions have inherent branching complexity
 
+import logging
+import os
+import stat
+import time
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
 import typer
 from rich.console import Console
 
 from chronoclean.config.schema import ChronoCleanConfig
 from chronoclean.config import ConfigLoader
-from chronoclean.core.date_inference import DateInferenceEngine
-from chronoclean.core.exif_reader import ExifReader
-from chronoclean.core.folder_tagger import FolderTagger
-from chronoclean.core.models import FileRecord
-from chronoclean.core.renamer import ConflictResolver, Renamer
-from chronoclean.core.scanner import Scanner
-from chronoclean.core.sorter import Sorter
-from chronoclean.core.video_metadata import VideoMetadataReader
+
+# Core modules (exifread, sqlite3, ...) are imported where they are used so
+# that commands which never scan, and --help, don't pay for them at startup.
+if TYPE_CHECKING:
+    from chronoclean.core.date_inference import DateInferenceEngine
+    from chronoclean.core.exif_reader import ExifReader
+    from chronoclean.core.folder_tagger import FolderTagger
+    from chronoclean.core.models import FileRecord
+    from chronoclean.core.renamer import ConflictResolver, Renamer
+    from chronoclean.core.scan_cache import RecordCache, ScanCache
+    from chronoclean.core.scanner import Scanner
+    from chronoclean.core.video_metadata import VideoMetadataReader
+
+logger = logging.getLogger(__name__)
 
 
 def _build_date_priority(cfg: ChronoCleanConfig) -> list[str]:
@@ -89,41 +100,88 @@ def _build_date_priority(cfg: ChronoCleanConfig) -> list[str]:
 class ScanComponents:
     """Container for scan-related components created from config."""
     
-    exif_reader: ExifReader
-    video_reader: Optional[VideoMetadataReader]
-    folder_tagger: FolderTagger
-    date_engine: DateInferenceEngine
+    exif_reader: "ExifReader"
+    video_reader: Optional["VideoMetadataReader"]
+    folder_tagger: "FolderTagger"
+    date_engine: "DateInferenceEngine"
     cfg: ChronoCleanConfig
     
     def create_scanner(
         self,
         recursive: bool,
         include_videos: bool,
-    ) -> Scanner:
+        cache: Optional["RecordCache"] = None,
+    ) -> "Scanner":
         """Create a Scanner instance with the stored components.
         
         Args:
             recursive: Whether to scan recursively
             include_videos: Whether to include video files
+            cache: Optional scan cache or loaded scan snapshot
             
         Returns:
             Configured Scanner instance
         """
+        from chronoclean.core.scanner import Scanner
+
         return Scanner(
             date_engine=self.date_engine,
             folder_tagger=self.folder_tagger,
-            image_extensions=set(self.cfg.scan.image_extensions),
-            video_extensions=set(self.cfg.scan.video_extensions),
-            raw_extensions=set(self.cfg.scan.raw_extensions),
+            image_extensions=self.cfg.scan.image_extensions_set,
+            video_extensions=self.cfg.scan.video_extensions_set,
+            raw_extensions=self.cfg.scan.raw_extensions_set,
             recursive=recursive,
             include_videos=include_videos,
             ignore_hidden=self.cfg.general.ignore_hidden_files,
             date_mismatch_enabled=self.cfg.date_mismatch.enabled,
             date_mismatch_threshold_days=self.cfg.date_mismatch.threshold_days,
+            cache=cache,
         )
 
+    def settings_fingerprint(self) -> str:
+        """Fingerprint of the settings and tag rules records are built under.
+        
+        Uses the readers' effective settings, so --fast/--no-fast and the
+        EXIF backend picked by "auto" count, not just the raw config.
+        """
+        from chronoclean.core.scan_cache import compute_settings_fingerprint
+
+        store = self.folder_tagger.tag_rules_store
+        effective = {
+            "fast_exif": self.exif_reader.fast,
+            "exif_backend": "exifread" if self.exif_reader.exiftool is None else "exiftool",
+        }
+        return compute_settings_fingerprint(
+            self.cfg, store.rules if store is not None else None, effective
+        )
+
+    def open_cache(self, enabled: bool) -> AbstractContextManager[Optional["ScanCache"]]:
+        """Open the persistent scan cache at performance.cache_location.
+        
+        Args:
+            enabled: Whether caching is enabled for this run
+            
+        Returns:
+            Context manager yielding the ScanCache, or None when disabled
+            or when the cache database cannot be opened
+        """
+        if not enabled:
+            return nullcontext()
+        
+        import sqlite3
+        from chronoclean.core.scan_cache import ScanCache
+
+        try:
+            return ScanCache(Path(self.cfg.performance.cache_location), self.settings_fingerprint())
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Scan cache unavailable, continuing without it: {e}")
+            return nullcontext()
+
 
-def create_scan_components(cfg: ChronoCleanConfig) -> ScanComponents:
+def create_scan_components(
+    cfg: ChronoCleanConfig,
+    fast_exif: Optional[bool] = None,
+) -> ScanComponents:
     """Create all scan-related components from configuration.
     
     This factory function centralizes the creation of ExifReader, VideoMetadataReader,
@@ -132,12 +190,30 @@ def create_scan_components(cfg: ChronoCleanConfig) -> ScanComponents:
     
     Args:
         cfg: ChronoClean configuration
+        fast_exif: CLI override for header-only EXIF reads (None = use config)
         
     Returns:
         ScanComponents dataclass containing all configured components
     """
-    # Create EXIF reader
-    exif_reader = ExifReader(skip_errors=cfg.scan.skip_exif_errors)
+    from chronoclean.core.date_inference import DateInferenceEngine
+    from chronoclean.core.exif_reader import ExifReader
+    from chronoclean.core.exiftool_process import ExifToolProcess
+    from chronoclean.core.folder_tagger import FolderTagger
+    from chronoclean.core.video_metadata import VideoMetadataReader
+    from chronoclean.core.tag_rules_store import TagRulesStore
+
+    # Create EXIF reader (optionally backed by a persistent exiftool)
+    exiftool = None
+    backend = cfg.scan.exif_backend
+    if backend == "exiftool" or (
+        backend == "auto" and ExifToolProcess.is_available(cfg.scan.exiftool_path)
+    ):
+        exiftool = ExifToolProcess(cfg.scan.exiftool_path)
+    exif_reader = ExifReader(
+        skip_errors=cfg.scan.skip_exif_errors,
+        fast=resolve_bool(fast_exif, cfg.scan.fast_exif),
+        exiftool=exiftool,
+    )
     
     # Create video metadata reader (if enabled)
     video_reader = None
@@ -150,7 +226,6 @@ def create_scan_components(cfg: ChronoCleanConfig) -> ScanComponents:
         )
     
     # v0.3.4: Create tag rules store for persistent tag decisions
-    from chronoclean.core.tag_rules_store import TagRulesStore
     tag_rules_store = TagRulesStore()  # Uses default path: .chronoclean/tag_rules.yaml
     
     # Create folder tagger with tag rules store integration
@@ -192,7 +267,7 @@ def get_config(config_path: Optional[Path] = None) -> ChronoCleanConfig:
     Returns:
         Loaded configuration
     """
-    return ConfigLoader.load(config_path)
+    return ConfigLoader.load_cached(config_path)
 
 
 def validate_source_dir(path: Path, console: Console) -> Path:
@@ -210,11 +285,14 @@ def validate_source_dir(path: Path, console: Console) -> Path:
     """
     resolved = path.resolve()
     
-    if not resolved.exists():
+    # One stat answers both checks
+    try:
+        mode = os.stat(resolved).st_mode
+    except (OSError, ValueError):
         console.print(f"[red]Error:[/red] Source path not found: {resolved}")
         raise typer.Exit(1)
     
-    if not resolved.is_dir():
+    if not stat.S_ISDIR(mode):
         console.print(f"[red]Error:[/red] Source is not a directory: {resolved}")
         raise typer.Exit(1)
     
@@ -251,6 +329,52 @@ def error_exit(console: Console, message: str, code: int = 1) -> None:
     raise typer.Exit(code)
 
 
+# Progress bars are updated at most every PROGRESS_BATCH files or
+# PROGRESS_INTERVAL seconds, whichever comes first
+PROGRESS_BATCH = 128
+PROGRESS_INTERVAL = 0.1
+
+
+def throttled_progress(
+    progress: Any, task: Any, label: str
+) -> Callable[[int, int], None]:
+    """Build a progress_callback(current, total) that updates a Rich task sparingly.
+    
+    Quick checks finish thousands of files per second; updating the bar
+    (and formatting its description) for each one costs more than the work.
+    The final file always updates so the bar ends at the true count.
+    
+    Args:
+        progress: Rich Progress instance
+        task: Task ID returned by progress.add_task
+        label: Description prefix, followed by "(current/total)"
+        
+    Returns:
+        Callback suitable for the core progress_callback parameters
+    """
+    last = time.monotonic()
+    # "label ({}/total)", rebuilt only if the total changes
+    template_total: Optional[int] = None
+    template = ""
+    
+    def update(current: int, total: int) -> None:
+        nonlocal last, template_total, template
+        if current & (PROGRESS_BATCH - 1) and current != total:
+            now = time.monotonic()
+            if now - last < PROGRESS_INTERVAL:
+                return
+            last = now
+        else:
+            last = time.monotonic()
+        if total != template_total:
+            template_total = total
+            escaped = label.replace("{", "{{").replace("}", "}}")
+            template = f"{escaped} ({{}}/{total})"
+        progress.update(task, completed=current, description=template.format(current))
+    
+    return update
+
+
 def resolve_bool(cli_value: Optional[bool], config_value: bool) -> bool:
     """Resolve boolean value: CLI overrides config if explicitly set.
     
@@ -264,14 +388,35 @@ def resolve_bool(cli_value: Optional[bool], config_value: bool) -> bool:
     return config_value if cli_value is None else cli_value
 
 
+def resolve_jobs(cli_value: Optional[int], cfg: ChronoCleanConfig) -> int:
+    """Resolve the scan worker process count: --jobs overrides config.
+
+    Without --jobs, performance.max_workers applies when
+    performance.multiprocessing is on; otherwise metadata is extracted
+    in-process (1).
+
+    Args:
+        cli_value: Value from --jobs (None if not provided)
+        cfg: Loaded configuration
+
+    Returns:
+        Worker process count (0 = one per CPU, 1 = in-process)
+    """
+    if cli_value is not None:
+        return cli_value
+    return cfg.performance.max_workers if cfg.performance.multiprocessing else 1
+
+
 def build_renamer_context(
     cfg: ChronoCleanConfig,
     use_rename: bool,
-) -> tuple[Optional[Renamer], Optional[ConflictResolver]]:
+) -> tuple[Optional["Renamer"], Optional["ConflictResolver"]]:
     """Create renamer and conflict resolver based on config and flags."""
     if not use_rename:
         return None, None
 
+    from chronoclean.core.renamer import ConflictResolver, Renamer
+
     renamer = Renamer(
         pattern=cfg.renaming.pattern,
         date_format=cfg.renaming.date_format,
@@ -283,35 +428,32 @@ def build_renamer_context(
     return renamer, conflict_resolver
 
 
-def compute_destination_for_record(
-    record: FileRecord,
-    sorter: Sorter,
+def compute_filename_for_record(
+    record: "FileRecord",
     cfg: ChronoCleanConfig,
     *,
     use_rename: bool,
     use_tag_names: bool,
-    renamer: Optional[Renamer],
-    conflict_resolver: Optional[ConflictResolver],
-) -> tuple[Path, str, Optional[Renamer]]:
-    """Compute destination folder and filename for a file record."""
-    dest_folder = sorter.compute_destination_folder(record.detected_date)
+    renamer: Optional["Renamer"],
+    conflict_resolver: Optional["ConflictResolver"],
+) -> tuple[str, Optional["Renamer"]]:
+    """Compute the destination filename for a file record."""
+    source_path = record.source_path
+    # folder_tag is None when the record has no usable tags
+    tag = record.folder_tag if use_tag_names else None
 
-    new_filename = None
     if use_rename and renamer and conflict_resolver:
-        tag = record.folder_tag if use_tag_names and record.folder_tag_usable else None
         new_filename = conflict_resolver.resolve(
-            record.source_path,
+            source_path,
             record.detected_date,
             tag=tag,
         )
-    elif use_tag_names and record.folder_tag_usable and record.folder_tag:
+    elif tag:
         if not renamer:
+            from chronoclean.core.renamer import Renamer
             renamer = Renamer(lowercase_ext=cfg.renaming.lowercase_extensions)
-        new_filename = renamer.generate_filename_tag_only(
-            record.source_path,
-            record.folder_tag,
-        )
+        new_filename = renamer.generate_filename_tag_only(source_path, tag)
     else:
-        new_filename = record.source_path.name
+        new_filename = source_path.name
 
-    return dest_folder, new_filename, renamer
+    return new_filename, renamer
@@ -5,7 +5,8 @@ from typing import Annotated, Optional
 
 import typer
 
-from chronoclean.cli._common import _default_cfg, bool_show_default
+from chronoclean.cli._common import _cfg_note, _default_cfg, bool_show_default
+from chronoclean.cli.helpers import resolve_jobs
 
 SourceScanArg = Annotated[Path, typer.Argument(help="Source directory to scan")]
 RecursiveOpt = Annotated[
@@ -28,6 +29,66 @@ LimitOpt = Annotated[
     Optional[int],
     typer.Option("--limit", "-l", help="Limit files (for debugging)"),
 ]
+JobsOpt = Annotated[
+    Optional[int],
+    typer.Option(
+        "--jobs", "-j",
+        min=0,
+        help="Worker processes for metadata extraction (0 = one per CPU)",
+        show_default=f"{resolve_jobs(None, _default_cfg)}{_cfg_note}",
+    ),
+]
+ThreadsOpt = Annotated[
+    Optional[int],
+    typer.Option(
+        "--threads",
+        min=0,
+        help="Threads reading metadata concurrently (0 = auto, ignored with --jobs)",
+        show_default=f"{_default_cfg.performance.scan_threads}{_cfg_note}",
+    ),
+]
+VerifyJobsOpt = Annotated[
+    Optional[int],
+    typer.Option(
+        "--jobs", "-j",
+        min=0,
+        help="Worker processes hashing files (0 = one per CPU)",
+        show_default=f"{_default_cfg.performance.verify_jobs}{_cfg_note}",
+    ),
+]
+IoJobsOpt = Annotated[
+    Optional[int],
+    typer.Option(
+        "--io-jobs",
+        min=0,
+        help="Copies/moves to run in parallel (0 = auto)",
+        show_default=f"{_default_cfg.performance.io_workers}{_cfg_note}",
+    ),
+]
+FastOpt = Annotated[
+    Optional[bool],
+    typer.Option(
+        "--fast/--no-fast",
+        help="Read EXIF from file headers only (full read as fallback)",
+        show_default=bool_show_default(_default_cfg.scan.fast_exif, "fast", "no-fast"),
+    ),
+]
+CacheOpt = Annotated[
+    Optional[bool],
+    typer.Option(
+        "--cache/--no-cache",
+        help="Reuse metadata of unchanged files from the scan cache",
+        show_default=bool_show_default(_default_cfg.performance.enable_cache, "cache", "no-cache"),
+    ),
+]
+ScanCacheOpt = Annotated[
+    Optional[bool],
+    typer.Option(
+        "--cache/--no-cache",
+        help="Reuse and fill the scan cache (off by default: scan writes nothing)",
+        show_default="no-cache",
+    ),
+]
 ConfigOpt = Annotated[
     Optional[Path],
     typer.Option("--config", "-c", help="Config file path"),
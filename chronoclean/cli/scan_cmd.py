@@ -1,23 +1,38 @@
 """Scan command for ChronoClean CLI."""
 
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
 import typer
-from rich.table import Table
 
 from chronoclean.config import ConfigLoader
 from chronoclean.cli._common import console
 from chronoclean.cli.helpers import (
+    PROGRESS_BATCH,
+    PROGRESS_INTERVAL,
     create_scan_components,
     validate_source_dir,
     resolve_bool,
+    resolve_jobs,
 )
 from chronoclean.cli.options import (
     SourceScanArg,
     RecursiveOpt,
     VideosOpt,
     LimitOpt,
+    JobsOpt,
+    ThreadsOpt,
+    FastOpt,
+    ScanCacheOpt,
     ConfigOpt,
 )
 
+# Above this many files the --report is printed as plain tab-separated lines;
+# laying out a rich Table costs far more than the scan output is worth
+REPORT_TABLE_MAX_ROWS = 500
+
 
 def register_scan(app: typer.Typer) -> None:
     """Register the scan command with the Typer app."""
@@ -28,8 +43,16 @@ def register_scan(app: typer.Typer) -> None:
         recursive: RecursiveOpt = None,
         videos: VideosOpt = None,
         limit: LimitOpt = None,
+        jobs: JobsOpt = None,
+        threads: ThreadsOpt = None,
+        fast: FastOpt = None,
+        cache: ScanCacheOpt = None,
         config: ConfigOpt = None,
         report: bool = typer.Option(False, "--report", "-r", help="Show detailed per-file report"),
+        save_scan: Optional[Path] = typer.Option(
+            None, "--save-scan",
+            help="Save scanned records for a later 'apply --from-scan'",
+        ),
     ):
         """
         Analyze files in the source directory.
@@ -39,13 +62,21 @@ def register_scan(app: typer.Typer) -> None:
         Configuration can be provided via --config flag or by placing a chronoclean.yaml
         file in the current directory. CLI arguments override config file values.
         """
+        from rich.table import Table
+
+        from chronoclean.core.models import ScanResult
+
         # Load configuration
-        cfg = ConfigLoader.load(config)
+        cfg = ConfigLoader.load_cached(config)
 
         # Resolve options: CLI overrides config
         use_recursive = resolve_bool(recursive, cfg.general.recursive)
         use_videos = resolve_bool(videos, cfg.general.include_videos)
         use_limit = limit if limit is not None else cfg.scan.limit
+        # scan is read-only unless asked: the cache is used only with --cache
+        use_cache = resolve_bool(cache, False)
+        use_threads = threads if threads is not None else cfg.performance.scan_threads
+        use_jobs = resolve_jobs(jobs, cfg)
 
         # Validate source using helper
         source = validate_source_dir(source, console)
@@ -56,12 +87,62 @@ def register_scan(app: typer.Typer) -> None:
         console.print()
 
         # Create components from config using factory
-        components = create_scan_components(cfg)
-        scanner = components.create_scanner(use_recursive, use_videos)
-
-        # Run scan
-        with console.status("[bold blue]Scanning files..."):
-            result = scanner.scan(source, limit=use_limit)
+        components = create_scan_components(cfg, fast_exif=fast)
+
+        # Run scan, tallying date sources (and --report lines) as records
+        # stream in, so result.files is not walked again afterwards
+        result = ScanResult(source_root=source)
+        date_sources: Counter[str] = Counter()
+        report_lines = ["File\tDate\tSource\tFolder Tag"]
+        recorder = None
+        with components.open_cache(use_cache) as scan_cache:
+            if save_scan:
+                from chronoclean.core.scan_snapshot import SnapshotRecorder
+
+                # Notes each file's stat before its record is built
+                scan_cache = recorder = SnapshotRecorder(scan_cache)
+            scanner = components.create_scanner(use_recursive, use_videos, cache=scan_cache)
+            with console.status("[bold blue]Scanning files...") as status:
+                records = scanner.iter_scan(
+                    source, limit=use_limit, jobs=use_jobs, threads=use_threads, result=result
+                )
+                last_update = time.monotonic()
+                for count, record in enumerate(records, 1):
+                    detected_date = record.detected_date
+                    if detected_date:
+                        date_sources[record.date_source.value] += 1
+                    if report:
+                        date_str = f"{detected_date:%Y-%m-%d %H:%M}" if detected_date else "None"
+                        tags = record.folder_tags
+                        report_lines.append(
+                            f"{record.source_path.name}\t{date_str}\t"
+                            f"{record.date_source.value}\t{tags[0] if tags else '-'}"
+                        )
+                    # Refresh the counter every PROGRESS_BATCH files or
+                    # PROGRESS_INTERVAL seconds, not per (often cached) file
+                    if not count & (PROGRESS_BATCH - 1):
+                        last_update = time.monotonic()
+                    elif (now := time.monotonic()) - last_update >= PROGRESS_INTERVAL:
+                        last_update = now
+                    else:
+                        continue
+                    status.update(f"[bold blue]Scanning files... ({count})")
+
+        if recorder is not None:
+            from chronoclean.core.scan_snapshot import save_scan_snapshot
+
+            try:
+                saved = save_scan_snapshot(
+                    save_scan,
+                    result,
+                    recorder.stats,
+                    fingerprint=components.settings_fingerprint(),
+                    recursive=use_recursive,
+                    include_videos=use_videos,
+                )
+                console.print(f"[dim]Scan snapshot: {save_scan} ({saved} files)[/dim]")
+            except OSError as e:
+                console.print(f"[yellow]Warning:[/yellow] Could not save scan snapshot: {e}")
 
         # Display results
         console.print()
@@ -83,21 +164,15 @@ def register_scan(app: typer.Typer) -> None:
         console.print()
 
         # Date source breakdown
-        date_sources: dict[str, int] = {}
-        no_date_count = 0
-        for record in result.files:
-            if record.detected_date:
-                source_name = record.date_source.value
-                date_sources[source_name] = date_sources.get(source_name, 0) + 1
-            else:
-                no_date_count += 1
+        no_date_count = len(result.files) - date_sources.total()
 
         if date_sources or no_date_count:
             date_table = Table(title="Date Sources")
             date_table.add_column("Source", style="cyan")
             date_table.add_column("Count", style="white")
 
-            for source_name, count in sorted(date_sources.items()):
+            # Most frequent source first
+            for source_name, count in date_sources.most_common():
                 date_table.add_row(source_name, str(count))
             if no_date_count:
                 date_table.add_row("no date found", str(no_date_count), style="yellow")
@@ -106,7 +181,13 @@ def register_scan(app: typer.Typer) -> None:
             console.print()
 
         # Detailed per-file report
-        if report:
+        if report and len(result.files) > REPORT_TABLE_MAX_ROWS:
+            console.print()
+            console.print("[bold]Detailed File Report:[/bold]")
+            # One write, bypassing rich markup and highlighting
+            console.file.write("\n".join(report_lines) + "\n\n")
+        elif report:
+            # Few enough rows that a second (bounded) pass is negligible
             console.print()
             console.print("[bold]Detailed File Report:[/bold]")
             report_table = Table(show_header=True)
@@ -115,16 +196,21 @@ def register_scan(app: typer.Typer) -> None:
             report_table.add_column("Source", style="yellow")
             report_table.add_column("Folder Tag", style="green")
 
+            no_date = "[red]None[/red]"
+            add_row = report_table.add_row
             for record in result.files:
                 filename = record.source_path.name
                 if len(filename) > 37:
                     filename = filename[:34] + "..."
-                
-                date_str = record.detected_date.strftime("%Y-%m-%d %H:%M") if record.detected_date else "[red]None[/red]"
-                source_str = record.date_source.value if record.date_source else "unknown"
-                tag_str = record.folder_tag if record.folder_tag else "-"
-                
-                report_table.add_row(filename, date_str, source_str, tag_str)
+                detected_date = record.detected_date
+                tags = record.folder_tags
+
+                add_row(
+                    filename,
+                    f"{detected_date:%Y-%m-%d %H:%M}" if detected_date else no_date,
+                    record.date_source.value,
+                    tags[0] if tags else "-",
+                )
 
             console.print(report_table)
             console.print()
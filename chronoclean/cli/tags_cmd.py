@@ -1,14 +1,12 @@
 """CLI commands for folder tag management (v0.3.4)."""
 
-import json
 import sys
-from collections import defaultdict
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from chronoclean.cli.helpers import (
     create_scan_components,
@@ -16,7 +14,6 @@ from chronoclean.cli.helpers import (
     validate_source_dir,
 )
 from chronoclean.cli._common import console as default_console
-from chronoclean.core.tag_rules_store import TagRulesStore
 
 console = Console()
 err_console = Console(stderr=True)
@@ -98,75 +95,106 @@ def create_tags_app() -> typer.Typer:
             components = create_scan_components(cfg)
             scanner = components.create_scanner(recursive, videos)
             
-            # Scan directory
+            # Only folder names and tags matter here: walk without reading dates
             err_console.print(f"[blue]Scanning {source}...[/blue]")
-            result = scanner.scan(source, limit=limit)
-            err_console.print(f"[green]✓ Scanned {result.processed_files} files[/green]")
             
-            # Aggregate tag candidates and ignored folders
-            tag_candidates = defaultdict(lambda: {"count": 0, "samples": []})
-            ignored_folders = defaultdict(lambda: {"count": 0, "reason": None, "samples": []})
+            # Aggregate tag candidates and ignored folders: counts, plus up to
+            # `samples` paths each; names whose samples are complete go in a
+            # "full" set so common tags skip sample bookkeeping
+            tag_counts: Counter[str] = Counter()
+            tag_samples: dict[str, list[str]] = {}
+            full_tags: set[str] = set()
+            ignored_counts: Counter[str] = Counter()
+            ignored_samples: dict[str, list[str]] = {}
+            full_ignored: set[str] = set()
             
-            for record in result.files:
+            # Files share folders, so each folder name is classified once
+            classifications: dict[str, tuple[bool, str]] = {}
+            classify_folder = scanner.folder_tagger.classify_folder
+            
+            file_count = 0
+            for file_count, (source_path, folder, folder_tags) in enumerate(
+                scanner.iter_folder_tags(source, limit=limit), 1
+            ):
                 # Collect tags that were applied
-                if record.folder_tags:
-                    for tag in record.folder_tags:
-                        tag_candidates[tag]["count"] += 1
-                        if len(tag_candidates[tag]["samples"]) < samples:
-                            tag_candidates[tag]["samples"].append(str(record.source_path))
+                if folder_tags:
+                    tag_counts.update(folder_tags)
+                    for tag in folder_tags:
+                        if tag in full_tags:
+                            continue
+                        tag_list = tag_samples.setdefault(tag, [])
+                        if len(tag_list) < samples:
+                            tag_list.append(str(source_path))
+                        else:
+                            full_tags.add(tag)
                 
                 # Collect folders that were checked but ignored
-                if record.source_folder_name and not record.folder_tags:
-                    folder = record.source_folder_name
+                if folder and not folder_tags:
                     # Get the reason from folder_tagger
-                    usable, reason = scanner.folder_tagger.classify_folder(folder)
-                    if not usable:
-                        ignored_folders[folder]["count"] += 1
-                        ignored_folders[folder]["reason"] = reason
-                        if len(ignored_folders[folder]["samples"]) < samples:
-                            ignored_folders[folder]["samples"].append(str(record.source_path))
+                    classification = classifications.get(folder)
+                    if classification is None:
+                        classification = classifications[folder] = classify_folder(folder)
+                    if not classification[0]:
+                        ignored_counts[folder] += 1
+                        if folder in full_ignored:
+                            continue
+                        folder_list = ignored_samples.setdefault(folder, [])
+                        if len(folder_list) < samples:
+                            folder_list.append(str(source_path))
+                        else:
+                            full_ignored.add(folder)
+            
+            err_console.print(f"[green]✓ Scanned {file_count} files[/green]")
             
             # Output results
             if output_format == "json":
+                from chronoclean.utils.json_utils import dumps_json_bytes
+
                 output_data = {
                     "tag_candidates": [
                         {
                             "tag": tag,
-                            "count": data["count"],
-                            "samples": data["samples"],
+                            "count": count,
+                            "samples": tag_samples[tag],
                         }
-                        for tag, data in sorted(tag_candidates.items())
+                        for tag, count in sorted(tag_counts.items())
                     ],
                     "ignored_folders": [
                         {
                             "folder_name": folder,
-                            "reason": data["reason"],
-                            "count": data["count"],
-                            "samples": data["samples"],
+                            "reason": classifications[folder][1],
+                            "count": count,
+                            "samples": ignored_samples[folder],
                         }
-                        for folder, data in sorted(ignored_folders.items())
+                        for folder, count in sorted(ignored_counts.items())
                     ] if show_ignored else [],
                 }
                 
-                json_str = json.dumps(output_data, indent=2)
+                # Encoded once to UTF-8 bytes (by orjson when installed)
+                payload = dumps_json_bytes(output_data)
                 
                 if output_file:
-                    output_file.write_text(json_str, encoding="utf-8")
+                    output_file.write_bytes(payload)
                     console.print(f"[green]✓ Exported to {output_file}[/green]")
                 else:
-                    print(json_str)
+                    # Anything already printed must come out first
+                    sys.stdout.flush()
+                    sys.stdout.buffer.write(payload + b"\n")
+                    sys.stdout.buffer.flush()
             
             else:  # text format
+                from rich.table import Table
+
                 # Will tag section
-                if tag_candidates:
+                if tag_counts:
                     table = Table(title="[bold green]Will Tag[/bold green]", show_lines=True)
                     table.add_column("Tag", style="cyan", no_wrap=True)
                     table.add_column("Count", justify="right", style="magenta")
                     table.add_column("Sample Files", style="dim")
                     
-                    for tag, data in sorted(tag_candidates.items()):
-                        sample_str = "\n".join(data["samples"][:samples])
-                        table.add_row(tag, str(data["count"]), sample_str)
+                    for tag, count in sorted(tag_counts.items()):
+                        sample_str = "\n".join(tag_samples[tag])
+                        table.add_row(tag, str(count), sample_str)
                     
                     console.print(table)
                     console.print()
@@ -174,19 +202,19 @@ def create_tags_app() -> typer.Typer:
                     console.print("[yellow]No tags detected[/yellow]\n")
                 
                 # Ignored section
-                if show_ignored and ignored_folders:
+                if show_ignored and ignored_counts:
                     table = Table(title="[bold red]Ignored[/bold red]", show_lines=True)
                     table.add_column("Folder Name", style="cyan", no_wrap=True)
                     table.add_column("Reason", style="yellow")
                     table.add_column("Count", justify="right", style="magenta")
                     table.add_column("Sample Files", style="dim")
                     
-                    for folder, data in sorted(ignored_folders.items()):
-                        sample_str = "\n".join(data["samples"][:samples])
+                    for folder, count in sorted(ignored_counts.items()):
+                        sample_str = "\n".join(ignored_samples[folder])
                         table.add_row(
                             folder,
-                            data["reason"] or "unknown",
-                            str(data["count"]),
+                            classifications[folder][1] or "unknown",
+                            str(count),
                             sample_str,
                         )
                     
@@ -244,6 +272,8 @@ def create_tags_app() -> typer.Typer:
             err_console.print(f"[red]Error: --tag option is only valid with 'use' action[/red]")
             raise typer.Exit(code=1)
         
+        from chronoclean.core.tag_rules_store import TagRulesStore
+
         try:
             # Load tag rules store
             store = TagRulesStore(rules_path)
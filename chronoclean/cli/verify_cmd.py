@@ -6,30 +6,17 @@ from typing import Optional
 from datetime import datetime
 
 import typer
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from chronoclean.config import ConfigLoader
 from chronoclean.cli._common import console
+from chronoclean.cli.options import VerifyJobsOpt
 from chronoclean.cli.helpers import (
     create_scan_components,
     validate_source_dir,
     resolve_bool,
     build_renamer_context,
-    compute_destination_for_record,
-)
-from chronoclean.core.sorter import Sorter
-from chronoclean.core.run_record_writer import ensure_verifications_dir
-from chronoclean.core.run_discovery import (
-    discover_run_records,
-    load_run_record,
-    find_run_by_id,
-)
-from chronoclean.core.verifier import Verifier
-from chronoclean.core.verification import (
-    InputSource,
-    VerificationReport,
-    generate_verify_id,
-    get_verification_filename,
+    compute_filename_for_record,
+    throttled_progress,
 )
 
 
@@ -68,8 +55,9 @@ def register_verify(app: typer.Typer) -> None:
         ),
         algorithm: Optional[str] = typer.Option(
             None, "--algorithm", "-a",
-            help="Hash algorithm: sha256 (default) or quick",
+            help="Hash algorithm: sha256 (default), blake3 or quick",
         ),
+        jobs: VerifyJobsOpt = None,
         include_dry_runs: bool = typer.Option(
             False, "--include-dry-runs",
             help="Include dry-run records in discovery",
@@ -94,19 +82,39 @@ def register_verify(app: typer.Typer) -> None:
             chronoclean verify --run-file run.json  # Use specific file
             chronoclean verify --source /src --destination /dest --reconstruct
         """
+        # Lazy imports to keep CLI startup fast (rich.progress included)
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+
+        from chronoclean.core.run_record_writer import (
+            open_verification_spool,
+            write_verification_report,
+        )
+        from chronoclean.core.run_discovery import (
+            discover_run_records,
+            load_run_record,
+            find_run_by_id,
+        )
+        from chronoclean.core.verifier import Verifier
+        from chronoclean.utils.deps import is_blake3_available
+
         # Load configuration
-        cfg = ConfigLoader.load(config)
+        cfg = ConfigLoader.load_cached(config)
         
         # Determine algorithm
         use_algorithm = algorithm if algorithm else cfg.verify.algorithm
-        if use_algorithm not in ("sha256", "quick"):
+        if use_algorithm not in ("sha256", "blake3", "quick"):
             console.print(f"[red]Error:[/red] Invalid algorithm: {use_algorithm}")
-            console.print("Use 'sha256' or 'quick'.")
+            console.print("Use 'sha256', 'blake3' or 'quick'.")
+            raise typer.Exit(1)
+        if use_algorithm == "blake3" and not is_blake3_available():
+            console.print("[red]Error:[/red] blake3 verification requires the 'blake3' package")
+            console.print("Install it with: pip install blake3")
             raise typer.Exit(1)
+        use_jobs = jobs if jobs is not None else cfg.performance.verify_jobs
         
         # Handle --reconstruct mode: verify without a run record
         if reconstruct:
-            _verify_reconstruct(source, destination, use_algorithm, cfg)
+            _verify_reconstruct(source, destination, use_algorithm, cfg, use_jobs)
             return
         
         # Find the run record (non-reconstruct mode)
@@ -115,9 +123,11 @@ def register_verify(app: typer.Typer) -> None:
         
         if run_file:
             # Explicit file path
-            run_file = run_file.resolve()
-            if not run_file.exists():
-                console.print(f"[red]Error:[/red] Run file not found: {run_file}")
+            # Strict resolve checks existence in the same pass
+            try:
+                run_file = run_file.resolve(strict=True)
+            except OSError:
+                console.print(f"[red]Error:[/red] Run file not found: {run_file.resolve()}")
                 raise typer.Exit(1)
             
             try:
@@ -194,38 +204,55 @@ def register_verify(app: typer.Typer) -> None:
         
         # Run verification with progress
         verify_action = (
-            "Hashing (sha256) and comparing..."
-            if use_algorithm == "sha256"
+            f"Hashing ({use_algorithm}) and comparing..."
+            if use_algorithm != "quick"
             else "Quick check (size-only)..."
         )
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(verify_action, total=len(verifiable))
-            
-            def update_progress(current, total):
-                progress.update(
-                    task,
-                    completed=current,
-                    description=f"{verify_action} ({current}/{total})",
+        # Entries wait on disk rather than in memory until the report is saved
+        with open_verification_spool(cfg.verify) as spool:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                console=console,
+            ) as progress:
+                task = progress.add_task(verify_action, total=len(verifiable))
+                
+                report = verifier.verify_from_run_record(
+                    run_record,
+                    progress_callback=throttled_progress(progress, task, verify_action),
+                    jobs=use_jobs,
+                    spool=spool,
                 )
             
-            report = verifier.verify_from_run_record(run_record, progress_callback=update_progress)
-        
-        # Save verification report
-        verifications_dir = ensure_verifications_dir(cfg.verify)
-        report_filename = get_verification_filename(report.verify_id)
-        report_path = verifications_dir / report_filename
-        report_path.write_text(report.to_json(pretty=True), encoding="utf-8")
+            # Save verification report
+            report_path = write_verification_report(report, cfg.verify)
         
         # Display results
         _display_verification_results(report, use_algorithm, report_path)
 
 
-def _verify_reconstruct(source: Optional[Path], destination: Optional[Path], algorithm: str, cfg) -> None:
+def _verify_reconstruct(
+    source: Optional[Path],
+    destination: Optional[Path],
+    algorithm: str,
+    cfg,
+    jobs: int = 1,
+) -> None:
     """Handle --reconstruct mode: verify without a run record."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    from chronoclean.core.sorter import Sorter
+    from chronoclean.core.run_record_writer import (
+        open_verification_spool,
+        write_verification_report,
+    )
+    from chronoclean.core.verifier import Verifier
+    from chronoclean.core.verification import (
+        InputSource,
+        VerificationReport,
+        generate_verify_id,
+    )
+
     if not source or not destination:
         console.print("[red]Error:[/red] --reconstruct requires both --source and --destination")
         raise typer.Exit(1)
@@ -264,26 +291,35 @@ def _verify_reconstruct(source: Optional[Path], destination: Optional[Path], alg
     renamer, conflict_resolver = build_renamer_context(cfg, use_rename)
     
     # Build expected mappings: [(source_path, expected_dest_path)]
-    expected_mappings: list[tuple[Path, Path]] = []
-    skipped_no_date = 0
+    dated = [record for record in scan_result.files if record.detected_date]
+    skipped_no_date = len(scan_result.files) - len(dated)
+    # Each distinct folder is formatted once for the whole batch
+    dest_folders = sorter.compute_destinations_batch([record.detected_date for record in dated])
     
-    for record in scan_result.files:
-        if not record.detected_date:
-            skipped_no_date += 1
-            continue
-        
-        dest_folder, new_filename, renamer = compute_destination_for_record(
-            record,
-            sorter,
-            cfg,
-            use_rename=use_rename,
-            use_tag_names=use_tag_names,
-            renamer=renamer,
-            conflict_resolver=conflict_resolver,
-        )
-        
-        expected_dest = dest_folder / new_filename
-        expected_mappings.append((record.source_path, expected_dest))
+    if use_rename or use_tag_names:
+        filenames = []
+        add_filename = filenames.append
+        for record in dated:
+            new_filename, renamer = compute_filename_for_record(
+                record,
+                cfg,
+                use_rename=use_rename,
+                use_tag_names=use_tag_names,
+                renamer=renamer,
+                conflict_resolver=conflict_resolver,
+            )
+            add_filename(new_filename)
+    else:
+        # Files keep their names
+        filenames = [record.source_path.name for record in dated]
+    
+    expected_mappings: list[tuple[Path, Path]] = [
+        (record.source_path, dest_folder / new_filename)
+        for record, dest_folder, new_filename in zip(dated, dest_folders, filenames)
+    ]
+    # Verify in destination order: files of one date folder are read one
+    # after another instead of jumping between folders in scan order
+    expected_mappings.sort(key=lambda mapping: mapping[1])
     
     if skipped_no_date > 0:
         console.print(f"[dim]Skipped {skipped_no_date} files without dates[/dim]")
@@ -298,11 +334,12 @@ def _verify_reconstruct(source: Optional[Path], destination: Optional[Path], alg
         content_search_on_reconstruct=cfg.verify.content_search_on_reconstruct,
     )
     
-    # Create verification report
-    verify_id = generate_verify_id()
+    # Create verification report; the id's timestamp must match created_at
+    # (run discovery orders report files by the stamp in their name)
+    timestamp = datetime.now()
     report = VerificationReport(
-        verify_id=verify_id,
-        created_at=datetime.now(),
+        verify_id=generate_verify_id(timestamp),
+        created_at=timestamp,
         source_root=str(source),
         destination_root=str(destination),
         input_source=InputSource.RECONSTRUCTED,
@@ -313,59 +350,53 @@ def _verify_reconstruct(source: Optional[Path], destination: Optional[Path], alg
     start_time = time.time()
     total_files = len(expected_mappings)
     verify_action = (
-        "Hashing (sha256) and comparing..."
-        if algorithm == "sha256"
+        f"Hashing ({algorithm}) and comparing..."
+        if algorithm != "quick"
         else "Quick check (size-only)..."
     )
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task(verify_action, total=total_files)
-        
-        for i, (source_path, expected_dest) in enumerate(expected_mappings):
-            entry = verifier.verify_with_content_search(
-                source_path,
-                expected_dest,
-                destination,
-            )
-            report.add_entry(entry)
+    # Entries wait on disk rather than in memory until the report is saved
+    with open_verification_spool(cfg.verify) as spool:
+        report.spool_entries(spool)
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=console,
+        ) as progress:
+            task = progress.add_task(verify_action, total=total_files)
             
-            progress.update(
-                task,
-                advance=1,
-                description=f"{verify_action} ({i+1}/{total_files})",
-            )
-    
-    duration = time.time() - start_time
-    report.duration_seconds = duration
-    
-    # Save verification report
-    verifications_dir = ensure_verifications_dir(cfg.verify)
-    report_filename = get_verification_filename(verify_id)
-    report_path = verifications_dir / report_filename
-    report_path.write_text(report.to_json(), encoding="utf-8")
-    
-    # Display results
-    console.print()
-    console.print("[bold]Verification Results (reconstructed)[/bold]")
-    console.print()
+            for entry in verifier.verify_pairs(
+                expected_mappings,
+                search_root=destination,
+                jobs=jobs,
+                progress_callback=throttled_progress(progress, task, verify_action),
+            ):
+                report.add_entry(entry)
+        
+        duration = time.time() - start_time
+        report.duration_seconds = duration
+        
+        # Save verification report
+        report_path = write_verification_report(report, cfg.verify)
     
+    # Display results in a single print
     summary = report.summary
-    console.print(f"  Algorithm:           {algorithm}")
-    console.print(f"  Total files:         {summary.total}")
-    console.print(f"  [green]OK:[/green]                  {summary.ok}")
-    console.print(f"  [green]OK (duplicate):[/green]      {summary.ok_existing_duplicate}")
-    console.print(f"  [red]Mismatch:[/red]             {summary.mismatch}")
-    console.print(f"  [yellow]Missing dest:[/yellow]       {summary.missing_destination}")
-    console.print(f"  [yellow]Missing source:[/yellow]     {summary.missing_source}")
-    console.print(f"  [red]Errors:[/red]               {summary.error}")
-    
-    console.print()
-    console.print(f"[dim]Duration: {duration:.1f}s[/dim]")
-    console.print(f"[dim]Report saved to: {report_path}[/dim]")
+    console.print("\n".join([
+        "",
+        "[bold]Verification Results (reconstructed)[/bold]",
+        "",
+        f"  Algorithm:           {algorithm}",
+        f"  Total files:         {summary.total}",
+        f"  [green]OK:[/green]                  {summary.ok}",
+        f"  [green]OK (duplicate):[/green]      {summary.ok_existing_duplicate}",
+        f"  [red]Mismatch:[/red]             {summary.mismatch}",
+        f"  [yellow]Missing dest:[/yellow]       {summary.missing_destination}",
+        f"  [yellow]Missing source:[/yellow]     {summary.missing_source}",
+        f"  [red]Errors:[/red]               {summary.error}",
+        "",
+        f"[dim]Duration: {duration:.1f}s[/dim]",
+        f"[dim]Report saved to: {report_path}[/dim]",
+    ]))
     
     _display_cleanup_eligibility(summary, algorithm)
     
@@ -374,13 +405,17 @@ def _verify_reconstruct(source: Optional[Path], destination: Optional[Path], alg
 
 def _select_run_interactive(runs):
     """Interactive selection of run record."""
+    from chronoclean.core.run_discovery import load_run_record
+
     if len(runs) == 1:
         selected = runs[0]
-        console.print(f"Last apply run: [cyan]{selected.age_description}[/cyan], "
-                    f"{selected.total_files} files {selected.mode_description}d")
-        console.print(f"  Source: {selected.source_root}")
-        console.print(f"  Destination: {selected.destination_root}")
-        console.print()
+        console.print("\n".join([
+            f"Last apply run: [cyan]{selected.age_description}[/cyan], "
+            f"{selected.total_files} files {selected.mode_description}d",
+            f"  Source: {selected.source_root}",
+            f"  Destination: {selected.destination_root}",
+            "",
+        ]))
         
         confirm = typer.confirm("Use this run?", default=True)
         if not confirm:
@@ -390,18 +425,17 @@ def _select_run_interactive(runs):
         return run_record, selected.filepath
     else:
         # Show list and ask to select
-        console.print(f"[blue]Found {len(runs)} apply runs:[/blue]")
-        console.print()
-        
+        # One print for the whole listing rather than two per run
+        lines = [f"[blue]Found {len(runs)} apply runs:[/blue]", ""]
         for i, run in enumerate(runs[:10], 1):
             dry_marker = " [dim](dry-run)[/dim]" if run.is_dry_run else ""
-            console.print(f"  {i}. {run.age_description}, {run.total_files} files {run.mode_description}d{dry_marker}")
-            console.print(f"     {run.source_root} → {run.destination_root}")
-        
+            lines.append(f"  {i}. {run.age_description}, {run.total_files} files {run.mode_description}d{dry_marker}")
+            lines.append(f"     {run.source_root} → {run.destination_root}")
         if len(runs) > 10:
-            console.print(f"  ... and {len(runs) - 10} more")
+            lines.append(f"  ... and {len(runs) - 10} more")
+        lines.append("")
+        console.print("\n".join(lines))
         
-        console.print()
         choice = typer.prompt("Select run number (or 0 to cancel)", default="1")
         
         try:
@@ -422,25 +456,27 @@ def _select_run_interactive(runs):
 
 def _display_verification_results(report, algorithm: str, report_path: Path) -> None:
     """Display verification results."""
-    console.print()
-    console.print("[bold]Verification Results:[/bold]")
-    console.print(f"  Algorithm: {algorithm}")
-    console.print(f"  Total files: {report.summary.total}")
-    console.print(f"  ✅ OK: {report.summary.ok}")
-    console.print(f"  ✅ OK (existing duplicate): {report.summary.ok_existing_duplicate}")
-    console.print(f"  ❌ Mismatch: {report.summary.mismatch}")
-    console.print(f"  ⚠️  Missing destination: {report.summary.missing_destination}")
-    console.print(f"  ⚠️  Missing source: {report.summary.missing_source}")
-    console.print(f"  ❗ Errors: {report.summary.error}")
-    console.print(f"  ⏭️  Skipped: {report.summary.skipped}")
-    
-    console.print()
-    console.print(f"Duration: {report.duration_seconds:.1f}s")
-    console.print(f"Report: {report_path}")
+    summary = report.summary
+    console.print("\n".join([
+        "",
+        "[bold]Verification Results:[/bold]",
+        f"  Algorithm: {algorithm}",
+        f"  Total files: {summary.total}",
+        f"  ✅ OK: {summary.ok}",
+        f"  ✅ OK (existing duplicate): {summary.ok_existing_duplicate}",
+        f"  ❌ Mismatch: {summary.mismatch}",
+        f"  ⚠️  Missing destination: {summary.missing_destination}",
+        f"  ⚠️  Missing source: {summary.missing_source}",
+        f"  ❗ Errors: {summary.error}",
+        f"  ⏭️  Skipped: {summary.skipped}",
+        "",
+        f"Duration: {report.duration_seconds:.1f}s",
+        f"Report: {report_path}",
+    ]))
     
-    _display_cleanup_eligibility(report.summary, algorithm)
+    _display_cleanup_eligibility(summary, algorithm)
     
-    cleanup_eligible = report.summary.cleanup_eligible_count
+    cleanup_eligible = summary.cleanup_eligible_count
     if cleanup_eligible > 0:
         console.print("Run 'chronoclean cleanup --only ok' to delete verified sources.")
 
@@ -452,8 +488,8 @@ def _display_cleanup_eligibility(summary, algorithm: str) -> None:
     
     console.print()
     if summary.ok + summary.ok_existing_duplicate == summary.total:
-        if algorithm == "sha256":
-            console.print("[green]All files verified (sha256). All entries eligible for cleanup.[/green]")
+        if algorithm != "quick":
+            console.print(f"[green]All files verified ({algorithm}). All entries eligible for cleanup.[/green]")
         else:
             console.print("[yellow]All files passed quick check (size-only). Not eligible for cleanup by default.[/yellow]")
     else:
@@ -1,11 +1,19 @@
 """Configuration loading and validation for ChronoClean."""
 
+import copy
 import logging
+import os
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+try:
+    # libyaml-backed loader, many times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 from chronoclean.config.schema import (
     ChronoCleanConfig,
     DateMismatchConfig,
@@ -39,12 +47,19 @@ class ConfigError(Exception):
 class ConfigLoader:
     """Loads configuration from YAML files."""
 
-    DEFAULT_CONFIG_PATHS = [
+    DEFAULT_CONFIG_PATHS = (
         Path("chronoclean.yaml"),
         Path("chronoclean.yml"),
         Path(".chronoclean/config.yaml"),
         Path(".chronoclean/config.yml"),
-    ]
+    )
+
+    # Parsed YAML per (resolved path, mtime_ns, size); a changed file misses
+    _yaml_cache: dict[tuple[str, int, int], dict[str, Any]] = {}
+    _YAML_CACHE_SIZE = 8
+
+    # Built configs for load_cached, keyed like _yaml_cache (None = no file)
+    _config_cache: dict[Optional[tuple[str, int, int]], ChronoCleanConfig] = {}
 
     @classmethod
     def load(cls, config_path: Optional[Path] = None) -> ChronoCleanConfig:
@@ -73,28 +88,91 @@ class ConfigLoader:
                 raise ConfigError(f"Config file not found: {config_path}")
             config_dict = cls._load_yaml(config_path)
         else:
-            # Search default paths
-            for default_path in cls.DEFAULT_CONFIG_PATHS:
-                if default_path.exists():
-                    logger.info(f"Loading config from {default_path}")
-                    config_dict = cls._load_yaml(default_path)
-                    break
+            default_path = cls.find_default_path()
+            if default_path is not None:
+                logger.info(f"Loading config from {default_path}")
+                config_dict = cls._load_yaml(default_path)
 
         # Build config object with defaults
         return cls._build_config(config_dict)
 
+    @classmethod
+    def load_cached(cls, config_path: Optional[Path] = None) -> ChronoCleanConfig:
+        """
+        Load configuration, reusing the result of an identical earlier load.
+
+        The CLI loads the config at import (for --help defaults) and again in
+        each command; while the config file is unchanged (same mtime and
+        size) both get the same object. The returned config is shared, so
+        callers must not modify it.
+
+        Args:
+            config_path: Optional explicit path to config file
+
+        Returns:
+            ChronoCleanConfig object
+
+        Raises:
+            ConfigError: If config file cannot be read or parsed
+        """
+        path = config_path or cls.find_default_path()
+        key = None
+        if path is not None:
+            try:
+                st = path.stat()
+            except OSError:
+                # Let load() report the missing or unreadable file
+                return cls.load(config_path)
+            key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
+
+        config = cls._config_cache.get(key)
+        if config is None:
+            # Load the path found above rather than searching the defaults again
+            config = cls.load(path)
+            if len(cls._config_cache) >= cls._YAML_CACHE_SIZE:
+                del cls._config_cache[next(iter(cls._config_cache))]
+            cls._config_cache[key] = config
+        return config
+
+    @classmethod
+    def find_default_path(cls) -> Optional[Path]:
+        """Return the first existing default config path, if any."""
+        for default_path in cls.DEFAULT_CONFIG_PATHS:
+            if os.path.exists(default_path):
+                return default_path
+        return None
+
     @classmethod
     def _load_yaml(cls, path: Path) -> dict[str, Any]:
-        """Load YAML file and return dict."""
+        """
+        Load YAML file and return dict.
+
+        Parsed files are cached per process; callers get a deep copy so
+        the built config never shares lists or dicts with the cache.
+        """
         try:
-            with open(path, encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-                return data if data else {}
-        except yaml.YAMLError as e:
-            raise ConfigError(f"Invalid YAML in {path}: {e}")
+            st = path.stat()
+            key = (str(path.resolve()), st.st_mtime_ns, st.st_size)
         except OSError as e:
             raise ConfigError(f"Cannot read {path}: {e}")
 
+        data = cls._yaml_cache.get(key)
+        if data is None:
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = yaml.load(f, Loader=_YamlLoader) or {}
+            except yaml.YAMLError as e:
+                raise ConfigError(f"Invalid YAML in {path}: {e}")
+            except OSError as e:
+                raise ConfigError(f"Cannot read {path}: {e}")
+
+            if len(cls._yaml_cache) >= cls._YAML_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del cls._yaml_cache[next(iter(cls._yaml_cache))]
+            cls._yaml_cache[key] = data
+
+        return copy.deepcopy(data)
+
     @classmethod
     def _build_config(cls, data: dict[str, Any]) -> ChronoCleanConfig:
         """Build ChronoCleanConfig from dictionary."""
@@ -165,6 +243,12 @@ class ConfigLoader:
             config.raw_extensions = list(data["raw_extensions"])
         if "skip_exif_errors" in data:
             config.skip_exif_errors = bool(data["skip_exif_errors"])
+        if "fast_exif" in data:
+            config.fast_exif = bool(data["fast_exif"])
+        if "exif_backend" in data:
+            config.exif_backend = data["exif_backend"]
+        if "exiftool_path" in data:
+            config.exiftool_path = data["exiftool_path"]
         if "limit" in data:
             config.limit = int(data["limit"]) if data["limit"] else None
         return config
@@ -375,15 +459,33 @@ class ConfigLoader:
         if "multiprocessing" in data:
             config.multiprocessing = bool(data["multiprocessing"])
         if "max_workers" in data:
-            config.max_workers = int(data["max_workers"])
+            config.max_workers = cls._worker_count(data, "max_workers")
         if "chunk_size" in data:
             config.chunk_size = int(data["chunk_size"])
         if "enable_cache" in data:
             config.enable_cache = bool(data["enable_cache"])
         if "cache_location" in data:
             config.cache_location = data["cache_location"]
+        if "io_workers" in data:
+            config.io_workers = cls._worker_count(data, "io_workers")
+        if "scan_threads" in data:
+            config.scan_threads = cls._worker_count(data, "scan_threads")
+        if "verify_jobs" in data:
+            config.verify_jobs = cls._worker_count(data, "verify_jobs")
         return config
 
+    @staticmethod
+    def _worker_count(data: dict[str, Any], key: str) -> int:
+        """Read a performance worker count; like the CLI options, it must be >= 0.
+
+        A negative count would otherwise only fail once a pool is created,
+        midway through a command.
+        """
+        value = int(data[key])
+        if value < 0:
+            raise ConfigError(f"performance.{key} must be 0 (auto) or more, got {value}")
+        return value
+
     @classmethod
     def _build_synology(cls, data: dict[str, Any]) -> SynologyConfig:
         """Build SynologyConfig from dictionary."""
@@ -423,6 +525,14 @@ class ConfigLoader:
             if source not in valid_sources:
                 errors.append(f"Invalid fallback source: {source}")
 
+        # Validate EXIF backend
+        valid_backends = ["exifread", "exiftool", "auto"]
+        if config.scan.exif_backend not in valid_backends:
+            errors.append(
+                f"Invalid exif_backend: {config.scan.exif_backend}. "
+                f"Must be one of: {valid_backends}"
+            )
+
         # Validate logging level
         valid_levels = ["debug", "info", "warning", "error", "critical"]
         if config.logging.level.lower() not in valid_levels:
@@ -443,4 +553,9 @@ class ConfigLoader:
         if config.folder_tags.max_length < config.folder_tags.min_length:
             errors.append("max_length must be >= min_length")
 
+        # Validate worker counts (0 = auto)
+        for key in ("max_workers", "io_workers", "scan_threads", "verify_jobs"):
+            if getattr(config.performance, key) < 0:
+                errors.append(f"performance.{key} must be >= 0")
+
         return errors
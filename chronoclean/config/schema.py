@@ -1,6 +1,7 @@
 """Configuration schema definitions for ChronoClean."""
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
@@ -48,8 +49,28 @@ class ScanConfig:
         ]
     )
     skip_exif_errors: bool = True
+    fast_exif: bool = True  # Parse file headers only, full read as fallback
+    exif_backend: str = "exifread"  # "exifread", "exiftool" or "auto" (exiftool if on PATH)
+    exiftool_path: str = "exiftool"
     limit: Optional[int] = None
 
+    # Config is treated as immutable once loaded, so the frozenset views are
+    # built on first access and reused by every scanner created from it.
+    @cached_property
+    def image_extensions_set(self) -> frozenset[str]:
+        """Image extensions as a frozenset for fast membership tests."""
+        return frozenset(self.image_extensions)
+
+    @cached_property
+    def video_extensions_set(self) -> frozenset[str]:
+        """Video extensions as a frozenset for fast membership tests."""
+        return frozenset(self.video_extensions)
+
+    @cached_property
+    def raw_extensions_set(self) -> frozenset[str]:
+        """RAW extensions as a frozenset for fast membership tests."""
+        return frozenset(self.raw_extensions)
+
 
 @dataclass
 class VideoMetadataConfig:
@@ -123,7 +144,7 @@ class DuplicatesConfig:
 
     enabled: bool = True
     policy: str = "safe"  # Planned (future): safe, skip, overwrite (currently unused)
-    hashing_algorithm: str = "sha256"  # sha256, md5
+    hashing_algorithm: str = "sha256"  # sha256, md5, blake3 (needs the blake3 package)
     on_collision: str = "check_hash"  # check_hash, rename, skip, fail
     cache_hashes: bool = True  # Planned v0.6: persistent hash cache
 
@@ -176,7 +197,7 @@ class VerifyConfig:
     """Verification and cleanup configuration (v0.3.1)."""
 
     enabled: bool = False  # Default off; user opts in when needed
-    algorithm: str = "sha256"  # sha256 | quick
+    algorithm: str = "sha256"  # sha256 | blake3 (needs the blake3 package) | quick
     state_dir: str = ".chronoclean"  # Stored in current working directory
     run_record_dir: str = "runs"  # Resolved under state_dir
     verification_dir: str = "verifications"  # Resolved under state_dir
@@ -208,13 +229,16 @@ class LoggingConfig:
 
 @dataclass
 class PerformanceConfig:
-    """Performance configuration settings (planned v0.6)."""
+    """Performance configuration settings."""
 
-    multiprocessing: bool = True  # Planned v0.6: parallel scan/inference
-    max_workers: int = 0  # Planned v0.6: 0 = auto-detect CPU count
-    chunk_size: int = 500  # Planned v0.6: batch processing size
-    enable_cache: bool = True  # Planned v0.6: metadata caching
-    cache_location: str = ".chronoclean/cache.db"  # Planned v0.6: SQLite cache path
+    multiprocessing: bool = False  # Extract metadata in worker processes (--jobs)
+    max_workers: int = 0  # Worker processes when multiprocessing is on (0 = one per CPU)
+    chunk_size: int = 500  # Deprecated: unused, still accepted so older configs load
+    enable_cache: bool = True  # apply reuses records of unchanged files (--cache/--no-cache)
+    cache_location: str = ".chronoclean/cache.db"  # SQLite scan cache path
+    io_workers: int = 1  # Threads for apply's copies/moves (0 = auto, --io-jobs)
+    scan_threads: int = 1  # Threads reading metadata during scans (0 = auto, --threads)
+    verify_jobs: int = 1  # Worker processes hashing files in verify (0 = auto, --jobs)
 
 
 @dataclass
@@ -256,8 +280,8 @@ class ChronoCleanConfig:
     @property
     def all_supported_extensions(self) -> set[str]:
         """Get all supported file extensions."""
-        return (
-            set(self.scan.image_extensions)
-            | set(self.scan.video_extensions)
-            | set(self.scan.raw_extensions)
+        return set(
+            self.scan.image_extensions_set
+            | self.scan.video_extensions_set
+            | self.scan.raw_extensions_set
         )
@@ -91,6 +91,9 @@ scan:
     - ".orf"
     - ".rw2"
   skip_exif_errors: true
+  fast_exif: true             # Parse only file headers (full read as fallback)
+  exif_backend: "exifread"    # exifread, exiftool, or auto (exiftool if installed)
+  exiftool_path: "exiftool"   # exiftool binary (PATH lookup by default)
   limit: null                 # Set to integer for debugging (e.g., 100)
 
 # ============================================================================
@@ -147,7 +150,7 @@ renaming:
 duplicates:
   enabled: true               # Enable duplicate detection on collision
   policy: "safe"              # Planned: safe, skip, overwrite
-  hashing_algorithm: "sha256" # sha256, md5
+  hashing_algorithm: "sha256" # sha256, md5, blake3 (pip install blake3)
   on_collision: "check_hash"  # check_hash, rename, skip, fail
 
 # ============================================================================
@@ -168,7 +171,7 @@ video_metadata:
 verify:
   enabled: false              # Verification is opt-in
   write_run_record: true      # Write apply run records for later verification
-  algorithm: "sha256"         # sha256 (safe) or quick (size only)
+  algorithm: "sha256"         # sha256 (safe), blake3 (safe, faster) or quick (size only)
   state_dir: ".chronoclean"   # Directory for run records and verification reports
   run_record_dir: "runs"      # Subdirectory for apply run records
   verification_dir: "verifications"  # Subdirectory for verification reports
@@ -218,9 +221,11 @@ logging:
 # PERFORMANCE (for large libraries)
 # ============================================================================
 performance:
-  multiprocessing: true       # Use multiple CPU cores
-  max_workers: 0              # 0 = auto-detect
-  chunk_size: 500             # Files per batch
+  multiprocessing: false      # Extract metadata in worker processes (--jobs)
+  max_workers: 0              # Processes when multiprocessing is on (0 = auto)
+  io_workers: 1               # Parallel copies/moves in apply (0 = auto)
+  scan_threads: 1             # Threads reading metadata in scans (0 = auto)
+  verify_jobs: 1              # Processes hashing files in verify (0 = auto)
 
 # ============================================================================
 # SYNOLOGY NAS SETTINGS
@@ -5,11 +5,14 @@ Handles safe deletion of source files after verification.
 
 import logging
 import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from chronoclean.core.verification import (
+    CONTENT_HASH_ALGORITHMS,
     VerificationReport,
     VerificationStatus,
     VerifyEntry,
@@ -17,6 +20,23 @@ from chronoclean.core.verification import (
 
 logger = logging.getLogger(__name__)
 
+# Verification outcomes whose source may be deleted
+CLEANUP_STATUSES = frozenset({VerificationStatus.OK, VerificationStatus.OK_EXISTING_DUPLICATE})
+
+# Threads deleting files concurrently; each unlink mostly waits on the
+# filesystem (journal, network share), so they overlap well beyond the
+# CPU count
+CLEANUP_THREADS = min(32, (os.cpu_count() or 1) * 4)
+
+# Entries kept in flight per cleanup thread (bounds queued futures)
+CLEANUP_PREFETCH = 4
+
+# Outcome of one deletion: (kind, source path, bytes, reason/error)
+DeleteOutcome = tuple[str, Path, int, Optional[str]]
+
+# format_bytes units, indexed by the power of 1024
+_BYTE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 
 @dataclass
 class CleanupResult:
@@ -52,7 +72,8 @@ class Cleaner:
         
         Args:
             dry_run: If True, don't actually delete files.
-            require_sha256: Only delete if verification used sha256 algorithm.
+            require_sha256: Only delete if verification hashed full content
+                (sha256 or blake3).
         """
         self.dry_run = dry_run
         self.require_sha256 = require_sha256
@@ -69,13 +90,19 @@ class Cleaner:
         Returns:
             List of entries that can be safely deleted.
         """
-        eligible = []
-        
-        for entry in report.entries:
-            if self._is_eligible(entry):
-                eligible.append(entry)
-        
-        return eligible
+        # Status and algorithm are checked for every entry first, so the
+        # existence checks only stat the files that could be deleted
+        candidates = [
+            entry for entry in report.iter_entries()
+            if entry.status in CLEANUP_STATUSES
+            and (not self.require_sha256 or entry.hash_algorithm in CONTENT_HASH_ALGORITHMS)
+        ]
+        exists = os.path.exists
+        return [
+            entry for entry in candidates
+            if exists(entry.source_path)
+            and (not entry.actual_destination_path or exists(entry.actual_destination_path))
+        ]
     
     def _is_eligible(self, entry: VerifyEntry) -> bool:
         """Check if an entry is eligible for cleanup.
@@ -87,23 +114,20 @@ class Cleaner:
             True if eligible for cleanup.
         """
         # Status must be OK or OK_EXISTING_DUPLICATE
-        if entry.status not in (VerificationStatus.OK, VerificationStatus.OK_EXISTING_DUPLICATE):
+        if entry.status not in CLEANUP_STATUSES:
             return False
         
-        # Must have sha256 verification (unless require_sha256 is False)
-        if self.require_sha256 and entry.hash_algorithm != "sha256":
+        # Must have content-hash verification (unless require_sha256 is False)
+        if self.require_sha256 and entry.hash_algorithm not in CONTENT_HASH_ALGORITHMS:
             return False
         
         # Source path must exist
-        source_path = Path(entry.source_path)
-        if not source_path.exists():
+        if not os.path.exists(entry.source_path):
             return False
         
         # Destination must exist (or have been verified as existing)
-        if entry.actual_destination_path:
-            dest_path = Path(entry.actual_destination_path)
-            if not dest_path.exists():
-                return False
+        if entry.actual_destination_path and not os.path.exists(entry.actual_destination_path):
+            return False
         
         return True
     
@@ -111,60 +135,104 @@ class Cleaner:
         self,
         report: VerificationReport,
         progress_callback: Optional[callable] = None,
+        eligible: Optional[list[VerifyEntry]] = None,
     ) -> CleanupResult:
         """Delete source files for verified OK entries.
         
         Args:
             report: Verification report.
             progress_callback: Optional callback(current, total) for progress.
+            eligible: Result of get_cleanup_eligible(report) if the caller
+                already has it (saves filtering the report twice).
             
         Returns:
             CleanupResult with counts and details.
         """
         result = CleanupResult()
-        eligible = self.get_cleanup_eligible(report)
-        result.total_eligible = len(eligible)
+        if eligible is None:
+            eligible = self.get_cleanup_eligible(report)
+        total = result.total_eligible = len(eligible)
         
-        for i, entry in enumerate(eligible):
+        # Delete a directory's files back to back, so its metadata stays
+        # cached; the stable sort keeps report order within a directory
+        ordered = sorted(eligible, key=lambda entry: os.path.dirname(entry.source_path))
+        
+        # Tallied in that order whatever order the threads finish in
+        for i, (kind, source_path, file_size, reason) in enumerate(self._delete_all(ordered)):
             if progress_callback:
-                progress_callback(i + 1, len(eligible))
-            
-            source_path = Path(entry.source_path)
-            
-            # Double-check destination still exists
-            if entry.actual_destination_path:
-                dest_path = Path(entry.actual_destination_path)
-                if not dest_path.exists():
-                    result.skipped += 1
-                    result.skipped_paths.append((source_path, "destination no longer exists"))
-                    continue
-            
-            # Get file size before deletion
-            try:
-                file_size = source_path.stat().st_size
-            except OSError:
-                file_size = 0
+                progress_callback(i + 1, total)
             
-            # Delete or simulate
-            if self.dry_run:
+            if kind == "skipped":
+                result.skipped += 1
+                result.skipped_paths.append((source_path, reason))
+            elif kind == "failed":
+                result.failed += 1
+                result.failed_paths.append((source_path, reason))
+                logger.warning(f"Failed to delete {source_path}: {reason}")
+            else:
                 result.deleted += 1
                 result.bytes_freed += file_size
                 result.deleted_paths.append(source_path)
-                logger.debug(f"Would delete: {source_path}")
-            else:
-                try:
-                    source_path.unlink()
-                    result.deleted += 1
-                    result.bytes_freed += file_size
-                    result.deleted_paths.append(source_path)
+                if self.dry_run:
+                    logger.debug(f"Would delete: {source_path}")
+                else:
                     logger.info(f"Deleted: {source_path}")
-                except OSError as e:
-                    result.failed += 1
-                    result.failed_paths.append((source_path, str(e)))
-                    logger.warning(f"Failed to delete {source_path}: {e}")
         
         return result
     
+    def _delete_all(self, eligible: list[VerifyEntry]) -> Iterator[DeleteOutcome]:
+        """Delete entries on a thread pool, yielding outcomes in input order.
+        
+        At most CLEANUP_PREFETCH entries per thread are in flight.
+        """
+        workers = min(CLEANUP_THREADS, len(eligible))
+        if workers <= 1:
+            yield from map(self._delete_one, eligible)
+            return
+        
+        window = workers * CLEANUP_PREFETCH
+        pending: deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cleanup") as executor:
+            try:
+                for entry in eligible:
+                    pending.append(executor.submit(self._delete_one, entry))
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+    
+    def _delete_one(self, entry: VerifyEntry) -> DeleteOutcome:
+        """Re-check one eligible entry and delete (or simulate deleting) its source."""
+        source_path = Path(entry.source_path)
+        
+        # Double-check destination still exists
+        if entry.actual_destination_path and not os.path.exists(entry.actual_destination_path):
+            return ("skipped", source_path, 0, "destination no longer exists")
+        
+        # Reports record the size verification saw; only older reports
+        # without it cost an extra stat before deletion
+        file_size = entry.source_size
+        if file_size is None:
+            try:
+                file_size = source_path.stat().st_size
+            except FileNotFoundError:
+                # Gone since eligibility was checked (e.g. while confirming)
+                return ("skipped", source_path, 0, "source no longer exists")
+            except OSError:
+                file_size = 0
+        
+        if not self.dry_run:
+            try:
+                source_path.unlink()
+            except FileNotFoundError:
+                return ("skipped", source_path, 0, "source no longer exists")
+            except OSError as e:
+                return ("failed", source_path, 0, str(e))
+        return ("deleted", source_path, file_size, None)
+    
     def cleanup_single(
         self,
         entry: VerifyEntry,
@@ -201,8 +269,8 @@ def format_bytes(num_bytes: int) -> str:
     Returns:
         Formatted string like "1.5 GB".
     """
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(num_bytes) < 1024.0:
-            return f"{num_bytes:.1f} {unit}"
-        num_bytes /= 1024.0
-    return f"{num_bytes:.1f} PB"
+    # The bit length picks the unit directly: every 10 bits is a factor of 1024
+    exponent = min((abs(int(num_bytes)).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    if exponent <= 0:
+        return f"{num_bytes:.1f} B"
+    return f"{num_bytes / (1 << (10 * exponent)):.1f} {_BYTE_UNITS[exponent]}"
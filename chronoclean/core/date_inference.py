@@ -117,6 +117,7 @@ class DateInferenceEngine:
         self,
         file_path: Path,
         file_type: Optional[FileType] = None,
+        file_stat: Optional[os.stat_result] = None,
     ) -> tuple[Optional[datetime], DateSource]:
         """
         Infer the date for a file using configured priority.
@@ -126,6 +127,8 @@ class DateInferenceEngine:
             file_type: Optional file type hint (IMAGE, VIDEO, RAW).
                        If provided, skips inapplicable sources.
                        If None, video_metadata is skipped for safety.
+            file_stat: Optional stat result of the file, reused by the
+                       filesystem source instead of stat'ing again.
 
         Returns:
             Tuple of (datetime or None, DateSource indicating origin)
@@ -152,7 +155,10 @@ class DateInferenceEngine:
                 logger.warning(f"Unknown date source: {source_name}")
                 continue
 
-            result = method(file_path)
+            if source_name == "filesystem":
+                result = self._get_filesystem_date(file_path, file_stat)
+            else:
+                result = method(file_path)
             if result:
                 date, date_source = result
                 if date:
@@ -217,15 +223,20 @@ class DateInferenceEngine:
             return date, DateSource.VIDEO_METADATA
         return None
 
-    def _get_filesystem_date(self, file_path: Path) -> Optional[tuple[datetime, DateSource]]:
+    def _get_filesystem_date(
+        self,
+        file_path: Path,
+        file_stat: Optional[os.stat_result] = None,
+    ) -> Optional[tuple[datetime, DateSource]]:
         """
         Get date from filesystem.
 
         Prefers modification date (more reliable after file copies),
-        falls back to creation date.
+        falls back to creation date. Uses file_stat when the caller
+        already has it.
         """
         try:
-            stat = file_path.stat()
+            stat = file_stat if file_stat is not None else file_path.stat()
 
             # Prefer modification time (survives file copies)
             mtime = datetime.fromtimestamp(stat.st_mtime)
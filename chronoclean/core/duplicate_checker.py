@@ -1,13 +1,21 @@
 """Duplicate detection via file hashing (v0.2)."""
 
 import logging
+import os
+import stat
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
 from chronoclean.core.hashing import compute_file_hash as _compute_file_hash
+from chronoclean.utils.deps import is_blake3_available
 
 logger = logging.getLogger(__name__)
 
+# Hash cache key: absolute path, size, mtime_ns (a changed file misses)
+HashKey = tuple[str, int, int]
+
 
 class DuplicateChecker:
     """
@@ -29,17 +37,23 @@ class DuplicateChecker:
         Initialize the duplicate checker.
 
         Args:
-            algorithm: Hash algorithm to use ('sha256' or 'md5')
+            algorithm: Hash algorithm to use ('sha256', 'md5', or 'blake3'
+                when the blake3 package is installed)
             cache_enabled: Whether to cache computed hashes
         """
         self.algorithm = algorithm.lower()
         self.cache_enabled = cache_enabled
-        self._hash_cache: dict[Path, str] = {}
+        self._hash_cache: dict[HashKey, str] = {}
+        # Hashes the second file of a pair while the caller hashes the first
+        self._executor: Optional[ThreadPoolExecutor] = None
 
         # Validate algorithm
-        if self.algorithm not in ("sha256", "md5"):
+        if self.algorithm not in ("sha256", "md5", "blake3"):
             logger.warning(f"Unknown algorithm '{algorithm}', using sha256")
             self.algorithm = "sha256"
+        elif self.algorithm == "blake3" and not is_blake3_available():
+            logger.warning("blake3 package not installed, using sha256")
+            self.algorithm = "sha256"
 
     def compute_hash(self, file_path: Path) -> Optional[str]:
         """
@@ -51,19 +65,29 @@ class DuplicateChecker:
         Returns:
             Hex digest of the file hash, or None on error
         """
-        # Check cache first
-        resolved_path = file_path.resolve()
-        if self.cache_enabled and resolved_path in self._hash_cache:
-            return self._hash_cache[resolved_path]
-
-        if not file_path.exists():
+        try:
+            st = file_path.stat()
+        except OSError:
             logger.warning(f"File not found: {file_path}")
             return None
 
-        if not file_path.is_file():
+        if not stat.S_ISREG(st.st_mode):
             logger.warning(f"Not a file: {file_path}")
             return None
 
+        return self._hash(file_path, self._hash_key(file_path, st))
+
+    @staticmethod
+    def _hash_key(file_path: Path, st: os.stat_result) -> HashKey:
+        return os.path.abspath(file_path), st.st_size, st.st_mtime_ns
+
+    def _hash(self, file_path: Path, key: HashKey) -> Optional[str]:
+        """Hash a regular file, using and filling the cache."""
+        if self.cache_enabled:
+            cached = self._hash_cache.get(key)
+            if cached is not None:
+                return cached
+
         # Use centralized hashing function
         file_hash = _compute_file_hash(
             file_path,
@@ -73,23 +97,57 @@ class DuplicateChecker:
 
         # Cache the result if successful
         if file_hash is not None and self.cache_enabled:
-            self._hash_cache[resolved_path] = file_hash
+            self._hash_cache[key] = file_hash
 
         return file_hash
 
-    def are_duplicates(self, file1: Path, file2: Path) -> bool:
+    def _hash_pair(
+        self, file1: Path, key1: HashKey, file2: Path, key2: HashKey
+    ) -> tuple[Optional[str], Optional[str]]:
+        """Hash two files, reading both at once when neither is cached."""
+        pending = None
+        if not self.cache_enabled or (
+            key1 not in self._hash_cache and key2 not in self._hash_cache
+        ):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="chronoclean-hash"
+                )
+                weakref.finalize(self, self._executor.shutdown, wait=False)
+            pending = self._executor.submit(self._hash, file1, key1)
+
+        hash2 = self._hash(file2, key2)
+        hash1 = pending.result() if pending is not None else self._hash(file1, key1)
+        return hash1, hash2
+
+    def are_duplicates(
+        self,
+        file1: Path,
+        file2: Path,
+        size1: Optional[int] = None,
+        size2: Optional[int] = None,
+    ) -> bool:
         """
         Check if two files are duplicates (have identical content).
 
         Args:
             file1: First file path
             file2: Second file path
+            size1: Size of file1 if already known (e.g. from the scan)
+            size2: Size of file2 if already known
 
         Returns:
             True if files have identical content, False otherwise
         """
-        # Quick checks first
-        if not file1.exists() or not file2.exists():
+        # Known sizes that differ settle it without touching either file
+        if size1 is not None and size2 is not None and size1 != size2:
+            return False
+
+        # Quick checks first (one stat per file)
+        try:
+            st1 = file1.stat()
+            st2 = file2.stat()
+        except OSError:
             return False
 
         # Same file (by path)
@@ -97,15 +155,15 @@ class DuplicateChecker:
             return True
 
         # Different sizes means different content
-        try:
-            if file1.stat().st_size != file2.stat().st_size:
-                return False
-        except OSError:
+        if st1.st_size != st2.st_size:
+            return False
+        if not (stat.S_ISREG(st1.st_mode) and stat.S_ISREG(st2.st_mode)):
             return False
 
-        # Compare hashes
-        hash1 = self.compute_hash(file1)
-        hash2 = self.compute_hash(file2)
+        # Compare hashes (both files are read concurrently)
+        hash1, hash2 = self._hash_pair(
+            file1, self._hash_key(file1, st1), file2, self._hash_key(file2, st2)
+        )
 
         if hash1 is None or hash2 is None:
             return False
@@ -1,5 +1,6 @@
 """EXIF metadata reader for ChronoClean."""
 
+import io
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -8,6 +9,7 @@ from typing import Any, Optional
 
 import exifread
 
+from chronoclean.core.exiftool_process import ExifToolProcess
 from chronoclean.utils.constants import EXIF_DATE_FORMATS
 from chronoclean.utils.deps import (
     is_exiftool_available,
@@ -63,14 +65,30 @@ class ExifReader:
         ".png", ".webp", ".cr2", ".nef", ".arw", ".dng"
     }
 
-    def __init__(self, skip_errors: bool = True):
+    # Leading bytes parsed in fast mode (EXIF headers sit at the start of the
+    # file); the window doubles up to FAST_READ_MAX_BYTES before a full read
+    FAST_READ_BYTES = 64 * 1024
+    FAST_READ_MAX_BYTES = 512 * 1024
+
+    def __init__(
+        self,
+        skip_errors: bool = True,
+        fast: bool = True,
+        exiftool: Optional[ExifToolProcess] = None,
+    ):
         """
         Initialize the EXIF reader.
 
         Args:
             skip_errors: If True, return empty ExifData on errors instead of raising
+            fast: If True, parse only the file header first and fall back to
+                the whole file when it does not yield DateTimeOriginal
+            exiftool: Optional persistent exiftool process to read tags with;
+                exifread is used for files it cannot answer for
         """
         self.skip_errors = skip_errors
+        self.fast = fast
+        self.exiftool = exiftool
 
     def read(self, file_path: Path) -> ExifData:
         """
@@ -85,29 +103,85 @@ class ExifReader:
         Raises:
             ExifReadError: If the file cannot be read and skip_errors is False
         """
-        if not file_path.exists():
-            if self.skip_errors:
-                logger.warning(f"File not found: {file_path}")
-                return ExifData()
-            raise ExifReadError(f"File not found: {file_path}")
-
         ext = file_path.suffix.lower()
         if ext not in self.SUPPORTED_EXTENSIONS:
+            if not file_path.exists():
+                return self._file_not_found(file_path)
             logger.debug(f"Unsupported extension for EXIF: {ext}")
             return ExifData()
 
+        if self.exiftool is not None:
+            tags = self.exiftool.read_tags(file_path)
+            if tags is not None:
+                return self._parse_tags(tags)
+
+        # open() doubles as the existence check: one syscall fewer per file
         try:
             with open(file_path, "rb") as f:
-                tags = exifread.process_file(f, details=False)
+                tags = self._read_header_tags(f) if self.fast else None
+                if tags is None:
+                    f.seek(0)
+                    tags = exifread.process_file(f, details=False)
 
             return self._parse_tags(tags)
 
+        except FileNotFoundError:
+            return self._file_not_found(file_path)
         except Exception as e:
             logger.warning(f"Error reading EXIF from {file_path}: {e}")
             if self.skip_errors:
                 return ExifData()
             raise ExifReadError(f"Cannot read EXIF from {file_path}: {e}")
 
+    def _file_not_found(self, file_path: Path) -> ExifData:
+        """Handle a missing file according to skip_errors."""
+        if self.skip_errors:
+            logger.warning(f"File not found: {file_path}")
+            return ExifData()
+        raise ExifReadError(f"File not found: {file_path}")
+
+    def _read_header_tags(self, f) -> Optional[dict[str, Any]]:
+        """
+        Parse EXIF from a growing window at the start of an open file.
+
+        The window starts at FAST_READ_BYTES and doubles while the header
+        looks truncated (parse error, or EXIF without DateTimeOriginal), up
+        to FAST_READ_MAX_BYTES. Large RAW/HEIC files are then never read
+        past their header. A file shorter than the window is parsed from
+        the bytes already read, like a full read but without reading the
+        file twice.
+
+        Args:
+            f: Binary file object positioned at the start
+
+        Returns:
+            Tag dictionary, or None if a full read is needed
+        """
+        head = b""
+        size = self.FAST_READ_BYTES
+        while size <= self.FAST_READ_MAX_BYTES:
+            head += f.read(size - len(head))
+            if len(head) < size:
+                # Whole file in memory: errors propagate as for a full read
+                return exifread.process_file(io.BytesIO(head), details=False)
+
+            try:
+                tags = exifread.process_file(
+                    io.BytesIO(head), details=False, extract_thumbnail=False
+                )
+            except Exception as e:
+                logger.debug(f"Header-only EXIF parse failed at {size} bytes: {e}")
+                tags = None
+            else:
+                if "EXIF DateTimeOriginal" in tags:
+                    return tags
+                if not tags:
+                    # No EXIF in the header at all: a wider window won't help
+                    return None
+            size *= 2
+
+        return None
+
     def _parse_tags(self, tags: dict[str, Any]) -> ExifData:
         """Parse EXIF tags into ExifData object."""
         data = ExifData()
@@ -0,0 +1,152 @@
+"""Persistent exiftool process for EXIF reads.
+
+Starting exiftool (a Perl program) costs far more than reading one file's
+tags, so instead of one process per file a single ``exiftool -stay_open``
+process is kept running and fed one request per file over stdin.
+
+Results are returned under the exifread tag names ExifReader already
+parses (e.g. ``"EXIF DateTimeOriginal"``), so both backends share one
+parsing path.
+"""
+
+import json
+import logging
+import shutil
+import subprocess
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+# exiftool tag name -> exifread tag name understood by ExifReader._parse_tags
+EXIFTOOL_TAGS = {
+    "DateTimeOriginal": "EXIF DateTimeOriginal",
+    "CreateDate": "EXIF DateTimeDigitized",
+    "ModifyDate": "Image DateTime",
+    "Make": "Image Make",
+    "Model": "Image Model",
+    "Orientation": "Image Orientation",
+    "ExifImageWidth": "EXIF ExifImageWidth",
+    "ExifImageHeight": "EXIF ExifImageLength",
+}
+
+# Printed by exiftool after each -execute in -stay_open mode
+READY_MARKER = b"{ready}"
+
+
+def _stop_process(process: subprocess.Popen) -> None:
+    """Ask a stay_open exiftool to exit, killing it if it does not."""
+    if process.poll() is not None:
+        return
+    try:
+        process.stdin.write(b"-stay_open\nFalse\n")
+        process.stdin.close()
+        process.wait(timeout=5)
+    except (OSError, ValueError, subprocess.TimeoutExpired):
+        process.kill()
+
+
+class ExifToolProcess:
+    """
+    One long-running exiftool serving tag requests for many files.
+
+    The process is started on first use and shared by all threads (requests
+    are serialized). Pickled copies, e.g. in scan worker processes, start
+    their own process.
+    """
+
+    def __init__(self, exiftool_path: str = "exiftool"):
+        """
+        Initialize the exiftool process wrapper.
+
+        Args:
+            exiftool_path: exiftool binary (default: "exiftool" from PATH)
+        """
+        self.exiftool_path = exiftool_path
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._failed = False
+
+    def __getstate__(self) -> dict:
+        return {"exiftool_path": self.exiftool_path}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["exiftool_path"])
+
+    @staticmethod
+    def is_available(exiftool_path: str = "exiftool") -> bool:
+        """Check if the exiftool binary can be found."""
+        return shutil.which(exiftool_path) is not None
+
+    def _start(self) -> subprocess.Popen:
+        process = subprocess.Popen(
+            [self.exiftool_path, "-stay_open", "True", "-@", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        weakref.finalize(self, _stop_process, process)
+        logger.debug(f"Started exiftool process (pid {process.pid})")
+        return process
+
+    def read_tags(self, file_path: Path) -> Optional[dict[str, Any]]:
+        """
+        Read the date and camera tags of one file.
+
+        Args:
+            file_path: Path to the image file
+
+        Returns:
+            Tags keyed by exifread tag name (empty if the file has none), or
+            None if exiftool could not answer (missing file, dead process)
+        """
+        path = str(file_path)
+        if self._failed or "\n" in path:
+            return None
+
+        args = ["-j", "-n", "-fast2", "-charset", "filename=utf8"]
+        args += [f"-{tag}" for tag in EXIFTOOL_TAGS]
+        request = "\n".join(args + [path, "-execute"]) + "\n"
+
+        with self._lock:
+            try:
+                if self._process is None:
+                    self._process = self._start()
+                self._process.stdin.write(request.encode("utf-8"))
+                self._process.stdin.flush()
+                output = self._read_response()
+            except OSError as e:
+                logger.warning(f"exiftool unavailable, using exifread instead: {e}")
+                self._failed = True
+                return None
+
+        try:
+            entries = json.loads(output) if output.strip() else []
+        except json.JSONDecodeError as e:
+            logger.debug(f"Unreadable exiftool output for {file_path}: {e}")
+            return None
+        if not entries:
+            return None
+
+        entry = entries[0]
+        return {
+            name: entry[tag] for tag, name in EXIFTOOL_TAGS.items() if tag in entry
+        }
+
+    def _read_response(self) -> bytes:
+        """Collect stdout lines up to the ready marker."""
+        lines = []
+        for line in iter(self._process.stdout.readline, b""):
+            if line.rstrip() == READY_MARKER:
+                return b"".join(lines)
+            lines.append(line)
+        raise OSError("exiftool exited unexpectedly")
+
+    def close(self) -> None:
+        """Stop the exiftool process, if running."""
+        with self._lock:
+            if self._process is not None:
+                _stop_process(self._process)
+                self._process = None
@@ -4,11 +4,13 @@ This module provides JSON and CSV export capabilities for scan results.
 """
 
 import csv
+import io
 import json
+from collections import Counter
 from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from chronoclean.core.models import ScanResult, FileRecord, DateSource
 
@@ -44,10 +46,9 @@ class Exporter:
         Returns:
             JSON string representation.
         """
-        data = self._prepare_export_data(scan_result)
-
-        indent = 2 if self.pretty_print else None
-        json_str = json.dumps(data, indent=indent, default=self._json_serializer)
+        buffer = io.StringIO()
+        self.write_json(scan_result, buffer)
+        json_str = buffer.getvalue()
 
         if output_path:
             output_path = Path(output_path)
@@ -70,20 +71,8 @@ class Exporter:
         Returns:
             CSV string representation.
         """
-        import io
-
         output = io.StringIO()
-        writer = csv.writer(output)
-
-        # Write header
-        headers = self._get_csv_headers()
-        writer.writerow(headers)
-
-        # Write file records
-        for record in scan_result.files:
-            row = self._record_to_csv_row(record)
-            writer.writerow(row)
-
+        self.write_csv(scan_result, output)
         csv_str = output.getvalue()
 
         if output_path:
@@ -93,6 +82,65 @@ class Exporter:
 
         return csv_str
 
+    def write_json(self, scan_result: ScanResult, stream: TextIO) -> None:
+        """Write scan result JSON to a text stream, one record at a time.
+
+        Produces the same document as json.dumps(to_dict(...)) without
+        holding every record dict (or the encoded string) in memory.
+
+        Args:
+            scan_result: The scan result to export.
+            stream: Text stream to write to.
+        """
+        indent = 2 if self.pretty_print else None
+        # Separator between items and the padding before a key at depth 1/2
+        if self.pretty_print:
+            item_sep, pad1, pad2 = ",", "\n  ", "\n    "
+        else:
+            item_sep, pad1, pad2 = ", ", "", ""
+
+        def encode(value: Any, pad: str) -> str:
+            text = json.dumps(value, indent=indent, default=self._json_serializer)
+            # Re-indent nested pretty output to its depth (JSON strings never
+            # contain raw newlines, so every newline is layout)
+            return text.replace("\n", pad) if pad else text
+
+        header = {
+            "export_timestamp": datetime.now().isoformat(),
+            "source_directory": str(scan_result.source_root),
+            "file_count": len(scan_result.files),
+        }
+        stream.write("{")
+        for key, value in header.items():
+            stream.write(f"{pad1}{json.dumps(key)}: {encode(value, pad1)}{item_sep}")
+
+        stream.write(f'{pad1}"files": [')
+        for i, record in enumerate(scan_result.files):
+            if i:
+                stream.write(item_sep)
+            stream.write(pad2 + encode(self._record_to_dict(record), pad2))
+        stream.write(f"{pad1}]" if scan_result.files else "]")
+
+        if self.include_statistics:
+            statistics = self._compute_statistics(scan_result)
+            stream.write(f'{item_sep}{pad1}"statistics": {encode(statistics, pad1)}')
+        stream.write("\n}" if self.pretty_print else "}")
+
+    def write_csv(self, scan_result: ScanResult, stream: TextIO) -> None:
+        """Write scan result CSV to a text stream, one row at a time.
+
+        Args:
+            scan_result: The scan result to export.
+            stream: Text stream to write to (opened with newline="").
+        """
+        writer = csv.writer(stream)
+
+        # Write header
+        writer.writerow(self._get_csv_headers())
+
+        # Write file records (rows are built lazily as the writer consumes them)
+        writer.writerows(map(self._record_to_csv_row, scan_result.files))
+
     def to_dict(self, scan_result: ScanResult) -> dict[str, Any]:
         """Convert scan result to dictionary.
 
@@ -272,56 +320,50 @@ class Exporter:
             Dictionary of statistics.
         """
         files = scan_result.files
-        total_size = sum(r.size_bytes for r in files)
-        dated_files = [r for r in files if r.detected_date]
-        undated_files = [r for r in files if not r.detected_date]
-        
-        # Count by date source
-        source_counts: dict[str, int] = {}
-        for record in dated_files:
-            if record.date_source:
-                source = record.date_source.value
-                source_counts[source] = source_counts.get(source, 0) + 1
-
-        # Count by year
-        year_counts: dict[str, int] = {}
-        for record in files:
-            if record.detected_date:
-                year = str(record.detected_date.year)
-                year_counts[year] = year_counts.get(year, 0) + 1
-
-        # Count by extension
-        ext_counts: dict[str, int] = {}
-        for record in files:
-            ext = record.extension.lower() if record.extension else "no_extension"
-            ext_counts[ext] = ext_counts.get(ext, 0) + 1
 
-        # Date mismatch statistics
-        mismatch_files = [r for r in files if r.date_mismatch]
-        
-        # Duplicate statistics
-        duplicate_files = [r for r in files if r.is_duplicate]
+        # Single pass over the records; every tally is updated per record
+        total_size = 0
+        dated_count = 0
+        mismatch_count = 0
+        duplicate_count = 0
+        source_counts: Counter[str] = Counter()
+        year_counts: Counter[str] = Counter()
+        ext_counts: Counter[str] = Counter()
+        error_categories: Counter[str] = Counter()  # v0.3: from file records
 
-        # v0.3: Error category counts (from file records)
-        error_categories: dict[str, int] = {}
         for record in files:
+            total_size += record.size_bytes
+
+            detected_date = record.detected_date
+            if detected_date:
+                dated_count += 1
+                year_counts[str(detected_date.year)] += 1
+                if record.date_source:
+                    source_counts[record.date_source.value] += 1
+
+            ext = record.extension
+            ext_counts[ext.lower() if ext else "no_extension"] += 1
+
+            if record.date_mismatch:
+                mismatch_count += 1
+            if record.is_duplicate:
+                duplicate_count += 1
             if record.error_category:
-                cat = record.error_category
-                error_categories[cat] = error_categories.get(cat, 0) + 1
+                error_categories[record.error_category] += 1
 
         return {
             "total_files": len(files),
             "total_size_bytes": total_size,
             "total_size_human": self._human_readable_size(total_size),
-            "dated_files": len(dated_files),
-            "undated_files": len(undated_files),
-            "date_sources": source_counts,
+            "dated_files": dated_count,
+            "undated_files": len(files) - dated_count,
+            "date_sources": dict(source_counts),
             "files_by_year": dict(sorted(year_counts.items())),
             "files_by_extension": dict(sorted(ext_counts.items())),
-            "date_mismatch_count": len(mismatch_files),
-            "duplicate_count": len(duplicate_files),
+            "date_mismatch_count": mismatch_count,
+            "duplicate_count": duplicate_count,
             # v0.3: Error categories
-            "errors_by_category": error_categories if error_categories else None,
+            "errors_by_category": dict(error_categories) if error_categories else None,
         }
 
     def _human_readable_size(self, size_bytes: int) -> str:
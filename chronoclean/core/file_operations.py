@@ -1,12 +1,24 @@
 """Safe file operations for ChronoClean."""
 
+import errno
 import logging
+import os
 import shutil
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Container, Iterable, Optional
 
 logger = logging.getLogger(__name__)
 
+# Bytes requested per os.copy_file_range call (the kernel may copy less)
+COPY_RANGE_CHUNK = 1 << 30
+
+# copy_file_range errors meaning "not supported here", not a failed copy
+_COPY_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EOPNOTSUPP, errno.EINVAL, errno.EBADF, errno.EPERM}
+)
+
 
 class FileOperationError(Exception):
     """Error during file operation."""
@@ -34,31 +46,151 @@ class FileOperations:
         self.dry_run = dry_run
         self.create_dirs = create_dirs
         self.preserve_metadata = preserve_metadata
+        # Device of each destination directory seen so far (for rename fast path)
+        self._dir_devices: dict[Path, int] = {}
+        # Destination directories already created (or found) by this instance
+        self._created_dirs: set[Path] = set()
+        # Whether copy_file_range works per (source device, destination device)
+        self._copy_range_support: dict[tuple[int, int], bool] = {}
+
+    def _dir_device(self, destination_dir: Path) -> int:
+        """Return the device of a destination directory, stat'ing it once."""
+        dest_dev = self._dir_devices.get(destination_dir)
+        if dest_dev is None:
+            dest_dev = self._dir_devices[destination_dir] = os.stat(destination_dir).st_dev
+        return dest_dev
+
+    def _make_parent_dir(self, destination: Path) -> None:
+        """Create the destination's folder, once per folder."""
+        parent = destination.parent
+        if parent not in self._created_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(parent)
+
+    def prepare_directories(self, destinations: Iterable[Path]) -> int:
+        """
+        Create the folders of many destinations up front, once per folder.
+
+        A batch of N files usually lands in far fewer folders, so this
+        replaces one mkdir per file with one per folder. Folders that cannot
+        be created are skipped; the file operation then reports the error.
+
+        Args:
+            destinations: Destination file paths
+
+        Returns:
+            Number of folders created or confirmed
+        """
+        if self.dry_run or not self.create_dirs:
+            return 0
+
+        prepared = 0
+        # Resolved like the per-file operations resolve their destination
+        for folder in {Path(destination).parent for destination in destinations}:
+            parent = folder.resolve()
+            if parent in self._created_dirs:
+                continue
+            try:
+                parent.mkdir(parents=True, exist_ok=True)
+            except OSError as e:
+                logger.debug(f"Cannot create directory {parent}: {e}")
+                continue
+            self._created_dirs.add(parent)
+            prepared += 1
+        return prepared
+
+    def _same_device(self, source_dev: int, destination_dir: Path) -> bool:
+        """
+        Check whether a source file and destination directory share a filesystem.
+
+        Destination directory devices are cached, so a batch of moves into
+        the same folder stats that folder only once.
+        """
+        try:
+            return source_dev == self._dir_device(destination_dir)
+        except OSError:
+            return False
+
+    def _copy_file_range(
+        self,
+        source: Path,
+        destination: Path,
+        source_stat: os.stat_result,
+    ) -> bool:
+        """
+        Copy file contents in the kernel with os.copy_file_range (Linux).
+
+        Data never passes through user space, and filesystems with reflinks
+        (btrfs, XFS) share extents instead of duplicating them. Support is
+        probed once per pair of devices.
+
+        Returns:
+            True if the contents were copied; False if copy_file_range is
+            unavailable here and nothing was written (use shutil instead)
+
+        Raises:
+            OSError: If the copy failed part way
+        """
+        if not hasattr(os, "copy_file_range"):
+            return False
+        try:
+            devices = (source_stat.st_dev, self._dir_device(destination.parent))
+        except OSError:
+            return False
+        if not self._copy_range_support.get(devices, True):
+            return False
+
+        with open(source, "rb") as fsrc, open(destination, "xb") as fdst:
+            copied = 0
+            try:
+                while n := os.copy_file_range(fsrc.fileno(), fdst.fileno(), COPY_RANGE_CHUNK):
+                    copied += n
+            except OSError as e:
+                if copied or e.errno not in _COPY_RANGE_UNSUPPORTED:
+                    raise
+                supported = False
+            else:
+                # Some filesystems (procfs, FUSE, NFS) return 0 before EOF
+                # instead of failing: a short copy is redone with shutil,
+                # never reported as a success
+                supported = copied == source_stat.st_size
+
+        self._copy_range_support[devices] = supported
+        if not supported:
+            logger.debug(
+                f"copy_file_range copied {copied} of {source_stat.st_size} bytes "
+                f"for {source}, using shutil"
+            )
+            destination.unlink()
+        return supported
 
     def _prepare_file_op(
         self,
         source: Path,
         destination: Path,
         verb: str,
-    ) -> tuple[bool, Path, Path, str, bool]:
+    ) -> tuple[bool, Path, Path, str, bool, Optional[os.stat_result]]:
         """
         Resolve/validate paths and handle dry-run logging for a file operation.
 
         Returns:
-            (ok, resolved_source, resolved_destination, message, handled)
+            (ok, resolved_source, resolved_destination, message, handled, source_stat)
 
         Where:
         - ok/message: final result if handled=True, or validation failure
         - handled=True means the caller should return (ok, message) immediately
+        - source_stat: the single stat of the source, reused by the operation
         """
         resolved_source = Path(source).resolve()
         resolved_destination = Path(destination).resolve()
 
-        if not resolved_source.exists():
-            return False, resolved_source, resolved_destination, f"Source file not found: {resolved_source}", True
+        try:
+            source_stat = os.stat(resolved_source)
+        except OSError:
+            return False, resolved_source, resolved_destination, f"Source file not found: {resolved_source}", True, None
 
-        if not resolved_source.is_file():
-            return False, resolved_source, resolved_destination, f"Source is not a file: {resolved_source}", True
+        if not stat.S_ISREG(source_stat.st_mode):
+            return False, resolved_source, resolved_destination, f"Source is not a file: {resolved_source}", True, None
 
         if resolved_destination.exists():
             return (
@@ -67,13 +199,14 @@ class FileOperations:
                 resolved_destination,
                 f"Destination already exists: {resolved_destination}",
                 True,
+                None,
             )
 
         if self.dry_run:
             logger.info(f"[DRY RUN] Would {verb}: {resolved_source} -> {resolved_destination}")
-            return True, resolved_source, resolved_destination, "Dry run - no changes made", True
+            return True, resolved_source, resolved_destination, "Dry run - no changes made", True, None
 
-        return True, resolved_source, resolved_destination, "", False
+        return True, resolved_source, resolved_destination, "", False, source_stat
 
     def move_file(
         self,
@@ -90,14 +223,25 @@ class FileOperations:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        ok, source, destination, message, handled = self._prepare_file_op(source, destination, "move")
+        ok, source, destination, message, handled, source_stat = self._prepare_file_op(
+            source, destination, "move"
+        )
         if handled:
             return ok, message
 
         try:
             # Create destination directory if needed
             if self.create_dirs:
-                destination.parent.mkdir(parents=True, exist_ok=True)
+                self._make_parent_dir(destination)
+
+            # Same filesystem: a plain rename moves the inode without copying data
+            if self._same_device(source_stat.st_dev, destination.parent):
+                try:
+                    os.rename(source, destination)
+                    logger.info(f"Moved: {source} -> {destination}")
+                    return True, "File moved successfully"
+                except OSError as e:
+                    logger.debug(f"Rename failed for {source}, falling back to copy: {e}")
 
             # Move the file
             if self.preserve_metadata:
@@ -128,17 +272,24 @@ class FileOperations:
         Returns:
             Tuple of (success: bool, message: str)
         """
-        ok, source, destination, message, handled = self._prepare_file_op(source, destination, "copy")
+        ok, source, destination, message, handled, source_stat = self._prepare_file_op(
+            source, destination, "copy"
+        )
         if handled:
             return ok, message
 
         try:
             # Create destination directory if needed
             if self.create_dirs:
-                destination.parent.mkdir(parents=True, exist_ok=True)
+                self._make_parent_dir(destination)
 
             # Copy the file
-            if self.preserve_metadata:
+            if self._copy_file_range(source, destination, source_stat):
+                if self.preserve_metadata:
+                    shutil.copystat(str(source), str(destination))
+                else:
+                    shutil.copymode(str(source), str(destination))
+            elif self.preserve_metadata:
                 shutil.copy2(str(source), str(destination))
             else:
                 shutil.copy(str(source), str(destination))
@@ -151,7 +302,7 @@ class FileOperations:
             return False, f"Copy failed: {e}"
 
     def ensure_unique_path(
-        self, path: Path, reserved: set[Path] | None = None
+        self, path: Path, reserved: Container[Path] | None = None
     ) -> Path:
         """
         Ensure the path is unique by adding suffix if needed.
@@ -161,7 +312,8 @@ class FileOperations:
 
         Args:
             path: Desired file path
-            reserved: Optional set of paths already reserved by planned operations
+            reserved: Optional paths already reserved by planned operations
+                (a set, or DestinationReservations)
 
         Returns:
             Unique path (may be same as input if already unique)
@@ -169,8 +321,9 @@ class FileOperations:
         Example:
             "photo.jpg" exists → "photo_001.jpg"
         """
-        reserved = reserved or set()
-        
+        if reserved is None:
+            reserved = ()
+
         if not path.exists() and path not in reserved:
             return path
 
@@ -251,6 +404,46 @@ class FileOperations:
             return False
 
 
+class DestinationReservations:
+    """
+    Destinations claimed by planned operations, grouped by folder.
+
+    Maps each reserved destination to the source that claimed it, so a
+    later operation can be compared against it. Also remembers which
+    destination folders do not exist yet: nothing in them can collide on
+    disk, so their files skip the per-file exists() stat (on a fresh
+    archive, that is nearly every file).
+    """
+
+    def __init__(self):
+        self._by_folder: dict[Path, dict[str, Path]] = {}
+        self._folder_exists: dict[Path, bool] = {}
+
+    def __contains__(self, path: Path) -> bool:
+        names = self._by_folder.get(path.parent)
+        return names is not None and path.name in names
+
+    def __len__(self) -> int:
+        return sum(len(names) for names in self._by_folder.values())
+
+    def exists_on_disk(self, path: Path) -> bool:
+        """Check whether a file already exists at path (folder checked once)."""
+        folder = path.parent
+        folder_exists = self._folder_exists.get(folder)
+        if folder_exists is None:
+            folder_exists = self._folder_exists[folder] = folder.is_dir()
+        return folder_exists and path.exists()
+
+    def reserve(self, path: Path, source: Path) -> None:
+        """Claim path for the operation copying/moving source."""
+        self._by_folder.setdefault(path.parent, {})[path.name] = source
+
+    def source_for(self, path: Path) -> Optional[Path]:
+        """Source of the operation that reserved path, if any."""
+        names = self._by_folder.get(path.parent)
+        return names.get(path.name) if names is not None else None
+
+
 class BatchOperations:
     """Execute multiple file operations with rollback support."""
 
@@ -274,50 +467,64 @@ class BatchOperations:
     def execute_moves(
         self,
         operations: list[tuple[Path, Path]],
+        workers: int = 1,
     ) -> tuple[int, int]:
         """
         Execute a batch of move operations.
 
         Args:
             operations: List of (source, destination) tuples
+            workers: Moves to run concurrently (1 = sequential, 0 = auto)
 
         Returns:
             Tuple of (success_count, failure_count)
         """
-        success_count = 0
-        failure_count = 0
-
-        for source, destination in operations:
-            success, message = self.file_ops.move_file(source, destination)
-
-            if success:
-                self._completed.append((source, destination))
-                success_count += 1
-            else:
-                self._failed.append((source, destination, message))
-                failure_count += 1
-
-        return success_count, failure_count
+        return self._execute(operations, self.file_ops.move_file, workers)
 
     def execute_copies(
         self,
         operations: list[tuple[Path, Path]],
+        workers: int = 1,
     ) -> tuple[int, int]:
         """
         Execute a batch of copy operations.
 
         Args:
             operations: List of (source, destination) tuples
+            workers: Copies to run concurrently (1 = sequential, 0 = auto)
 
         Returns:
             Tuple of (success_count, failure_count)
         """
+        return self._execute(operations, self.file_ops.copy_file, workers)
+
+    def _execute(
+        self,
+        operations: list[tuple[Path, Path]],
+        file_op: Callable[[Path, Path], tuple[bool, str]],
+        workers: int,
+    ) -> tuple[int, int]:
+        """
+        Run a file operation over a batch and track the outcomes.
+
+        Destinations are expected to be unique within the batch, so the
+        operations are independent and can overlap in a thread pool (the
+        work is I/O bound). Outcomes are recorded in operation order either way.
+        """
         success_count = 0
         failure_count = 0
 
-        for source, destination in operations:
-            success, message = self.file_ops.copy_file(source, destination)
+        if not self.dry_run:
+            self.file_ops.prepare_directories(destination for _, destination in operations)
+
+        if workers != 1 and len(operations) > 1:
+            # 0 = let the executor pick a thread count
+            with ThreadPoolExecutor(max_workers=workers or None) as executor:
+                results = list(executor.map(lambda op: file_op(*op), operations))
+        else:
+            results = [file_op(source, destination) for source, destination in operations]
 
+        for (source, destination), (success, message) in zip(operations, results):
             if success:
                 self._completed.append((source, destination))
                 success_count += 1
@@ -14,6 +14,12 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Compiled once; these run for every scanned file
+_SEPARATORS = re.compile(r"[-_./\s]")
+_WHITESPACE = re.compile(r"\s+")
+_NON_TAG_CHARS = re.compile(r"[^\w\-]")
+_FILENAME_PART_SEPARATORS = re.compile(r"[-_\s]+")
+
 
 class FolderTagger:
     """Detects and classifies folder names for potential use as file tags."""
@@ -31,6 +37,13 @@ class FolderTagger:
         re.compile(r"^\d{8}$"),                            # 20240315 (just date)
     ]
 
+    # All of the above as one alternation: one match call per folder name.
+    # IGNORECASE is harmless for the digit-only patterns.
+    CAMERA_FOLDER_PATTERN = re.compile(
+        "|".join(f"(?:{p.pattern})" for p in CAMERA_FOLDER_PATTERNS),
+        re.IGNORECASE,
+    )
+
     def __init__(
         self,
         ignore_list: Optional[list[str]] = None,
@@ -121,9 +134,8 @@ class FolderTagger:
             return False, "too_long"
 
         # Check for camera-generated patterns
-        for pattern in self.CAMERA_FOLDER_PATTERNS:
-            if pattern.match(folder_name):
-                return False, "camera_generated"
+        if self.CAMERA_FOLDER_PATTERN.match(folder_name):
+            return False, "camera_generated"
 
         # Check if it's just numbers or date-like
         if self._is_only_numbers_or_date(folder_name):
@@ -138,7 +150,7 @@ class FolderTagger:
     def _is_only_numbers_or_date(self, name: str) -> bool:
         """Check if the name is only numbers, possibly with separators."""
         # Remove common separators
-        cleaned = re.sub(r"[-_./\s]", "", name)
+        cleaned = _SEPARATORS.sub("", name)
         return cleaned.isdigit()
 
     def extract_tag(self, folder_path: Path) -> Optional[str]:
@@ -156,6 +168,21 @@ class FolderTagger:
         if folder_path.is_file():
             folder_path = folder_path.parent
 
+        return self.extract_tag_from_folder(folder_path)
+
+    def extract_tag_from_folder(self, folder_path: Path) -> Optional[str]:
+        """
+        Extract the best tag starting from a folder known to be a directory.
+
+        Same as extract_tag() without the is_file() check, for callers
+        (like the scanner) that already know the path is a folder.
+
+        Args:
+            folder_path: Folder to start from
+
+        Returns:
+            Meaningful folder name or None
+        """
         # Walk up the path (check up to 3 levels)
         current = folder_path
         for _ in range(3):
@@ -195,10 +222,10 @@ class FolderTagger:
         
         # Strip and replace spaces
         tag = folder_name.strip()
-        tag = re.sub(r"\s+", "_", tag)
+        tag = _WHITESPACE.sub("_", tag)
 
         # Remove special characters except underscore and hyphen
-        tag = re.sub(r"[^\w\-]", "", tag)
+        tag = _NON_TAG_CHARS.sub("", tag)
 
         # Remove leading/trailing underscores
         tag = tag.strip("_-")
@@ -244,7 +271,7 @@ class FolderTagger:
         # Check similarity with parts of the filename
         # Split filename into parts (by underscore, hyphen, space)
         filename_stem = Path(filename).stem
-        parts = re.split(r"[-_\s]+", filename_stem)
+        parts = _FILENAME_PART_SEPARATORS.split(filename_stem)
 
         for part in parts:
             if len(part) < 2:
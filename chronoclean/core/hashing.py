@@ -6,13 +6,27 @@ Provides streamed SHA-256 hashing to avoid loading large files into memory.
 import hashlib
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 logger = logging.getLogger(__name__)
 
 # Default chunk size for streaming hash computation (64KB)
 DEFAULT_CHUNK_SIZE = 65536
 
+# blake3 needs the optional 'blake3' package
+SUPPORTED_ALGORITHMS = ("sha256", "md5", "blake3")
+
+
+def _hasher_factory(algorithm: str) -> Callable[[], Any]:
+    """Return a constructor for a fresh hash object."""
+    if algorithm == "blake3":
+        try:
+            from blake3 import blake3
+        except ImportError:
+            raise ValueError("blake3 hashing requires the 'blake3' package (pip install blake3)")
+        return blake3
+    return lambda: hashlib.new(algorithm)
+
 
 def compute_file_hash(
     file_path: Path,
@@ -21,26 +35,38 @@ def compute_file_hash(
 ) -> Optional[str]:
     """Compute hash of a file using streamed reading.
     
+    On Python 3.11+ the file is fed through hashlib.file_digest(), which
+    reads into one reused buffer and hashes without holding the GIL.
+    Files of every size are read rather than mmap'ed: a source truncated
+    mid-hash (NAS, SD card) then raises a catchable OSError instead of
+    killing the process with SIGBUS.
+    
     Args:
         file_path: Path to the file to hash.
-        algorithm: Hash algorithm to use ('sha256', 'md5').
-        chunk_size: Size of chunks to read at a time.
+        algorithm: Hash algorithm to use ('sha256', 'md5', 'blake3').
+        chunk_size: Size of chunks to read at a time (Python 3.10 only;
+            file_digest manages its own buffer).
         
     Returns:
         Hexadecimal hash string, or None if file cannot be read.
         
     Raises:
-        ValueError: If algorithm is not supported.
+        ValueError: If algorithm is not supported (or blake3 is not installed).
     """
-    if algorithm not in ("sha256", "md5"):
-        raise ValueError(f"Unsupported hash algorithm: {algorithm}. Use 'sha256' or 'md5'.")
+    if algorithm not in SUPPORTED_ALGORITHMS:
+        raise ValueError(
+            f"Unsupported hash algorithm: {algorithm}. Use 'sha256', 'md5' or 'blake3'."
+        )
+    new_hasher = _hasher_factory(algorithm)
     
     try:
-        hasher = hashlib.new(algorithm)
-        
         with open(file_path, "rb") as f:
-            while chunk := f.read(chunk_size):
-                hasher.update(chunk)
+            if hasattr(hashlib, "file_digest"):
+                hasher = hashlib.file_digest(f, new_hasher)
+            else:
+                hasher = new_hasher()
+                while chunk := f.read(chunk_size):
+                    hasher.update(chunk)
         
         return hasher.hexdigest()
     
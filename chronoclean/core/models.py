@@ -1,10 +1,11 @@
 """Data models for ChronoClean."""
 
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 
 class DateSource(Enum):
@@ -29,7 +30,7 @@ class FileType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class FileRecord:
     """Represents a single file in the scan."""
 
@@ -129,7 +130,7 @@ class ScanResult:
     errors: list[tuple[Path, str]] = field(default_factory=list)
 
     # v0.3: Error categorization
-    errors_by_category: dict[str, int] = field(default_factory=dict)
+    errors_by_category: Counter[str] = field(default_factory=Counter)
 
     scan_duration_seconds: float = 0.0
     scan_timestamp: datetime = field(default_factory=datetime.now)
@@ -157,7 +158,7 @@ class ScanResult:
         self.errors.append((path, error))
         self.error_files += 1
         if category:
-            self.errors_by_category[category] = self.errors_by_category.get(category, 0) + 1
+            self.errors_by_category[category] += 1
 
     def add_skipped(self) -> None:
         """Record a skipped file."""
@@ -168,10 +169,10 @@ class ScanResult:
         
         Use for warnings/issues that don't prevent processing.
         """
-        self.errors_by_category[category] = self.errors_by_category.get(category, 0) + 1
+        self.errors_by_category[category] += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class MoveOperation:
     """Represents a single file move operation."""
 
@@ -179,6 +180,8 @@ class MoveOperation:
     destination: Path
     new_filename: Optional[str] = None
     reason: str = ""
+    # Source size from the scan, for cheap duplicate pre-checks
+    size_bytes: Optional[int] = None
 
     @property
     def destination_path(self) -> Path:
@@ -216,6 +219,10 @@ class OperationPlan:
         """Add a move operation to the plan."""
         self.moves.append(MoveOperation(source, destination, new_filename, reason))
 
+    def add_moves_bulk(self, moves: Iterable[MoveOperation]) -> None:
+        """Add many prebuilt move operations to the plan in one call."""
+        self.moves.extend(moves)
+
     def add_skip(self, path: Path, reason: str) -> None:
         """Add a skipped file to the plan."""
         self.skipped.append((path, reason))
@@ -3,20 +3,93 @@
 Auto-discovers apply run records from .chronoclean/runs/ directory.
 """
 
+import fnmatch
+import heapq
+import itertools
 import json
 import logging
+import os
+import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterable, Optional, TypeVar
 
 from chronoclean.config.schema import VerifyConfig
 from chronoclean.core.run_record import ApplyRunRecord, RunMode
-from chronoclean.core.run_record_writer import get_runs_dir, get_verifications_dir
+from chronoclean.core.run_record_writer import (
+    RECORD_INDEX_FILENAME,
+    RECORD_INDEX_VERSION,
+    get_runs_dir,
+    get_verifications_dir,
+)
 from chronoclean.core.verification import VerificationReport
+from chronoclean.utils.json_utils import read_json_header
 
 logger = logging.getLogger(__name__)
 
+# Record filenames start with their ID: created_at to the second, then a suffix
+_ID_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+_ID_TIMESTAMP = re.compile(r"\d{8}_\d{6}")
+
+SummaryT = TypeVar("SummaryT", "RunSummary", "VerificationSummary")
+
+
+def _scan_records(directory: Path, pattern: str) -> Optional[list[os.DirEntry]]:
+    """List the record files in directory matching pattern, in one scandir pass.
+
+    Names are filtered before any Path is built or any file is stat'ed.
+    Returns None if the directory does not exist.
+    """
+    try:
+        with os.scandir(directory) as it:
+            return [entry for entry in it if fnmatch.fnmatchcase(entry.name, pattern)]
+    except FileNotFoundError:
+        return None
+
+
+def _read_metadata(filepath: Path) -> dict:
+    """Read a record's top-level fields, without its entries where possible.
+
+    Records list "entries" last, so the header read stops before them. Older
+    files wrote "summary" after the entries; those are read in full.
+    """
+    data = read_json_header(filepath, "entries")
+    if "summary" not in data:
+        data = json.loads(filepath.read_text(encoding="utf-8"))
+    return data
+
+
+class _MetadataIndex:
+    """Record metadata from a directory's index file, read-only.
+
+    The index is written by run_record_writer whenever it writes a record;
+    discovery only reads it, so listing records never writes files. Entries
+    are keyed by file name and stamped with size and mtime_ns, so a record
+    changed or written elsewhere is read from the file instead. An
+    unreadable index is treated as empty.
+    """
+
+    def __init__(self, directory: Path):
+        self.path = directory / RECORD_INDEX_FILENAME
+        self._entries: dict[str, dict] = {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == RECORD_INDEX_VERSION:
+                self._entries = data["entries"]
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    def read(self, entry: os.DirEntry) -> dict:
+        """Return a record's metadata, from the index when still current."""
+        st = entry.stat()
+        stamp = [st.st_size, st.st_mtime_ns]
+        cached = self._entries.get(entry.name)
+        if isinstance(cached, dict) and cached.get("stamp") == stamp:
+            return cached["metadata"]
+        return _read_metadata(Path(entry.path))
+
 
 def _format_age(created_at: datetime) -> str:
     """Human-readable age from a timestamp."""
@@ -36,26 +109,75 @@ def _format_age(created_at: datetime) -> str:
     return "just now"
 
 
+def _resolve_filter(path_filter: Optional[Path]) -> Optional[str]:
+    """Resolve an optional path filter once, to a prefix string."""
+    return str(path_filter.resolve()) if path_filter else None
+
+
 def _passes_path_filters(
     source_root: str,
     destination_root: str,
-    source_filter: Optional[Path],
-    destination_filter: Optional[Path],
+    source_prefix: Optional[str],
+    destination_prefix: Optional[str],
 ) -> bool:
-    """Return True when source/destination roots match optional filters."""
-    if source_filter:
-        source_filter_str = str(source_filter.resolve())
-        if not source_root.startswith(source_filter_str):
-            return False
+    """Return True when source/destination roots match optional filter prefixes."""
+    if source_prefix and not source_root.startswith(source_prefix):
+        return False
 
-    if destination_filter:
-        dest_filter_str = str(destination_filter.resolve())
-        if not destination_root.startswith(dest_filter_str):
-            return False
+    if destination_prefix and not destination_root.startswith(destination_prefix):
+        return False
 
     return True
 
 
+def _collect_newest(
+    records: Iterable[os.DirEntry],
+    parse: Callable[[os.DirEntry], Optional[SummaryT]],
+    limit: int,
+) -> list[SummaryT]:
+    """Return the `limit` newest summaries, parsing as few files as possible.
+
+    Files are visited newest-first by the timestamp that starts their name
+    (created_at truncated to the second). Once `limit` summaries are held,
+    a file named for an earlier second than the oldest of them cannot be
+    newer, so the walk stops there. Files without a timestamped name are
+    always parsed.
+
+    Args:
+        records: Candidate record files.
+        parse: Returns a summary, or None for filtered/unreadable files.
+        limit: Maximum number of summaries to return.
+
+    Returns:
+        Summaries sorted by created_at descending (newest first).
+    """
+    if limit <= 0:
+        return []
+
+    def name_stamp(record: os.DirEntry) -> str:
+        stamp = record.name[:15]
+        # "~" sorts after digits, so unrecognized names come first
+        return stamp if _ID_TIMESTAMP.fullmatch(stamp) else "~"
+
+    newest: list[tuple[datetime, int, SummaryT]] = []  # min-heap on created_at
+    order = itertools.count()
+    for record in sorted(records, key=name_stamp, reverse=True):
+        if len(newest) == limit:
+            oldest_kept = newest[0][0].strftime(_ID_TIMESTAMP_FORMAT)
+            if name_stamp(record) < oldest_kept:
+                break
+        summary = parse(record)
+        if summary is None:
+            continue
+        entry = (summary.created_at, next(order), summary)
+        if len(newest) < limit:
+            heapq.heappush(newest, entry)
+        elif entry[0] > newest[0][0]:
+            heapq.heapreplace(newest, entry)
+
+    return [summary for _, _, summary in sorted(newest, key=lambda e: e[0], reverse=True)]
+
+
 @dataclass
 class RunSummary:
     """Summary of a discovered run record for display."""
@@ -69,9 +191,9 @@ class RunSummary:
     total_files: int
     is_dry_run: bool
     
-    @property
+    @cached_property
     def age_description(self) -> str:
-        """Human-readable age of the run."""
+        """Human-readable age of the run (computed once, when first shown)."""
         return _format_age(self.created_at)
     
     @property
@@ -101,9 +223,9 @@ class VerificationSummary:
     missing_count: int
     total: int
     
-    @property
+    @cached_property
     def age_description(self) -> str:
-        """Human-readable age of the verification."""
+        """Human-readable age of the verification (computed once, when first shown)."""
         return _format_age(self.created_at)
     
     @property
@@ -132,33 +254,36 @@ def discover_run_records(
         List of RunSummary sorted by created_at descending (newest first).
     """
     runs_dir = get_runs_dir(verify_config)
+    records = _scan_records(runs_dir, "*_apply*.json")
     
-    if not runs_dir.exists():
+    if records is None:
         return []
     
-    summaries = []
+    source_prefix = _resolve_filter(source_filter)
+    destination_prefix = _resolve_filter(destination_filter)
+    index = _MetadataIndex(runs_dir)
     
-    for filepath in runs_dir.glob("*_apply*.json"):
+    def parse(record: os.DirEntry) -> Optional[RunSummary]:
+        filepath = Path(record.path)
         try:
-            content = filepath.read_text(encoding="utf-8")
-            data = json.loads(content)
+            data = index.read(record)
             
             mode = RunMode(data.get("mode", "dry_run"))
             is_dry_run = mode == RunMode.DRY_RUN
             
             # Filter dry runs
             if is_dry_run and not include_dry_runs:
-                continue
+                return None
             
             source_root = data.get("source_root", "")
             destination_root = data.get("destination_root", "")
             
-            if not _passes_path_filters(source_root, destination_root, source_filter, destination_filter):
-                continue
+            if not _passes_path_filters(source_root, destination_root, source_prefix, destination_prefix):
+                return None
             
             summary_data = data.get("summary", {})
             
-            summary = RunSummary(
+            return RunSummary(
                 run_id=data.get("run_id", ""),
                 filepath=filepath,
                 created_at=datetime.fromisoformat(data["created_at"]),
@@ -168,16 +293,12 @@ def discover_run_records(
                 total_files=summary_data.get("total_files", 0),
                 is_dry_run=is_dry_run,
             )
-            summaries.append(summary)
             
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Could not parse run record {filepath}: {e}")
-            continue
-    
-    # Sort by created_at descending (newest first)
-    summaries.sort(key=lambda s: s.created_at, reverse=True)
+            return None
     
-    return summaries[:limit]
+    return _collect_newest(records, parse, limit)
 
 
 def discover_verification_reports(
@@ -198,26 +319,29 @@ def discover_verification_reports(
         List of VerificationSummary sorted by created_at descending (newest first).
     """
     verifications_dir = get_verifications_dir(verify_config)
+    records = _scan_records(verifications_dir, "*_verify.json")
     
-    if not verifications_dir.exists():
+    if records is None:
         return []
     
-    summaries = []
+    source_prefix = _resolve_filter(source_filter)
+    destination_prefix = _resolve_filter(destination_filter)
+    index = _MetadataIndex(verifications_dir)
     
-    for filepath in verifications_dir.glob("*_verify.json"):
+    def parse(record: os.DirEntry) -> Optional[VerificationSummary]:
+        filepath = Path(record.path)
         try:
-            content = filepath.read_text(encoding="utf-8")
-            data = json.loads(content)
+            data = index.read(record)
             
             source_root = data.get("source_root", "")
             destination_root = data.get("destination_root", "")
             
-            if not _passes_path_filters(source_root, destination_root, source_filter, destination_filter):
-                continue
+            if not _passes_path_filters(source_root, destination_root, source_prefix, destination_prefix):
+                return None
             
             summary_data = data.get("summary", {})
             
-            summary = VerificationSummary(
+            return VerificationSummary(
                 verify_id=data.get("verify_id", ""),
                 filepath=filepath,
                 created_at=datetime.fromisoformat(data["created_at"]),
@@ -229,16 +353,12 @@ def discover_verification_reports(
                 missing_count=summary_data.get("missing_destination", 0) + summary_data.get("missing_source", 0),
                 total=summary_data.get("total", 0),
             )
-            summaries.append(summary)
             
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Could not parse verification report {filepath}: {e}")
-            continue
+            return None
     
-    # Sort by created_at descending (newest first)
-    summaries.sort(key=lambda s: s.created_at, reverse=True)
-    
-    return summaries[:limit]
+    return _collect_newest(records, parse, limit)
 
 
 def load_run_record(filepath: Path) -> ApplyRunRecord:
@@ -275,6 +395,27 @@ def load_verification_report(filepath: Path) -> VerificationReport:
     return VerificationReport.from_json(content)
 
 
+def load_verification_header(filepath: Path) -> VerificationReport:
+    """Load a verification report's metadata and summary, without its entries.
+    
+    Enough to decide whether a report is worth loading in full, e.g. to
+    reject one verified without a content hash before reading its entries.
+    
+    Args:
+        filepath: Path to the verification report JSON file.
+        
+    Returns:
+        VerificationReport instance with an empty entries list.
+        
+    Raises:
+        FileNotFoundError: If file doesn't exist.
+        json.JSONDecodeError: If file is not valid JSON.
+    """
+    data = _read_metadata(filepath)
+    data.pop("entries", None)
+    return VerificationReport.from_dict(data)
+
+
 def find_run_by_id(
     verify_config: VerifyConfig,
     run_id: str,
@@ -302,8 +443,8 @@ def find_run_by_id(
     # Fall back to searching all files
     for filepath in runs_dir.glob("*_apply*.json"):
         try:
-            content = filepath.read_text(encoding="utf-8")
-            data = json.loads(content)
+            # The ID precedes the entries in every record
+            data = read_json_header(filepath, "entries")
             if data.get("run_id") == run_id:
                 return filepath
         except (json.JSONDecodeError, KeyError):
@@ -338,8 +479,8 @@ def find_verification_by_id(
     # Fall back to searching all files
     for filepath in verifications_dir.glob("*_verify.json"):
         try:
-            content = filepath.read_text(encoding="utf-8")
-            data = json.loads(content)
+            # The ID precedes the entries in every record
+            data = read_json_header(filepath, "entries")
             if data.get("verify_id") == verify_id:
                 return filepath
         except (json.JSONDecodeError, KeyError):
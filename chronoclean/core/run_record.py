@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from chronoclean.utils.json_utils import JsonSerializable
 
@@ -127,7 +127,6 @@ class ApplyRunRecord(JsonSerializable):
             "destination_root": self.destination_root,
             "mode": self.mode.value,
             "config_signature": self.config_signature.to_dict(),
-            "entries": [e.to_dict() for e in self.entries],
             "summary": {
                 "total_files": self.total_files,
                 "copied_files": self.copied_files,
@@ -136,6 +135,8 @@ class ApplyRunRecord(JsonSerializable):
                 "error_files": self.error_files,
                 "duration_seconds": self.duration_seconds,
             },
+            # Last, so discovery can read the metadata above without it
+            "entries": [e.to_dict() for e in self.entries],
         }
     
     @classmethod
@@ -175,15 +176,41 @@ class ApplyRunRecord(JsonSerializable):
             )
         )
         
-        # Update summary counts
+        self._update_counts(operation, 1)
+    
+    def add_entries(
+        self,
+        rows: Iterable[tuple[Path, Optional[Path], Optional[str]]],
+        operation: OperationType,
+    ) -> None:
+        """Add many entries of one operation type to the run record.
+        
+        Args:
+            rows: (source, destination, reason) tuples.
+            operation: Operation type shared by all rows.
+        """
+        new_entries = [
+            RunEntry(
+                source_path=str(source.resolve()),
+                destination_path=str(destination.resolve()) if destination else None,
+                operation=operation,
+                reason=reason,
+            )
+            for source, destination, reason in rows
+        ]
+        self.entries.extend(new_entries)
+        self._update_counts(operation, len(new_entries))
+    
+    def _update_counts(self, operation: OperationType, count: int) -> None:
+        """Update summary counts for entries just added."""
         if operation == OperationType.COPY:
-            self.copied_files += 1
+            self.copied_files += count
         elif operation == OperationType.MOVE:
-            self.moved_files += 1
+            self.moved_files += count
         elif operation == OperationType.SKIP:
-            self.skipped_files += 1
+            self.skipped_files += count
         
-        self.total_files += 1
+        self.total_files += count
     
     @property
     def copy_entries(self) -> list[RunEntry]:
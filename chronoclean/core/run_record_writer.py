@@ -5,9 +5,11 @@ Handles writing apply run records to the .chronoclean/runs/ directory.
 
 import json
 import logging
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Iterable, Optional
 
 from chronoclean.config.schema import ChronoCleanConfig, VerifyConfig
 from chronoclean.core.run_record import (
@@ -18,9 +20,17 @@ from chronoclean.core.run_record import (
     generate_run_id,
     get_run_filename,
 )
+from chronoclean.core.verification import VerificationReport, get_verification_filename
+from chronoclean.utils.json_utils import WRITE_BUFFER_SIZE, write_atomic, write_json_atomic
 
 logger = logging.getLogger(__name__)
 
+# Per-directory index of record metadata, kept up to date by the writers
+# below so discovery can list records without opening them (dot-prefixed,
+# so record globs skip it)
+RECORD_INDEX_FILENAME = ".index.json"
+RECORD_INDEX_VERSION = 1
+
 
 def get_state_dir(verify_config: VerifyConfig) -> Path:
     """Get the state directory path (resolved from CWD).
@@ -86,6 +96,37 @@ def ensure_verifications_dir(verify_config: VerifyConfig) -> Path:
     return verifications_dir
 
 
+def _index_record(filepath: Path, metadata: dict[str, Any]) -> None:
+    """Add a just-written record's metadata to its directory's index.
+    
+    Entries are stamped with the record's size and mtime_ns, so discovery
+    ignores any that no longer match the file; records deleted since the
+    last write are dropped. A failed update is not fatal: discovery then
+    reads the record itself.
+    
+    Args:
+        filepath: The record file just written.
+        metadata: The record's top-level fields, without its entries.
+    """
+    index_path = filepath.parent / RECORD_INDEX_FILENAME
+    try:
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            entries = dict(data["entries"]) if data.get("version") == RECORD_INDEX_VERSION else {}
+        except (FileNotFoundError, ValueError, KeyError, TypeError, AttributeError):
+            # Missing, corrupt or outdated: rebuilt from this record on
+            entries = {}
+        present = set(os.listdir(filepath.parent))
+        entries = {name: entry for name, entry in entries.items() if name in present}
+        st = filepath.stat()
+        entries[filepath.name] = {"stamp": [st.st_size, st.st_mtime_ns], "metadata": metadata}
+        write_json_atomic(
+            index_path, {"version": RECORD_INDEX_VERSION, "entries": entries}, pretty=False
+        )
+    except OSError as e:
+        logger.warning(f"Could not update record index {index_path}: {e}")
+
+
 def create_config_signature(config: ChronoCleanConfig) -> ConfigSignature:
     """Extract config signature from full config.
     
@@ -164,13 +205,64 @@ def write_run_record(
     filename = get_run_filename(run_record.run_id, run_record.mode)
     filepath = runs_dir / filename
     
-    json_content = run_record.to_json(pretty=True)
-    filepath.write_text(json_content, encoding="utf-8")
+    data = run_record.to_dict()
+    write_json_atomic(filepath, data, pretty=True)
+    data.pop("entries", None)
+    _index_record(filepath, data)
     
     logger.info(f"Run record written to: {filepath}")
     return filepath
 
 
+def open_verification_spool(verify_config: VerifyConfig) -> BinaryIO:
+    """Open an anonymous file for VerificationReport.spool_entries().
+    
+    The file lives in the verifications directory, next to the report it
+    will be copied into, and is deleted when closed.
+    
+    Args:
+        verify_config: Verify configuration.
+        
+    Returns:
+        Binary file open for reading and writing.
+    """
+    return tempfile.TemporaryFile(
+        dir=ensure_verifications_dir(verify_config),
+        buffering=WRITE_BUFFER_SIZE,
+    )
+
+
+def write_verification_report(
+    report: VerificationReport,
+    verify_config: VerifyConfig,
+    pretty: bool = True,
+) -> Path:
+    """Write a verification report to disk.
+    
+    A spooled report is detached from its spool afterwards (see
+    VerificationReport.detach_spool), so it stays readable once the spool
+    is closed.
+    
+    Args:
+        report: The verification report to write.
+        verify_config: Verify configuration.
+        pretty: Indent the JSON for readability.
+        
+    Returns:
+        Path to the written file.
+    """
+    verifications_dir = ensure_verifications_dir(verify_config)
+    filepath = verifications_dir / get_verification_filename(report.verify_id)
+    
+    # Streamed entry by entry: large reports are never held as one string
+    write_atomic(filepath, lambda fp: report.dump(fp, pretty=pretty))
+    _index_record(filepath, report.metadata_dict())
+    report.detach_spool(filepath)
+    
+    logger.info(f"Verification report written to: {filepath}")
+    return filepath
+
+
 def load_run_record(filepath: Path) -> ApplyRunRecord:
     """Load a run record from disk.
     
@@ -281,6 +373,27 @@ class RunRecordWriter:
         """Record a skipped file."""
         self.run_record.add_entry(source, None, OperationType.SKIP, reason)
     
+    def add_copies(self, operations: Iterable[tuple[Path, Path]]) -> None:
+        """Record many copy operations at once."""
+        self.run_record.add_entries(
+            ((source, destination, None) for source, destination in operations),
+            OperationType.COPY,
+        )
+    
+    def add_moves(self, operations: Iterable[tuple[Path, Path]]) -> None:
+        """Record many move operations at once."""
+        self.run_record.add_entries(
+            ((source, destination, None) for source, destination in operations),
+            OperationType.MOVE,
+        )
+    
+    def add_skips(self, skipped: Iterable[tuple[Path, str]]) -> None:
+        """Record many skipped files at once."""
+        self.run_record.add_entries(
+            ((source, None, reason) for source, reason in skipped),
+            OperationType.SKIP,
+        )
+    
     def add_error(self) -> None:
         """Increment error count."""
         self.run_record.error_files += 1
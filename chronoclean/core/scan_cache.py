@@ -0,0 +1,172 @@
+"""Persistent scan cache for ChronoClean.
+
+Stores built FileRecords in a small SQLite database so unchanged files skip
+metadata extraction on later scans. An entry is reused only when the file's
+path, mtime and size match and it was built under the same settings
+fingerprint (the record-building config sections, tag rules and ChronoClean
+version). Records are
+stored as JSON rows (the scan snapshot format), never as pickles, so a
+tampered database can at worst cause cache misses.
+
+File location: performance.cache_location (default .chronoclean/cache.db)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+from dataclasses import asdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, Optional, Protocol
+
+from chronoclean import __version__
+from chronoclean.core.models import FileRecord
+from chronoclean.core.scan_snapshot import record_to_row, row_to_record
+
+if TYPE_CHECKING:
+    from chronoclean.config.schema import ChronoCleanConfig
+    from chronoclean.core.tag_rules_store import TagRules
+
+logger = logging.getLogger(__name__)
+
+# Config sections that decide how a FileRecord is built. The rest
+# (performance, verify, output, ...) can change without invalidating records.
+RECORD_CONFIG_SECTIONS = (
+    "scan",
+    "sorting",
+    "renaming",
+    "folder_tags",
+    "filename_date",
+    "date_mismatch",
+    "video_metadata",
+)
+
+
+def compute_settings_fingerprint(
+    cfg: "ChronoCleanConfig",
+    tag_rules: Optional["TagRules"] = None,
+    effective: Optional[Mapping[str, Any]] = None,
+) -> str:
+    """
+    Fingerprint everything that influences how a FileRecord is built.
+
+    Args:
+        cfg: ChronoClean configuration
+        tag_rules: Tag rules in effect (timestamps are ignored)
+        effective: Reader settings actually in use where they can differ
+            from cfg (CLI overrides such as --fast, the resolved EXIF backend)
+
+    Returns:
+        Hex digest identifying the settings
+    """
+    sections = {name: asdict(getattr(cfg, name)) for name in RECORD_CONFIG_SECTIONS}
+    # The file count cap does not change what a record contains
+    sections["scan"].pop("limit", None)
+    parts = [__version__, repr(sections)]
+    if effective is not None:
+        parts.append(repr(sorted(effective.items())))
+    if tag_rules is not None:
+        parts.append(repr((sorted(tag_rules.use), sorted(tag_rules.ignore),
+                           sorted(tag_rules.aliases.items()))))
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class RecordCache(Protocol):
+    """Source of previously built records the scanner can reuse.
+
+    The scanner stats each file once, before building its record, and
+    passes that stat to both calls: a file that changes while being read
+    is stored under its old mtime/size and misses next time.
+    """
+
+    def get(self, file_path: Path, file_stat: os.stat_result) -> Optional[FileRecord]:
+        """Return the record for an unchanged file, or None."""
+
+    def put(self, file_path: Path, file_stat: os.stat_result, record: FileRecord) -> None:
+        """Remember a freshly built record."""
+
+
+class ScanCache:
+    """SQLite-backed FileRecord cache keyed by (path, mtime, size)."""
+
+    def __init__(self, db_path: Path, fingerprint: str):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            db_path: Location of the SQLite file
+            fingerprint: Settings fingerprint entries must match
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened
+        """
+        self.db_path = Path(db_path)
+        self.fingerprint = fingerprint
+        self.hits = 0
+        self.misses = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS scan_cache ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, "
+            "fingerprint TEXT, record BLOB)"
+        )
+
+    def get(self, file_path: Path, file_stat: os.stat_result) -> Optional[FileRecord]:
+        """
+        Return the cached record for a file if it is still valid.
+
+        Args:
+            file_path: Path to the file
+            file_stat: The file's current stat
+
+        Returns:
+            Cached FileRecord, or None on a miss, stale or undecodable entry
+        """
+        row = self._conn.execute(
+            "SELECT record FROM scan_cache "
+            "WHERE path = ? AND mtime_ns = ? AND size = ? AND fingerprint = ?",
+            (str(file_path), file_stat.st_mtime_ns, file_stat.st_size, self.fingerprint),
+        ).fetchone()
+
+        if row is not None:
+            try:
+                record = row_to_record(json.loads(row[0]))
+            except Exception as e:
+                logger.debug(f"Discarding unreadable cache entry for {file_path}: {e}")
+            else:
+                self.hits += 1
+                return record
+
+        self.misses += 1
+        return None
+
+    def put(self, file_path: Path, file_stat: os.stat_result, record: FileRecord) -> None:
+        """
+        Store (or replace) the record for a file.
+
+        Args:
+            file_path: Path to the file
+            file_stat: The file's stat taken before the record was built
+            record: Record built for the file
+        """
+        row = record_to_row(record, file_stat.st_mtime_ns)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO scan_cache "
+            "(path, mtime_ns, size, fingerprint, record) VALUES (?, ?, ?, ?, ?)",
+            (str(file_path), file_stat.st_mtime_ns, file_stat.st_size, self.fingerprint,
+             json.dumps(row, ensure_ascii=False)),
+        )
+
+    def close(self) -> None:
+        """Commit pending entries and close the database."""
+        self._conn.commit()
+        self._conn.close()
+
+    def __enter__(self) -> "ScanCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,255 @@
+"""Scan snapshots for ChronoClean.
+
+`scan --save-scan` writes the records of a scan to a JSON Lines file so a
+following `apply --from-scan` can reuse them instead of reading every file's
+metadata again. apply still walks the source itself; the snapshot is only
+a record lookup, so files added since (or left out by `scan --limit`) are
+scanned rather than skipped. Each entry carries the file's mtime and size as stat'ed
+before its record was built (see SnapshotRecorder); entries whose file
+changed (or disappeared) since then are rescanned.
+
+Format: one header object, then one object per record.
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+
+from chronoclean import __version__
+from chronoclean.core.models import DateSource, FileRecord, FileType, ScanResult
+
+if TYPE_CHECKING:
+    from chronoclean.core.scan_cache import RecordCache
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = "chronoclean-scan"
+SNAPSHOT_FORMAT_VERSION = 1
+
+
+class ScanSnapshotError(Exception):
+    """Scan snapshot cannot be read or is not a snapshot."""
+
+    pass
+
+
+def _iso(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+def _from_iso(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def record_to_row(record: FileRecord, mtime_ns: int) -> dict[str, Any]:
+    """Serialize the scan-time fields of a record (also used by the scan cache)."""
+    return {
+        "path": str(record.source_path),
+        "mtime_ns": mtime_ns,
+        "size": record.size_bytes,
+        "file_type": record.file_type.value,
+        "detected_date": _iso(record.detected_date),
+        "date_source": record.date_source.value,
+        "source_folder_name": record.source_folder_name,
+        "folder_tags": record.folder_tags,
+        "folder_tag_reasons": record.folder_tag_reasons,
+        "has_exif": record.has_exif,
+        "exif_error": record.exif_error,
+        "filename_date": _iso(record.filename_date),
+        "date_mismatch": record.date_mismatch,
+        "date_mismatch_days": record.date_mismatch_days,
+        "video_metadata_date": _iso(record.video_metadata_date),
+        "error_category": record.error_category,
+    }
+
+
+def row_to_record(row: dict[str, Any]) -> FileRecord:
+    """Rebuild a record from a row made by record_to_row."""
+    return FileRecord(
+        source_path=Path(row["path"]),
+        file_type=FileType(row["file_type"]),
+        size_bytes=row["size"],
+        detected_date=_from_iso(row.get("detected_date")),
+        date_source=DateSource(row.get("date_source", "unknown")),
+        source_folder_name=row.get("source_folder_name"),
+        folder_tags=list(row.get("folder_tags", [])),
+        folder_tag_reasons=list(row.get("folder_tag_reasons", [])),
+        has_exif=row.get("has_exif", False),
+        exif_error=row.get("exif_error"),
+        filename_date=_from_iso(row.get("filename_date")),
+        date_mismatch=row.get("date_mismatch", False),
+        date_mismatch_days=row.get("date_mismatch_days"),
+        video_metadata_date=_from_iso(row.get("video_metadata_date")),
+        error_category=row.get("error_category"),
+    )
+
+
+class SnapshotRecorder:
+    """
+    Record cache wrapper noting the stat each record was built under.
+
+    Handed to the scanner (around the scan cache, if any) so the snapshot
+    stores each file's mtime/size from before its record was built; a file
+    changed afterwards then misses on `apply --from-scan` instead of
+    pairing its new stat with the old record.
+    """
+
+    def __init__(self, cache: Optional["RecordCache"] = None):
+        self.cache = cache
+        # (mtime_ns, size) per file, as passed to get() by the scanner
+        self.stats: dict[Path, tuple[int, int]] = {}
+
+    def get(self, file_path: Path, file_stat: os.stat_result) -> Optional[FileRecord]:
+        """Note the file's stat and look it up in the wrapped cache."""
+        self.stats[file_path] = (file_stat.st_mtime_ns, file_stat.st_size)
+        if self.cache is None:
+            return None
+        return self.cache.get(file_path, file_stat)
+
+    def put(self, file_path: Path, file_stat: os.stat_result, record: FileRecord) -> None:
+        """Pass a freshly built record on to the wrapped cache."""
+        if self.cache is not None:
+            self.cache.put(file_path, file_stat, record)
+
+
+def save_scan_snapshot(
+    path: Path,
+    result: ScanResult,
+    build_stats: Mapping[Path, tuple[int, int]],
+    *,
+    fingerprint: str,
+    recursive: bool,
+    include_videos: bool,
+) -> int:
+    """
+    Write the records of a scan to a snapshot file.
+
+    Args:
+        path: Snapshot file to write
+        result: Completed scan result
+        build_stats: (mtime_ns, size) of each file before its record was
+            built (SnapshotRecorder.stats)
+        fingerprint: Settings fingerprint the records were built under
+        recursive: Whether the scan included subfolders
+        include_videos: Whether the scan included videos
+
+    Returns:
+        Number of records written (records without a pre-build stat, or
+        whose size differs from it, are left out)
+    """
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "chronoclean_version": __version__,
+        "created_at": datetime.now().isoformat(),
+        "source_root": str(Path(result.source_root).resolve()),
+        "fingerprint": fingerprint,
+        "recursive": recursive,
+        "include_videos": include_videos,
+    }
+
+    written = 0
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(header) + "\n")
+        for record in result.files:
+            stat_key = build_stats.get(record.source_path)
+            # A size mismatch means the file changed while it was being read
+            if stat_key is None or stat_key[1] != record.size_bytes:
+                continue
+            f.write(json.dumps(record_to_row(record, stat_key[0]), ensure_ascii=False) + "\n")
+            written += 1
+
+    logger.info(f"Scan snapshot written to {path} ({written} records)")
+    return written
+
+
+class ScanSnapshot:
+    """
+    Records loaded from a snapshot file.
+
+    Acts as a record cache for the scanner: get() returns the saved record
+    only while the file's mtime and size still match the snapshot.
+    """
+
+    def __init__(self, header: dict[str, Any], rows: dict[Path, tuple[int, int, FileRecord]]):
+        self.source_root = Path(header["source_root"])
+        self.fingerprint: str = header["fingerprint"]
+        self.recursive: bool = header.get("recursive", True)
+        self.include_videos: bool = header.get("include_videos", True)
+        self._rows = rows
+        self.hits = 0
+        self.misses = 0
+
+    def matches(self, fingerprint: str, recursive: bool, include_videos: bool) -> bool:
+        """Check whether the snapshot was taken with the given settings."""
+        return (
+            self.fingerprint == fingerprint
+            and self.recursive == recursive
+            and self.include_videos == include_videos
+        )
+
+    def get(self, file_path: Path, file_stat: os.stat_result) -> Optional[FileRecord]:
+        """
+        Return the saved record if the file is unchanged since the snapshot.
+
+        Args:
+            file_path: Path to the file
+            file_stat: The file's current stat
+
+        Returns:
+            Saved FileRecord, or None if the file changed or is unknown
+        """
+        row = self._rows.get(file_path)
+        if row is not None:
+            mtime_ns, size, record = row
+            if file_stat.st_mtime_ns == mtime_ns and file_stat.st_size == size:
+                self.hits += 1
+                return record
+
+        self.misses += 1
+        return None
+
+    def put(self, file_path: Path, file_stat: os.stat_result, record: FileRecord) -> None:
+        """Snapshots are read-only; rescanned records are not written back."""
+
+
+def load_scan_snapshot(path: Path) -> ScanSnapshot:
+    """
+    Load a snapshot written by save_scan_snapshot.
+
+    Args:
+        path: Snapshot file
+
+    Returns:
+        Loaded ScanSnapshot
+
+    Raises:
+        ScanSnapshotError: If the file is missing, unreadable or malformed
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            header = json.loads(f.readline() or "null")
+            if not isinstance(header, dict) or header.get("format") != SNAPSHOT_FORMAT:
+                raise ScanSnapshotError(f"Not a ChronoClean scan snapshot: {path}")
+            if header.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+                raise ScanSnapshotError(
+                    f"Unsupported scan snapshot version {header.get('format_version')} in {path}"
+                )
+
+            rows: dict[Path, tuple[int, int, FileRecord]] = {}
+            for line in f:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                record = row_to_record(row)
+                rows[record.source_path] = (row["mtime_ns"], row["size"], record)
+    except OSError as e:
+        raise ScanSnapshotError(f"Cannot read scan snapshot {path}: {e}")
+    except (json.JSONDecodeError, KeyError, ValueError, TypeError) as e:
+        raise ScanSnapshotError(f"Invalid scan snapshot {path}: {e}")
+
+    return ScanSnapshot(header, rows)
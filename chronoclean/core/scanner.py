@@ -1,14 +1,21 @@
 """Directory scanner for ChronoClean."""
 
 import logging
+import multiprocessing
+import os
+import stat
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional
 
 from chronoclean.core.date_inference import DateInferenceEngine
 from chronoclean.core.exif_reader import ExifReader
 from chronoclean.core.folder_tagger import FolderTagger
 from chronoclean.core.models import DateSource, FileRecord, FileType, ScanResult
+from chronoclean.core.scan_cache import RecordCache
 from chronoclean.utils.constants import (
     IMAGE_EXTENSIONS as DEFAULT_IMAGE_EXTENSIONS,
     RAW_EXTENSIONS as DEFAULT_RAW_EXTENSIONS,
@@ -17,6 +24,51 @@ from chronoclean.utils.constants import (
 
 logger = logging.getLogger(__name__)
 
+# Bounds on the files handed to a worker process per task in parallel scans
+PARALLEL_CHUNK_SIZE_MIN = 8
+PARALLEL_CHUNK_SIZE_MAX = 256
+
+# Files kept in flight per thread in threaded scans (bounds memory and open files)
+THREAD_PREFETCH = 4
+
+# Start method for scan worker processes. Spawn, not the Linux default fork:
+# the CLI scans while rich's refresh thread runs, and spawn pickles the
+# scanner (via __getstate__, dropping the cache connection) instead of
+# copying the parent's memory into each worker
+WORKER_CONTEXT = multiprocessing.get_context("spawn")
+
+# Threads listing upcoming directories during the walk; readdir is syscall
+# bound, so these overlap without contending for the GIL (one per 2 CPUs)
+LISTING_WORKERS = max(1, (os.cpu_count() or 2) // 2)
+
+# (record, error message, error category) for one scanned file
+ScanOutcome = tuple[Optional[FileRecord], Optional[str], Optional[str]]
+
+# Scanner copy owned by each worker process of a parallel scan
+_worker_scanner: Optional["Scanner"] = None
+
+
+def _init_worker(scanner: "Scanner") -> None:
+    """Install the pickled scanner in a freshly started worker process."""
+    global _worker_scanner
+    _worker_scanner = scanner
+
+
+def _process_in_worker(file_path: Path) -> ScanOutcome:
+    """Top-level (picklable) entry point for parallel record building."""
+    return _worker_scanner._process_one(file_path)
+
+
+def _parallel_chunk_size(file_count: int, workers: int) -> int:
+    """
+    Pick how many files each worker task builds.
+
+    Aims for about four tasks per worker so the pool stays balanced, while
+    large libraries get big chunks that amortize the pickling round trip.
+    """
+    chunk = file_count // (workers * 4)
+    return max(PARALLEL_CHUNK_SIZE_MIN, min(PARALLEL_CHUNK_SIZE_MAX, chunk))
+
 
 class Scanner:
     """Scans directories and builds file records."""
@@ -31,15 +83,16 @@ class Scanner:
         exif_reader: Optional[ExifReader] = None,
         date_engine: Optional[DateInferenceEngine] = None,
         folder_tagger: Optional[FolderTagger] = None,
-        image_extensions: Optional[set[str]] = None,
-        video_extensions: Optional[set[str]] = None,
-        raw_extensions: Optional[set[str]] = None,
+        image_extensions: Optional[frozenset[str] | set[str]] = None,
+        video_extensions: Optional[frozenset[str] | set[str]] = None,
+        raw_extensions: Optional[frozenset[str] | set[str]] = None,
         include_videos: bool = True,
         include_raw: bool = True,
         recursive: bool = True,
         ignore_hidden: bool = True,
         date_mismatch_enabled: bool = True,
         date_mismatch_threshold_days: int = 1,
+        cache: Optional[RecordCache] = None,
     ):
         """
         Initialize the scanner.
@@ -57,6 +110,8 @@ class Scanner:
             ignore_hidden: Whether to skip hidden files/folders
             date_mismatch_enabled: Whether to detect date mismatches between filename and EXIF
             date_mismatch_threshold_days: Minimum difference in days to flag as mismatch
+            cache: Optional source of previously built records (scan cache
+                or a loaded scan snapshot)
         """
         self.exif_reader = exif_reader or ExifReader()
         self.date_engine = date_engine or DateInferenceEngine(exif_reader=self.exif_reader)
@@ -72,86 +127,116 @@ class Scanner:
         self.ignore_hidden = ignore_hidden
         self.date_mismatch_enabled = date_mismatch_enabled
         self.date_mismatch_threshold_days = date_mismatch_threshold_days
+        self.cache = cache
 
-    @property
-    def supported_extensions(self) -> set[str]:
-        """Get all supported file extensions."""
+        # Built once: _iter_files checks every walked file against it.
+        self._supported_extensions = self._build_supported_extensions()
+
+    def _build_supported_extensions(self) -> frozenset[str]:
+        """Combine the enabled extension sets into one frozenset."""
         extensions = set(self.image_extensions)
         if self.include_videos:
             extensions |= self.video_extensions
         if self.include_raw:
             extensions |= self.raw_extensions
-        return extensions
+        return frozenset(extensions)
+
+    @property
+    def supported_extensions(self) -> frozenset[str]:
+        """Get all supported file extensions."""
+        return self._supported_extensions
+
+    def __getstate__(self) -> dict:
+        # The cache connection stays in the parent; workers only build records.
+        state = self.__dict__.copy()
+        state["cache"] = None
+        return state
 
     def scan(
         self,
         source_path: Path,
         limit: Optional[int] = None,
+        jobs: int = 1,
+        threads: int = 1,
     ) -> ScanResult:
         """
         Scan a directory and return results.
 
         Args:
             source_path: Directory to scan
-            limit: Optional limit on number of files (for debugging)
+            limit: Optional cap on files taken from the walk, errors included
+                (for debugging)
+            jobs: Worker processes for per-file metadata extraction
+                (1 = in-process, 0 = one per CPU)
+            threads: Threads reading metadata concurrently when jobs is 1
+                (1 = serial, 0 = auto)
 
         Returns:
             ScanResult with all file records
         """
-        source_path = Path(source_path).resolve()
+        result = ScanResult(source_root=Path(source_path).resolve())
+        records = self.iter_scan(
+            source_path, limit=limit, jobs=jobs, threads=threads, result=result
+        )
+        for _ in records:
+            pass
+        return result
+
+    def iter_scan(
+        self,
+        source_path: Path,
+        limit: Optional[int] = None,
+        jobs: int = 1,
+        result: Optional[ScanResult] = None,
+        files: Optional[Iterable[Path]] = None,
+        threads: int = 1,
+    ) -> Iterator[FileRecord]:
+        """
+        Scan a directory, yielding each record as soon as it is built.
 
-        if not source_path.exists():
-            raise FileNotFoundError(f"Source path not found: {source_path}")
+        Lets callers tally or plan while metadata is still being read.
+        Records, errors and counters are also accumulated into ``result``,
+        which is finalized (folder tags, duration) once iteration completes.
 
-        if not source_path.is_dir():
-            raise NotADirectoryError(f"Source path is not a directory: {source_path}")
+        Args:
+            source_path: Directory to scan
+            limit: Optional cap on files taken from the walk, errors included
+                (for debugging)
+            jobs: Worker processes for per-file metadata extraction
+                (1 = in-process, 0 = one per CPU)
+            result: ScanResult to fill (a private one is used if omitted)
+            files: Files to process instead of walking source_path (e.g. the
+                entries of a saved scan snapshot)
+            threads: Threads reading metadata concurrently when jobs is 1
+                (1 = serial, 0 = auto)
+
+        Yields:
+            FileRecord for each successfully processed file, in walk order
+
+        Raises:
+            FileNotFoundError: If source_path does not exist
+            NotADirectoryError: If source_path is not a directory
+        """
+        source_path = self._resolve_source(source_path)
 
         logger.info(f"Scanning {source_path}")
         start_time = time.time()
 
-        result = ScanResult(source_root=source_path)
+        if result is None:
+            result = ScanResult(source_root=source_path)
         folder_tags_seen: set[str] = set()
-        file_count = 0
 
-        for file_path in self._iter_files(source_path):
-            result.total_files += 1
-
-            # Check limit
-            if limit and file_count >= limit:
-                logger.info(f"Reached scan limit of {limit} files")
-                break
+        paths = self._iter_files(source_path) if files is None else iter(files)
+        if jobs != 1:
+            outcomes = self._iter_parallel(paths, limit, jobs, result)
+        elif threads != 1:
+            outcomes = self._iter_threaded(paths, limit, threads, result)
+        else:
+            outcomes = self._iter_serial(paths, limit, result)
 
-            try:
-                record = self._build_file_record(file_path)
-                result.add_file(record)
-                file_count += 1
-
-                # Track folder tags
-                if record.folder_tag:
-                    folder_tags_seen.add(record.folder_tag)
-
-                # v0.3: Track error categories from records
-                # Only count the specific error category, not also "no_date_found"
-                # error_category is set for no_exif_date, no_video_metadata, etc.
-                if record.error_category:
-                    result.increment_error_category(record.error_category)
-                elif record.date_source == DateSource.UNKNOWN:
-                    # Fallback for files without a specific error category
-                    result.increment_error_category("no_date_found")
-                
-                # v0.2: Track date mismatches
-                if record.date_mismatch:
-                    result.increment_error_category("date_mismatch")
-
-            except PermissionError as e:
-                logger.error(f"Permission denied for {file_path}: {e}")
-                result.add_error(file_path, str(e), category="file_access_error")
-            except OSError as e:
-                logger.error(f"OS error processing {file_path}: {e}")
-                result.add_error(file_path, str(e), category="file_access_error")
-            except Exception as e:
-                logger.error(f"Error processing {file_path}: {e}")
-                result.add_error(file_path, str(e))
+        for file_path, outcome in outcomes:
+            if self._collect_outcome(result, folder_tags_seen, file_path, outcome):
+                yield outcome[0]
 
         # Finalize result
         result.folder_tags_detected = sorted(folder_tags_seen)
@@ -163,7 +248,284 @@ class Scanner:
             f"in {result.scan_duration_seconds:.2f}s"
         )
 
-        return result
+    def iter_folder_tags(
+        self,
+        source_path: Path,
+        limit: Optional[int] = None,
+    ) -> Iterator[tuple[Path, str, list[str]]]:
+        """
+        Walk a directory yielding only what folder tagging needs.
+
+        No dates or other metadata are read and files are not stat'ed, so
+        this is far cheaper than scan() when only folder tags matter (e.g.
+        ``tags list``). Each folder is classified once for all its files.
+
+        Args:
+            source_path: Directory to scan
+            limit: Optional limit on number of files (for debugging)
+
+        Yields:
+            (file path, parent folder name, folder tags) for each matching
+            file, in walk order; the tags are those scan() would record
+
+        Raises:
+            FileNotFoundError: If source_path does not exist
+            NotADirectoryError: If source_path is not a directory
+        """
+        source_path = self._resolve_source(source_path)
+        is_tag_in_filename = self.folder_tagger.is_tag_in_filename
+        last_folder = None
+        tag = None
+
+        for file_count, file_path in enumerate(self._iter_files(source_path)):
+            if limit and file_count >= limit:
+                logger.info(f"Reached scan limit of {limit} files")
+                break
+
+            # The walk yields a directory's files together
+            folder = file_path.parent
+            if folder != last_folder:
+                last_folder = folder
+                tag = self._folder_tag(folder)[0]
+
+            if tag and not is_tag_in_filename(file_path.name, tag):
+                yield file_path, folder.name, [tag]
+            else:
+                yield file_path, folder.name, []
+
+    @staticmethod
+    def _resolve_source(source_path: Path) -> Path:
+        """
+        Resolve a scan root, checking that it is an existing directory.
+
+        Raises:
+            FileNotFoundError: If source_path does not exist
+            NotADirectoryError: If source_path is not a directory
+        """
+        source_path = Path(source_path).resolve()
+
+        try:
+            is_dir = stat.S_ISDIR(os.stat(source_path).st_mode)
+        except (OSError, ValueError):
+            raise FileNotFoundError(f"Source path not found: {source_path}") from None
+
+        if not is_dir:
+            raise NotADirectoryError(f"Source path is not a directory: {source_path}")
+
+        return source_path
+
+    def _iter_serial(
+        self,
+        paths: Iterator[Path],
+        limit: Optional[int],
+        result: ScanResult,
+    ) -> Iterator[tuple[Path, ScanOutcome]]:
+        """
+        Build outcomes one file at a time in this process.
+
+        As in every mode, a limit caps the files taken from the walk
+        (errors included), not the records built.
+        """
+        for file_path in islice(paths, limit or None):
+            result.total_files += 1
+            outcome, file_stat = self._lookup_cached(file_path)
+            if outcome is None:
+                outcome = self._process_one(file_path)
+                self._store_cached(file_path, file_stat, outcome)
+            yield file_path, outcome
+
+    def _iter_parallel(
+        self,
+        paths: Iterator[Path],
+        limit: Optional[int],
+        jobs: int,
+        result: ScanResult,
+    ) -> Iterator[tuple[Path, ScanOutcome]]:
+        """
+        Build outcomes across a process pool.
+
+        The file list is walked up front; with a limit, only the first
+        ``limit`` files found are dispatched. Outcomes are yielded in walk
+        order so the output matches a serial scan. Cache hits are resolved
+        in this process and never dispatched.
+        """
+        paths = list(islice(paths, limit or None))
+        result.total_files = len(paths)
+        workers = jobs if jobs > 0 else (os.cpu_count() or 1)
+
+        cached: dict[Path, ScanOutcome] = {}
+        stats: dict[Path, Optional[os.stat_result]] = {}
+        for file_path in paths:
+            outcome, stats[file_path] = self._lookup_cached(file_path)
+            if outcome is not None:
+                cached[file_path] = outcome
+        misses = [p for p in paths if p not in cached]
+        if not misses:
+            for file_path in paths:
+                yield file_path, cached[file_path]
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=WORKER_CONTEXT,
+            initializer=_init_worker,
+            initargs=(self,),
+        ) as executor:
+            built = executor.map(
+                _process_in_worker,
+                misses,
+                chunksize=_parallel_chunk_size(len(misses), workers),
+            )
+            for file_path in paths:
+                outcome = cached.get(file_path)
+                if outcome is None:
+                    # misses are dispatched in walk order, so results line up
+                    outcome = next(built)
+                    self._store_cached(file_path, stats[file_path], outcome)
+                yield file_path, outcome
+
+    def _iter_threaded(
+        self,
+        paths: Iterator[Path],
+        limit: Optional[int],
+        threads: int,
+        result: ScanResult,
+    ) -> Iterator[tuple[Path, ScanOutcome]]:
+        """
+        Build outcomes on a thread pool in this process.
+
+        Metadata reads mostly wait on storage, so threads overlap them without
+        the start-up and pickling cost of worker processes. The walk stays
+        lazy: at most THREAD_PREFETCH files per thread are in flight. As with
+        process pools, a limit caps the files dispatched, and outcomes are
+        yielded in walk order. Cache lookups and stores stay in this thread.
+        """
+        workers = threads if threads > 0 else min(32, (os.cpu_count() or 1) * 2)
+        window = workers * THREAD_PREFETCH
+        pending: deque[
+            tuple[Path, Optional[os.stat_result], Optional[ScanOutcome], Optional[Future]]
+        ] = deque()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for file_path in islice(paths, limit or None):
+                result.total_files += 1
+                outcome, file_stat = self._lookup_cached(file_path)
+                future = None
+                if outcome is None:
+                    future = executor.submit(self._process_one, file_path)
+                pending.append((file_path, file_stat, outcome, future))
+                if len(pending) >= window:
+                    yield self._finish_pending(*pending.popleft())
+            while pending:
+                yield self._finish_pending(*pending.popleft())
+
+    def _finish_pending(
+        self,
+        file_path: Path,
+        file_stat: Optional[os.stat_result],
+        outcome: Optional[ScanOutcome],
+        future: Optional[Future],
+    ) -> tuple[Path, ScanOutcome]:
+        """Wait for a threaded build (if any) and cache its outcome."""
+        if future is not None:
+            outcome = future.result()
+            self._store_cached(file_path, file_stat, outcome)
+        return file_path, outcome
+
+    def _lookup_cached(
+        self, file_path: Path
+    ) -> tuple[Optional[ScanOutcome], Optional[os.stat_result]]:
+        """
+        Return a cached outcome for an unchanged file, if any.
+
+        The file is stat'ed here, once, before any record is built; the
+        same stat must go to _store_cached so a file that changes while
+        being read is stored under its old mtime/size.
+
+        Returns:
+            Tuple of (cached outcome or None, stat or None without a cache
+            or if the file cannot be stat'ed)
+        """
+        if self.cache is None:
+            return None, None
+        try:
+            file_stat = os.stat(file_path)
+        except OSError:
+            return None, None
+        record = self.cache.get(file_path, file_stat)
+        return ((record, None, None) if record is not None else None), file_stat
+
+    def _store_cached(
+        self,
+        file_path: Path,
+        file_stat: Optional[os.stat_result],
+        outcome: ScanOutcome,
+    ) -> None:
+        """Remember a successfully built record under its pre-build stat."""
+        record = outcome[0]
+        if file_stat is not None and record is not None:
+            self.cache.put(file_path, file_stat, record)
+
+    def _process_one(self, file_path: Path) -> ScanOutcome:
+        """
+        Build the record for one file, capturing failures instead of raising.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            Tuple of (record, error message, error category); record is None on failure
+        """
+        try:
+            return self._build_file_record(file_path), None, None
+        except PermissionError as e:
+            logger.error(f"Permission denied for {file_path}: {e}")
+            return None, str(e), "file_access_error"
+        except OSError as e:
+            logger.error(f"OS error processing {file_path}: {e}")
+            return None, str(e), "file_access_error"
+        except Exception as e:
+            logger.error(f"Error processing {file_path}: {e}")
+            return None, str(e), None
+
+    @staticmethod
+    def _collect_outcome(
+        result: ScanResult,
+        folder_tags_seen: set[str],
+        file_path: Path,
+        outcome: ScanOutcome,
+    ) -> bool:
+        """
+        Add one file's outcome to the scan result.
+
+        Returns:
+            True if a record was added, False if the file errored
+        """
+        record, error, category = outcome
+        if record is None:
+            result.add_error(file_path, error or "", category=category)
+            return False
+
+        result.add_file(record)
+
+        # Track folder tags
+        if record.folder_tag:
+            folder_tags_seen.add(record.folder_tag)
+
+        # v0.3: Track error categories from records
+        # Only count the specific error category, not also "no_date_found"
+        # error_category is set for no_exif_date, no_video_metadata, etc.
+        if record.error_category:
+            result.increment_error_category(record.error_category)
+        elif record.date_source == DateSource.UNKNOWN:
+            # Fallback for files without a specific error category
+            result.increment_error_category("no_date_found")
+
+        # v0.2: Track date mismatches
+        if record.date_mismatch:
+            result.increment_error_category("date_mismatch")
+
+        return True
 
     def _iter_files(self, source_path: Path) -> Iterator[Path]:
         """
@@ -175,24 +537,90 @@ class Scanner:
         Yields:
             Path objects for matching files
         """
-        pattern = "**/*" if self.recursive else "*"
+        # Explicit stack of directories. While the caller processes one
+        # directory's files, background threads list the (up to
+        # LISTING_WORKERS) directories that will be popped next, so readdir
+        # latency overlaps the EXIF work. The pool is only started once
+        # there is a subdirectory to list: flat and non-recursive scans
+        # never create it.
+        stack = [os.fspath(source_path)]
+        listings: dict[str, Future] = {}
+        lister: Optional[ThreadPoolExecutor] = None
+        try:
+            while stack:
+                directory = stack.pop()
+                listing = listings.pop(directory, None)
+                try:
+                    if listing is not None:
+                        files, subdirs = listing.result()
+                    else:
+                        files, subdirs = self._list_directory(directory)
+                except OSError as e:
+                    logger.warning(f"Cannot read directory {directory}: {e}")
+                    files, subdirs = [], []
+
+                # Reversed so subdirectories are visited in listing order
+                stack.extend(reversed(subdirs))
+                if stack:
+                    if lister is None:
+                        lister = ThreadPoolExecutor(
+                            max_workers=LISTING_WORKERS, thread_name_prefix="scan-listdir"
+                        )
+                    # The next pops come from the top of the stack
+                    for upcoming in reversed(stack[-LISTING_WORKERS:]):
+                        if upcoming not in listings:
+                            listings[upcoming] = lister.submit(self._list_directory, upcoming)
+
+                for file_path in files:
+                    yield Path(file_path)
+        finally:
+            if lister is not None:
+                lister.shutdown(cancel_futures=True)
+
+    def _list_directory(self, directory: str) -> tuple[list[str], list[str]]:
+        """
+        List one directory's matching files and subdirectories to descend into.
+
+        DirEntry type checks come from the directory listing itself, so no
+        per-entry stat is needed.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Tuple of (matching file paths, subdirectory paths)
 
-        for path in source_path.glob(pattern):
-            # Skip directories
-            if path.is_dir():
-                continue
+        Raises:
+            OSError: If the directory cannot be read
+        """
+        supported_extensions = self._supported_extensions
+        ignore_hidden = self.ignore_hidden
+        files = []
+        subdirs = []
+
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Skip hidden files/folders
+                if ignore_hidden and entry.name.startswith("."):
+                    continue
 
-            # Skip hidden files/folders
-            if self.ignore_hidden:
-                if any(part.startswith(".") for part in path.parts):
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self.recursive:
+                            subdirs.append(entry.path)
+                        continue
+                    # Extension first: is_file() can cost a stat
+                    # (symlinks, filesystems without d_type), so
+                    # non-media files never pay for it
+                    ext = os.path.splitext(entry.name)[1].lower()
+                    if ext not in supported_extensions or not entry.is_file():
+                        continue
+                except OSError:
                     continue
 
-            # Check extension
-            ext = path.suffix.lower()
-            if ext not in self.supported_extensions:
-                continue
+                files.append(entry.path)
 
-            yield path
+        return files, subdirs
 
     def _classify_file_type(self, path: Path) -> FileType:
         """
@@ -227,18 +655,23 @@ class Scanner:
         """
         # Basic info
         file_type = self._classify_file_type(file_path)
-        size_bytes = file_path.stat().st_size
+        # One stat per file: size here, mtime for the filesystem date fallback
+        file_stat = file_path.stat()
+        folder = file_path.parent
+        folder_name = folder.name
 
         # Create record
         record = FileRecord(
             source_path=file_path,
             file_type=file_type,
-            size_bytes=size_bytes,
-            source_folder_name=file_path.parent.name,
+            size_bytes=file_stat.st_size,
+            source_folder_name=folder_name,
         )
 
         # Get date (pass file_type to route to correct metadata reader)
-        detected_date, date_source = self.date_engine.infer_date(file_path, file_type)
+        detected_date, date_source = self.date_engine.infer_date(
+            file_path, file_type, file_stat=file_stat
+        )
         record.detected_date = detected_date
         record.date_source = date_source
         record.has_exif = date_source == DateSource.EXIF
@@ -254,12 +687,20 @@ class Scanner:
 
         # v0.3: Extract video metadata date for video files
         if file_type == FileType.VIDEO:
-            video_date = self.date_engine.get_video_metadata_date(file_path)
-            if video_date:
-                record.video_metadata_date = video_date
+            if date_source == DateSource.VIDEO_METADATA:
+                # infer_date already ran the metadata probe; don't spawn it again
+                record.video_metadata_date = detected_date
+            else:
+                video_date = self.date_engine.get_video_metadata_date(file_path)
+                if video_date:
+                    record.video_metadata_date = video_date
 
         # v0.2: Extract filename date (always extract for comparison)
-        filename_date = self.date_engine.get_filename_date(file_path)
+        if date_source == DateSource.FILENAME:
+            # infer_date already parsed the filename
+            filename_date = detected_date
+        else:
+            filename_date = self.date_engine.get_filename_date(file_path)
         if filename_date:
             record.filename_date = filename_date
             
@@ -272,25 +713,36 @@ class Scanner:
                     record.date_mismatch_days = delta
 
         # v0.3.4: Get folder tag (array-based for multi-tag support)
-        folder_name = file_path.parent.name
-        record.source_folder_name = folder_name
-        usable, reason = self.folder_tagger.classify_folder(folder_name)
-        if usable:
-            tag = self.folder_tagger.extract_tag(file_path)
-            if tag:
-                # Check if tag is already in filename
-                tag_usable = not self.folder_tagger.is_tag_in_filename(
-                    file_path.name, tag
-                )
-                if tag_usable:
-                    record.folder_tags.append(tag)
-                    record.folder_tag_reasons.append(reason)
-                else:
-                    # Tag exists in filename, don't add but record reason
-                    record.folder_tag_reasons.append("already_in_filename")
+        tag, reason = self._folder_tag(folder)
+        if tag:
+            # Check if tag is already in filename
+            tag_usable = not self.folder_tagger.is_tag_in_filename(
+                file_path.name, tag
+            )
+            if tag_usable:
+                record.folder_tags.append(tag)
+                record.folder_tag_reasons.append(reason)
+            else:
+                # Tag exists in filename, don't add but record reason
+                record.folder_tag_reasons.append("already_in_filename")
 
         return record
 
+    def _folder_tag(self, folder: Path) -> tuple[Optional[str], str]:
+        """
+        Get the tag a folder gives its files, before the filename check.
+
+        Args:
+            folder: Parent folder of the files
+
+        Returns:
+            Tuple of (tag or None if the folder is not usable, classification reason)
+        """
+        usable, reason = self.folder_tagger.classify_folder(folder.name)
+        if not usable:
+            return None, reason
+        return self.folder_tagger.extract_tag_from_folder(folder), reason
+
 
 def scan_directory(
     source_path: Path,
@@ -2,6 +2,7 @@
 
 import logging
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +19,13 @@ class Sorter:
         "YYYY/MM/DD": "{year}/{month:02d}/{day:02d}",
     }
 
+    # Date fields each structure depends on (dates sharing them share a folder)
+    _DATE_KEYS = {
+        "YYYY": attrgetter("year"),
+        "YYYY/MM": attrgetter("year", "month"),
+        "YYYY/MM/DD": attrgetter("year", "month", "day"),
+    }
+
     def __init__(
         self,
         destination_root: Path,
@@ -39,6 +47,12 @@ class Sorter:
             )
             self.folder_structure = "YYYY/MM"
 
+        # Resolved once; folders are memoized per distinct date key
+        self._template = self.STRUCTURES[self.folder_structure]
+        self._date_key = self._DATE_KEYS[self.folder_structure]
+        self._folders: dict[object, Path] = {}
+        self._relative_folders: dict[object, str] = {}
+
     def compute_destination_folder(self, date: datetime) -> Path:
         """
         Compute the destination folder for a given date.
@@ -53,13 +67,32 @@ class Sorter:
             date=2024-03-15, structure="YYYY/MM"
             → destination_root / "2024" / "03"
         """
-        template = self.STRUCTURES[self.folder_structure]
-        folder_path = template.format(
-            year=date.year,
-            month=date.month,
-            day=date.day,
-        )
-        return self.destination_root / folder_path
+        key = self._date_key(date)
+        folder = self._folders.get(key)
+        if folder is None:
+            folder_path = self._template.format(
+                year=date.year,
+                month=date.month,
+                day=date.day,
+            )
+            folder = self._folders[key] = self.destination_root / folder_path
+        return folder
+
+    def compute_destinations_batch(self, dates: list[datetime]) -> list[Path]:
+        """
+        Compute destination folders for many dates at once.
+
+        Each distinct folder is formatted and joined only once; dates that
+        map to the same folder share the same Path object.
+
+        Args:
+            dates: Dates to compute folders for
+
+        Returns:
+            Destination folders, in the same order as dates
+        """
+        compute = self.compute_destination_folder
+        return [compute(date) for date in dates]
 
     def compute_full_destination(
         self,
@@ -104,12 +137,14 @@ class Sorter:
         Returns:
             Relative path string like "2024/03/photo.jpg"
         """
-        template = self.STRUCTURES[self.folder_structure]
-        folder_path = template.format(
-            year=date.year,
-            month=date.month,
-            day=date.day,
-        )
+        key = self._date_key(date)
+        folder_path = self._relative_folders.get(key)
+        if folder_path is None:
+            folder_path = self._relative_folders[key] = self._template.format(
+                year=date.year,
+                month=date.month,
+                day=date.day,
+            )
         return f"{folder_path}/{filename}"
 
 
@@ -55,6 +55,13 @@ class TagRulesStore:
         
         self.rules_path = rules_path
         self._rules: Optional[TagRules] = None
+        # should_use() runs once per scanned file: the use/ignore lists are
+        # compiled into sets once, rebuilt only when the rules are saved
+        self._rule_sets: Optional[tuple[frozenset[str], frozenset[str]]] = None
+        # Same for the force/ignore lists of the last config passed in
+        self._config_sets: Optional[
+            tuple[FolderTagsConfig, frozenset[str], frozenset[str]]
+        ] = None
     
     @property
     def rules(self) -> TagRules:
@@ -63,6 +70,23 @@ class TagRulesStore:
             self._rules = self.load()
         return self._rules
     
+    def _compiled_rules(self) -> tuple[frozenset[str], frozenset[str]]:
+        """Get the rules' (use, ignore) folder names as sets."""
+        if self._rule_sets is None:
+            rules = self.rules
+            self._rule_sets = (frozenset(rules.use), frozenset(rules.ignore))
+        return self._rule_sets
+    
+    def _compiled_config(self, config: FolderTagsConfig) -> tuple[frozenset[str], frozenset[str]]:
+        """Get the config's (force, ignore) folder names as sets."""
+        if self._config_sets is None or self._config_sets[0] is not config:
+            self._config_sets = (
+                config,
+                frozenset(config.force_list),
+                frozenset(config.ignore_list),
+            )
+        return self._config_sets[1:]
+    
     def load(self) -> TagRules:
         """
         Load tag rules from disk.
@@ -96,6 +120,8 @@ class TagRulesStore:
         """
         if rules is None:
             rules = self.rules
+        # add_use() and friends edit the lists in place before saving
+        self._rule_sets = None
         
         # Update timestamp
         rules.updated_at = datetime.now(timezone.utc).isoformat()
@@ -206,18 +232,19 @@ class TagRulesStore:
             2. Config force_list/ignore_list
             3. None (defer to heuristics)
         """
-        rules = self.rules
+        use, ignore = self._compiled_rules()
         
         # Priority 1: Tag rules file
-        if folder_name in rules.use:
+        if folder_name in use:
             return True
-        if folder_name in rules.ignore:
+        if folder_name in ignore:
             return False
         
         # Priority 2: Config lists
-        if folder_name in config.force_list:
+        force_list, ignore_list = self._compiled_config(config)
+        if folder_name in force_list:
             return True
-        if folder_name in config.ignore_list:
+        if folder_name in ignore_list:
             return False
         
         # Priority 3: Defer to heuristics
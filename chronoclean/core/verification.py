@@ -3,13 +3,22 @@
 Defines the Verification Report schema for tracking verification results.
 """
 
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Iterator, Optional
 
-from chronoclean.utils.json_utils import JsonSerializable
+from chronoclean.utils.json_utils import (
+    JsonSerializable,
+    dump_json_items,
+    dumps_json_bytes,
+    loads_json,
+)
+
+# Algorithms that hash full file content (verifications eligible for cleanup)
+CONTENT_HASH_ALGORITHMS = ("sha256", "blake3")
 
 
 class VerificationStatus(Enum):
@@ -55,6 +64,7 @@ class VerifyEntry:
     source_hash: Optional[str] = None
     destination_hash: Optional[str] = None
     error: Optional[str] = None
+    source_size: Optional[int] = None  # Bytes, as stat'ed during verification
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -68,6 +78,7 @@ class VerifyEntry:
             "source_hash": self.source_hash,
             "destination_hash": self.destination_hash,
             "error": self.error,
+            "source_size": self.source_size,
         }
     
     @classmethod
@@ -83,17 +94,19 @@ class VerifyEntry:
             source_hash=data.get("source_hash"),
             destination_hash=data.get("destination_hash"),
             error=data.get("error"),
+            source_size=data.get("source_size"),
         )
     
     @property
     def is_cleanup_eligible(self) -> bool:
         """Check if this entry is eligible for cleanup.
         
-        Only OK and OK_EXISTING_DUPLICATE statuses with sha256 are eligible.
+        Only OK and OK_EXISTING_DUPLICATE statuses with a content hash
+        (sha256 or blake3) are eligible.
         """
         return (
             self.status in (VerificationStatus.OK, VerificationStatus.OK_EXISTING_DUPLICATE)
-            and self.hash_algorithm == "sha256"
+            and self.hash_algorithm in CONTENT_HASH_ALGORITHMS
         )
 
 
@@ -147,7 +160,11 @@ class VerificationSummary:
 class VerificationReport(JsonSerializable):
     """Complete verification report.
     
-    Contains all verification results for a set of files.
+    Contains all verification results for a set of files. After
+    spool_entries(), added entries go to a JSON Lines file instead of
+    `entries`; iter_entries() and the serializers read both. Once the
+    report is written, detach_spool() hands the spooled entries over to
+    the written file, so the spool may be closed.
     """
     
     verify_id: str
@@ -160,9 +177,79 @@ class VerificationReport(JsonSerializable):
     entries: list[VerifyEntry] = field(default_factory=list)
     summary: VerificationSummary = field(default_factory=VerificationSummary)
     duration_seconds: float = 0.0
+    # Binary file receiving added entries as JSON Lines (see spool_entries)
+    _spool: Optional[BinaryIO] = field(default=None, init=False, repr=False, compare=False)
+    # Written report holding the spooled entries, and how many in-memory
+    # entries precede them in it (see detach_spool)
+    _spooled_in: Optional[tuple[Path, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
+        # Entries last, so discovery can read the metadata without them
+        return {**self.metadata_dict(), "entries": list(self._iter_entry_dicts())}
+    
+    def dump(self, fp: BinaryIO, pretty: bool = True) -> None:
+        """Write the report as JSON to a binary stream, one entry at a time.
+        
+        Same document as to_json(), without building the entry dicts or the
+        encoded text for the whole report at once.
+        """
+        dump_json_items(
+            fp, self.metadata_dict(), "entries", self._iter_entry_dicts(), pretty=pretty
+        )
+    
+    def spool_entries(self, fp: BinaryIO) -> None:
+        """Write entries added from now on to fp rather than keeping them.
+        
+        fp must be open for reading and writing (e.g. a TemporaryFile); each
+        entry becomes one JSON line, so memory no longer grows with the
+        number of files verified.
+        """
+        self._spool = fp
+    
+    def detach_spool(self, report_path: Path) -> None:
+        """Stop reading spooled entries from the spool file.
+        
+        Call once the report has been written to report_path: spooled
+        entries are read back from there afterwards, so the spool file can
+        be closed. Entries added later are kept in memory.
+        """
+        if self._spool is None:
+            return
+        self._spool = None
+        self._spooled_in = (report_path, len(self.entries))
+    
+    def iter_entries(self) -> Iterator[VerifyEntry]:
+        """Yield all entries in order, including spooled ones."""
+        yield from self.entries
+        for data in self._iter_spooled():
+            yield VerifyEntry.from_dict(data)
+    
+    def _iter_entry_dicts(self) -> Iterator[dict[str, Any]]:
+        """Yield every entry as a dict, spooled ones without a round trip."""
+        for entry in self.entries:
+            yield entry.to_dict()
+        yield from self._iter_spooled()
+    
+    def _iter_spooled(self) -> Iterator[dict[str, Any]]:
+        """Read the spooled entries back, leaving the file ready to append."""
+        if self._spool is None:
+            if self._spooled_in is not None:
+                report_path, skip = self._spooled_in
+                yield from loads_json(report_path.read_bytes())["entries"][skip:]
+            return
+        self._spool.flush()
+        self._spool.seek(0)
+        try:
+            for line in self._spool:
+                yield loads_json(line)
+        finally:
+            self._spool.seek(0, os.SEEK_END)
+    
+    def metadata_dict(self) -> dict[str, Any]:
+        """Everything in to_dict() except the entries."""
         return {
             "verify_id": self.verify_id,
             "created_at": self.created_at.isoformat(),
@@ -171,7 +258,6 @@ class VerificationReport(JsonSerializable):
             "input_source": self.input_source.value,
             "run_id": self.run_id,
             "hash_algorithm": self.hash_algorithm,
-            "entries": [e.to_dict() for e in self.entries],
             "summary": self.summary.to_dict(),
             "duration_seconds": self.duration_seconds,
         }
@@ -194,7 +280,10 @@ class VerificationReport(JsonSerializable):
     
     def add_entry(self, entry: VerifyEntry) -> None:
         """Add an entry and update summary counts."""
-        self.entries.append(entry)
+        if self._spool is not None:
+            self._spool.write(dumps_json_bytes(entry.to_dict(), pretty=False) + b"\n")
+        else:
+            self.entries.append(entry)
         self.summary.total += 1
         
         # Update status-specific counts
@@ -216,13 +305,13 @@ class VerificationReport(JsonSerializable):
     @property
     def cleanup_eligible_entries(self) -> list[VerifyEntry]:
         """Get entries eligible for cleanup."""
-        return [e for e in self.entries if e.is_cleanup_eligible]
+        return [e for e in self.iter_entries() if e.is_cleanup_eligible]
     
     @property
     def ok_entries(self) -> list[VerifyEntry]:
         """Get all OK entries (both ok and ok_existing_duplicate)."""
         return [
-            e for e in self.entries
+            e for e in self.iter_entries()
             if e.status in (VerificationStatus.OK, VerificationStatus.OK_EXISTING_DUPLICATE)
         ]
 
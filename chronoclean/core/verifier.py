@@ -4,13 +4,17 @@ Handles hash-based verification of copy operations.
 """
 
 import logging
+import multiprocessing
+import os
 import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Iterator, Optional
 
 from chronoclean.config.schema import VerifyConfig
-from chronoclean.core.hashing import compute_file_hash, compare_file_hashes, hash_matches_any
+from chronoclean.core.hashing import compute_file_hash
 from chronoclean.core.run_record import ApplyRunRecord, OperationType
 from chronoclean.core.verification import (
     InputSource,
@@ -20,9 +24,43 @@ from chronoclean.core.verification import (
     VerifyEntry,
     generate_verify_id,
 )
+from chronoclean.utils.deps import is_blake3_available
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on file pairs handed to a worker process per task
+VERIFY_CHUNK_SIZE_MAX = 32
+
+# Start method for hashing worker processes: spawn rather than fork, since
+# the CLI verifies while rich's progress thread is running
+WORKER_CONTEXT = multiprocessing.get_context("spawn")
+
+# Threads issuing stats concurrently in quick mode; stat latency, not CPU,
+# bounds it on network destinations (the GIL is released during the call)
+QUICK_VERIFY_THREADS = 32
+
+# Pairs kept in flight per quick-mode thread (bounds queued futures)
+QUICK_VERIFY_PREFETCH = 4
+
+# Hash cache key: device, inode, size, mtime_ns. Hard links and repeated
+# sources share an entry; a changed file misses.
+HashKey = tuple[object, int, int, int]
+
+# Verifier copy owned by each worker process of a parallel verification
+_worker_verifier: Optional["Verifier"] = None
+
+
+def _init_worker(verifier: "Verifier") -> None:
+    """Install the pickled verifier in a freshly started worker process."""
+    global _worker_verifier
+    _worker_verifier = verifier
+
+
+def _verify_pair_in_worker(task: tuple[Path, Optional[Path], Optional[Path]]) -> VerifyEntry:
+    """Verify one (source, expected destination, search root) task in a worker."""
+    return _worker_verifier._verify_pair(*task)
+
+
 
 class Verifier:
     """Verifies copy operations by comparing source and destination hashes."""
@@ -35,25 +73,43 @@ class Verifier:
         """Initialize the verifier.
         
         Args:
-            algorithm: Hash algorithm to use ('sha256' or 'quick').
+            algorithm: Hash algorithm to use ('sha256', 'blake3' or 'quick').
             content_search_on_reconstruct: Enable content search for reconstruction mode.
         """
-        if algorithm not in ("sha256", "quick"):
-            raise ValueError(f"Unsupported algorithm: {algorithm}. Use 'sha256' or 'quick'.")
+        if algorithm not in ("sha256", "blake3", "quick"):
+            raise ValueError(
+                f"Unsupported algorithm: {algorithm}. Use 'sha256', 'blake3' or 'quick'."
+            )
+        if algorithm == "blake3" and not is_blake3_available():
+            raise ValueError("blake3 verification requires the 'blake3' package (pip install blake3)")
         
         self.algorithm = algorithm
         self.content_search_on_reconstruct = content_search_on_reconstruct
+        # In-process only: None in worker copies (see __getstate__)
+        self._hash_cache: Optional[dict[HashKey, str]] = {}
+    
+    def __getstate__(self) -> dict:
+        # Worker processes hash without a cache: each would fill a private
+        # copy that is thrown away with the pool, so the parent's stays here
+        state = self.__dict__.copy()
+        state["_hash_cache"] = None
+        return state
     
     def verify_from_run_record(
         self,
         run_record: ApplyRunRecord,
         progress_callback: Optional[callable] = None,
+        jobs: int = 1,
+        spool: Optional[BinaryIO] = None,
     ) -> VerificationReport:
         """Verify operations from an apply run record.
         
         Args:
             run_record: The run record to verify.
             progress_callback: Optional callback(current, total) for progress updates.
+            jobs: Worker processes hashing files (1 = in-process, 0 = one per CPU).
+            spool: Optional file receiving the entries instead of memory
+                (see VerificationReport.spool_entries).
             
         Returns:
             VerificationReport with results.
@@ -70,23 +126,20 @@ class Verifier:
             run_id=run_record.run_id,
             hash_algorithm=self.algorithm,
         )
+        if spool is not None:
+            report.spool_entries(spool)
         
         # Only verify copy operations (moves have no source to verify)
-        verifiable = run_record.verifiable_entries
-        total = len(verifiable)
-        
-        for i, entry in enumerate(verifiable):
-            if progress_callback:
-                progress_callback(i + 1, total)
-            
-            source_path = Path(entry.source_path)
-            dest_path = Path(entry.destination_path) if entry.destination_path else None
-            
-            verify_entry = self._verify_single_entry(
-                source_path=source_path,
-                expected_dest_path=dest_path,
-                match_type=MatchType.EXPECTED_PATH,
+        pairs = [
+            (
+                Path(entry.source_path),
+                Path(entry.destination_path) if entry.destination_path else None,
             )
+            for entry in run_record.verifiable_entries
+        ]
+        for verify_entry in self.verify_pairs(
+            pairs, jobs=jobs, progress_callback=progress_callback
+        ):
             report.add_entry(verify_entry)
         
         # Also record move operations as missing_source (source no longer exists)
@@ -107,6 +160,128 @@ class Verifier:
         report.duration_seconds = time.time() - start_time
         return report
     
+    def verify_pairs(
+        self,
+        pairs: Iterable[tuple[Path, Optional[Path]]],
+        search_root: Optional[Path] = None,
+        jobs: int = 1,
+        progress_callback: Optional[callable] = None,
+    ) -> Iterator[VerifyEntry]:
+        """Verify many source/destination pairs, optionally in worker processes.
+        
+        SHA-256 hashing is CPU bound, so with jobs != 1 the pairs are spread
+        over a process pool; entries are still yielded in input order.
+        Quick mode only stats files, so it overlaps them on a thread pool
+        in this process instead.
+        
+        Repeated sources, hard links and content-search candidates are
+        hashed once only in-process (jobs=1): worker processes skip the
+        hash cache and hash every file they are given.
+        
+        Args:
+            pairs: (source path, expected destination path) tuples.
+            search_root: Destination root for content search (reconstruct
+                mode); None verifies expected paths only.
+            jobs: Worker processes (1 = in-process, 0 = one per CPU).
+            progress_callback: Optional callback(current, total) per entry.
+            
+        Yields:
+            VerifyEntry per pair, in input order.
+        """
+        tasks = [(source, dest, search_root) for source, dest in pairs]
+        total = len(tasks)
+        workers = jobs or os.cpu_count() or 1
+        
+        if self.algorithm == "quick" and total >= 2:
+            results = self._iter_threaded(tasks)
+            executor = None
+        elif workers == 1 or total < 2:
+            results = (self._verify_pair(*task) for task in tasks)
+            executor = None
+        else:
+            workers = min(workers, total)
+            chunk_size = max(1, min(VERIFY_CHUNK_SIZE_MAX, total // (workers * 4)))
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=WORKER_CONTEXT,
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+            results = executor.map(_verify_pair_in_worker, tasks, chunksize=chunk_size)
+        
+        try:
+            for i, entry in enumerate(results):
+                if progress_callback:
+                    progress_callback(i + 1, total)
+                yield entry
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+    
+    def _iter_threaded(
+        self,
+        tasks: list[tuple[Path, Optional[Path], Optional[Path]]],
+    ) -> Iterator[VerifyEntry]:
+        """Verify tasks on a thread pool, yielding entries in input order.
+        
+        At most QUICK_VERIFY_PREFETCH tasks per thread are in flight.
+        """
+        workers = min(QUICK_VERIFY_THREADS, len(tasks))
+        window = workers * QUICK_VERIFY_PREFETCH
+        pending: deque[Future] = deque()
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="verify-stat") as executor:
+            try:
+                for task in tasks:
+                    pending.append(executor.submit(self._verify_pair, *task))
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+    
+    def _file_hash(self, file_path: Path) -> Optional[str]:
+        """Hash a file once per verifier, keyed by its identity on disk.
+        
+        Worker copies have no cache and hash on every call.
+        """
+        return self._file_hash_and_size(file_path)[0]
+    
+    def _file_hash_and_size(self, file_path: Path) -> tuple[Optional[str], Optional[int]]:
+        """Hash a file as in _file_hash, also returning the size from its stat."""
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return compute_file_hash(file_path, self.algorithm), None
+        if self._hash_cache is None:
+            return compute_file_hash(file_path, self.algorithm), st.st_size
+        # Some filesystems report no inode numbers; fall back to the path
+        identity = st.st_dev if st.st_ino else str(file_path)
+        key = (identity, st.st_ino, st.st_size, st.st_mtime_ns)
+        file_hash = self._hash_cache.get(key)
+        if file_hash is None:
+            file_hash = compute_file_hash(file_path, self.algorithm)
+            if file_hash is not None:
+                self._hash_cache[key] = file_hash
+        return file_hash, st.st_size
+    
+    def _verify_pair(
+        self,
+        source_path: Path,
+        expected_dest_path: Optional[Path],
+        search_root: Optional[Path],
+    ) -> VerifyEntry:
+        """Verify one pair, with content search when a search root is given."""
+        if search_root is None:
+            return self._verify_single_entry(
+                source_path=source_path,
+                expected_dest_path=expected_dest_path,
+                match_type=MatchType.EXPECTED_PATH,
+            )
+        return self.verify_with_content_search(source_path, expected_dest_path, search_root)
+    
     def verify_single(
         self,
         source_path: Path,
@@ -165,51 +340,50 @@ class Verifier:
                 hash_algorithm=self.algorithm,
             )
         
-        # Quick mode: compare size and modification time only
+        # Compare sizes first: a size difference is a mismatch in every mode,
+        # so only equal-size pairs are worth reading for a hash
+        try:
+            source_stat = source_path.stat()
+            dest_stat = expected_dest_path.stat()
+        except OSError as e:
+            return VerifyEntry(
+                source_path=str(source_path),
+                expected_destination_path=str(expected_dest_path),
+                actual_destination_path=None,
+                status=VerificationStatus.ERROR,
+                match_type=match_type,
+                hash_algorithm=self.algorithm,
+                error=str(e),
+            )
+        
+        if source_stat.st_size != dest_stat.st_size:
+            return VerifyEntry(
+                source_path=str(source_path),
+                expected_destination_path=str(expected_dest_path),
+                actual_destination_path=str(expected_dest_path),
+                status=VerificationStatus.MISMATCH,
+                match_type=match_type,
+                hash_algorithm=self.algorithm,
+                error="Size mismatch",
+            )
+        
+        # Quick mode: a size match is enough (timestamps may differ due to copy)
         if self.algorithm == "quick":
-            try:
-                source_stat = source_path.stat()
-                dest_stat = expected_dest_path.stat()
-                
-                # Size must match exactly
-                if source_stat.st_size != dest_stat.st_size:
-                    return VerifyEntry(
-                        source_path=str(source_path),
-                        expected_destination_path=str(expected_dest_path),
-                        actual_destination_path=str(expected_dest_path),
-                        status=VerificationStatus.MISMATCH,
-                        match_type=match_type,
-                        hash_algorithm="quick",
-                        error="Size mismatch",
-                    )
-                
-                # For quick mode, size match is enough (timestamps may differ due to copy)
-                return VerifyEntry(
-                    source_path=str(source_path),
-                    expected_destination_path=str(expected_dest_path),
-                    actual_destination_path=str(expected_dest_path),
-                    status=VerificationStatus.OK,
-                    match_type=match_type,
-                    hash_algorithm="quick",
-                )
-            except OSError as e:
-                return VerifyEntry(
-                    source_path=str(source_path),
-                    expected_destination_path=str(expected_dest_path),
-                    actual_destination_path=None,
-                    status=VerificationStatus.ERROR,
-                    match_type=match_type,
-                    hash_algorithm="quick",
-                    error=str(e),
-                )
+            return VerifyEntry(
+                source_path=str(source_path),
+                expected_destination_path=str(expected_dest_path),
+                actual_destination_path=str(expected_dest_path),
+                status=VerificationStatus.OK,
+                match_type=match_type,
+                hash_algorithm="quick",
+                source_size=source_stat.st_size,
+            )
         
         # SHA-256 mode: compare hashes
         try:
-            match, source_hash, dest_hash = compare_file_hashes(
-                source_path,
-                expected_dest_path,
-                algorithm=self.algorithm,
-            )
+            source_hash, source_size = self._file_hash_and_size(source_path)
+            dest_hash = self._file_hash(expected_dest_path)
+            match = source_hash is not None and source_hash == dest_hash
             
             if source_hash is None:
                 return VerifyEntry(
@@ -245,6 +419,7 @@ class Verifier:
                 hash_algorithm=self.algorithm,
                 source_hash=source_hash,
                 destination_hash=dest_hash,
+                source_size=source_size,
             )
             
         except Exception as e:
@@ -348,14 +523,18 @@ class Verifier:
                     hash_algorithm=self.algorithm,
                 )
             
-            # Search for content match
-            found, match_path, source_hash, dest_hash = hash_matches_any(
-                source_path,
-                candidates,
-                algorithm=self.algorithm,
-            )
+            # Search for content match; candidates recur across sources, so
+            # in-process their hashes come from the cache after the first search
+            source_hash = self._file_hash(source_path)
+            match_path = None
+            dest_hash = None
+            if source_hash is not None:
+                for candidate in candidates:
+                    if self._file_hash(candidate) == source_hash:
+                        match_path, dest_hash = candidate, source_hash
+                        break
             
-            if found and match_path:
+            if match_path:
                 return VerifyEntry(
                     source_path=str(source_path),
                     expected_destination_path=str(expected_dest_path) if expected_dest_path else None,
@@ -365,6 +544,7 @@ class Verifier:
                     hash_algorithm=self.algorithm,
                     source_hash=source_hash,
                     destination_hash=dest_hash,
+                    source_size=source_size,
                 )
             
             return VerifyEntry(
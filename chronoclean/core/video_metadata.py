@@ -429,12 +429,30 @@ def get_ffprobe_version(ffprobe_path: str = "ffprobe") -> Optional[str]:
     Returns:
         Version string or None if not available
     """
-    if not is_ffprobe_available(ffprobe_path):
-        return None
+    return check_ffprobe(ffprobe_path)[1]
+
+
+def check_ffprobe(ffprobe_path: str = "ffprobe") -> tuple[Optional[str], Optional[str]]:
+    """Resolve ffprobe and read its version, searching PATH only once.
     
+    Args:
+        ffprobe_path: Path to ffprobe binary
+        
+    Returns:
+        Tuple of (resolved path, version string); the path is None if
+        ffprobe is not available, the version if it could not be read.
+    """
+    resolved = shutil.which(ffprobe_path)
+    if resolved is None:
+        return (None, None)
+    return (resolved, _read_ffprobe_version(resolved))
+
+
+def _read_ffprobe_version(resolved_path: str) -> Optional[str]:
+    """Run an already resolved ffprobe with -version."""
     try:
         result = subprocess.run(
-            [ffprobe_path, "-version"],
+            [resolved_path, "-version"],
             capture_output=True,
             text=True,
             timeout=10,
@@ -453,6 +471,7 @@ __all__ = [
     "VideoMetadataReader",
     "is_ffprobe_available",
     "get_ffprobe_version",
+    "check_ffprobe",
     "is_hachoir_available",
     "get_hachoir_version",
 ]
@@ -26,13 +26,25 @@ def is_package_available(package_name: str) -> bool:
 def get_package_version(package_name: str, default: Optional[str] = None) -> Optional[str]:
     """Get the version of an installed package.
 
+    The installed distribution's metadata is consulted first, which avoids
+    importing (and executing) the package just to read its version. Modules
+    whose distribution has a different name fall back to importing them.
+
     Args:
-        package_name: Name of the package
+        package_name: Name of the package (distribution or module name)
         default: Value to return if version is unavailable (default: None)
 
     Returns:
         Version string, default value, or None if not installed
     """
+    # importlib.metadata is slow to import; only commands that report
+    # versions pay for it
+    from importlib import metadata
+
+    try:
+        return metadata.version(package_name)
+    except metadata.PackageNotFoundError:
+        pass
     try:
         module = __import__(package_name)
         return getattr(module, "__version__", default or "unknown")
@@ -56,6 +68,11 @@ def is_exiftool_available() -> bool:
     return is_package_available("exiftool")
 
 
+def is_blake3_available() -> bool:
+    """Check if blake3 package is installed."""
+    return is_package_available("blake3")
+
+
 def get_exifread_version() -> str:
     """Get exifread package version."""
     return get_package_version("exifread", default="unknown") or "not installed"
@@ -3,7 +3,15 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Type, TypeVar
+import os
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Type, TypeVar
+
+try:
+    # Optional C serializer, several times faster than json on large reports
+    import orjson as _orjson
+except ImportError:  # not installed: fall back to the stdlib encoder
+    _orjson = None
 
 
 def dumps_json(data: Any, pretty: bool = True) -> str:
@@ -14,10 +22,171 @@ def dumps_json(data: Any, pretty: bool = True) -> str:
     )
 
 
+def dumps_json_bytes(data: Any, pretty: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    if _orjson is not None:
+        return _orjson.dumps(data, option=_orjson.OPT_INDENT_2 if pretty else 0)
+    return dumps_json(data, pretty=pretty).encode("utf-8")
+
+
+# Buffer for streamed writes: large enough that encoding small items one
+# at a time doesn't turn into one write(2) per item
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def dump_json_items(
+    fp: BinaryIO,
+    data: dict[str, Any],
+    items_key: str,
+    items: Iterable[Any],
+    pretty: bool = True,
+) -> None:
+    """Write data plus a final items_key list to fp, one item at a time.
+
+    The document is the one dumps_json_bytes would give for data with
+    items_key added last, but the list is never built or encoded as a whole:
+    items may be a generator, and each is encoded just before it is written.
+    """
+    head = dumps_json_bytes(data, pretty=pretty)
+    key = dumps_json(items_key)
+    if pretty:
+        # Drop the closing "\n}" and continue with the list at depth 1
+        fp.write(head[:-2] + b",\n" if data else b"{\n")
+        fp.write(f"  {key}: [".encode("utf-8"))
+        separator = b"\n    "
+        empty = True
+        for item in items:
+            # Re-indent to depth 2 (JSON strings never contain raw newlines)
+            encoded = dumps_json_bytes(item, pretty=True).replace(b"\n", separator)
+            fp.write((separator if empty else b"," + separator) + encoded)
+            empty = False
+        fp.write(b"]\n}" if empty else b"\n  ]\n}")
+    else:
+        # Match the separators of whichever encoder produced head
+        comma, colon = (b", ", b": ") if _orjson is None else (b",", b":")
+        fp.write(head[:-1] + comma if data else b"{")
+        fp.write(key.encode("utf-8") + colon + b"[")
+        empty = True
+        for item in items:
+            fp.write((b"" if empty else comma) + dumps_json_bytes(item, pretty=False))
+            empty = False
+        fp.write(b"]}")
+
+
+def write_atomic(path: Path, write: Callable[[BinaryIO], None]) -> None:
+    """Write path through write(fp), replacing it only once fully written.
+
+    The bytes go to a sibling ``<name>.tmp`` file that is renamed over path,
+    so an interrupted write never leaves a truncated file behind.
+    """
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as fp:
+            write(fp)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_json_atomic(path: Path, data: Any, pretty: bool = True) -> None:
+    """Write data as JSON to path atomically (see write_atomic)."""
+    payload = dumps_json_bytes(data, pretty=pretty)
+    write_atomic(path, lambda fp: fp.write(payload))
+
+
 def loads_json(json_str: str) -> Any:
+    if _orjson is not None:
+        return _orjson.loads(json_str)
     return json.loads(json_str)
 
 
+# Decoder for read_json_header; raw_decode parses one value at an offset
+_DECODER = json.JSONDecoder()
+
+# Characters JSON allows between tokens
+_JSON_WHITESPACE = " \t\n\r"
+
+
+def read_json_header(path: Path, stop_key: str, chunk_size: int = 65536) -> dict[str, Any]:
+    """Read the top-level members of a JSON object up to stop_key.
+
+    Large records put their bulky member (e.g. "entries") after the small
+    metadata, so callers that only need the metadata can stop there instead
+    of reading and decoding the whole file. The file is read in chunks of
+    chunk_size characters; the members after stop_key are never read.
+
+    Args:
+        path: JSON file holding an object.
+        stop_key: Member at which to stop; it is not included.
+        chunk_size: Characters read at a time.
+
+    Returns:
+        The members preceding stop_key (all members if it is absent).
+
+    Raises:
+        json.JSONDecodeError: If the file is not a JSON object.
+    """
+    header: dict[str, Any] = {}
+    with open(path, encoding="utf-8") as f:
+        text = f.read(chunk_size)
+        eof = len(text) < chunk_size
+        pos = 0
+
+        def fill() -> bool:
+            nonlocal text, eof
+            if eof:
+                return False
+            chunk = f.read(chunk_size)
+            eof = len(chunk) < chunk_size
+            text += chunk
+            return bool(chunk)
+
+        def skip_whitespace() -> str:
+            nonlocal pos
+            while True:
+                while pos < len(text) and text[pos] in _JSON_WHITESPACE:
+                    pos += 1
+                if pos < len(text) or not fill():
+                    return text[pos:pos + 1]
+
+        def decode() -> Any:
+            nonlocal pos
+            # A value ending exactly at the buffer end may be cut short
+            # (e.g. a number), so only trust it once more text follows
+            while True:
+                try:
+                    value, end = _DECODER.raw_decode(text, pos)
+                    if end < len(text) or eof:
+                        pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                fill()
+
+        def expect(char: str) -> None:
+            nonlocal pos
+            if skip_whitespace() != char:
+                raise json.JSONDecodeError(f"Expecting '{char}'", text, pos)
+            pos += 1
+
+        expect("{")
+        if skip_whitespace() == "}":
+            return header
+        while True:
+            skip_whitespace()
+            key = decode()
+            expect(":")
+            if key == stop_key:
+                return header
+            skip_whitespace()
+            header[key] = decode()
+            if skip_whitespace() == "}":
+                return header
+            expect(",")
+
+
 TJsonSerializable = TypeVar("TJsonSerializable", bound="JsonSerializable")
 
 
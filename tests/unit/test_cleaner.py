@@ -1,11 +1,12 @@
 """Tests for the cleaner module."""
 
+import io
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-from chronoclean.core.cleaner import Cleaner, CleanupResult
+from chronoclean.core.cleaner import Cleaner, CleanupResult, format_bytes
 from chronoclean.core.verification import (
     InputSource,
     MatchType,
@@ -116,6 +117,32 @@ class TestCleaner:
         for entry in eligible:
             assert entry.status == VerificationStatus.OK
     
+    def test_get_cleanup_eligible_reads_spooled_entries(self, tmp_path):
+        """Entries spooled to disk are considered, not just report.entries."""
+        source = tmp_path / "source.jpg"
+        source.write_bytes(b"content")
+        report = VerificationReport(
+            verify_id="verify_test",
+            created_at=datetime.now(),
+            source_root=str(tmp_path),
+            destination_root=str(tmp_path),
+            input_source=InputSource.RECONSTRUCTED,
+            run_id=None,
+        )
+        report.spool_entries(io.BytesIO())
+        report.add_entry(VerifyEntry(
+            source_path=str(source),
+            expected_destination_path=str(source),
+            actual_destination_path=str(source),
+            status=VerificationStatus.OK,
+            hash_algorithm="sha256",
+        ))
+        
+        eligible = Cleaner(dry_run=True).get_cleanup_eligible(report)
+        
+        assert report.entries == []
+        assert [entry.source_path for entry in eligible] == [str(source)]
+    
     def test_dry_run_does_not_delete(self, sample_verification_report, tmp_path):
         """Test that dry run mode doesn't delete files."""
         cleaner = Cleaner(dry_run=True, require_sha256=True)
@@ -217,6 +244,125 @@ class TestCleaner:
         # File doesn't exist, so not eligible
         assert len(eligible) == 0
 
+    def test_cleanup_reuses_precomputed_eligible(self, sample_verification_report, tmp_path):
+        """Passing eligible entries skips refiltering; vanished sources are skipped."""
+        cleaner = Cleaner(dry_run=True, require_sha256=True)
+        eligible = cleaner.get_cleanup_eligible(sample_verification_report)
+        (tmp_path / "source1.jpg").unlink()
+        
+        result = cleaner.cleanup(sample_verification_report, eligible=eligible)
+        
+        assert result.total_eligible == 2
+        assert result.deleted == 1
+        assert result.skipped_paths == [(tmp_path / "source1.jpg", "source no longer exists")]
+
+    def test_cleanup_counts_recorded_sizes(self, tmp_path):
+        """bytes_freed sums sizes from the report; a source gone at unlink is skipped."""
+        entries = []
+        for name, size in (("kept.jpg", 1000), ("gone.jpg", 2000)):
+            dest = tmp_path / f"dest_{name}"
+            dest.write_bytes(b"x")
+            entries.append(VerifyEntry(
+                source_path=str(tmp_path / name),
+                expected_destination_path=str(dest),
+                actual_destination_path=str(dest),
+                status=VerificationStatus.OK,
+                match_type=MatchType.EXPECTED_PATH,
+                hash_algorithm="sha256",
+                source_size=size,
+            ))
+        # Written smaller than recorded: the recorded size is what counts
+        (tmp_path / "kept.jpg").write_bytes(b"x")
+        report = VerificationReport(
+            verify_id="verify_test",
+            created_at=datetime.now(),
+            source_root=str(tmp_path),
+            destination_root=str(tmp_path),
+            input_source=InputSource.RUN_RECORD,
+            run_id="test_run",
+            entries=entries,
+        )
+        
+        result = Cleaner(dry_run=False, require_sha256=True).cleanup(report, eligible=entries)
+        
+        assert result.deleted_paths == [tmp_path / "kept.jpg"]
+        assert result.bytes_freed == 1000
+        assert result.skipped_paths == [(tmp_path / "gone.jpg", "source no longer exists")]
+        assert not (tmp_path / "kept.jpg").exists()
+
+    def test_cleanup_groups_deletions_by_directory(self, tmp_path):
+        """Interleaved directories are deleted one directory at a time."""
+        entries = []
+        for i in range(4):
+            folder = tmp_path / ("b" if i % 2 else "a")
+            folder.mkdir(exist_ok=True)
+            source = folder / f"source{i}.jpg"
+            source.write_bytes(b"x")
+            entries.append(VerifyEntry(
+                source_path=str(source),
+                expected_destination_path=str(source),
+                actual_destination_path=str(source),
+                status=VerificationStatus.OK,
+                match_type=MatchType.EXPECTED_PATH,
+                hash_algorithm="sha256",
+            ))
+        report = VerificationReport(
+            verify_id="verify_test",
+            created_at=datetime.now(),
+            source_root=str(tmp_path),
+            destination_root=str(tmp_path),
+            input_source=InputSource.RUN_RECORD,
+            run_id="test_run",
+            entries=entries,
+        )
+        
+        result = Cleaner(dry_run=True, require_sha256=True).cleanup(report, eligible=entries)
+        
+        assert result.deleted_paths == [
+            tmp_path / "a" / "source0.jpg",
+            tmp_path / "a" / "source2.jpg",
+            tmp_path / "b" / "source1.jpg",
+            tmp_path / "b" / "source3.jpg",
+        ]
+
+    def test_threaded_cleanup_keeps_report_order(self, tmp_path):
+        """Many deletions run concurrently but are tallied in report order."""
+        entries = []
+        for i in range(50):
+            source = tmp_path / f"source{i}.jpg"
+            dest = tmp_path / f"dest{i}.jpg"
+            source.write_bytes(b"x" * (i + 1))
+            if i % 10:
+                dest.write_bytes(b"x" * (i + 1))
+            entries.append(VerifyEntry(
+                source_path=str(source),
+                expected_destination_path=str(dest),
+                actual_destination_path=str(dest),
+                status=VerificationStatus.OK,
+                match_type=MatchType.EXPECTED_PATH,
+                hash_algorithm="sha256",
+            ))
+        report = VerificationReport(
+            verify_id="verify_test",
+            created_at=datetime.now(),
+            source_root=str(tmp_path),
+            destination_root=str(tmp_path),
+            input_source=InputSource.RUN_RECORD,
+            run_id="test_run",
+            entries=entries,
+        )
+        cleaner = Cleaner(dry_run=False, require_sha256=True)
+        
+        # Every tenth destination was never written, as if it vanished
+        # after the eligibility check
+        result = cleaner.cleanup(report, eligible=entries)
+        
+        kept = [i for i in range(50) if i % 10 == 0]
+        assert result.deleted_paths == [tmp_path / f"source{i}.jpg" for i in range(50) if i % 10]
+        assert result.bytes_freed == sum(i + 1 for i in range(50) if i % 10)
+        assert [p for p, _ in result.skipped_paths] == [tmp_path / f"source{i}.jpg" for i in kept]
+        assert sorted(p.name for p in tmp_path.glob("source*")) == sorted(f"source{i}.jpg" for i in kept)
+
 
 class TestCleanerFilters:
     """Tests for cleaner status filters."""
@@ -326,3 +472,24 @@ class TestCleanerFilters:
         # MISSING_SOURCE entries should not be in eligible list
         for entry in eligible:
             assert entry.status != VerificationStatus.MISSING_SOURCE
+
+
+class TestFormatBytes:
+    """Tests for format_bytes."""
+
+    @pytest.mark.parametrize(
+        ("num_bytes", "expected"),
+        [
+            (0, "0.0 B"),
+            (1023, "1023.0 B"),
+            (1024, "1.0 KB"),
+            (1536, "1.5 KB"),
+            (1024**2 - 1, "1024.0 KB"),
+            (5 * 1024**3, "5.0 GB"),
+            (1024**5, "1.0 PB"),
+            (2048 * 1024**5, "2048.0 PB"),
+        ],
+    )
+    def test_units(self, num_bytes, expected):
+        """Sizes pick the largest unit below them, up to PB."""
+        assert format_bytes(num_bytes) == expected
@@ -47,6 +47,37 @@ class TestApplyCommandDryRun:
         # Source file should still exist
         assert (source / "photo.jpg").exists()
     
+    def test_apply_preview_shows_relative_destinations(self, tmp_path, monkeypatch):
+        """Planned operations are listed relative to the destination root."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        (source / "IMG_20240315_143000.jpg").write_bytes(JPEG_HEADER)
+        
+        result = runner.invoke(app, ["apply", str(source), str(dest), "--no-rename"])
+        
+        assert result.exit_code == 0
+        assert str(Path("2024", "03", "IMG_20240315_143000.jpg")) in result.stdout
+        assert str(dest / "2024") not in result.stdout
+    
+    def test_apply_preview_truncated_for_large_plans(self, tmp_path, monkeypatch):
+        """Plans over 20 moves list only the first 10 operations."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        for i in range(25):
+            (source / f"IMG_20240315_1430{i:02d}.jpg").write_bytes(JPEG_HEADER)
+        
+        result = runner.invoke(app, ["apply", str(source), str(dest), "--no-rename"])
+        
+        assert result.exit_code == 0
+        assert "Showing first 10 of 25 operations" in result.stdout
+        assert result.stdout.count(" → ") == 10
+    
     def test_apply_empty_source(self, tmp_path, monkeypatch):
         """apply on empty source directory shows warning."""
         monkeypatch.chdir(tmp_path)
@@ -140,6 +171,24 @@ class TestApplyCommandLiveMode:
         # Original should still exist (copy, not move)
         assert (source / "photo.jpg").exists()
     
+    def test_apply_parallel_io_jobs(self, tmp_path, monkeypatch):
+        """apply --io-jobs copies files concurrently."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        for i in range(6):
+            (source / f"photo_{i}.jpg").write_bytes(JPEG_HEADER)
+        
+        result = runner.invoke(
+            app, ["apply", str(source), str(dest), "--no-dry-run", "--force", "--io-jobs", "3"]
+        )
+        
+        assert result.exit_code == 0
+        assert "Successfully copied: 6" in result.stdout
+        assert len([p for p in dest.rglob("*.jpg")]) == 6
+    
     def test_apply_move_mode(self, tmp_path, monkeypatch):
         """apply --move moves files instead of copying."""
         monkeypatch.chdir(tmp_path)
@@ -256,6 +305,109 @@ sorting:
         assert "YYYY" in result.stdout
 
 
+class TestApplyFromScan:
+    """Tests for apply --from-scan with a saved scan snapshot."""
+    
+    def test_apply_reuses_saved_scan(self, tmp_path, monkeypatch):
+        """scan --save-scan then apply --from-scan skips re-reading unchanged files."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        (source / "IMG_20240315_143000.jpg").write_bytes(JPEG_HEADER)
+        (source / "IMG_20230101_090000.jpg").write_bytes(JPEG_HEADER)
+        snapshot = tmp_path / "scan.jsonl"
+        
+        scan_result = runner.invoke(app, ["scan", str(source), "--save-scan", str(snapshot)])
+        assert scan_result.exit_code == 0
+        assert snapshot.exists()
+        
+        (source / "IMG_20230101_090000.jpg").write_bytes(JPEG_HEADER + b"changed")
+        result = runner.invoke(
+            app, ["apply", str(source), str(dest), "--from-scan", str(snapshot), "--no-cache"]
+        )
+        
+        assert result.exit_code == 0
+        assert "Reused 1 records" in result.stdout
+        assert "scanned 1 new or changed" in result.stdout
+        assert "Found 2 files" in result.stdout
+    
+    def test_apply_from_limited_scan_plans_whole_source(self, tmp_path, monkeypatch):
+        """Files added since the scan or left out by --limit are still planned."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        for day in (1, 2, 3):
+            (source / f"IMG_2024010{day}_120000.jpg").write_bytes(JPEG_HEADER)
+        snapshot = tmp_path / "scan.jsonl"
+        
+        scan_result = runner.invoke(
+            app, ["scan", str(source), "--limit", "1", "--save-scan", str(snapshot)]
+        )
+        assert scan_result.exit_code == 0
+        (source / "IMG_20240104_120000.jpg").write_bytes(JPEG_HEADER)
+        result = runner.invoke(
+            app, ["apply", str(source), str(dest), "--from-scan", str(snapshot), "--no-cache"]
+        )
+        
+        assert result.exit_code == 0
+        assert "Reused 1 records" in result.stdout
+        assert "scanned 3 new or changed" in result.stdout
+        assert "Found 4 files" in result.stdout
+    
+    def test_apply_rejects_snapshot_of_other_source(self, tmp_path, monkeypatch):
+        """apply --from-scan fails when the snapshot was taken elsewhere."""
+        monkeypatch.chdir(tmp_path)
+        other = tmp_path / "other"
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        for d in (other, source, dest):
+            d.mkdir()
+        (other / "photo.jpg").write_bytes(JPEG_HEADER)
+        snapshot = tmp_path / "scan.jsonl"
+        runner.invoke(app, ["scan", str(other), "--save-scan", str(snapshot)])
+        
+        result = runner.invoke(app, ["apply", str(source), str(dest), "--from-scan", str(snapshot)])
+        
+        assert result.exit_code == 1
+        assert "Scan snapshot is for" in result.stdout
+    
+    def test_apply_rescans_when_settings_differ(self, tmp_path, monkeypatch):
+        """A snapshot saved with other options is ignored."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        (source / "photo.jpg").write_bytes(JPEG_HEADER)
+        snapshot = tmp_path / "scan.jsonl"
+        runner.invoke(app, ["scan", str(source), "--no-recursive", "--save-scan", str(snapshot)])
+        
+        result = runner.invoke(app, ["apply", str(source), str(dest), "--from-scan", str(snapshot)])
+        
+        assert result.exit_code == 0
+        assert "different settings" in result.stdout
+        assert "Found 1 files" in result.stdout
+    
+    def test_apply_invalid_snapshot(self, tmp_path, monkeypatch):
+        """apply --from-scan reports unreadable snapshots."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        snapshot = tmp_path / "scan.jsonl"
+        snapshot.write_text("not json\n")
+        
+        result = runner.invoke(app, ["apply", str(source), str(dest), "--from-scan", str(snapshot)])
+        
+        assert result.exit_code == 1
+        assert "Invalid scan snapshot" in result.stdout
+
+
 class TestApplyCommandErrors:
     """Error handling tests for apply command."""
     
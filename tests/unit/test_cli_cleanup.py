@@ -1,11 +1,18 @@
 """Tests for cleanup CLI command."""
 
+import io
 import json
+import sys
 import pytest
 from pathlib import Path
+from types import SimpleNamespace
+
+import typer
 from typer.testing import CliRunner
 
+from chronoclean.cli import cleanup_cmd
 from chronoclean.cli.main import app
+from chronoclean.core import run_discovery
 
 
 runner = CliRunner()
@@ -78,6 +85,7 @@ class TestCleanupCommandOptions:
         result = runner.invoke(app, ["cleanup", "--verify-file", str(fake_file)])
         
         assert result.exit_code == 1
+        assert "Verification file not found" in result.stdout
     
     def test_cleanup_last_option(self, tmp_path, monkeypatch):
         """cleanup --last uses most recent verification."""
@@ -158,6 +166,31 @@ class TestCleanupWithVerificationReport:
         assert result.exit_code == 0
         assert "Cleanup" in result.stdout or "DRY RUN" in result.stdout or "1" in result.stdout
     
+    def test_cleanup_quick_report_rejected_from_header(self, tmp_path, monkeypatch):
+        """A quick-mode report is turned away without loading its entries."""
+        verify_file = tmp_path / "verify.json"
+        verify_file.write_text(json.dumps({
+            "verify_id": "verify-quick",
+            "created_at": "2025-12-31T12:00:00",
+            "source_root": str(tmp_path),
+            "destination_root": str(tmp_path),
+            "input_source": "run_record",
+            "hash_algorithm": "quick",
+            "summary": {"total": 1, "ok": 1},
+            "entries": [],
+        }))
+
+        def fail(path):
+            raise AssertionError("entries should not be loaded")
+
+        monkeypatch.setattr(run_discovery, "load_verification_report", fail)
+
+        result = runner.invoke(app, ["cleanup", "--verify-file", str(verify_file), "--dry-run"])
+
+        assert result.exit_code == 0
+        assert "No files eligible" in result.stdout
+        assert "Algorithm: quick" in result.stdout
+
     def test_cleanup_dry_run_preserves_files(self, tmp_path):
         """cleanup --dry-run does not delete files."""
         # Create source directory with file
@@ -232,3 +265,47 @@ class TestCleanupFilter:
         
         assert result.exit_code == 1
         assert "only" in result.stdout.lower() or "ok" in result.stdout
+
+
+class TestInteractiveSelection:
+    """Tests for choosing among several verification reports."""
+
+    @staticmethod
+    def _verifications(tmp_path, count):
+        return [
+            SimpleNamespace(
+                filepath=tmp_path / f"verify_{i}.json",
+                age_description=f"{i} hours ago",
+                cleanup_eligible_count=1,
+                total=1,
+                source_root=str(tmp_path / "source"),
+            )
+            for i in range(count)
+        ]
+
+    def test_invalid_answers_are_asked_again(self, tmp_path, monkeypatch):
+        """Out-of-range and non-numeric answers re-prompt instead of exiting."""
+        monkeypatch.setattr(sys, "stdin", io.StringIO("abc\n9\n2\n"))
+
+        path = cleanup_cmd._select_verification_interactive(self._verifications(tmp_path, 3))
+
+        assert path == tmp_path / "verify_1.json"
+
+    def test_zero_cancels(self, tmp_path, monkeypatch):
+        """Answering 0 exits without selecting a report."""
+        monkeypatch.setattr(sys, "stdin", io.StringIO("0\n"))
+
+        with pytest.raises(typer.Exit) as exc_info:
+            cleanup_cmd._select_verification_interactive(self._verifications(tmp_path, 2))
+
+        assert exc_info.value.exit_code == 0
+
+    def test_listing_shows_each_report(self, tmp_path, monkeypatch, capsys):
+        """Every listed report gets its numbered line and source line."""
+        monkeypatch.setattr(sys, "stdin", io.StringIO("1\n"))
+
+        cleanup_cmd._select_verification_interactive(self._verifications(tmp_path, 2))
+
+        out = capsys.readouterr().out
+        assert "  1. 0 hours ago, ✅ 1 OK / 1 total\n" in out
+        assert "  2. 1 hours ago, ✅ 1 OK / 1 total\n" in out
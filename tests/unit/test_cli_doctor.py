@@ -50,6 +50,16 @@ class TestDoctorCommand:
         assert result.exit_code == 0
         assert "exifread" in result.stdout.lower()
     
+    def test_doctor_reports_installed_package_versions(self):
+        """doctor reads versions from package metadata (rich has no __version__)."""
+        from importlib.metadata import version
+        
+        result = runner.invoke(app, ["doctor"])
+        
+        assert result.exit_code == 0
+        assert version("rich") in result.stdout
+        assert version("exifread") in result.stdout
+    
     def test_doctor_shows_python_info(self):
         """doctor displays Python environment info."""
         result = runner.invoke(app, ["doctor"])
@@ -84,8 +94,8 @@ class TestDoctorCommandWithMocks:
     
     def test_doctor_ffprobe_not_available(self):
         """doctor handles missing ffprobe gracefully."""
-        with patch("chronoclean.cli.doctor_cmd.is_ffprobe_available", return_value=False):
-            with patch("chronoclean.cli.doctor_cmd.find_ffprobe_path", return_value=None):
+        with patch("chronoclean.core.video_metadata.check_ffprobe", return_value=(None, None)):
+            with patch("chronoclean.core.video_metadata.find_ffprobe_path", return_value=None):
                 result = runner.invoke(app, ["doctor"])
         
         assert result.exit_code == 0
@@ -94,7 +104,7 @@ class TestDoctorCommandWithMocks:
     
     def test_doctor_hachoir_not_available(self):
         """doctor handles missing hachoir gracefully."""
-        with patch("chronoclean.cli.doctor_cmd.is_hachoir_available", return_value=False):
+        with patch("chronoclean.core.video_metadata.is_hachoir_available", return_value=False):
             result = runner.invoke(app, ["doctor"])
         
         assert result.exit_code == 0
@@ -102,15 +112,16 @@ class TestDoctorCommandWithMocks:
     
     def test_doctor_all_dependencies_available(self):
         """doctor shows success when all dependencies found."""
-        with patch("chronoclean.cli.doctor_cmd.is_ffprobe_available", return_value=True):
-            with patch("chronoclean.cli.doctor_cmd.is_hachoir_available", return_value=True):
-                with patch("chronoclean.cli.doctor_cmd.get_ffprobe_version", return_value="ffprobe version 5.0"):
-                    with patch("chronoclean.cli.doctor_cmd.get_hachoir_version", return_value="3.0"):
-                        result = runner.invoke(app, ["doctor"])
+        ffprobe = ("/usr/bin/ffprobe", "ffprobe version 5.0")
+        with patch("chronoclean.core.video_metadata.check_ffprobe", return_value=ffprobe):
+            with patch("chronoclean.core.video_metadata.is_hachoir_available", return_value=True):
+                with patch("chronoclean.core.video_metadata.get_hachoir_version", return_value="3.0"):
+                    result = runner.invoke(app, ["doctor"])
         
         assert result.exit_code == 0
         # Should show found/success indicators
         assert "✓" in result.stdout or "found" in result.stdout.lower()
+        assert "/usr/bin/ffprobe" in result.stdout
 
 
 class TestDoctorFixMode:
@@ -126,8 +137,8 @@ class TestDoctorFixMode:
     
     def test_doctor_fix_shows_issues(self):
         """doctor --fix shows issues that can be fixed."""
-        with patch("chronoclean.cli.doctor_cmd.is_ffprobe_available", return_value=False):
-            with patch("chronoclean.cli.doctor_cmd.find_ffprobe_path", return_value="/usr/bin/ffprobe"):
+        with patch("chronoclean.core.video_metadata.check_ffprobe", return_value=(None, None)):
+            with patch("chronoclean.core.video_metadata.find_ffprobe_path", return_value="/usr/bin/ffprobe"):
                 result = runner.invoke(app, ["doctor", "--fix"], input="n\n")
         
         # Should show the issue and offer to fix
@@ -47,6 +47,18 @@ class TestExportJsonCommand:
         assert "files" in data
         assert len(data["files"]) == 1
     
+    def test_export_json_stdout_is_plain_json(self, tmp_path):
+        """export json writes the document to stdout without console markup."""
+        source = tmp_path / "[2024] trip"
+        source.mkdir()
+        (source / "photo.jpg").write_bytes(JPEG_HEADER)
+        
+        result = runner.invoke(app, ["export", "json", str(source)])
+        
+        assert result.exit_code == 0
+        data = json.loads(result.stdout[result.stdout.index("{\n"):])
+        assert data["files"][0]["path"] == str(source / "photo.jpg")
+    
     def test_export_json_empty_directory(self, tmp_path):
         """export json on empty directory produces empty files array."""
         result = runner.invoke(app, ["export", "json", str(tmp_path)])
@@ -120,6 +132,28 @@ class TestExportJsonCommand:
         assert "size_bytes" in file_record
         assert "date_source" in file_record
 
+    def test_export_json_with_destination(self, tmp_path):
+        """export json --destination fills proposed destinations for dated files."""
+        source = tmp_path / "src"
+        source.mkdir()
+        (source / "IMG_20240315_143000.jpg").write_bytes(JPEG_HEADER)
+        (source / "IMG_20240316_090000.jpg").write_bytes(JPEG_HEADER)
+        dest = tmp_path / "dest"
+        output_file = tmp_path / "output.json"
+        
+        result = runner.invoke(app, [
+            "export", "json", str(source), "-o", str(output_file),
+            "--destination", str(dest), "--structure", "YYYY/MM", "--no-rename",
+        ])
+        
+        assert result.exit_code == 0, result.output
+        files = json.loads(output_file.read_text())["files"]
+        folders = {f["proposed_destination_folder"] for f in files}
+        assert folders == {str(dest / "2024" / "03")}
+        assert {f["proposed_filename"] for f in files} == {
+            "IMG_20240315_143000.jpg", "IMG_20240316_090000.jpg",
+        }
+
 
 class TestExportCsvCommand:
     """Tests for 'chronoclean export csv' command."""
@@ -137,6 +171,24 @@ class TestExportCsvCommand:
         csv_lines = [l for l in lines if "," in l or "source_path" in l.lower() or "path" in l.lower()]
         assert len(csv_lines) >= 2  # Header + at least 1 data row
     
+    def test_export_csv_stdout_matches_file(self, tmp_path):
+        """export csv streams the same bytes to stdout as to --output."""
+        source = tmp_path / "photos"
+        source.mkdir()
+        (source / "photo.jpg").write_bytes(JPEG_HEADER)
+        (source / "other.jpg").write_bytes(JPEG_HEADER)
+        output_file = tmp_path / "out.csv"
+        
+        to_file = runner.invoke(app, ["export", "csv", str(source), "-o", str(output_file)])
+        to_stdout = runner.invoke(app, ["export", "csv", str(source)])
+        
+        assert to_file.exit_code == 0
+        assert to_stdout.exit_code == 0
+        csv_bytes = output_file.read_bytes()
+        assert csv_bytes.count(b"\r\n") == 3
+        # Anything before the CSV is log output from the scan
+        assert to_stdout.stdout_bytes.endswith(csv_bytes)
+    
     def test_export_csv_to_file(self, tmp_path):
         """export csv --output writes to file."""
         (tmp_path / "photo.jpg").write_bytes(JPEG_HEADER)
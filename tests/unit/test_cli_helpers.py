@@ -1,9 +1,19 @@
 """Unit tests for CLI helper functions."""
 
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 import pytest
 
-from chronoclean.cli.helpers import _build_date_priority
+from chronoclean.cli.helpers import (
+    _build_date_priority,
+    compute_filename_for_record,
+    create_scan_components,
+    throttled_progress,
+)
 from chronoclean.config.loader import ChronoCleanConfig
+from chronoclean.core.models import FileRecord, FileType
 
 
 class TestBuildDatePriority:
@@ -161,3 +171,125 @@ class TestBuildDatePriority:
         exif_idx = result.index("exif")
         filename_idx = result.index("filename")
         assert filename_idx == exif_idx + 1
+
+
+class TestComputeFilenameForRecord:
+    """Tests for compute_filename_for_record function."""
+
+    @staticmethod
+    def _record(folder_tags: list[str]) -> FileRecord:
+        return FileRecord(
+            source_path=Path("/photos/Paris/IMG_1234.JPG"),
+            file_type=FileType.IMAGE,
+            size_bytes=1,
+            folder_tags=folder_tags,
+        )
+
+    def _compute(self, record: FileRecord, use_tag_names: bool):
+        return compute_filename_for_record(
+            record,
+            ChronoCleanConfig(),
+            use_rename=False,
+            use_tag_names=use_tag_names,
+            renamer=None,
+            conflict_resolver=None,
+        )
+
+    def test_keeps_original_name_without_tags(self):
+        name, renamer = self._compute(self._record([]), use_tag_names=True)
+
+        assert name == "IMG_1234.JPG"
+        assert renamer is None
+
+    def test_appends_primary_tag(self):
+        name, renamer = self._compute(self._record(["Paris", "Trip"]), use_tag_names=True)
+
+        assert name == "IMG_1234_Paris.jpg"
+        assert renamer is not None
+
+    def test_ignores_tags_when_tag_names_disabled(self):
+        name, _ = self._compute(self._record(["Paris"]), use_tag_names=False)
+
+        assert name == "IMG_1234.JPG"
+
+
+class TestCreateScanComponentsExifBackend:
+    """Tests for the EXIF backend chosen by create_scan_components."""
+
+    def test_exifread_by_default(self):
+        components = create_scan_components(ChronoCleanConfig())
+
+        assert components.exif_reader.exiftool is None
+
+    def test_exiftool_backend(self):
+        cfg = ChronoCleanConfig()
+        cfg.scan.exif_backend = "exiftool"
+        cfg.scan.exiftool_path = "/opt/bin/exiftool"
+
+        components = create_scan_components(cfg)
+
+        assert components.exif_reader.exiftool.exiftool_path == "/opt/bin/exiftool"
+
+    def test_auto_backend_without_exiftool(self, temp_dir: Path):
+        cfg = ChronoCleanConfig()
+        cfg.scan.exif_backend = "auto"
+        cfg.scan.exiftool_path = str(temp_dir / "no-such-exiftool")
+
+        components = create_scan_components(cfg)
+
+        assert components.exif_reader.exiftool is None
+
+
+class TestSettingsFingerprint:
+    """Tests for ScanComponents.settings_fingerprint."""
+
+    def test_fast_override_changes_fingerprint(self):
+        """--no-fast after a fast scan must not reuse header-only records."""
+        cfg = ChronoCleanConfig()
+
+        fast = create_scan_components(cfg, fast_exif=True).settings_fingerprint()
+        full = create_scan_components(cfg, fast_exif=False).settings_fingerprint()
+
+        assert fast != full
+        assert fast == create_scan_components(cfg).settings_fingerprint()
+
+
+class TestThrottledProgress:
+    """Tests for throttled_progress."""
+
+    def test_updates_in_batches_and_on_last_file(self):
+        progress = MagicMock()
+        update = throttled_progress(progress, "task", "Checking")
+
+        for i in range(1, 301):
+            update(i, 300)
+
+        completed = [c.kwargs["completed"] for c in progress.update.call_args_list]
+        # Only batch boundaries and the final count (timing may add a few)
+        assert {128, 256, 300} <= set(completed)
+        assert len(completed) < 30
+        assert progress.update.call_args.kwargs["description"] == "Checking (300/300)"
+
+    def test_description_follows_total(self):
+        progress = MagicMock()
+        update = throttled_progress(progress, "task", "Checking {x}")
+
+        update(3, 3)
+        update(5, 5)
+
+        assert [c.kwargs["description"] for c in progress.update.call_args_list] == [
+            "Checking {x} (3/3)", "Checking {x} (5/5)",
+        ]
+
+    def test_updates_after_interval(self, monkeypatch):
+        clock = iter([0.0, 0.05, 0.5])
+        monkeypatch.setattr(
+            "chronoclean.cli.helpers.time", SimpleNamespace(monotonic=lambda: next(clock))
+        )
+        progress = MagicMock()
+        update = throttled_progress(progress, "task", "Checking")
+
+        update(1, 10)  # 0.05s after start: skipped
+        update(2, 10)  # 0.5s after start: shown
+
+        assert [c.kwargs["completed"] for c in progress.update.call_args_list] == [2]
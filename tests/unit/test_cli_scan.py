@@ -2,9 +2,11 @@
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from typer.testing import CliRunner
 
 from chronoclean.cli.main import app
+from chronoclean.core.scanner import Scanner
 
 
 runner = CliRunner()
@@ -46,6 +48,92 @@ class TestScanCommand:
         assert "Scan Complete" in result.stdout
         assert "5" in result.stdout
     
+    def test_scan_shows_date_source_breakdown(self, tmp_path):
+        """scan tallies files per date source."""
+        for i in range(3):
+            (tmp_path / f"photo_{i}.jpg").write_bytes(JPEG_HEADER)
+        
+        result = runner.invoke(app, ["scan", str(tmp_path)])
+        
+        assert result.exit_code == 0
+        assert "Date Sources" in result.stdout
+        assert "filesystem" in result.stdout
+        assert "no date found" not in result.stdout
+    
+    def test_scan_date_sources_most_frequent_first(self, tmp_path):
+        """Date sources are listed by descending count."""
+        (tmp_path / "IMG_20240315_143000.jpg").write_bytes(JPEG_HEADER)
+        for i in range(2):
+            (tmp_path / f"photo_{i}.jpg").write_bytes(JPEG_HEADER)
+        
+        result = runner.invoke(app, ["scan", str(tmp_path)])
+        
+        assert result.exit_code == 0
+        breakdown = result.stdout.split("Date Sources", 1)[1]
+        assert breakdown.index("filesystem") < breakdown.index("filename")
+    
+    def test_scan_with_jobs(self, tmp_path):
+        """scan --jobs processes files in worker processes."""
+        for i in range(3):
+            (tmp_path / f"photo_{i}.jpg").write_bytes(JPEG_HEADER)
+        
+        result = runner.invoke(app, ["scan", str(tmp_path), "--jobs", "2"])
+        
+        assert result.exit_code == 0
+        assert "Scan Complete" in result.stdout
+        assert "3" in result.stdout
+    
+    def test_scan_jobs_from_config(self, tmp_path):
+        """performance.multiprocessing/max_workers supply --jobs; --jobs wins."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "photo.jpg").write_bytes(JPEG_HEADER)
+        config = tmp_path / "parallel.yaml"
+        config.write_text("performance:\n  multiprocessing: true\n  max_workers: 2\n")
+        
+        with patch("chronoclean.core.scanner.Scanner.iter_scan", autospec=True,
+                   side_effect=Scanner.iter_scan) as mock_iter:
+            result = runner.invoke(app, ["scan", str(source)])
+            assert result.exit_code == 0
+            assert mock_iter.call_args.kwargs["jobs"] == 1
+            
+            result = runner.invoke(app, ["scan", str(source), "--config", str(config)])
+            assert result.exit_code == 0
+            assert mock_iter.call_args.kwargs["jobs"] == 2
+            
+            result = runner.invoke(
+                app, ["scan", str(source), "--config", str(config), "--jobs", "1"]
+            )
+            assert result.exit_code == 0
+            assert mock_iter.call_args.kwargs["jobs"] == 1
+    
+    def test_scan_with_threads(self, tmp_path):
+        """scan --threads reads metadata on a thread pool."""
+        for i in range(3):
+            (tmp_path / f"photo_{i}.jpg").write_bytes(JPEG_HEADER)
+        
+        with patch("chronoclean.core.scanner.Scanner.iter_scan", autospec=True,
+                   side_effect=Scanner.iter_scan) as mock_iter:
+            result = runner.invoke(app, ["scan", str(tmp_path), "--threads", "4"])
+        
+        assert result.exit_code == 0
+        assert mock_iter.call_args.kwargs["threads"] == 4
+        assert "3" in result.stdout
+    
+    def test_scan_writes_cache_only_when_asked(self, tmp_path):
+        """scan is read-only by default; --cache stores records in the scan cache."""
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "photo.jpg").write_bytes(JPEG_HEADER)
+        
+        result = runner.invoke(app, ["scan", str(source)])
+        assert result.exit_code == 0
+        assert not (tmp_path / ".chronoclean").exists()
+        
+        result = runner.invoke(app, ["scan", str(source), "--cache"])
+        assert result.exit_code == 0
+        assert (tmp_path / ".chronoclean" / "cache.db").exists()
+    
     def test_scan_nonexistent_directory(self, tmp_path):
         """scan on nonexistent directory shows error."""
         fake_path = tmp_path / "does_not_exist"
@@ -145,6 +233,30 @@ general:
         # Config says non-recursive, so should only find 1 file
         assert "1" in result.stdout
     
+    def test_scan_report_table(self, tmp_path):
+        """--report lists each file in a table."""
+        (tmp_path / "photo_a.jpg").write_bytes(JPEG_HEADER)
+
+        result = runner.invoke(app, ["scan", str(tmp_path), "--report"])
+
+        assert result.exit_code == 0
+        assert "Detailed File Report" in result.stdout
+        assert "photo_a.jpg" in result.stdout
+        assert "Folder Tag" in result.stdout
+
+    def test_scan_large_report_is_plain_text(self, tmp_path):
+        """Large --report output skips the rich table."""
+        for i in range(3):
+            (tmp_path / f"photo_{i}.jpg").write_bytes(JPEG_HEADER)
+
+        with patch("chronoclean.cli.scan_cmd.REPORT_TABLE_MAX_ROWS", 2):
+            result = runner.invoke(app, ["scan", str(tmp_path), "--report"])
+
+        assert result.exit_code == 0
+        assert "File\tDate\tSource\tFolder Tag" in result.stdout
+        for i in range(3):
+            assert f"photo_{i}.jpg\t" in result.stdout
+
     def test_scan_displays_source_path(self, tmp_path):
         """scan shows the source directory being scanned."""
         result = runner.invoke(app, ["scan", str(tmp_path)])
@@ -3,9 +3,13 @@
 import json
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from typer.testing import CliRunner
 
 from chronoclean.cli.main import app
+from chronoclean.core.date_inference import DateInferenceEngine
+from chronoclean.core.folder_tagger import FolderTagger
+from chronoclean.core.scanner import Scanner
 from chronoclean.core.tag_rules_store import TagRulesStore
 
 
@@ -178,6 +182,89 @@ class TestTagsListCommand:
         data = json.loads(output_file.read_text())
         assert "tag_candidates" in data
     
+    def test_list_json_keeps_non_ascii_tags(self, source_with_folders, tmp_path):
+        """Tags outside ASCII are written as UTF-8 and read back intact."""
+        folder = source_with_folders / "Été à Québec"
+        folder.mkdir()
+        (folder / "IMG_003.jpg").write_bytes((source_with_folders / "Paris 2022" / "IMG_001.jpg").read_bytes())
+        output_file = tmp_path / "tags.json"
+        
+        result = runner.invoke(app, [
+            "tags", "list", str(source_with_folders),
+            "--format", "json",
+            "--output", str(output_file),
+            "--no-videos"
+        ])
+        
+        assert result.exit_code == 0
+        data = json.loads(output_file.read_text(encoding="utf-8"))
+        assert "Été_à_Québec" in [c["tag"] for c in data["tag_candidates"]]
+    
+    def test_list_classifies_each_ignored_folder_once(self, tmp_path):
+        """Files sharing an ignored folder reuse its classification."""
+        ignored = tmp_path / "source" / "ab"
+        ignored.mkdir(parents=True)
+        for i in range(5):
+            (ignored / f"IMG_{i}.jpg").write_bytes(b"\xff\xd8\xff\xe0\x00\x10JFIF\x00")
+        events = []
+        classify_folder = FolderTagger.classify_folder
+        
+        def spy_classify(self, folder_name):
+            events.append(folder_name)
+            return classify_folder(self, folder_name)
+        
+        with patch.object(FolderTagger, "classify_folder", spy_classify):
+            result = runner.invoke(app, [
+                "tags", "list", str(tmp_path / "source"),
+                "--format", "json",
+                "--no-videos"
+            ])
+        
+        assert result.exit_code == 0
+        # Once by the walk for the folder, once for its reason: not per file
+        assert events == ["ab", "ab"]
+        data = json.loads(result.output[result.output.find("{"):])
+        assert data["ignored_folders"][0]["count"] == 5
+    
+    def test_list_reads_no_dates(self, source_with_folders):
+        """Listing tags walks the tree without building full scan records."""
+        with patch.object(Scanner, "scan") as mock_scan, \
+                patch.object(DateInferenceEngine, "infer_date") as mock_infer:
+            result = runner.invoke(app, [
+                "tags", "list", str(source_with_folders),
+                "--format", "json",
+                "--no-videos"
+            ])
+        
+        assert result.exit_code == 0
+        mock_scan.assert_not_called()
+        mock_infer.assert_not_called()
+        data = json.loads(result.output[result.output.find("{"):])
+        assert data["tag_candidates"]
+    
+    def test_list_caps_samples_but_counts_every_file(self, tmp_path):
+        """--samples limits the paths listed, not the counts."""
+        for folder in ("Paris 2022", "ab"):
+            path = tmp_path / "source" / folder
+            path.mkdir(parents=True)
+            for i in range(4):
+                (path / f"IMG_{i}.jpg").write_bytes(b"\xff\xd8\xff\xe0\x00\x10JFIF\x00")
+        
+        result = runner.invoke(app, [
+            "tags", "list", str(tmp_path / "source"),
+            "--format", "json",
+            "--samples", "2",
+            "--no-videos"
+        ])
+        
+        assert result.exit_code == 0
+        data = json.loads(result.output[result.output.find("{"):])
+        [tag] = data["tag_candidates"]
+        [ignored] = data["ignored_folders"]
+        assert (tag["count"], len(tag["samples"])) == (4, 2)
+        assert (ignored["count"], len(ignored["samples"])) == (4, 2)
+        assert ignored["reason"] == "too_short"
+    
     def test_list_no_show_ignored(self, source_with_folders):
         """Test --no-show-ignored hides ignored folders."""
         result = runner.invoke(app, [
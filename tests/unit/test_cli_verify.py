@@ -2,10 +2,13 @@
 
 import json
 import pytest
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 from typer.testing import CliRunner
 
 from chronoclean.cli.main import app
+from chronoclean.core.verifier import Verifier
 
 
 runner = CliRunner()
@@ -34,6 +37,7 @@ class TestVerifyCommandBasic:
         result = runner.invoke(app, ["verify", "--run-file", str(fake_file)])
         
         assert result.exit_code == 1
+        assert "Run file not found" in result.stdout
     
     def test_verify_help(self):
         """verify --help shows usage information."""
@@ -85,9 +89,104 @@ class TestVerifyReconstructMode:
         # Should complete (with 0 files verified)
         assert result.exit_code == 0 or "No files" in result.stdout
 
+    def test_verify_reconstruct_expected_paths(self, tmp_path, monkeypatch):
+        """Reconstruct maps dated files to tagged names and skips undated ones."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "chronoclean.yaml").write_text(
+            "folder_tags:\n  enabled: true\n"
+            "sorting:\n  fallback_date_priority: [exif, filename]\n"
+        )
+        source = tmp_path / "source" / "Paris Trip"
+        dest = tmp_path / "dest"
+        source.mkdir(parents=True)
+        dest.mkdir()
+        (source / "IMG_20240315_143000.jpg").write_bytes(JPEG_HEADER)
+        (source / "IMG_20230101_120000.jpg").write_bytes(JPEG_HEADER)
+        (source / "undated.jpg").write_bytes(JPEG_HEADER)
+
+        pairs_seen = []
+        real_verify_pairs = Verifier.verify_pairs
+
+        def verify_pairs(self, pairs, **kwargs):
+            pairs_seen.extend(pairs)
+            return real_verify_pairs(self, pairs, **kwargs)
+
+        with patch.object(Verifier, "verify_pairs", verify_pairs):
+            result = runner.invoke(app, [
+                "verify", "--reconstruct",
+                "--source", str(tmp_path / "source"),
+                "--destination", str(dest),
+                "--algorithm", "quick",
+            ])
+
+        assert result.exit_code == 0, result.stdout
+        assert "Skipped 1 files without dates" in result.stdout
+        # Pairs are verified in destination order
+        assert pairs_seen == [
+            (source / "IMG_20230101_120000.jpg",
+             dest / "2023" / "01" / "IMG_20230101_120000_Paris_Trip.jpg"),
+            (source / "IMG_20240315_143000.jpg",
+             dest / "2024" / "03" / "IMG_20240315_143000_Paris_Trip.jpg"),
+        ]
+
+    def test_verify_reconstruct_id_matches_created_at(self, tmp_path, monkeypatch):
+        """The reconstructed report's id is stamped with its created_at."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        (source / "IMG_20240315_143000.jpg").write_bytes(JPEG_HEADER)
+
+        created = datetime(2024, 3, 15, 14, 30, 0, 999999)
+        with patch("chronoclean.cli.verify_cmd.datetime") as mock_datetime:
+            mock_datetime.now.return_value = created
+            result = runner.invoke(app, [
+                "verify", "--reconstruct",
+                "--source", str(source),
+                "--destination", str(dest),
+                "--algorithm", "quick",
+            ])
+
+        assert result.exit_code == 0, result.stdout
+        [report_file] = (tmp_path / ".chronoclean" / "verifications").glob("*_verify.json")
+        data = json.loads(report_file.read_text())
+        assert data["created_at"] == created.isoformat()
+        assert data["verify_id"].startswith("20240315_143000")
+
 
 class TestVerifyCommandOptions:
     """Tests for verify command options."""
+
+    def test_verify_jobs_option(self, tmp_path, monkeypatch):
+        """verify --jobs hands the worker count to the verifier."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest" / "2024" / "03"
+        source.mkdir()
+        dest.mkdir(parents=True)
+        name = "IMG_20240315_143000.jpg"
+        (source / name).write_bytes(JPEG_HEADER)
+        (dest / name).write_bytes(JPEG_HEADER)
+
+        calls = []
+        real_verify_pairs = Verifier.verify_pairs
+
+        def verify_pairs(self, pairs, **kwargs):
+            calls.append(kwargs["jobs"])
+            return real_verify_pairs(self, pairs, **kwargs)
+
+        with patch.object(Verifier, "verify_pairs", verify_pairs):
+            result = runner.invoke(app, [
+                "verify", "--reconstruct",
+                "--source", str(source),
+                "--destination", str(tmp_path / "dest"),
+                "--jobs", "2",
+            ])
+
+        assert result.exit_code == 0, result.stdout
+        assert calls == [2]
+        assert "OK:" in result.stdout
     
     def test_verify_algorithm_option(self, tmp_path, monkeypatch):
         """verify accepts --algorithm option."""
@@ -184,6 +283,53 @@ class TestVerifyWithRunRecord:
         # (may exit 0 or show verification info)
         assert "Verification" in result.stdout or "verified" in result.stdout.lower() or "OK" in result.stdout or result.exit_code == 0
 
+    def test_verify_results_block(self, tmp_path, monkeypatch):
+        """The results summary prints its lines in order."""
+        monkeypatch.chdir(tmp_path)
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        (source / "photo.jpg").write_bytes(JPEG_HEADER)
+        (dest / "photo.jpg").write_bytes(JPEG_HEADER)
+        
+        run_file = tmp_path / "run.json"
+        run_file.write_text(json.dumps({
+            "run_id": "test-run-002",
+            "created_at": "2025-12-31T12:00:00",
+            "source_root": str(source),
+            "destination_root": str(dest),
+            "mode": "live_copy",
+            "config_signature": {
+                "folder_structure": "YYYY/MM",
+                "renaming_enabled": False,
+                "renaming_pattern": "{date}_{original}",
+                "folder_tags_enabled": False,
+                "on_collision": "increment",
+            },
+            "entries": [
+                {
+                    "source_path": str(source / "photo.jpg"),
+                    "destination_path": str(dest / "photo.jpg"),
+                    "operation": "copy",
+                    "status": "success",
+                }
+            ],
+        }))
+        
+        result = runner.invoke(app, ["verify", "--run-file", str(run_file)])
+        
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        start = lines.index("Verification Results:")
+        assert lines[start - 1] == ""
+        assert lines[start + 1:start + 4] == [
+            "  Algorithm: sha256",
+            "  Total files: 1",
+            "  ✅ OK: 1",
+        ]
+        assert any(line.startswith("Report: ") for line in lines[start:])
+
 
 class TestVerifyCommandWithConfig:
     """Tests for verify command with config file."""
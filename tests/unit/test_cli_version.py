@@ -1,7 +1,13 @@
 """Tests for version CLI command."""
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 from typer.testing import CliRunner
 
+import chronoclean
 from chronoclean import __version__
 from chronoclean.cli.main import app
 
@@ -27,3 +33,26 @@ class TestVersionCommand:
         assert result.exit_code == 0
         # Should be "ChronoClean v0.3.3" format
         assert f"v{__version__}" in result.stdout
+
+
+class TestCliStartupImports:
+    """CLI startup should not load the scan pipeline."""
+
+    def test_scan_pipeline_not_imported_at_startup(self):
+        """Importing the CLI app leaves scanner/file-operation/progress/table modules unloaded."""
+        code = (
+            "import sys, chronoclean.cli.main; "
+            "print(','.join(m for m in ("
+            "'chronoclean.core.scanner', 'chronoclean.core.date_inference', "
+            "'chronoclean.core.scan_cache', 'chronoclean.core.file_operations', "
+            "'chronoclean.core.duplicate_checker', 'rich.progress', "
+            "'rich.table', 'importlib.metadata', 'chronoclean.core.models', "
+            "'chronoclean.core.video_metadata') if m in sys.modules))"
+        )
+        project_root = Path(chronoclean.__file__).resolve().parents[1]
+        env = {**os.environ, "PYTHONPATH": str(project_root)}
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=env
+        )
+
+        assert result.stdout.strip() == ""
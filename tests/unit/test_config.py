@@ -1,8 +1,11 @@
 """Unit tests for chronoclean.config module."""
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from chronoclean.config.loader import ConfigError, ConfigLoader
 from chronoclean.config.schema import (
@@ -92,6 +95,7 @@ class TestScanConfig:
         assert ".mp4" in config.video_extensions
         assert ".cr2" in config.raw_extensions
         assert config.skip_exif_errors is True
+        assert config.exif_backend == "exifread"
         assert config.limit is None
 
     def test_custom_extensions(self):
@@ -103,6 +107,14 @@ class TestScanConfig:
         assert len(config.image_extensions) == 2
         assert len(config.video_extensions) == 1
 
+    def test_extension_sets_are_cached_frozensets(self):
+        config = ScanConfig(image_extensions=[".jpg", ".png"])
+
+        assert config.image_extensions_set == frozenset({".jpg", ".png"})
+        assert isinstance(config.video_extensions_set, frozenset)
+        assert isinstance(config.raw_extensions_set, frozenset)
+        assert config.image_extensions_set is config.image_extensions_set
+
 
 class TestSortingConfig:
     """Tests for SortingConfig dataclass."""
@@ -283,6 +295,111 @@ folder_tags:
         assert "custom_ignore" in config.folder_tags.ignore_list
         assert "always" in config.folder_tags.force_list
 
+    def test_load_performance_io_workers(self, temp_dir: Path):
+        """Load apply I/O worker count from YAML."""
+        config_path = temp_dir / "perf.yaml"
+        config_path.write_text("""
+performance:
+  io_workers: 4
+""")
+
+        config = ConfigLoader.load(config_path)
+
+        assert config.performance.io_workers == 4
+        assert ChronoCleanConfig().performance.io_workers == 1
+
+    def test_load_performance_scan_threads(self, temp_dir: Path):
+        """Load scan metadata thread count from YAML."""
+        config_path = temp_dir / "perf.yaml"
+        config_path.write_text("""
+performance:
+  scan_threads: 8
+""")
+
+        config = ConfigLoader.load(config_path)
+
+        assert config.performance.scan_threads == 8
+        assert ChronoCleanConfig().performance.scan_threads == 1
+
+    def test_load_performance_verify_jobs(self, temp_dir: Path):
+        """Load verify worker process count from YAML."""
+        config_path = temp_dir / "perf.yaml"
+        config_path.write_text("""
+performance:
+  verify_jobs: 0
+""")
+
+        config = ConfigLoader.load(config_path)
+
+        assert config.performance.verify_jobs == 0
+        assert ChronoCleanConfig().performance.verify_jobs == 1
+
+    @pytest.mark.parametrize("key", ["max_workers", "io_workers", "scan_threads", "verify_jobs"])
+    def test_load_rejects_negative_worker_counts(self, temp_dir: Path, key):
+        """Negative worker counts fail at load, not once a pool is created."""
+        config_path = temp_dir / "perf.yaml"
+        config_path.write_text(f"performance:\n  {key}: -1\n")
+
+        with pytest.raises(ConfigError, match=f"performance.{key} must be 0"):
+            ConfigLoader.load(config_path)
+
+    def test_load_parses_unchanged_file_once(self, temp_dir: Path):
+        """Repeated loads of an unchanged file reuse the parsed YAML."""
+        config_path = temp_dir / "cached.yaml"
+        config_path.write_text("folder_tags:\n  ignore_list:\n    - skipme\n")
+
+        with patch("chronoclean.config.loader.yaml.load", wraps=yaml.load) as mock_load:
+            first = ConfigLoader.load(config_path)
+            second = ConfigLoader.load(config_path)
+
+        assert mock_load.call_count == 1
+        assert first.folder_tags.ignore_list == second.folder_tags.ignore_list
+        # Each load builds an independent config
+        first.folder_tags.ignore_list.append("mutated")
+        assert "mutated" not in ConfigLoader.load(config_path).folder_tags.ignore_list
+
+    def test_load_reparses_modified_file(self, temp_dir: Path):
+        """A modified file is parsed again."""
+        config_path = temp_dir / "changing.yaml"
+        config_path.write_text("general:\n  recursive: true\n")
+        assert ConfigLoader.load(config_path).general.recursive is True
+
+        config_path.write_text("general:\n  recursive: false\n")
+        st = config_path.stat()
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert ConfigLoader.load(config_path).general.recursive is False
+
+    def test_load_cached_reuses_config_until_file_changes(self, temp_dir: Path):
+        """load_cached returns the same object while the file is unchanged."""
+        config_path = temp_dir / "shared.yaml"
+        config_path.write_text("general:\n  recursive: true\n")
+
+        first = ConfigLoader.load_cached(config_path)
+        assert ConfigLoader.load_cached(config_path) is first
+
+        config_path.write_text("general:\n  recursive: false\n")
+        st = config_path.stat()
+        os.utime(config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert ConfigLoader.load_cached(config_path).general.recursive is False
+
+    def test_load_cached_uses_default_path(self, temp_dir: Path, monkeypatch):
+        """Without a path, load_cached follows the default config search."""
+        monkeypatch.chdir(temp_dir)
+        assert ConfigLoader.find_default_path() is None
+        assert ConfigLoader.load_cached().general.recursive is True
+
+        (temp_dir / "chronoclean.yaml").write_text("general:\n  recursive: false\n")
+
+        assert ConfigLoader.find_default_path() == Path("chronoclean.yaml")
+        assert ConfigLoader.load_cached().general.recursive is False
+
+    def test_load_cached_missing_file_raises(self, temp_dir: Path):
+        """An explicit missing path still raises ConfigError."""
+        with pytest.raises(ConfigError):
+            ConfigLoader.load_cached(temp_dir / "missing.yaml")
+
 
 class TestConfigValidation:
     """Tests for configuration validation."""
@@ -314,6 +431,15 @@ class TestConfigValidation:
         assert len(errors) > 0
         assert any("fallback" in e.lower() for e in errors)
 
+    def test_validate_invalid_exif_backend(self):
+        """Unknown EXIF backend returns error."""
+        config = ChronoCleanConfig()
+        config.scan.exif_backend = "pillow"
+
+        errors = ConfigLoader.validate(config)
+
+        assert any("exif_backend" in e for e in errors)
+
     def test_validate_invalid_log_level(self):
         """Invalid log level returns error."""
         config = ChronoCleanConfig()
@@ -353,3 +479,12 @@ class TestConfigValidation:
 
         assert len(errors) > 0
         assert any("max_length" in e.lower() for e in errors)
+
+    def test_validate_negative_worker_count(self):
+        """Negative worker counts return an error."""
+        config = ChronoCleanConfig()
+        config.performance.verify_jobs = -1
+
+        errors = ConfigLoader.validate(config)
+
+        assert errors == ["performance.verify_jobs must be >= 0"]
@@ -63,6 +63,19 @@ class TestConfigInit:
         assert result.exit_code == 0
         assert output_path.exists()
     
+    @pytest.mark.skipif(os.name == "nt", reason="symlinks need privileges on Windows")
+    def test_init_relative_output_through_symlink(self, tmp_path, monkeypatch):
+        """config init writes a relative --output without resolving symlinks."""
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        monkeypatch.chdir(tmp_path)
+        
+        result = runner.invoke(app, ["config", "init", "-o", "link/cc.yaml"])
+        
+        assert result.exit_code == 0
+        assert (tmp_path / "real" / "cc.yaml").exists()
+        assert str(tmp_path / "link" / "cc.yaml") in result.stdout.replace("\n", "")
+    
     def test_init_refuses_overwrite_without_force(self, tmp_path, monkeypatch):
         """config init won't overwrite existing file without --force."""
         monkeypatch.chdir(tmp_path)
@@ -130,6 +143,24 @@ sorting:
         # Check that config source is shown
         assert "chronoclean.yaml" in result.stdout
     
+    def test_show_searches_default_paths_once(self, tmp_path, monkeypatch):
+        """config show reuses one default-path search for loading and display."""
+        from unittest.mock import patch
+        from chronoclean.config import ConfigLoader
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / ".chronoclean").mkdir()
+        (tmp_path / ".chronoclean" / "config.yaml").write_text("general:\n  recursive: false\n")
+        
+        with patch.object(
+            ConfigLoader, "find_default_path", wraps=ConfigLoader.find_default_path
+        ) as find:
+            result = runner.invoke(app, ["config", "show", "--section", "general"])
+        
+        assert result.exit_code == 0
+        assert find.call_count == 1
+        assert "config.yaml" in result.stdout
+        assert "recursive: false" in result.stdout
+    
     def test_show_specific_section(self, tmp_path, monkeypatch):
         """config show --section displays only that section."""
         monkeypatch.chdir(tmp_path)
@@ -139,6 +170,19 @@ sorting:
         assert result.exit_code == 0
         assert "sorting:" in result.stdout
     
+    def test_show_section_is_loadable_yaml(self, tmp_path, monkeypatch):
+        """config show prints YAML that loads back to the effective values."""
+        import yaml
+        from dataclasses import asdict
+        from chronoclean.config.schema import ChronoCleanConfig
+        monkeypatch.chdir(tmp_path)
+        
+        result = runner.invoke(app, ["config", "show", "--section", "sorting"])
+        
+        assert result.exit_code == 0
+        shown = yaml.safe_load(result.stdout[result.stdout.index("sorting:"):])
+        assert shown == {"sorting": asdict(ChronoCleanConfig().sorting)}
+    
     def test_show_unknown_section_error(self, tmp_path, monkeypatch):
         """config show --section with unknown section shows error."""
         monkeypatch.chdir(tmp_path)
@@ -93,6 +93,19 @@ class TestInferDateFromFilesystem:
         now = datetime.now()
         assert (now - date).total_seconds() < 60
 
+    def test_filesystem_date_uses_given_stat(self, temp_dir: Path):
+        """A stat result passed in is used instead of stat'ing again."""
+        jpg_file = temp_dir / "test.jpg"
+        jpg_file.write_bytes(b"\xFF\xD8\xFF\xE0")
+        file_stat = MagicMock(st_mtime=datetime(2020, 5, 17, 12, 0).timestamp())
+
+        engine = DateInferenceEngine(priority=["filesystem"])
+        with patch.object(Path, "stat", side_effect=AssertionError("re-stat")):
+            date, source = engine.infer_date(jpg_file, file_stat=file_stat)
+
+        assert date == datetime(2020, 5, 17, 12, 0)
+        assert source == DateSource.FILESYSTEM_MODIFIED
+
 
 class TestInferDateFromFolderName:
     """Tests for folder name date inference."""
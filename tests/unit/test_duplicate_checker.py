@@ -1,8 +1,12 @@
 """Tests for duplicate checker module (v0.2)."""
 
+import os
+import threading
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
+from chronoclean.core import duplicate_checker
 from chronoclean.core.duplicate_checker import (
     DuplicateChecker,
     compute_file_hash,
@@ -39,6 +43,16 @@ class TestDuplicateCheckerInit:
         checker = DuplicateChecker(cache_enabled=False)
         assert checker.cache_enabled is False
 
+    def test_blake3_when_installed(self):
+        with patch("chronoclean.core.duplicate_checker.is_blake3_available", return_value=True):
+            checker = DuplicateChecker(algorithm="blake3")
+        assert checker.algorithm == "blake3"
+
+    def test_blake3_falls_back_without_package(self):
+        with patch("chronoclean.core.duplicate_checker.is_blake3_available", return_value=False):
+            checker = DuplicateChecker(algorithm="blake3")
+        assert checker.algorithm == "sha256"
+
     def test_case_insensitive_algorithm(self):
         """Test algorithm name is case insensitive."""
         checker = DuplicateChecker(algorithm="SHA256")
@@ -123,6 +137,20 @@ class TestComputeHash:
         assert hash1 == hash2
         assert checker.get_cache_size() == 1
 
+    def test_hash_cache_misses_after_change(self, tmp_path):
+        """A modified file is hashed again instead of served from cache."""
+        file = tmp_path / "test.txt"
+        file.write_text("content")
+        checker = DuplicateChecker(cache_enabled=True)
+        hash1 = checker.compute_hash(file)
+
+        file.write_text("changed content")
+        st = file.stat()
+        os.utime(file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        hash2 = checker.compute_hash(file)
+
+        assert hash1 != hash2
+
     def test_hash_no_caching(self, tmp_path):
         """Test hash caching can be disabled."""
         file = tmp_path / "test.txt"
@@ -201,6 +229,40 @@ class TestAreDuplicates:
         checker = DuplicateChecker()
         assert checker.are_duplicates(file1, file2) is False
 
+    def test_pair_hashed_concurrently(self, tmp_path):
+        """Both files of a pair are hashed at the same time."""
+        file1 = tmp_path / "file1.jpg"
+        file2 = tmp_path / "file2.jpg"
+        file1.write_bytes(b"same")
+        file2.write_bytes(b"same")
+        both_started = threading.Barrier(2, timeout=5)
+
+        real_hash = duplicate_checker._compute_file_hash
+
+        def hash_when_both_running(*args, **kwargs):
+            both_started.wait()  # breaks (raises) if the hashes run one after another
+            return real_hash(*args, **kwargs)
+
+        checker = DuplicateChecker()
+        with patch.object(
+            duplicate_checker, "_compute_file_hash", side_effect=hash_when_both_running
+        ):
+            assert checker.are_duplicates(file1, file2) is True
+
+    def test_pair_uses_cached_hashes(self, tmp_path):
+        """Cached hashes are not recomputed for a later comparison."""
+        file1 = tmp_path / "file1.jpg"
+        file2 = tmp_path / "file2.jpg"
+        file1.write_bytes(b"same")
+        file2.write_bytes(b"same")
+        checker = DuplicateChecker()
+        checker.are_duplicates(file1, file2)
+
+        with patch("chronoclean.core.duplicate_checker._compute_file_hash") as mock_hash:
+            assert checker.are_duplicates(file2, file1) is True
+
+        mock_hash.assert_not_called()
+
     def test_different_sizes_fast_fail(self, tmp_path):
         """Test different file sizes skip hash comparison."""
         file1 = tmp_path / "small.txt"
@@ -212,6 +274,31 @@ class TestAreDuplicates:
         # Should return False without computing hashes
         assert checker.are_duplicates(file1, file2) is False
 
+    def test_known_different_sizes_skip_stat(self, tmp_path):
+        """Sizes passed in from the scan settle a mismatch without any I/O."""
+        file1 = tmp_path / "a.jpg"
+        file2 = tmp_path / "b.jpg"
+
+        checker = DuplicateChecker()
+        with patch.object(Path, "stat") as mock_stat:
+            assert checker.are_duplicates(file1, file2, 100, 200) is False
+
+        mock_stat.assert_not_called()
+
+    def test_known_equal_sizes_still_compare_content(self, tmp_path):
+        """Equal known sizes fall through to the hash comparison."""
+        file1 = tmp_path / "a.jpg"
+        file2 = tmp_path / "b.jpg"
+        file3 = tmp_path / "c.jpg"
+        file1.write_bytes(b"same")
+        file2.write_bytes(b"diff")
+        file3.write_bytes(b"same")
+
+        checker = DuplicateChecker()
+
+        assert checker.are_duplicates(file1, file2, 4, 4) is False
+        assert checker.are_duplicates(file1, file3, 4, 4) is True
+
 
 class TestFindDuplicatesInList:
     """Tests for find_duplicates_in_list method."""
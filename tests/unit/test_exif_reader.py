@@ -93,6 +93,17 @@ class TestExifReader:
         with pytest.raises(ExifReadError, match="not found"):
             reader.read(fake_path)
 
+    @patch("chronoclean.core.exif_reader.exifread.process_file", return_value={})
+    def test_read_skips_existence_precheck(self, mock_process, temp_dir: Path):
+        """Supported files are opened directly without a separate stat."""
+        jpg_file = temp_dir / "test.jpg"
+        jpg_file.write_bytes(b"\xFF\xD8\xFF\xE0")
+
+        with patch.object(Path, "exists", side_effect=AssertionError("extra stat")):
+            result = ExifReader().read(jpg_file)
+
+        assert result.best_date is None
+
     def test_read_unsupported_extension(self, temp_dir: Path):
         """Unsupported extension returns empty ExifData."""
         reader = ExifReader()
@@ -178,6 +189,95 @@ class TestExifReader:
         assert reader.has_exif(jpg_file) is False
 
 
+class TestExifReaderFastMode:
+    """Tests for header-only EXIF reads."""
+
+    DATE_TAGS = {
+        "EXIF DateTimeOriginal": MagicMock(__str__=lambda s: "2024:03:15 14:30:00"),
+    }
+
+    def _large_jpeg(self, temp_dir: Path) -> Path:
+        jpg_file = temp_dir / "large.jpg"
+        jpg_file.write_bytes(b"\xFF\xD8\xFF\xE0" + b"\x00" * (ExifReader.FAST_READ_MAX_BYTES * 2))
+        return jpg_file
+
+    @patch("chronoclean.core.exif_reader.exifread.process_file")
+    def test_header_only_when_date_found(self, mock_process, temp_dir: Path):
+        """Large files are parsed from the header window only."""
+        mock_process.return_value = self.DATE_TAGS
+
+        result = ExifReader().read(self._large_jpeg(temp_dir))
+
+        assert result.date_original == datetime(2024, 3, 15, 14, 30, 0)
+        assert mock_process.call_count == 1
+        header = mock_process.call_args.args[0]
+        assert len(header.getvalue()) == ExifReader.FAST_READ_BYTES
+
+    @patch("chronoclean.core.exif_reader.exifread.process_file")
+    def test_window_grows_when_date_missing(self, mock_process, temp_dir: Path):
+        """EXIF without DateTimeOriginal retries with a larger window."""
+        mock_process.side_effect = [{"Image Make": "Canon"}, self.DATE_TAGS]
+
+        result = ExifReader().read(self._large_jpeg(temp_dir))
+
+        assert result.date_original == datetime(2024, 3, 15, 14, 30, 0)
+        assert mock_process.call_count == 2
+        header = mock_process.call_args.args[0]
+        assert len(header.getvalue()) == ExifReader.FAST_READ_BYTES * 2
+
+    @patch("chronoclean.core.exif_reader.exifread.process_file")
+    def test_falls_back_to_full_read(self, mock_process, temp_dir: Path):
+        """No DateTimeOriginal within the largest window triggers a full-file parse."""
+        windows = 4  # 64, 128, 256, 512 KB
+        mock_process.side_effect = [{"Image Make": "Canon"}] * windows + [self.DATE_TAGS]
+
+        result = ExifReader().read(self._large_jpeg(temp_dir))
+
+        assert result.date_original == datetime(2024, 3, 15, 14, 30, 0)
+        assert mock_process.call_count == windows + 1
+        assert not hasattr(mock_process.call_args.args[0], "getvalue")
+
+    @patch("chronoclean.core.exif_reader.exifread.process_file")
+    def test_no_exif_in_header_skips_larger_windows(self, mock_process, temp_dir: Path):
+        """A header without any EXIF goes straight to the full read."""
+        mock_process.side_effect = [{}, {}]
+
+        ExifReader().read(self._large_jpeg(temp_dir))
+
+        assert mock_process.call_count == 2
+
+    @patch("chronoclean.core.exif_reader.exifread.process_file")
+    def test_falls_back_on_header_error(self, mock_process, temp_dir: Path):
+        """Parse errors on the truncated header are not fatal."""
+        mock_process.side_effect = [ValueError("truncated"), self.DATE_TAGS]
+
+        result = ExifReader(skip_errors=False).read(self._large_jpeg(temp_dir))
+
+        assert result.date_original == datetime(2024, 3, 15, 14, 30, 0)
+
+    @patch("chronoclean.core.exif_reader.exifread.process_file")
+    def test_small_file_parsed_from_memory(self, mock_process, temp_dir: Path):
+        """Files shorter than the window are parsed once, from the bytes read."""
+        mock_process.return_value = {}
+        jpg_file = temp_dir / "small.jpg"
+        jpg_file.write_bytes(b"\xFF\xD8\xFF\xE0" + b"\x00" * 100)
+
+        ExifReader().read(jpg_file)
+
+        assert mock_process.call_count == 1
+        assert len(mock_process.call_args.args[0].getvalue()) == 104
+
+    @patch("chronoclean.core.exif_reader.exifread.process_file")
+    def test_fast_disabled_reads_full_file(self, mock_process, temp_dir: Path):
+        """fast=False always parses the whole file."""
+        mock_process.return_value = self.DATE_TAGS
+
+        ExifReader(fast=False).read(self._large_jpeg(temp_dir))
+
+        assert mock_process.call_count == 1
+        assert not hasattr(mock_process.call_args.args[0], "getvalue")
+
+
 class TestExifReaderDateParsing:
     """Tests for EXIF date parsing."""
 
@@ -0,0 +1,150 @@
+"""Unit tests for chronoclean.core.exiftool_process."""
+
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from chronoclean.core.exif_reader import ExifReader
+from chronoclean.core.exiftool_process import ExifToolProcess
+
+# Minimal stand-in for `exiftool -stay_open True -@ -`: answers each
+# -execute with JSON for the file argument, then prints {ready}.
+FAKE_EXIFTOOL = """\
+import json, os, sys
+
+args = []
+for line in sys.stdin:
+    line = line.rstrip("\\n")
+    if line == "-execute":
+        path = args[-1]
+        if os.path.exists(path):
+            entry = {"SourceFile": path}
+            if path.endswith("dated.jpg"):
+                entry.update(DateTimeOriginal="2024:03:15 14:30:00", Make="Canon", Orientation=6)
+            sys.stdout.write(json.dumps([entry]) + "\\n")
+        sys.stdout.write("{ready}\\n")
+        sys.stdout.flush()
+        args = []
+    elif line == "False" and args and args[-1] == "-stay_open":
+        break
+    else:
+        args.append(line)
+"""
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake exiftool is a POSIX script")
+
+
+@pytest.fixture
+def fake_exiftool(temp_dir: Path) -> str:
+    script = temp_dir / "exiftool"
+    script.write_text(f"#!{sys.executable}\n{FAKE_EXIFTOOL}")
+    script.chmod(0o755)
+    return str(script)
+
+
+class TestExifToolProcess:
+    """Tests for the persistent exiftool process."""
+
+    def test_reads_tags_under_exifread_names(self, temp_dir: Path, fake_exiftool: str):
+        photo = temp_dir / "dated.jpg"
+        photo.write_bytes(b"test")
+        exiftool = ExifToolProcess(fake_exiftool)
+
+        try:
+            tags = exiftool.read_tags(photo)
+        finally:
+            exiftool.close()
+
+        assert tags == {
+            "EXIF DateTimeOriginal": "2024:03:15 14:30:00",
+            "Image Make": "Canon",
+            "Image Orientation": 6,
+        }
+
+    def test_one_process_for_many_files(self, temp_dir: Path, fake_exiftool: str):
+        exiftool = ExifToolProcess(fake_exiftool)
+        try:
+            for i in range(3):
+                photo = temp_dir / f"plain{i}.jpg"
+                photo.write_bytes(b"test")
+                assert exiftool.read_tags(photo) == {}
+            pid = exiftool._process.pid
+            exiftool.read_tags(temp_dir / "plain0.jpg")
+            assert exiftool._process.pid == pid
+        finally:
+            exiftool.close()
+
+        assert exiftool._process is None
+
+    def test_missing_file_returns_none(self, temp_dir: Path, fake_exiftool: str):
+        exiftool = ExifToolProcess(fake_exiftool)
+        try:
+            assert exiftool.read_tags(temp_dir / "missing.jpg") is None
+        finally:
+            exiftool.close()
+
+    def test_unavailable_binary_returns_none(self, temp_dir: Path):
+        exiftool = ExifToolProcess(str(temp_dir / "no-such-exiftool"))
+
+        assert exiftool.read_tags(temp_dir / "photo.jpg") is None
+        assert exiftool._failed
+
+    def test_is_available(self, fake_exiftool: str, temp_dir: Path):
+        assert ExifToolProcess.is_available(fake_exiftool)
+        assert not ExifToolProcess.is_available(str(temp_dir / "no-such-exiftool"))
+
+    def test_pickled_copy_starts_its_own_process(self, temp_dir: Path, fake_exiftool: str):
+        import pickle
+
+        photo = temp_dir / "dated.jpg"
+        photo.write_bytes(b"test")
+        exiftool = ExifToolProcess(fake_exiftool)
+        try:
+            exiftool.read_tags(photo)
+            copy = pickle.loads(pickle.dumps(exiftool))
+            assert copy._process is None
+            assert copy.exiftool_path == fake_exiftool
+        finally:
+            exiftool.close()
+
+
+class TestExifReaderWithExifTool:
+    """Tests for ExifReader backed by exiftool."""
+
+    def test_uses_exiftool_tags(self, temp_dir: Path):
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"\xFF\xD8\xFF\xE0")
+        exiftool = MagicMock()
+        exiftool.read_tags.return_value = {
+            "EXIF DateTimeOriginal": "2024:03:15 14:30:00",
+            "Image Orientation": 6,
+        }
+
+        data = ExifReader(exiftool=exiftool).read(photo)
+
+        assert data.date_original == datetime(2024, 3, 15, 14, 30, 0)
+        assert data.orientation == 6
+
+    def test_falls_back_to_exifread(self, temp_dir: Path):
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"\xFF\xD8\xFF\xE0")
+        exiftool = MagicMock()
+        exiftool.read_tags.return_value = None
+
+        data = ExifReader(exiftool=exiftool).read(photo)
+
+        exiftool.read_tags.assert_called_once_with(photo)
+        assert data.best_date is None
+
+    def test_unsupported_extension_skips_exiftool(self, temp_dir: Path):
+        text = temp_dir / "notes.txt"
+        text.write_text("hello")
+        exiftool = MagicMock()
+
+        ExifReader(exiftool=exiftool).read(text)
+
+        exiftool.read_tags.assert_not_called()
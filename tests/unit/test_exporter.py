@@ -173,6 +173,25 @@ class TestToJson:
         assert "\n" in pretty_json
         assert "\n" not in compact_json
 
+    @pytest.mark.parametrize("pretty_print", [True, False])
+    @pytest.mark.parametrize("include_statistics", [True, False])
+    @pytest.mark.parametrize("with_files", [True, False])
+    def test_streamed_json_matches_json_dumps(self, pretty_print, include_statistics, with_files):
+        """write_json streams the same document json.dumps would build."""
+        scan_result = create_test_scan_result(None if with_files else [])
+        if with_files:
+            scan_result.files[0].folder_tags = ["Paris", "2024"]
+        exporter = Exporter(include_statistics=include_statistics, pretty_print=pretty_print)
+        
+        stream = io.StringIO()
+        exporter.write_json(scan_result, stream)
+        expected = exporter.to_dict(scan_result)
+        written = stream.getvalue()
+        expected["export_timestamp"] = json.loads(written)["export_timestamp"]
+        
+        indent = 2 if pretty_print else None
+        assert written == json.dumps(expected, indent=indent)
+
     def test_json_writes_to_file(self, tmp_path):
         """Test JSON writes to file."""
         scan_result = create_test_scan_result()
@@ -446,6 +465,23 @@ class TestStatistics:
         
         assert data["statistics"]["duplicate_count"] == 1
 
+    def test_error_category_counts(self):
+        """Test error categories are tallied from records."""
+        records = [
+            create_test_record(),
+            create_test_record(source_path="/photos/b.jpg"),
+            create_test_record(source_path="/photos/c.jpg"),
+        ]
+        records[0].error_category = "exif_error"
+        records[2].error_category = "exif_error"
+        exporter = Exporter()
+        
+        stats = exporter._compute_statistics(create_test_scan_result(records))
+        
+        assert stats["errors_by_category"] == {"exif_error": 2}
+        assert type(stats["date_sources"]) is dict
+        assert exporter._compute_statistics(create_test_scan_result([create_test_record()]))["errors_by_category"] is None
+
     def test_human_readable_size(self):
         """Test human readable size formatting."""
         exporter = Exporter()
@@ -1,5 +1,8 @@
 """Unit tests for chronoclean.core.file_operations."""
 
+import errno
+import os
+import shutil
 from pathlib import Path
 from unittest.mock import patch
 
@@ -7,6 +10,7 @@ import pytest
 
 from chronoclean.core.file_operations import (
     BatchOperations,
+    DestinationReservations,
     FileOperationError,
     FileOperations,
 )
@@ -64,6 +68,63 @@ class TestMoveFile:
         assert dest.exists()  # File at destination
         assert dest.read_bytes() == b"test content"
 
+    @pytest.mark.parametrize("preserve_metadata", [True, False])
+    def test_same_filesystem_move_uses_rename(self, temp_dir: Path, preserve_metadata: bool):
+        source = temp_dir / "source.jpg"
+        source.write_bytes(b"test content")
+        dest = temp_dir / "dest" / "moved.jpg"
+
+        ops = FileOperations(dry_run=False, preserve_metadata=preserve_metadata)
+        with patch("chronoclean.core.file_operations.shutil") as mock_shutil:
+            success, _ = ops.move_file(source, dest)
+
+        assert success is True
+        mock_shutil.move.assert_not_called()
+        mock_shutil.copy2.assert_not_called()
+        assert not source.exists()
+        assert dest.read_bytes() == b"test content"
+
+    def test_rename_failure_falls_back_to_shutil_move(self, temp_dir: Path):
+        source = temp_dir / "source.jpg"
+        source.write_bytes(b"test content")
+        dest = temp_dir / "dest" / "moved.jpg"
+
+        ops = FileOperations(dry_run=False)
+        with patch(
+            "chronoclean.core.file_operations.os.rename",
+            side_effect=OSError(18, "Invalid cross-device link"),
+        ), patch(
+            "chronoclean.core.file_operations.shutil.move",
+            wraps=shutil.move,
+        ) as mock_move:
+            success, _ = ops.move_file(source, dest)
+
+        assert success is True
+        mock_move.assert_called_once()
+
+    def test_destination_device_cached_per_directory(self, temp_dir: Path):
+        dest_dir = temp_dir / "dest"
+        ops = FileOperations(dry_run=False)
+        for name in ("a.jpg", "b.jpg"):
+            (temp_dir / name).write_bytes(b"x")
+            ops.move_file(temp_dir / name, dest_dir / name)
+
+        assert list(ops._dir_devices) == [dest_dir.resolve()]
+
+    def test_move_stats_source_once(self, temp_dir: Path):
+        source = temp_dir / "source.jpg"
+        source.write_bytes(b"test content")
+        dest = temp_dir / "dest" / "moved.jpg"
+
+        ops = FileOperations(dry_run=False)
+        with patch("chronoclean.core.file_operations.os.stat", wraps=os.stat) as mock_stat:
+            success, _ = ops.move_file(source, dest)
+
+        assert success is True
+        source_stats = [c for c in mock_stat.call_args_list if Path(c.args[0]) == source.resolve()]
+        # One stat inside Path.resolve() plus the validation stat
+        assert len(source_stats) == 2
+
     def test_move_creates_directories(self, temp_dir: Path):
         source = temp_dir / "source.jpg"
         source.write_bytes(b"test")
@@ -187,6 +248,71 @@ class TestCopyFile:
         assert success is False
         assert "already exists" in message
 
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="Linux only")
+    def test_copy_uses_copy_file_range(self, temp_dir: Path):
+        source = temp_dir / "source.jpg"
+        source.write_bytes(b"test content" * 1000)
+        os.chmod(source, 0o640)
+        dest = temp_dir / "dest" / "copied.jpg"
+
+        ops = FileOperations(dry_run=False)
+        with patch(
+            "chronoclean.core.file_operations.os.copy_file_range",
+            wraps=os.copy_file_range,
+        ) as mock_range, patch(
+            "chronoclean.core.file_operations.shutil.copy2",
+        ) as mock_copy2:
+            success, _ = ops.copy_file(source, dest)
+
+        assert success is True
+        assert mock_range.called
+        mock_copy2.assert_not_called()
+        assert dest.read_bytes() == source.read_bytes()
+        assert dest.stat().st_mode == source.stat().st_mode
+        assert dest.stat().st_mtime_ns == source.stat().st_mtime_ns
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="Linux only")
+    def test_unsupported_copy_file_range_falls_back_once(self, temp_dir: Path):
+        ops = FileOperations(dry_run=False)
+        with patch(
+            "chronoclean.core.file_operations.os.copy_file_range",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ) as mock_range:
+            for name in ("a.jpg", "b.jpg"):
+                source = temp_dir / name
+                source.write_bytes(b"test content")
+                success, _ = ops.copy_file(source, temp_dir / "dest" / name)
+                assert success is True
+                assert (temp_dir / "dest" / name).read_bytes() == b"test content"
+
+        # Support is probed once per device pair
+        mock_range.assert_called_once()
+
+    @pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="Linux only")
+    def test_short_copy_file_range_falls_back_to_full_copy(self, temp_dir: Path):
+        """A copy_file_range that stops before EOF never leaves a truncated file."""
+        source = temp_dir / "source.jpg"
+        source.write_bytes(b"test content" * 1000)
+        dest = temp_dir / "dest" / "copied.jpg"
+        real_copy_file_range = os.copy_file_range
+        calls = []
+
+        def short_copy(src, dst, count, *args):
+            # First call copies part of the file, then 0 as if at EOF
+            calls.append(count)
+            return real_copy_file_range(src, dst, 100) if len(calls) == 1 else 0
+
+        ops = FileOperations(dry_run=False)
+        with patch(
+            "chronoclean.core.file_operations.os.copy_file_range",
+            side_effect=short_copy,
+        ):
+            success, _ = ops.copy_file(source, dest)
+
+        assert success is True
+        assert len(calls) == 2
+        assert dest.read_bytes() == source.read_bytes()
+
 
 class TestEnsureUniquePath:
     """Tests for ensure_unique_path method."""
@@ -244,6 +370,49 @@ class TestEnsureUniquePath:
         assert "unique filename" in str(exc_info.value)
 
 
+class TestDestinationReservations:
+    """Tests for DestinationReservations."""
+
+    def test_reserve_and_lookup(self, temp_dir: Path):
+        reserved = DestinationReservations()
+        dest = temp_dir / "2024" / "03" / "photo.jpg"
+        source = temp_dir / "src" / "photo.jpg"
+
+        reserved.reserve(dest, source)
+
+        assert dest in reserved
+        assert temp_dir / "2024" / "03" / "other.jpg" not in reserved
+        assert temp_dir / "2024" / "04" / "photo.jpg" not in reserved
+        assert reserved.source_for(dest) == source
+        assert reserved.source_for(temp_dir / "other.jpg") is None
+        assert len(reserved) == 1
+
+    def test_exists_on_disk(self, temp_dir: Path):
+        existing = temp_dir / "photo.jpg"
+        existing.write_bytes(b"test")
+        reserved = DestinationReservations()
+
+        assert reserved.exists_on_disk(existing)
+        assert not reserved.exists_on_disk(temp_dir / "new.jpg")
+
+    def test_missing_folder_skips_file_stat(self, temp_dir: Path):
+        reserved = DestinationReservations()
+        folder = temp_dir / "2024" / "03"
+
+        with patch.object(Path, "exists", side_effect=AssertionError("stat")):
+            assert not reserved.exists_on_disk(folder / "a.jpg")
+            assert not reserved.exists_on_disk(folder / "b.jpg")
+
+    def test_ensure_unique_path_honours_reservations(self, temp_dir: Path):
+        reserved = DestinationReservations()
+        dest = temp_dir / "photo.jpg"
+        reserved.reserve(dest, temp_dir / "src.jpg")
+
+        result = FileOperations().ensure_unique_path(dest, reserved)
+
+        assert result == temp_dir / "photo_001.jpg"
+
+
 class TestCheckDiskSpace:
     """Tests for check_disk_space method."""
 
@@ -400,6 +569,75 @@ class TestExecuteMoves:
         assert failed_dest == dest
         assert "not found" in message
 
+    @pytest.mark.parametrize("workers", [0, 4])
+    def test_parallel_batch_move(self, temp_dir: Path, workers: int):
+        operations = []
+        for i in range(20):
+            source = temp_dir / f"file{i}.jpg"
+            source.write_bytes(f"content{i}".encode())
+            operations.append((source, temp_dir / "dest" / f"{i % 3}" / source.name))
+        operations.append((temp_dir / "missing.jpg", temp_dir / "dest" / "missing.jpg"))
+
+        file_ops = FileOperations(dry_run=False, create_dirs=True)
+        batch = BatchOperations(file_ops=file_ops, dry_run=False)
+        success, failure = batch.execute_moves(operations, workers=workers)
+
+        assert success == 20
+        assert failure == 1
+        # Outcomes are tracked in operation order
+        assert batch.completed == operations[:20]
+        assert batch.failed[0][0] == temp_dir / "missing.jpg"
+        for source, dest in operations[:20]:
+            assert not source.exists()
+            assert dest.read_bytes() == f"content{source.stem[4:]}".encode()
+
+    def test_parallel_batch_copy(self, temp_dir: Path):
+        operations = []
+        for i in range(5):
+            source = temp_dir / f"file{i}.jpg"
+            source.write_bytes(b"content")
+            operations.append((source, temp_dir / "dest" / source.name))
+
+        file_ops = FileOperations(dry_run=False, create_dirs=True)
+        batch = BatchOperations(file_ops=file_ops, dry_run=False)
+        success, failure = batch.execute_copies(operations, workers=3)
+
+        assert (success, failure) == (5, 0)
+        assert all(source.exists() and dest.exists() for source, dest in operations)
+
+    def test_batch_creates_each_folder_once(self, temp_dir: Path):
+        operations = []
+        for i in range(6):
+            source = temp_dir / f"file{i}.jpg"
+            source.write_bytes(b"content")
+            operations.append((source, temp_dir / f"folder{i % 2}" / source.name))
+
+        created = []
+        real_mkdir = Path.mkdir
+
+        def mkdir(self, *args, **kwargs):
+            created.append(self)
+            return real_mkdir(self, *args, **kwargs)
+
+        batch = BatchOperations(dry_run=False)
+        with patch.object(Path, "mkdir", mkdir):
+            success, failure = batch.execute_moves(operations)
+
+        assert (success, failure) == (6, 0)
+        assert sorted(created) == [
+            (temp_dir / "folder0").resolve(),
+            (temp_dir / "folder1").resolve(),
+        ]
+
+    def test_dry_run_batch_creates_no_folders(self, temp_dir: Path):
+        source = temp_dir / "file.jpg"
+        source.write_bytes(b"content")
+
+        batch = BatchOperations(dry_run=True)
+        batch.execute_copies([(source, temp_dir / "dest" / "file.jpg")])
+
+        assert not (temp_dir / "dest").exists()
+
 
 class TestRollback:
     """Tests for rollback method."""
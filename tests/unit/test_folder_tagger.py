@@ -154,6 +154,15 @@ class TestCameraFolderPatterns:
 
         assert usable is False
 
+    @pytest.mark.parametrize("folder_name", [
+        "100APPLE", "100_0001", "img_0001", "DSC0001", "DSC_0001", "DCIM",
+        "20240315", "Vacation", "100APPLES", "IMG_", "DCIM2", "2024031",
+    ])
+    def test_combined_pattern_matches_like_individual_patterns(self, folder_name: str):
+        individual = any(p.match(folder_name) for p in FolderTagger.CAMERA_FOLDER_PATTERNS)
+
+        assert bool(FolderTagger.CAMERA_FOLDER_PATTERN.match(folder_name)) == individual
+
     @pytest.mark.parametrize("folder_name", [
         "12345678",  # Just 8 digits
         "20240315",  # Date-like
@@ -256,6 +265,12 @@ class TestExtractTag:
 
         assert tag == "Wedding"
 
+    def test_extract_from_folder_walks_up_without_touching_disk(self):
+        tagger = FolderTagger()
+        tag = tagger.extract_tag_from_folder(Path("/photos/Paris 2024/tosort"))
+
+        assert tag == "Paris_2024"
+
     def test_extract_none_when_no_meaningful(self, temp_dir: Path):
         # Create 3+ levels of non-meaningful folders to exhaust walk limit
         folder = temp_dir / "DCIM" / "100APPLE" / "tosort"
@@ -1,7 +1,10 @@
 """Tests for the hashing module."""
 
 import hashlib
+import sys
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -88,6 +91,51 @@ class TestComputeFileHash:
         expected = hashlib.sha256(content).hexdigest()
         assert result == expected
 
+    
+    def test_without_file_digest(self, tmp_path, monkeypatch):
+        """Python 3.10 (no hashlib.file_digest) streams chunks instead."""
+        test_file = tmp_path / "large.bin"
+        content = b"y" * (DEFAULT_CHUNK_SIZE * 2 + 7)
+        test_file.write_bytes(content)
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+        
+        result = compute_file_hash(test_file, chunk_size=1000)
+        
+        assert result == hashlib.sha256(content).hexdigest()
+    
+    @pytest.mark.skipif(not hasattr(hashlib, "file_digest"), reason="Python 3.11+")
+    def test_large_file_is_read_not_mapped(self, tmp_path):
+        """Large files go through file_digest too, never a memory mapping."""
+        test_file = tmp_path / "video.bin"
+        with open(test_file, "wb") as f:
+            f.truncate(64 * 1024 * 1024 + 1)
+        
+        with patch("hashlib.file_digest", wraps=hashlib.file_digest) as file_digest:
+            result = compute_file_hash(test_file)
+        
+        file_digest.assert_called_once()
+        with open(test_file, "rb") as f:
+            assert result == hashlib.file_digest(f, "sha256").hexdigest()
+    
+    def test_blake3_uses_package(self, tmp_path):
+        """blake3 hashes through the blake3 package's hasher."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"content")
+        fake_blake3 = SimpleNamespace(blake3=hashlib.sha1)
+        
+        with patch.dict(sys.modules, {"blake3": fake_blake3}):
+            result = compute_file_hash(test_file, algorithm="blake3")
+        
+        assert result == hashlib.sha1(b"content").hexdigest()
+    
+    def test_blake3_without_package_raises(self, tmp_path):
+        """blake3 without the package installed is reported clearly."""
+        test_file = tmp_path / "test.txt"
+        test_file.write_bytes(b"content")
+        
+        with patch.dict(sys.modules, {"blake3": None}):
+            with pytest.raises(ValueError, match="pip install blake3"):
+                compute_file_hash(test_file, algorithm="blake3")
 
 class TestCompareFileHashes:
     """Tests for compare_file_hashes function."""
@@ -1,5 +1,6 @@
 """Unit tests for chronoclean.core.models."""
 
+import pickle
 from datetime import datetime
 from pathlib import Path
 
@@ -160,6 +161,19 @@ class TestFileRecord:
         assert record.folder_tag is None
         assert record.folder_tag_usable is False
 
+    def test_uses_slots_and_pickles(self):
+        record = FileRecord(
+            source_path=Path("/photos/a.jpg"),
+            file_type=FileType.IMAGE,
+            size_bytes=100,
+            folder_tags=["Paris"],
+        )
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.not_a_field = 1
+        assert pickle.loads(pickle.dumps(record)) == record
+
 
 class TestScanResult:
     """Tests for ScanResult dataclass."""
@@ -200,6 +214,16 @@ class TestScanResult:
         assert result.error_files == 1
         assert result.errors[0] == (error_path, "Cannot read file")
 
+    def test_error_categories_counted(self, temp_dir: Path):
+        result = ScanResult(source_root=temp_dir)
+
+        result.add_error(temp_dir / "a.jpg", "denied", category="file_access_error")
+        result.add_error(temp_dir / "b.jpg", "denied", category="file_access_error")
+        result.increment_error_category("no_exif_date")
+
+        assert result.errors_by_category == {"file_access_error": 2, "no_exif_date": 1}
+        assert result.errors_by_category["date_mismatch"] == 0
+
     def test_add_skipped(self, temp_dir: Path):
         result = ScanResult(source_root=temp_dir)
 
@@ -306,6 +330,18 @@ class TestOperationPlan:
         assert plan.moves[0].new_filename == "renamed.jpg"
         assert plan.moves[0].reason == "date-based"
 
+    def test_add_moves_bulk(self):
+        plan = OperationPlan()
+        moves = [
+            MoveOperation(Path("/source/a.jpg"), Path("/dest/2024/03")),
+            MoveOperation(Path("/source/b.jpg"), Path("/dest/2024/04"), "b2.jpg"),
+        ]
+
+        plan.add_moves_bulk(moves)
+
+        assert plan.moves == moves
+        assert plan.total_operations == 2
+
     def test_add_skip(self):
         plan = OperationPlan()
         path = Path("/source/unknown.jpg")
@@ -99,6 +99,18 @@ class TestGenerateFilename:
 
         assert result == "20240315_143045_042.jpg"
 
+    @pytest.mark.parametrize("date", [
+        datetime(2024, 3, 15, 14, 30, 45),
+        datetime(1999, 12, 31, 23, 59, 59),
+        datetime(2001, 1, 2, 3, 4, 5),
+    ])
+    def test_default_formats_match_strftime(self, date):
+        renamer = Renamer()
+
+        result = renamer.generate_filename(Path("IMG_001.JPG"), date)
+
+        assert result == f"{date.strftime('%Y%m%d')}_{date.strftime('%H%M%S')}.jpg"
+
     def test_custom_date_format(self):
         renamer = Renamer(date_format="%Y-%m-%d")
         date = datetime(2024, 3, 15, 14, 30, 45)
@@ -162,6 +174,13 @@ class TestFormatTag:
 
         assert renamer._format_tag("_Paris_") == "Paris"
 
+    def test_formatted_tag_reused(self):
+        renamer = Renamer()
+
+        assert renamer._format_tag("Paris Trip!") == "Paris_Trip"
+        assert renamer._format_tag("Paris Trip!") == "Paris_Trip"
+        assert renamer._tag_cache == {"Paris Trip!": "Paris_Trip"}
+
 
 class TestNeedsRename:
     """Tests for needs_rename method."""
@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from chronoclean.config.schema import VerifyConfig
+from chronoclean.core import run_discovery
 from chronoclean.core.run_discovery import (
     RunSummary,
     VerificationSummary,
@@ -15,9 +16,13 @@ from chronoclean.core.run_discovery import (
     find_run_by_id,
     find_verification_by_id,
     load_run_record,
+    load_verification_header,
     load_verification_report,
 )
 from chronoclean.core.run_record import RunMode
+from chronoclean.core.run_record_writer import write_verification_report
+from chronoclean.core.verification import InputSource, VerificationReport
+from chronoclean.utils.json_utils import read_json_header
 
 
 class TestRunSummary:
@@ -104,6 +109,29 @@ class TestVerificationSummary:
         
         assert summary.cleanup_eligible_count == 13  # 10 + 3
 
+    def test_age_description_computed_once(self, monkeypatch):
+        """Repeated renders reuse the age formatted on first access."""
+        calls = []
+        monkeypatch.setattr(
+            run_discovery, "_format_age", lambda created_at: calls.append(created_at) or "just now"
+        )
+        summary = VerificationSummary(
+            verify_id="verify_test",
+            filepath=Path("/verifications/test.json"),
+            created_at=datetime.now(),
+            source_root="/source",
+            destination_root="/dest",
+            ok_count=1,
+            ok_duplicate_count=0,
+            mismatch_count=0,
+            missing_count=0,
+            total=1,
+        )
+
+        assert summary.age_description == "just now"
+        assert summary.age_description == "just now"
+        assert len(calls) == 1
+
 
 class TestDiscoverRunRecords:
     """Tests for discover_run_records function."""
@@ -198,6 +226,52 @@ class TestDiscoverRunRecords:
         
         assert len(records) == 2
     
+    def test_discover_limit_skips_older_files(self, verify_config, runs_dir, caplog):
+        """Files named for seconds older than the kept records are not read."""
+        for run_id, timestamp in [
+            ("20241229_120000_aaaa", "2024-12-29T12:00:00.500000"),
+            ("20241229_120000_bbbb", "2024-12-29T12:00:00.100000"),
+            ("20241228_090000_cccc", "2024-12-28T09:00:00"),
+        ]:
+            record_data = {
+                "run_id": run_id,
+                "created_at": timestamp,
+                "source_root": "/source",
+                "destination_root": "/dest",
+                "mode": "live_copy",
+                "config_signature": {},
+                "entries": [],
+            }
+            (runs_dir / f"{run_id}_apply.json").write_text(json.dumps(record_data))
+        (runs_dir / "20200101_000000_dddd_apply.json").write_text("not valid json")
+        
+        records = discover_run_records(verify_config, limit=2)
+        
+        assert [r.run_id for r in records] == ["20241229_120000_aaaa", "20241229_120000_bbbb"]
+        assert "Could not parse" not in caplog.text
+    
+    def test_discover_limit_considers_untimestamped_names(self, verify_config, runs_dir):
+        """Records whose filenames carry no timestamp still compete on created_at."""
+        for name, timestamp in [
+            ("20241229_120000_aaaa", "2024-12-29T12:00:00"),
+            ("manual_copy", "2024-12-30T08:00:00"),
+            ("20241201_120000_bbbb", "2024-12-01T12:00:00"),
+        ]:
+            record_data = {
+                "run_id": name,
+                "created_at": timestamp,
+                "source_root": "/source",
+                "destination_root": "/dest",
+                "mode": "live_copy",
+                "config_signature": {},
+                "entries": [],
+            }
+            (runs_dir / f"{name}_apply.json").write_text(json.dumps(record_data))
+        
+        records = discover_run_records(verify_config, limit=2)
+        
+        assert [r.run_id for r in records] == ["manual_copy", "20241229_120000_aaaa"]
+    
     def test_discover_ignores_invalid_json(self, verify_config, runs_dir):
         """Test that invalid JSON files are skipped."""
         (runs_dir / "invalid_apply.json").write_text("not valid json")
@@ -298,6 +372,119 @@ class TestDiscoverVerificationReports:
         assert reports[0].verify_id == "verify_20241229_130000"
         assert reports[0].ok_count == 8
 
+    def _report_data(self, tmp_path) -> dict:
+        return {
+            "verify_id": "verify_20241229_130000",
+            "created_at": "2024-12-29T13:00:00",
+            "source_root": str(tmp_path / "source"),
+            "destination_root": str(tmp_path / "dest"),
+            "summary": {"total": 10, "ok": 8},
+        }
+    
+    def test_discover_stops_before_entries(self, verify_config, verifications_dir, tmp_path):
+        """Only the metadata ahead of the entries is decoded."""
+        header = json.dumps(self._report_data(tmp_path))[:-1]
+        report_file = verifications_dir / "verify_20241229_130000_verify.json"
+        # Entries are never parsed, so even a truncated tail doesn't matter
+        report_file.write_text(header + ', "entries": [{"source_path": ')
+        
+        reports = discover_verification_reports(verify_config)
+        
+        assert [r.ok_count for r in reports] == [8]
+    
+    def test_discover_reads_summary_after_entries(self, verify_config, verifications_dir, tmp_path):
+        """Older reports with the summary after the entries are still read."""
+        data = self._report_data(tmp_path)
+        summary = data.pop("summary")
+        data["entries"] = []
+        data["summary"] = summary
+        report_file = verifications_dir / "verify_20241229_130000_verify.json"
+        report_file.write_text(json.dumps(data, indent=2))
+        
+        reports = discover_verification_reports(verify_config)
+        
+        assert [r.ok_count for r in reports] == [8]
+
+    def _write_report(self, verify_config, tmp_path) -> Path:
+        report = VerificationReport(
+            verify_id="20241229_130000_verify",
+            created_at=datetime(2024, 12, 29, 13, 0),
+            source_root=str(tmp_path / "source"),
+            destination_root=str(tmp_path / "dest"),
+            input_source=InputSource.RECONSTRUCTED,
+            run_id=None,
+        )
+        report.summary.total, report.summary.ok = 10, 8
+        return write_verification_report(report, verify_config)
+
+    def test_discovery_reuses_index_until_report_changes(
+        self, verify_config, verifications_dir, tmp_path, monkeypatch
+    ):
+        """Reports indexed by the writer are summarized without being opened."""
+        report_file = self._write_report(verify_config, tmp_path)
+        assert (verifications_dir / ".index.json").exists()
+        
+        read = []
+        real_read = run_discovery._read_metadata
+        monkeypatch.setattr(
+            run_discovery, "_read_metadata", lambda path: read.append(path) or real_read(path)
+        )
+        assert [r.ok_count for r in discover_verification_reports(verify_config)] == [8]
+        assert read == []
+        
+        data = self._report_data(tmp_path)
+        data["summary"]["ok"] = 9
+        report_file.write_text(json.dumps({**data, "entries": [1]}))
+        assert [r.ok_count for r in discover_verification_reports(verify_config)] == [9]
+        assert read == [report_file]
+    
+    def test_discovery_writes_nothing(self, verify_config, verifications_dir, tmp_path):
+        """Listing reports never creates or rewrites the index."""
+        report_file = verifications_dir / "verify_20241229_130000_verify.json"
+        report_file.write_text(json.dumps({**self._report_data(tmp_path), "entries": []}))
+        
+        assert [r.ok_count for r in discover_verification_reports(verify_config)] == [8]
+        assert sorted(verifications_dir.iterdir()) == [report_file]
+    
+    def test_corrupt_index_is_ignored(self, verify_config, verifications_dir, tmp_path):
+        (verifications_dir / ".index.json").write_text("{not json")
+        report_file = verifications_dir / "verify_20241229_130000_verify.json"
+        report_file.write_text(json.dumps({**self._report_data(tmp_path), "entries": []}))
+        
+        assert [r.ok_count for r in discover_verification_reports(verify_config)] == [8]
+        
+        # The next written report rebuilds it, keeping only existing records
+        report_file.unlink()
+        written = self._write_report(verify_config, tmp_path)
+        index = json.loads((verifications_dir / ".index.json").read_text())
+        assert index["version"] == 1
+        assert list(index["entries"]) == [written.name]
+
+
+class TestReadJsonHeader:
+    """Tests for read_json_header."""
+    
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 65536])
+    def test_reads_members_before_stop_key(self, tmp_path, chunk_size):
+        data = {"id": "a\"b", "count": 12345, "nested": {"x": [1, 2.5, None]}, "flag": True}
+        path = tmp_path / "record.json"
+        path.write_text(json.dumps({**data, "entries": [1, 2], "after": 1}, indent=2))
+        
+        assert read_json_header(path, "entries", chunk_size=chunk_size) == data
+    
+    def test_missing_stop_key_returns_all_members(self, tmp_path):
+        path = tmp_path / "record.json"
+        path.write_text('{"a": 1, "b": [2]}')
+        
+        assert read_json_header(path, "entries", chunk_size=2) == {"a": 1, "b": [2]}
+    
+    def test_not_an_object_raises(self, tmp_path):
+        path = tmp_path / "record.json"
+        path.write_text("[1, 2]")
+        
+        with pytest.raises(json.JSONDecodeError):
+            read_json_header(path, "entries")
+
 
 class TestFindByID:
     """Tests for find_run_by_id and find_verification_by_id functions."""
@@ -445,3 +632,27 @@ class TestLoadFunctions:
         report = load_verification_report(filepath)
         
         assert report.verify_id == "test_verify"
+
+    def test_load_verification_header_skips_entries(self, tmp_path):
+        """The header load keeps metadata and summary but no entries."""
+        report_data = {
+            "verify_id": "test_verify",
+            "created_at": "2024-12-29T13:00:00",
+            "source_root": str(tmp_path / "source"),
+            "destination_root": str(tmp_path / "dest"),
+            "input_source": "run_record",
+            "hash_algorithm": "quick",
+            "summary": {"total": 1, "ok": 1},
+            "entries": [
+                {"source_path": "/a.jpg", "expected_destination_path": "/b.jpg",
+                 "actual_destination_path": "/b.jpg", "status": "ok"},
+            ],
+        }
+        filepath = tmp_path / "test_verify.json"
+        filepath.write_text(json.dumps(report_data))
+
+        header = load_verification_header(filepath)
+
+        assert header.hash_algorithm == "quick"
+        assert header.summary.ok == 1
+        assert header.entries == []
@@ -161,6 +161,32 @@ class TestApplyRunRecord:
         assert sample_run_record.skipped_files == 1
         assert sample_run_record.entries[0].destination_path is None
     
+    def test_add_entries_bulk(self, sample_run_record, tmp_path):
+        """Test adding many entries of one operation type at once."""
+        rows = [
+            (tmp_path / "a.jpg", tmp_path / "dest" / "a.jpg", None),
+            (tmp_path / "b.jpg", tmp_path / "dest" / "b.jpg", None),
+        ]
+        
+        sample_run_record.add_entries(rows, OperationType.MOVE)
+        sample_run_record.add_entries(iter([(tmp_path / "c.jpg", None, "no date")]), OperationType.SKIP)
+        
+        assert sample_run_record.total_files == 3
+        assert sample_run_record.moved_files == 2
+        assert sample_run_record.skipped_files == 1
+        assert [e.operation for e in sample_run_record.entries] == [
+            OperationType.MOVE, OperationType.MOVE, OperationType.SKIP,
+        ]
+        assert sample_run_record.entries[0].source_path == str((tmp_path / "a.jpg").resolve())
+        assert sample_run_record.entries[2].reason == "no date"
+    
+    def test_add_entries_empty(self, sample_run_record):
+        """Test that an empty bulk add leaves counts unchanged."""
+        sample_run_record.add_entries([], OperationType.COPY)
+        
+        assert sample_run_record.total_files == 0
+        assert sample_run_record.entries == []
+    
     def test_to_json_and_back(self, sample_run_record, tmp_path):
         """Test JSON serialization roundtrip."""
         source = tmp_path / "file.jpg"
@@ -3,6 +3,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -16,14 +17,25 @@ from chronoclean.config.schema import (
 )
 from chronoclean.core.run_record import OperationType, RunMode
 from chronoclean.core.run_record_writer import (
+    RECORD_INDEX_FILENAME,
     RunRecordWriter,
     create_config_signature,
     create_run_record,
     ensure_runs_dir,
     get_runs_dir,
     get_state_dir,
+    open_verification_spool,
     write_run_record,
+    write_verification_report,
 )
+from chronoclean.core.verification import (
+    InputSource,
+    MatchType,
+    VerificationReport,
+    VerificationStatus,
+    VerifyEntry,
+)
+from chronoclean.utils.json_utils import dumps_json_bytes, read_json_header
 
 
 class TestGetStateDir:
@@ -196,6 +208,150 @@ class TestWriteRunRecord:
         data = json.loads(filepath.read_text())
         assert data["run_id"] == record.run_id
 
+    def test_failed_write_keeps_previous_file(self, tmp_path, monkeypatch):
+        """An interrupted write leaves neither a partial file nor a temp file."""
+        monkeypatch.chdir(tmp_path)
+        verify_config = VerifyConfig(state_dir=".chronoclean")
+        record = create_run_record(
+            source_root=tmp_path / "source",
+            destination_root=tmp_path / "dest",
+            config=ChronoCleanConfig(),
+            dry_run=False,
+            move_mode=False,
+        )
+        filepath = write_run_record(record, verify_config)
+        previous = filepath.read_bytes()
+        
+        def fail(*args, **kwargs):
+            raise KeyboardInterrupt
+        
+        monkeypatch.setattr("chronoclean.utils.json_utils.os", SimpleNamespace(replace=fail))
+        with pytest.raises(KeyboardInterrupt):
+            write_run_record(record, verify_config)
+        
+        assert filepath.read_bytes() == previous
+        assert sorted(filepath.parent.iterdir()) == [
+            filepath.parent / RECORD_INDEX_FILENAME, filepath,
+        ]
+
+    def test_indexes_record_metadata(self, tmp_path, monkeypatch):
+        """The runs directory index holds the record's fields without entries."""
+        monkeypatch.chdir(tmp_path)
+        verify_config = VerifyConfig(state_dir=".chronoclean")
+        record = create_run_record(
+            source_root=tmp_path / "source",
+            destination_root=tmp_path / "dest",
+            config=ChronoCleanConfig(),
+            dry_run=True,
+            move_mode=False,
+        )
+        record.add_entry(tmp_path / "source" / "a.jpg", None, OperationType.SKIP, "no date")
+        
+        filepath = write_run_record(record, verify_config)
+        
+        index = json.loads((filepath.parent / RECORD_INDEX_FILENAME).read_text())
+        entry = index["entries"][filepath.name]
+        st = filepath.stat()
+        assert entry["stamp"] == [st.st_size, st.st_mtime_ns]
+        assert entry["metadata"] == read_json_header(filepath, "entries")
+
+
+class TestWriteVerificationReport:
+    """Tests for write_verification_report function."""
+    
+    def test_writes_loadable_report(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        verify_config = VerifyConfig(state_dir=".chronoclean")
+        report = VerificationReport(
+            verify_id="20240315_143000_verify",
+            created_at=datetime(2024, 3, 15, 14, 30),
+            source_root="/src",
+            destination_root="/dst",
+            input_source=InputSource.RECONSTRUCTED,
+            run_id=None,
+        )
+        
+        filepath = write_verification_report(report, verify_config)
+        
+        assert filepath.parent == tmp_path / ".chronoclean" / verify_config.verification_dir
+        assert VerificationReport.from_json(filepath.read_text()).verify_id == report.verify_id
+    
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_streamed_report_matches_full_encoding(self, tmp_path, monkeypatch, pretty):
+        """Entries written one at a time give the same bytes as encoding to_dict()."""
+        monkeypatch.chdir(tmp_path)
+        report = VerificationReport(
+            verify_id="20240315_143000_verify",
+            created_at=datetime(2024, 3, 15, 14, 30),
+            source_root="/src",
+            destination_root="/dst",
+            input_source=InputSource.RECONSTRUCTED,
+            run_id=None,
+        )
+        for i in range(3):
+            report.add_entry(VerifyEntry(
+                source_path=f"/src/été_{i}.jpg",
+                expected_destination_path=f"/dst/été_{i}.jpg",
+                actual_destination_path=f"/dst/été_{i}.jpg",
+                status=VerificationStatus.OK,
+                match_type=MatchType.EXPECTED_PATH,
+                source_hash="abc",
+                destination_hash="abc",
+                source_size=i,
+            ))
+        
+        filepath = write_verification_report(report, VerifyConfig(state_dir=".chronoclean"), pretty=pretty)
+        
+        assert filepath.read_bytes() == dumps_json_bytes(report.to_dict(), pretty=pretty)
+        assert not filepath.with_name(f"{filepath.name}.tmp").exists()
+    
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_spooled_report_matches_in_memory_report(self, tmp_path, monkeypatch, pretty):
+        """A report whose entries were spooled to disk is written identically."""
+        monkeypatch.chdir(tmp_path)
+        verify_config = VerifyConfig(state_dir=".chronoclean")
+        reports = [
+            VerificationReport(
+                verify_id=f"20240315_14300{i}_verify",
+                created_at=datetime(2024, 3, 15, 14, 30),
+                source_root="/src",
+                destination_root="/dst",
+                input_source=InputSource.RECONSTRUCTED,
+                run_id=None,
+            )
+            for i in range(2)
+        ]
+        entries = [
+            VerifyEntry(
+                source_path=f"/src/été_{i}.jpg",
+                expected_destination_path=f"/dst/été_{i}.jpg",
+                actual_destination_path=None,
+                status=VerificationStatus.MISSING_DESTINATION,
+                error="quote \" and\nnewline",
+            )
+            for i in range(3)
+        ]
+        
+        with open_verification_spool(verify_config) as spool:
+            reports[1].spool_entries(spool)
+            for report in reports:
+                for entry in entries:
+                    report.add_entry(entry)
+            in_memory, spooled = (
+                write_verification_report(report, verify_config, pretty=pretty)
+                for report in reports
+            )
+        
+        assert reports[1].entries == []
+        # Detached from the closed spool, the report reads the written file
+        assert list(reports[1].iter_entries()) == entries
+        assert reports[1].cleanup_eligible_entries == []
+        assert spooled.read_bytes().replace(b"1_verify", b"0_verify") == in_memory.read_bytes()
+        # The spool file is anonymous: nothing is left beside the reports
+        assert sorted(spooled.parent.iterdir()) == sorted(
+            [in_memory, spooled, spooled.parent / RECORD_INDEX_FILENAME]
+        )
+
 
 class TestRunRecordWriter:
     """Tests for RunRecordWriter context manager."""
@@ -227,7 +383,7 @@ class TestRunRecordWriter:
         runs_dir = tmp_path / ".chronoclean" / "runs"
         assert runs_dir.exists()
         
-        run_files = list(runs_dir.glob("*.json"))
+        run_files = list(runs_dir.glob("*_apply*.json"))
         assert len(run_files) == 1
     
     def test_disabled_writer_no_file(self, tmp_path, monkeypatch):
@@ -257,7 +413,7 @@ class TestRunRecordWriter:
         
         runs_dir = tmp_path / ".chronoclean" / "runs"
         if runs_dir.exists():
-            assert len(list(runs_dir.glob("*.json"))) == 0
+            assert len(list(runs_dir.glob("*_apply*.json"))) == 0
     
     def test_run_record_content(self, tmp_path, monkeypatch):
         """Test the content of the run record."""
@@ -288,7 +444,7 @@ class TestRunRecordWriter:
             )
         
         runs_dir = tmp_path / ".chronoclean" / "runs"
-        run_file = list(runs_dir.glob("*.json"))[0]
+        run_file = list(runs_dir.glob("*_apply*.json"))[0]
         
         data = json.loads(run_file.read_text())
         
@@ -297,6 +453,40 @@ class TestRunRecordWriter:
         assert data["mode"] == "live_copy"
         assert len(data["entries"]) == 2
 
+    
+    def test_bulk_add_methods(self, tmp_path, monkeypatch):
+        """Test recording copies, moves and skips in bulk."""
+        monkeypatch.chdir(tmp_path)
+        
+        config = ChronoCleanConfig(
+            verify=VerifyConfig(state_dir=".chronoclean"),
+        )
+        source_root = tmp_path / "source"
+        dest_root = tmp_path / "dest"
+        source_root.mkdir()
+        dest_root.mkdir()
+        
+        with RunRecordWriter(
+            source_root=source_root,
+            destination_root=dest_root,
+            config=config,
+            dry_run=False,
+            move_mode=False,
+        ) as writer:
+            writer.add_copies([(source_root / "a.jpg", dest_root / "a.jpg")])
+            writer.add_moves([
+                (source_root / "b.jpg", dest_root / "b.jpg"),
+                (source_root / "c.jpg", dest_root / "c.jpg"),
+            ])
+            writer.add_skips([(source_root / "d.jpg", "No date detected")])
+        
+        data = json.loads(writer.output_path.read_text())
+        
+        assert data["summary"]["copied_files"] == 1
+        assert data["summary"]["moved_files"] == 2
+        assert data["summary"]["skipped_files"] == 1
+        assert data["summary"]["total_files"] == 4
+        assert data["entries"][-1]["reason"] == "No date detected"
 
 class TestRunRecordWriterModes:
     """Tests for different run modes."""
@@ -323,6 +513,6 @@ class TestRunRecordWriterModes:
             pass
         
         runs_dir = tmp_path / ".chronoclean" / "runs"
-        data = json.loads(list(runs_dir.glob("*.json"))[0].read_text())
+        data = json.loads(list(runs_dir.glob("*_apply*.json"))[0].read_text())
         
         assert data["mode"] == "dry_run"
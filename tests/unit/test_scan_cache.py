@@ -0,0 +1,228 @@
+"""Unit tests for chronoclean.core.scan_cache module."""
+
+import json
+import os
+import pickle
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+from chronoclean.config.schema import ChronoCleanConfig
+from chronoclean.core.models import DateSource, FileRecord, FileType
+from chronoclean.core.scan_cache import ScanCache, compute_settings_fingerprint
+from chronoclean.core.scanner import Scanner
+from chronoclean.core.tag_rules_store import TagRules
+
+
+class TestComputeSettingsFingerprint:
+    """Tests for compute_settings_fingerprint function."""
+
+    def test_same_settings_same_fingerprint(self):
+        assert compute_settings_fingerprint(ChronoCleanConfig()) == compute_settings_fingerprint(
+            ChronoCleanConfig()
+        )
+
+    def test_config_change_changes_fingerprint(self):
+        cfg = ChronoCleanConfig()
+        changed = ChronoCleanConfig()
+        changed.sorting.folder_structure = "YYYY"
+
+        assert compute_settings_fingerprint(cfg) != compute_settings_fingerprint(changed)
+
+    def test_tag_rules_change_fingerprint(self):
+        cfg = ChronoCleanConfig()
+
+        assert compute_settings_fingerprint(cfg, TagRules()) != compute_settings_fingerprint(
+            cfg, TagRules(use=["Paris"])
+        )
+
+    def test_effective_settings_change_fingerprint(self):
+        cfg = ChronoCleanConfig()
+
+        assert compute_settings_fingerprint(cfg, effective={"fast_exif": True}) != (
+            compute_settings_fingerprint(cfg, effective={"fast_exif": False})
+        )
+
+    def test_unrelated_sections_keep_fingerprint(self):
+        """Tuning parallelism or verify settings does not wipe the cache."""
+        cfg = ChronoCleanConfig()
+        changed = ChronoCleanConfig()
+        changed.performance.scan_threads = 8
+        changed.performance.io_workers = 4
+        changed.verify.algorithm = "quick"
+        changed.scan.limit = 10
+
+        assert compute_settings_fingerprint(cfg) == compute_settings_fingerprint(changed)
+
+    def test_rules_timestamp_ignored(self):
+        cfg = ChronoCleanConfig()
+
+        assert compute_settings_fingerprint(cfg, TagRules(updated_at="a")) == (
+            compute_settings_fingerprint(cfg, TagRules(updated_at="b"))
+        )
+
+
+class TestScanCache:
+    """Tests for ScanCache class."""
+
+    def _record(self, path: Path) -> FileRecord:
+        return FileRecord(source_path=path, file_type=FileType.IMAGE, size_bytes=4)
+
+    def test_roundtrip(self, temp_dir: Path):
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"test")
+        record = FileRecord(
+            source_path=photo,
+            file_type=FileType.IMAGE,
+            size_bytes=4,
+            detected_date=datetime(2024, 3, 15, 14, 30),
+            date_source=DateSource.EXIF,
+            folder_tags=["Été"],
+        )
+
+        with ScanCache(temp_dir / "cache.db", "fp") as cache:
+            assert cache.get(photo, photo.stat()) is None
+            cache.put(photo, photo.stat(), record)
+
+        with ScanCache(temp_dir / "cache.db", "fp") as cache:
+            cached = cache.get(photo, photo.stat())
+
+        assert cached == record
+
+    def test_stale_after_modification(self, temp_dir: Path):
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"test")
+
+        with ScanCache(temp_dir / "cache.db", "fp") as cache:
+            cache.put(photo, photo.stat(), self._record(photo))
+            photo.write_bytes(b"longer content")
+
+            assert cache.get(photo, photo.stat()) is None
+
+    def test_entry_keeps_stat_taken_before_build(self, temp_dir: Path):
+        """A file changed while its record was built is not cached as current."""
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"test")
+        before = photo.stat()
+        photo.write_bytes(b"changed during the build")
+
+        with ScanCache(temp_dir / "cache.db", "fp") as cache:
+            cache.put(photo, before, self._record(photo))
+
+            assert cache.get(photo, photo.stat()) is None
+            assert cache.get(photo, before) is not None
+
+    def test_other_fingerprint_misses(self, temp_dir: Path):
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"test")
+
+        with ScanCache(temp_dir / "cache.db", "fp") as cache:
+            cache.put(photo, photo.stat(), self._record(photo))
+
+        with ScanCache(temp_dir / "cache.db", "other") as cache:
+            assert cache.get(photo, photo.stat()) is None
+
+    def test_unknown_file_misses(self, temp_dir: Path):
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"test")
+
+        with ScanCache(temp_dir / "cache.db", "fp") as cache:
+            assert cache.get(photo, photo.stat()) is None
+            assert cache.misses == 1
+
+    def test_records_are_stored_as_json(self, temp_dir: Path):
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"test")
+
+        with ScanCache(temp_dir / "cache.db", "fp") as cache:
+            cache.put(photo, photo.stat(), self._record(photo))
+
+        with sqlite3.connect(temp_dir / "cache.db") as conn:
+            (stored,) = conn.execute("SELECT record FROM scan_cache").fetchone()
+        assert json.loads(stored)["path"] == str(photo)
+
+    def test_undecodable_entry_misses_without_unpickling(self, temp_dir: Path):
+        """A pickle planted in the database is never loaded."""
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"test")
+        st = photo.stat()
+        with ScanCache(temp_dir / "cache.db", "fp") as cache:
+            pass
+        with sqlite3.connect(temp_dir / "cache.db") as conn:
+            conn.execute(
+                "INSERT INTO scan_cache VALUES (?, ?, ?, ?, ?)",
+                (str(photo), st.st_mtime_ns, st.st_size, "fp",
+                 pickle.dumps(self._record(photo))),
+            )
+
+        with patch("pickle.loads") as mock_loads, \
+                ScanCache(temp_dir / "cache.db", "fp") as cache:
+            assert cache.get(photo, st) is None
+            assert cache.misses == 1
+
+        mock_loads.assert_not_called()
+
+    def test_creates_parent_directory(self, temp_dir: Path):
+        with ScanCache(temp_dir / "nested" / "cache.db", "fp"):
+            pass
+
+        assert (temp_dir / "nested" / "cache.db").exists()
+
+
+class TestScannerWithCache:
+    """Tests for Scanner using a ScanCache."""
+
+    def test_second_scan_hits_cache(self, temp_dir: Path):
+        source = temp_dir / "source"
+        source.mkdir()
+        for i in range(3):
+            (source / f"photo{i}.jpg").write_bytes(b"test")
+
+        with ScanCache(temp_dir / "cache.db", "fp") as cache:
+            first = Scanner(cache=cache).scan(source)
+            second = Scanner(cache=cache).scan(source)
+
+            assert cache.misses == 3
+            assert cache.hits == 3
+
+        assert second.processed_files == first.processed_files == 3
+        assert [r.source_path for r in second.files] == [r.source_path for r in first.files]
+
+    def test_parallel_scan_uses_cache(self, temp_dir: Path):
+        source = temp_dir / "source"
+        source.mkdir()
+        for i in range(3):
+            (source / f"photo{i}.jpg").write_bytes(b"test")
+
+        with ScanCache(temp_dir / "cache.db", "fp") as cache:
+            Scanner(cache=cache).scan(source)
+            result = Scanner(cache=cache).scan(source, jobs=2)
+
+            assert cache.hits == 3
+
+        assert result.processed_files == 3
+
+    def test_parallel_scan_with_cache_misses_spawns_workers(self, temp_dir: Path):
+        """Workers are spawned with a pickled scanner that has no cache."""
+        source = temp_dir / "source"
+        source.mkdir()
+        for i in range(3):
+            (source / f"photo{i}.jpg").write_bytes(b"test")
+        contexts = []
+
+        def spy_executor(*args, **kwargs):
+            contexts.append(kwargs["mp_context"].get_start_method())
+            return ProcessPoolExecutor(*args, **kwargs)
+
+        with ScanCache(temp_dir / "cache.db", "fp") as cache, \
+                patch("chronoclean.core.scanner.ProcessPoolExecutor", spy_executor):
+            result = Scanner(cache=cache).scan(source, jobs=2)
+            rescanned = Scanner(cache=cache).scan(source)
+
+            assert cache.misses == 3
+            assert cache.hits == 3
+
+        assert contexts == ["spawn"]
+        assert result.processed_files == rescanned.processed_files == 3
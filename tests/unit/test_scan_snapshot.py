@@ -0,0 +1,205 @@
+"""Unit tests for chronoclean.core.scan_snapshot module."""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from chronoclean.core.models import DateSource, ScanResult
+from chronoclean.core.scan_snapshot import (
+    ScanSnapshotError,
+    SnapshotRecorder,
+    load_scan_snapshot,
+    save_scan_snapshot,
+)
+from chronoclean.core.scanner import Scanner
+
+
+def _scan_and_save(source: Path, snapshot_path: Path) -> ScanResult:
+    recorder = SnapshotRecorder()
+    result = Scanner(cache=recorder).scan(source)
+    save_scan_snapshot(
+        snapshot_path, result, recorder.stats,
+        fingerprint="fp", recursive=True, include_videos=True,
+    )
+    return result
+
+
+class TestSaveAndLoad:
+    """Tests for writing and reading snapshots."""
+
+    def test_roundtrip_preserves_records(self, temp_dir: Path):
+        source = temp_dir / "source"
+        event_dir = source / "Paris 2024"
+        event_dir.mkdir(parents=True)
+        (event_dir / "IMG_20240315_143000.jpg").write_bytes(b"test")
+        snapshot_path = temp_dir / "scan.jsonl"
+
+        result = _scan_and_save(source, snapshot_path)
+        snapshot = load_scan_snapshot(snapshot_path)
+
+        original = result.files[0]
+        loaded = snapshot.get(original.source_path, original.source_path.stat())
+        assert loaded == original
+        assert snapshot.source_root == source.resolve()
+
+    def test_header_records_settings(self, temp_dir: Path):
+        (temp_dir / "photo.jpg").write_bytes(b"test")
+        snapshot_path = temp_dir / "out" / "scan.jsonl"
+        recorder = SnapshotRecorder()
+
+        save_scan_snapshot(
+            snapshot_path,
+            Scanner(cache=recorder).scan(temp_dir),
+            recorder.stats,
+            fingerprint="abc",
+            recursive=False,
+            include_videos=True,
+        )
+        snapshot = load_scan_snapshot(snapshot_path)
+
+        assert snapshot.matches("abc", recursive=False, include_videos=True)
+        assert not snapshot.matches("abc", recursive=True, include_videos=True)
+        assert not snapshot.matches("other", recursive=False, include_videos=True)
+
+    def test_change_after_build_is_not_recorded(self, temp_dir: Path):
+        """The snapshot keeps the stat taken before the build, not at save time."""
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"test")
+        recorder = SnapshotRecorder()
+        result = Scanner(cache=recorder).scan(temp_dir)
+        st = photo.stat()
+        os.utime(photo, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        written = save_scan_snapshot(
+            temp_dir / "scan.jsonl", result, recorder.stats,
+            fingerprint="fp", recursive=True, include_videos=True,
+        )
+        snapshot = load_scan_snapshot(temp_dir / "scan.jsonl")
+
+        assert written == 1
+        assert snapshot.get(photo, photo.stat()) is None
+
+    def test_records_without_build_stat_are_not_written(self, temp_dir: Path):
+        (temp_dir / "a.jpg").write_bytes(b"test")
+        (temp_dir / "b.jpg").write_bytes(b"test")
+        recorder = SnapshotRecorder()
+        result = Scanner(cache=recorder).scan(temp_dir)
+        del recorder.stats[temp_dir / "b.jpg"]
+
+        written = save_scan_snapshot(
+            temp_dir / "scan.jsonl", result, recorder.stats,
+            fingerprint="fp", recursive=True, include_videos=True,
+        )
+
+        assert written == 1
+
+    def test_recorder_passes_through_to_cache(self, temp_dir: Path):
+        """Hits and stores still reach the wrapped cache."""
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"test")
+        _scan_and_save(temp_dir, temp_dir / "first.jsonl")
+        snapshot = load_scan_snapshot(temp_dir / "first.jsonl")
+        recorder = SnapshotRecorder(snapshot)
+
+        result = Scanner(cache=recorder).scan(temp_dir)
+
+        assert snapshot.hits == 1
+        assert recorder.stats[photo] == (photo.stat().st_mtime_ns, photo.stat().st_size)
+        assert result.processed_files == 1
+
+
+class TestSnapshotGet:
+    """Tests for staleness checks on lookup."""
+
+    def test_modified_file_misses(self, temp_dir: Path):
+        source = temp_dir / "source"
+        source.mkdir()
+        photo = source / "photo.jpg"
+        photo.write_bytes(b"test")
+        _scan_and_save(source, temp_dir / "scan.jsonl")
+        snapshot = load_scan_snapshot(temp_dir / "scan.jsonl")
+
+        st = photo.stat()
+        os.utime(photo, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert snapshot.get(photo.resolve(), photo.stat()) is None
+        assert (snapshot.hits, snapshot.misses) == (0, 1)
+
+    def test_resized_and_unknown_files_miss(self, temp_dir: Path):
+        source = temp_dir / "source"
+        source.mkdir()
+        photo = source / "photo.jpg"
+        photo.write_bytes(b"test")
+        other = source / "other.jpg"
+        _scan_and_save(source, temp_dir / "scan.jsonl")
+        snapshot = load_scan_snapshot(temp_dir / "scan.jsonl")
+        other.write_bytes(b"test")
+        st = photo.stat()
+        photo.write_bytes(b"longer content")
+        os.utime(photo, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert snapshot.get(photo.resolve(), photo.stat()) is None
+        assert snapshot.get(other, other.stat()) is None
+        assert snapshot.misses == 2
+
+    def test_scanner_reuses_snapshot_records(self, temp_dir: Path):
+        source = temp_dir / "source"
+        source.mkdir()
+        (source / "a.jpg").write_bytes(b"test")
+        (source / "b.jpg").write_bytes(b"test")
+        _scan_and_save(source, temp_dir / "scan.jsonl")
+        snapshot = load_scan_snapshot(temp_dir / "scan.jsonl")
+        (source / "b.jpg").write_bytes(b"changed content")
+
+        scanner = Scanner(cache=snapshot)
+        result = scanner.scan(source)
+
+        assert result.processed_files == 2
+        assert (snapshot.hits, snapshot.misses) == (1, 1)
+
+
+class TestLoadErrors:
+    """Tests for malformed snapshot files."""
+
+    def test_missing_file(self, temp_dir: Path):
+        with pytest.raises(ScanSnapshotError, match="Cannot read"):
+            load_scan_snapshot(temp_dir / "missing.jsonl")
+
+    def test_not_a_snapshot(self, temp_dir: Path):
+        path = temp_dir / "other.json"
+        path.write_text('{"files": []}\n')
+
+        with pytest.raises(ScanSnapshotError, match="Not a ChronoClean scan snapshot"):
+            load_scan_snapshot(path)
+
+    def test_unsupported_version(self, temp_dir: Path):
+        path = temp_dir / "future.jsonl"
+        path.write_text(json.dumps({"format": "chronoclean-scan", "format_version": 99}) + "\n")
+
+        with pytest.raises(ScanSnapshotError, match="Unsupported"):
+            load_scan_snapshot(path)
+
+    def test_corrupt_row(self, temp_dir: Path):
+        (temp_dir / "photo.jpg").write_bytes(b"test")
+        path = temp_dir / "scan.jsonl"
+        _scan_and_save(temp_dir, path)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"path": "/x.jpg"}\n')
+
+        with pytest.raises(ScanSnapshotError, match="Invalid scan snapshot"):
+            load_scan_snapshot(path)
+
+    def test_dates_and_sources_survive(self, temp_dir: Path):
+        (temp_dir / "IMG_20240315_143000.jpg").write_bytes(b"test")
+        path = temp_dir / "scan.jsonl"
+        result = _scan_and_save(temp_dir, path)
+
+        source_path = result.files[0].source_path
+        loaded = load_scan_snapshot(path).get(source_path, source_path.stat())
+
+        assert isinstance(loaded.detected_date, datetime)
+        assert loaded.date_source == result.files[0].date_source
+        assert isinstance(loaded.date_source, DateSource)
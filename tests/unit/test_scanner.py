@@ -1,13 +1,22 @@
 """Unit tests for chronoclean.core.scanner."""
 
+import threading
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from chronoclean.core import scanner as scanner_module
+from chronoclean.core.date_inference import DateInferenceEngine
 from chronoclean.core.models import DateSource, FileType, ScanResult
-from chronoclean.core.scanner import Scanner, scan_directory
+from chronoclean.core.scanner import (
+    PARALLEL_CHUNK_SIZE_MAX,
+    PARALLEL_CHUNK_SIZE_MIN,
+    Scanner,
+    _parallel_chunk_size,
+    scan_directory,
+)
 
 
 class TestScannerInit:
@@ -78,6 +87,12 @@ class TestSupportedExtensions:
         assert ".cr2" not in scanner.supported_extensions
         assert ".nef" not in scanner.supported_extensions
 
+    def test_is_built_once(self):
+        scanner = Scanner()
+
+        assert isinstance(scanner.supported_extensions, frozenset)
+        assert scanner.supported_extensions is scanner.supported_extensions
+
 
 class TestClassifyFileType:
     """Tests for _classify_file_type method."""
@@ -144,6 +159,27 @@ class TestIterFiles:
         assert len(files) == 1
         assert files[0].name == "photo.jpg"
 
+    def test_extension_checked_before_file_type(self, temp_dir: Path):
+        def entry(name: str, is_file: bool = True) -> MagicMock:
+            e = MagicMock()
+            e.name = name
+            e.path = str(temp_dir / name)
+            e.is_dir.return_value = False
+            e.is_file.return_value = is_file
+            return e
+
+        media = entry("photo.jpg")
+        other = entry("cache.db")
+        listing = MagicMock()
+        listing.__enter__.return_value = iter([media, other])
+
+        with patch("chronoclean.core.scanner.os.scandir", return_value=listing):
+            files = list(Scanner(recursive=False)._iter_files(temp_dir))
+
+        assert files == [temp_dir / "photo.jpg"]
+        media.is_file.assert_called_once()
+        other.is_file.assert_not_called()
+
     def test_recursive_scanning(self, temp_dir: Path):
         (temp_dir / "photo.jpg").write_bytes(b"test")
         subdir = temp_dir / "subdir"
@@ -210,6 +246,137 @@ class TestIterFiles:
         assert len(files) == 1
         assert all(f.is_file() for f in files)
 
+    def test_deeply_nested_directories(self, temp_dir: Path):
+        deepest = temp_dir.joinpath(*(f"level{i}" for i in range(30)))
+        deepest.mkdir(parents=True)
+        (deepest / "deep.jpg").write_bytes(b"test")
+        (temp_dir / "level0" / "shallow.jpg").write_bytes(b"test")
+
+        scanner = Scanner(recursive=True)
+        files = list(scanner._iter_files(temp_dir))
+
+        assert {f.name for f in files} == {"deep.jpg", "shallow.jpg"}
+        assert deepest / "deep.jpg" in files
+
+    def test_hidden_source_directory_is_scanned(self, temp_dir: Path):
+        source = temp_dir / ".photos"
+        source.mkdir()
+        (source / "photo.jpg").write_bytes(b"test")
+
+        scanner = Scanner(ignore_hidden=True)
+        files = list(scanner._iter_files(source))
+
+        assert files == [source / "photo.jpg"]
+
+    def test_does_not_follow_directory_symlinks(self, temp_dir: Path):
+        outside = temp_dir / "outside"
+        outside.mkdir()
+        (outside / "photo.jpg").write_bytes(b"test")
+        source = temp_dir / "source"
+        source.mkdir()
+        try:
+            (source / "link").symlink_to(outside, target_is_directory=True)
+        except OSError:
+            pytest.skip("Symlinks not supported")
+
+        scanner = Scanner(recursive=True)
+        files = list(scanner._iter_files(source))
+
+        assert files == []
+
+    def test_next_directory_listed_while_files_are_consumed(self, temp_dir: Path):
+        for name in ("a", "b"):
+            (temp_dir / name).mkdir()
+            (temp_dir / name / f"{name}.jpg").write_bytes(b"test")
+
+        scanner = Scanner(recursive=True)
+        listed = []
+        all_listed = threading.Event()
+        real_list = scanner._list_directory
+
+        def list_directory(directory: str):
+            result = real_list(directory)
+            listed.append(directory)
+            if len(listed) == 3:
+                all_listed.set()
+            return result
+
+        with patch.object(scanner, "_list_directory", side_effect=list_directory):
+            files = scanner._iter_files(temp_dir)
+            first = next(files)
+            # The other folder is listed in the background before its files are requested
+            assert all_listed.wait(timeout=5)
+            rest = list(files)
+
+        assert {first, *rest} == {temp_dir / "a" / "a.jpg", temp_dir / "b" / "b.jpg"}
+
+    @pytest.mark.parametrize("recursive,nested,pools", [
+        (True, False, 0),
+        (False, True, 0),
+        (True, True, 1),
+    ])
+    def test_listing_pool_only_for_subdirectories(
+        self, temp_dir: Path, recursive, nested, pools
+    ):
+        """Flat and non-recursive walks never start the listing threads."""
+        (temp_dir / "a.jpg").write_bytes(b"test")
+        if nested:
+            (temp_dir / "sub").mkdir()
+            (temp_dir / "sub" / "b.jpg").write_bytes(b"test")
+        created = []
+        real_executor = scanner_module.ThreadPoolExecutor
+
+        def executor(*args, **kwargs):
+            created.append(kwargs.get("thread_name_prefix"))
+            return real_executor(*args, **kwargs)
+
+        with patch("chronoclean.core.scanner.ThreadPoolExecutor", side_effect=executor):
+            files = list(Scanner(recursive=recursive)._iter_files(temp_dir))
+
+        assert len(files) == (2 if recursive and nested else 1)
+        assert created == ["scan-listdir"] * pools
+
+    def test_several_directories_listed_ahead_in_walk_order(self, temp_dir: Path):
+        for name in ("a", "b", "c"):
+            (temp_dir / name / "inner").mkdir(parents=True)
+            (temp_dir / name / f"{name}.jpg").write_bytes(b"test")
+            (temp_dir / name / "inner" / f"{name}2.jpg").write_bytes(b"test")
+        serial = list(Scanner(recursive=True)._iter_files(temp_dir))
+
+        scanner = Scanner(recursive=True)
+        listed = []
+        real_list = scanner._list_directory
+
+        def list_directory(directory: str):
+            listed.append(directory)
+            return real_list(directory)
+
+        with patch("chronoclean.core.scanner.LISTING_WORKERS", 3), \
+                patch.object(scanner, "_list_directory", side_effect=list_directory):
+            files = list(scanner._iter_files(temp_dir))
+
+        assert files == serial
+        assert len(files) == 6
+        # Every directory is listed exactly once, however many were prefetched
+        assert sorted(listed) == sorted({str(temp_dir), *(
+            str(temp_dir / n / d) for n in ("a", "b", "c") for d in ("", "inner")
+        )})
+
+    def test_unreadable_prefetched_directory_is_skipped(self, temp_dir: Path):
+        (temp_dir / "a").mkdir()
+        (temp_dir / "a" / "a.jpg").write_bytes(b"test")
+        (temp_dir / "b").mkdir()
+        scanner = Scanner(recursive=True)
+        real_list = scanner._list_directory
+
+        def list_directory(directory: str):
+            if directory.endswith("a"):
+                raise PermissionError("denied")
+            return real_list(directory)
+
+        with patch.object(scanner, "_list_directory", side_effect=list_directory):
+            assert list(scanner._iter_files(temp_dir)) == []
+
 
 class TestScan:
     """Tests for scan method."""
@@ -274,6 +441,153 @@ class TestScan:
 
         assert "Paris_2024" in result.folder_tags_detected
 
+    def test_iter_scan_yields_records(self, temp_dir: Path):
+        for i in range(3):
+            (temp_dir / f"photo{i}.jpg").write_bytes(b"test")
+
+        result = ScanResult(source_root=temp_dir)
+        records = list(Scanner().iter_scan(temp_dir, result=result))
+
+        assert len(records) == 3
+        assert result.files == records
+        assert result.scan_duration_seconds >= 0
+
+    def test_iter_scan_is_lazy(self, temp_dir: Path):
+        (temp_dir / "photo.jpg").write_bytes(b"test")
+        scanner = Scanner()
+        scanner._build_file_record = MagicMock(side_effect=AssertionError("eager"))
+
+        scanner.iter_scan(temp_dir)
+
+        scanner._build_file_record.assert_not_called()
+
+    def test_iter_scan_explicit_files(self, temp_dir: Path):
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            (temp_dir / name).write_bytes(b"test")
+        files = [temp_dir / "c.jpg", temp_dir / "a.jpg"]
+
+        records = list(Scanner().iter_scan(temp_dir, files=files))
+
+        assert [r.source_path for r in records] == files
+
+    def test_iter_scan_nonexistent_directory(self, temp_dir: Path):
+        with pytest.raises(FileNotFoundError):
+            next(Scanner().iter_scan(temp_dir / "missing"))
+
+    def test_parallel_scan_matches_serial(self, temp_dir: Path):
+        event_dir = temp_dir / "Paris 2024"
+        event_dir.mkdir()
+        for i in range(5):
+            (event_dir / f"photo{i}.jpg").write_bytes(b"test")
+
+        serial = Scanner().scan(temp_dir)
+        parallel = Scanner().scan(temp_dir, jobs=2)
+
+        assert parallel.processed_files == serial.processed_files == 5
+        assert [r.source_path for r in parallel.files] == [r.source_path for r in serial.files]
+        assert parallel.folder_tags_detected == serial.folder_tags_detected
+        assert parallel.errors_by_category == serial.errors_by_category
+
+    def test_parallel_scan_with_limit(self, temp_dir: Path):
+        for i in range(10):
+            (temp_dir / f"photo{i}.jpg").write_bytes(b"test")
+
+        result = Scanner().scan(temp_dir, limit=3, jobs=2)
+
+        assert result.processed_files == 3
+
+    @pytest.mark.parametrize("mode", [{}, {"jobs": 2}, {"threads": 2}])
+    def test_limit_counts_files_taken_not_records_built(self, temp_dir: Path, mode):
+        """Serial, parallel and threaded scans stop after the same files."""
+        photos = []
+        for i in range(4):
+            photos.append(temp_dir / f"photo{i}.jpg")
+            photos[-1].write_bytes(b"test")
+        # Unreadable: the walk listed it, but it is gone by the time it is read
+        files = [photos[0], temp_dir / "vanished.jpg", *photos[1:]]
+        result = ScanResult(source_root=temp_dir)
+
+        records = list(
+            Scanner().iter_scan(temp_dir, limit=3, result=result, files=files, **mode)
+        )
+
+        assert [r.source_path for r in records] == photos[:2]
+        assert result.total_files == 3
+        assert result.processed_files == 2
+        assert result.error_files == 1
+
+    def test_parallel_chunk_size_bounds(self):
+        assert _parallel_chunk_size(10, 4) == PARALLEL_CHUNK_SIZE_MIN
+        assert _parallel_chunk_size(1_000_000, 4) == PARALLEL_CHUNK_SIZE_MAX
+        # about four tasks per worker in between
+        assert _parallel_chunk_size(3200, 8) == 100
+
+    def test_threaded_scan_matches_serial(self, temp_dir: Path):
+        event_dir = temp_dir / "Paris 2024"
+        event_dir.mkdir()
+        for i in range(20):
+            (event_dir / f"photo{i:02d}.jpg").write_bytes(b"test")
+        (event_dir / "broken.jpg").mkdir()  # not a file: skipped by the walk
+
+        serial = Scanner().scan(temp_dir)
+        threaded = Scanner().scan(temp_dir, threads=3)
+
+        assert threaded.processed_files == serial.processed_files == 20
+        assert [r.source_path for r in threaded.files] == [r.source_path for r in serial.files]
+        assert threaded.folder_tags_detected == serial.folder_tags_detected
+        assert threaded.errors_by_category == serial.errors_by_category
+
+    def test_threaded_scan_with_limit(self, temp_dir: Path):
+        for i in range(10):
+            (temp_dir / f"photo{i}.jpg").write_bytes(b"test")
+
+        result = Scanner().scan(temp_dir, limit=3, threads=0)
+
+        assert result.processed_files == 3
+        assert result.total_files == 3
+
+    def test_threaded_scan_uses_cache_in_calling_thread(self, temp_dir: Path):
+        for i in range(4):
+            (temp_dir / f"photo{i}.jpg").write_bytes(b"test")
+        cache = MagicMock()
+        cache.get.return_value = None
+
+        result = Scanner(cache=cache).scan(temp_dir, threads=2)
+
+        assert result.processed_files == 4
+        assert cache.get.call_count == 4
+        assert cache.put.call_count == 4
+
+
+    def test_iter_folder_tags_matches_scan(self, temp_dir: Path):
+        for folder in ("Paris 2024", "ab"):
+            (temp_dir / folder).mkdir()
+            for i in range(2):
+                (temp_dir / folder / f"photo{i}.jpg").write_bytes(b"test")
+        # Tag already in the filename: no tag, as in scan()
+        (temp_dir / "Paris 2024" / "Paris_2024_photo.jpg").write_bytes(b"test")
+        scanner = Scanner()
+
+        with patch.object(DateInferenceEngine, "infer_date") as mock_infer:
+            walked = list(scanner.iter_folder_tags(temp_dir))
+        scanned = scanner.scan(temp_dir).files
+
+        mock_infer.assert_not_called()
+        assert walked == [
+            (r.source_path, r.source_folder_name, r.folder_tags) for r in scanned
+        ]
+        assert sum(1 for _, _, tags in walked if tags == ["Paris_2024"]) == 2
+
+    def test_iter_folder_tags_respects_limit(self, temp_dir: Path):
+        for i in range(5):
+            (temp_dir / f"photo{i}.jpg").write_bytes(b"test")
+
+        assert len(list(Scanner().iter_folder_tags(temp_dir, limit=3))) == 3
+
+    def test_iter_folder_tags_rejects_missing_source(self, temp_dir: Path):
+        with pytest.raises(FileNotFoundError):
+            list(Scanner().iter_folder_tags(temp_dir / "missing"))
+
 
 class TestBuildFileRecord:
     """Tests for _build_file_record method."""
@@ -301,6 +615,31 @@ class TestBuildFileRecord:
         assert record.detected_date is not None
         assert record.date_source in DateSource
 
+    def test_filename_date_not_parsed_twice(self, temp_dir: Path):
+        photo = temp_dir / "IMG_20240315_143000.jpg"
+        photo.write_bytes(b"test")
+        engine = DateInferenceEngine(priority=["filename"])
+        scanner = Scanner(date_engine=engine)
+
+        with patch.object(engine, "get_filename_date") as mock_get:
+            record = scanner._build_file_record(photo)
+
+        mock_get.assert_not_called()
+        assert record.date_source == DateSource.FILENAME
+        assert record.filename_date == datetime(2024, 3, 15, 14, 30, 0)
+
+    def test_stats_file_once(self, temp_dir: Path):
+        photo = temp_dir / "photo.jpg"
+        photo.write_bytes(b"test")
+
+        scanner = Scanner(date_engine=DateInferenceEngine(priority=["filesystem"]))
+        real_stat = Path.stat
+        with patch.object(Path, "stat", autospec=True, side_effect=real_stat) as mock_stat:
+            record = scanner._build_file_record(photo)
+
+        assert mock_stat.call_count == 1
+        assert record.date_source == DateSource.FILESYSTEM_MODIFIED
+
     def test_record_folder_tag(self, temp_dir: Path):
         event_dir = temp_dir / "Wedding"
         event_dir.mkdir()
@@ -385,6 +724,24 @@ class TestScannerWithMocks:
         assert result.error_files == 1
         assert len(result.errors) == 1
 
+    def test_video_metadata_probed_once(self, temp_dir: Path):
+        video = temp_dir / "clip.mp4"
+        video.write_bytes(b"test")
+        video_date = datetime(2024, 3, 15, 14, 30, 0)
+
+        mock_video_reader = MagicMock()
+        mock_video_reader.get_creation_date.return_value = video_date
+        date_engine = DateInferenceEngine(
+            priority=["video_metadata", "filesystem"],
+            video_reader=mock_video_reader,
+        )
+
+        record = Scanner(date_engine=date_engine)._build_file_record(video)
+
+        assert record.date_source == DateSource.VIDEO_METADATA
+        assert record.video_metadata_date == video_date
+        assert mock_video_reader.get_creation_date.call_count == 1
+
 
 class TestExtensionSets:
     """Tests for extension constants."""
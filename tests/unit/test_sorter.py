@@ -81,6 +81,47 @@ class TestComputeDestinationFolder:
 
         assert result == temp_dir / "2024" / "01" / "05"
 
+    def test_same_month_reuses_folder(self, temp_dir: Path):
+        sorter = Sorter(destination_root=temp_dir, folder_structure="YYYY/MM")
+
+        first = sorter.compute_destination_folder(datetime(2024, 3, 1))
+        second = sorter.compute_destination_folder(datetime(2024, 3, 31, 23))
+        other = sorter.compute_destination_folder(datetime(2024, 4, 1))
+
+        assert first is second
+        assert other == temp_dir / "2024" / "04"
+
+    def test_unknown_structure_uses_default_folder(self, temp_dir: Path):
+        sorter = Sorter(destination_root=temp_dir, folder_structure="MM/YYYY")
+
+        result = sorter.compute_destination_folder(datetime(2024, 3, 15))
+
+        assert result == temp_dir / "2024" / "03"
+
+
+class TestComputeDestinationsBatch:
+    """Tests for compute_destinations_batch method."""
+
+    def test_matches_single_computation(self, temp_dir: Path):
+        sorter = Sorter(destination_root=temp_dir, folder_structure="YYYY/MM/DD")
+        dates = [datetime(2024, 3, 15), datetime(2023, 1, 5), datetime(2024, 3, 15, 18)]
+
+        result = sorter.compute_destinations_batch(dates)
+
+        assert result == [sorter.compute_destination_folder(d) for d in dates]
+
+    def test_repeated_dates_share_path(self, temp_dir: Path):
+        sorter = Sorter(destination_root=temp_dir)
+
+        first, second = sorter.compute_destinations_batch(
+            [datetime(2024, 3, 15, 9), datetime(2024, 3, 15, 21)]
+        )
+
+        assert first is second
+
+    def test_empty(self, temp_dir: Path):
+        assert Sorter(destination_root=temp_dir).compute_destinations_batch([]) == []
+
 
 class TestComputeFullDestination:
     """Tests for compute_full_destination method."""
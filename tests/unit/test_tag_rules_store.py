@@ -278,6 +278,26 @@ class TestTagRulesStoreShouldUse:
         config = FolderTagsConfig()
         
         assert store.should_use("unknown_folder", config) is None
+    
+    def test_rule_changes_after_lookup_take_effect(self, tmp_path):
+        """Compiled rule sets follow add_use/add_ignore/clear."""
+        store = TagRulesStore(rules_path=tmp_path / "rules.yaml")
+        config = FolderTagsConfig()
+        assert store.should_use("Paris 2022", config) is None
+        
+        store.add_use("Paris 2022")
+        assert store.should_use("Paris 2022", config) is True
+        store.add_ignore("Paris 2022")
+        assert store.should_use("Paris 2022", config) is False
+        store.clear("Paris 2022")
+        assert store.should_use("Paris 2022", config) is None
+    
+    def test_each_config_uses_its_own_lists(self, tmp_path):
+        """Switching config objects does not reuse the previous lists."""
+        store = TagRulesStore(rules_path=tmp_path / "rules.yaml")
+        
+        assert store.should_use("tosort", FolderTagsConfig(force_list=["tosort"])) is True
+        assert store.should_use("tosort", FolderTagsConfig(ignore_list=["tosort"])) is False
 
 
 class TestTagRulesStoreAliases:
@@ -1,5 +1,6 @@
 """Tests for the verification module."""
 
+import io
 import json
 from datetime import datetime
 from pathlib import Path
@@ -61,6 +62,8 @@ class TestVerifyEntry:
         assert entry.status == VerificationStatus.MISMATCH
         assert entry.source_hash == "abc"
         assert entry.destination_hash == "def"
+        # Reports written before sizes were recorded still load
+        assert entry.source_size is None
     
     def test_is_cleanup_eligible_ok_sha256(self):
         """Test that OK with sha256 is cleanup eligible."""
@@ -241,6 +244,59 @@ class TestVerificationReport:
         assert len(ok_entries) == 2
 
 
+    def test_spooled_entries_are_counted_and_read_back(self, sample_report):
+        """Spooled entries stay out of memory but are still reported."""
+        spool = io.BytesIO()
+        sample_report.spool_entries(spool)
+        for status in (VerificationStatus.OK, VerificationStatus.MISMATCH):
+            sample_report.add_entry(VerifyEntry(
+                source_path=f"/source/{status.value}.jpg",
+                expected_destination_path="/dest/file.jpg",
+                actual_destination_path="/dest/file.jpg",
+                status=status,
+            ))
+        
+        assert sample_report.entries == []
+        assert len(spool.getvalue().splitlines()) == 2
+        assert sample_report.summary.total == 2
+        assert sample_report.summary.mismatch == 1
+        assert [e.status for e in sample_report.iter_entries()] == [
+            VerificationStatus.OK,
+            VerificationStatus.MISMATCH,
+        ]
+        assert [e.source_path for e in sample_report.cleanup_eligible_entries] == ["/source/ok.jpg"]
+        
+        # Reading back leaves the spool ready for more entries
+        sample_report.add_entry(VerifyEntry(
+            source_path="/source/late.jpg",
+            expected_destination_path=None,
+            actual_destination_path=None,
+            status=VerificationStatus.MISSING_DESTINATION,
+        ))
+        restored = VerificationReport.from_json(sample_report.to_json())
+        assert [e.source_path for e in restored.entries][-1] == "/source/late.jpg"
+        assert len(restored.entries) == 3
+
+    def test_detached_spool_reads_entries_from_written_report(self, sample_report, tmp_path):
+        """After detach_spool the spool may close; entries come from the report file."""
+        def entry(name):
+            return VerifyEntry(f"/s/{name}.jpg", "/d/x.jpg", "/d/x.jpg", VerificationStatus.OK)
+        
+        sample_report.add_entry(entry("memory"))
+        with io.BytesIO() as spool:
+            sample_report.spool_entries(spool)
+            sample_report.add_entry(entry("spooled"))
+            report_path = tmp_path / "report.json"
+            report_path.write_text(sample_report.to_json())
+            sample_report.detach_spool(report_path)
+        sample_report.add_entry(entry("late"))
+        
+        assert [e.source_path for e in sample_report.iter_entries()] == [
+            "/s/memory.jpg", "/s/late.jpg", "/s/spooled.jpg",
+        ]
+        assert len(sample_report.ok_entries) == 3
+
+
 class TestVerificationIdGeneration:
     """Tests for verification ID and filename generation."""
     
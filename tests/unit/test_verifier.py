@@ -1,7 +1,15 @@
 """Tests for the verifier module."""
 
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -16,6 +24,7 @@ from chronoclean.core.verification import (
     MatchType,
     VerificationStatus,
 )
+from chronoclean.core.hashing import compute_file_hash
 from chronoclean.core.verifier import Verifier
 
 
@@ -45,6 +54,7 @@ class TestVerifier:
         assert entry.status == VerificationStatus.OK
         assert entry.source_hash == entry.destination_hash
         assert entry.source_hash is not None
+        assert entry.source_size == len(content)
     
     def test_verify_single_mismatched_files(self, verifier, tmp_path):
         """Test verification of mismatched files."""
@@ -103,11 +113,49 @@ class TestVerifier:
         assert entry.status == VerificationStatus.MISMATCH
         assert "Size mismatch" in (entry.error or "")
     
+    def test_size_mismatch_skips_hashing(self, verifier, tmp_path):
+        """A size difference is a mismatch before either file is hashed."""
+        source = tmp_path / "source.jpg"
+        dest = tmp_path / "dest.jpg"
+        source.write_bytes(b"Short")
+        dest.write_bytes(b"Much longer content here")
+        
+        with patch("chronoclean.core.verifier.compute_file_hash") as mock_hash:
+            entry = verifier.verify_single(source, dest)
+        
+        mock_hash.assert_not_called()
+        assert entry.status == VerificationStatus.MISMATCH
+        assert entry.hash_algorithm == "sha256"
+        assert "Size mismatch" in (entry.error or "")
+    
     def test_invalid_algorithm_raises(self):
         """Test that invalid algorithm raises ValueError."""
         with pytest.raises(ValueError, match="Unsupported algorithm"):
             Verifier(algorithm="invalid")
 
+    def test_blake3_without_package_raises(self):
+        """blake3 verification needs the blake3 package."""
+        with patch("chronoclean.core.verifier.is_blake3_available", return_value=False):
+            with pytest.raises(ValueError, match="pip install blake3"):
+                Verifier(algorithm="blake3")
+
+    def test_blake3_verification_is_cleanup_eligible(self, tmp_path):
+        """A blake3 match is a full content check, so cleanup may use it."""
+        source = tmp_path / "source.jpg"
+        dest = tmp_path / "dest.jpg"
+        source.write_bytes(b"content")
+        dest.write_bytes(b"content")
+        fake_blake3 = SimpleNamespace(blake3=hashlib.sha1)
+
+        with patch("chronoclean.core.verifier.is_blake3_available", return_value=True), \
+                patch.dict(sys.modules, {"blake3": fake_blake3}):
+            entry = Verifier(algorithm="blake3").verify_single(source, dest)
+
+        assert entry.status == VerificationStatus.OK
+        assert entry.hash_algorithm == "blake3"
+        assert entry.source_hash == hashlib.sha1(b"content").hexdigest()
+        assert entry.is_cleanup_eligible
+
 
 class TestVerifyFromRunRecord:
     """Tests for verify_from_run_record method."""
@@ -204,6 +252,154 @@ class TestVerifyFromRunRecord:
         assert progress_calls[0] == (1, 2)
         assert progress_calls[1] == (2, 2)
 
+    def test_verify_run_record_in_worker_processes(self, run_record_with_copies):
+        """Parallel verification gives the same entries in the same order."""
+        verifier = Verifier()
+
+        serial = verifier.verify_from_run_record(run_record_with_copies)
+        contexts = []
+        
+        def spy_executor(*args, **kwargs):
+            contexts.append(kwargs["mp_context"].get_start_method())
+            return ProcessPoolExecutor(*args, **kwargs)
+        
+        with patch("chronoclean.core.verifier.ProcessPoolExecutor", spy_executor):
+            parallel = verifier.verify_from_run_record(run_record_with_copies, jobs=2)
+        
+        assert contexts == ["spawn"]
+
+        assert [(e.source_path, e.status) for e in parallel.entries] == [
+            (e.source_path, e.status) for e in serial.entries
+        ]
+        assert parallel.summary.ok == 1
+        assert parallel.summary.mismatch == 1
+
+
+class TestVerifyPairs:
+    """Tests for verify_pairs method."""
+
+    def _pairs(self, tmp_path: Path, count: int) -> list[tuple[Path, Path]]:
+        pairs = []
+        for i in range(count):
+            source = tmp_path / f"src{i}.jpg"
+            dest = tmp_path / f"dst{i}.jpg"
+            source.write_bytes(f"content{i}".encode())
+            # Every third destination differs
+            dest.write_bytes(f"content{i}".encode() if i % 3 else b"other")
+            pairs.append((source, dest))
+        return pairs
+
+    @pytest.mark.parametrize("jobs", [1, 2, 0])
+    def test_entries_in_input_order(self, tmp_path, jobs):
+        pairs = self._pairs(tmp_path, 7)
+
+        entries = list(Verifier().verify_pairs(pairs, jobs=jobs))
+
+        assert [e.source_path for e in entries] == [str(s) for s, _ in pairs]
+        assert [e.status for e in entries] == [
+            VerificationStatus.MISMATCH if i % 3 == 0 else VerificationStatus.OK
+            for i in range(7)
+        ]
+
+    def test_quick_mode_overlaps_stats_in_input_order(self, tmp_path):
+        pairs = self._pairs(tmp_path, 40)
+        # Same sizes except where the destination was replaced by b"other"
+        for i, (_, dest) in enumerate(pairs):
+            if i % 3 == 0:
+                dest.write_bytes(b"different-size")
+        threads = set()
+        verifier = Verifier(algorithm="quick")
+        real_verify = verifier._verify_pair
+
+        def verify_pair(*task):
+            threads.add(threading.current_thread().name)
+            return real_verify(*task)
+
+        with patch.object(verifier, "_verify_pair", side_effect=verify_pair):
+            entries = list(verifier.verify_pairs(pairs))
+
+        assert [e.source_path for e in entries] == [str(s) for s, _ in pairs]
+        assert [e.status for e in entries] == [
+            VerificationStatus.MISMATCH if i % 3 == 0 else VerificationStatus.OK
+            for i in range(40)
+        ]
+        assert all(name.startswith("verify-stat") for name in threads)
+
+    def test_linked_and_repeated_files_hashed_once(self, tmp_path):
+        source = tmp_path / "photo.jpg"
+        source.write_bytes(b"content")
+        link = tmp_path / "photo_link.jpg"
+        os.link(source, link)
+        dest = tmp_path / "dest.jpg"
+        dest.write_bytes(b"content")
+        pairs = [(source, dest), (link, dest), (source, dest)]
+
+        with patch(
+            "chronoclean.core.verifier.compute_file_hash", wraps=compute_file_hash
+        ) as hashed:
+            entries = list(Verifier().verify_pairs(pairs))
+
+        assert [e.status for e in entries] == [VerificationStatus.OK] * 3
+        assert hashed.call_count == 2
+
+    def test_worker_copies_skip_hash_cache(self, tmp_path):
+        """Pickled (worker) verifiers carry no cache and hash every time."""
+        source = tmp_path / "photo.jpg"
+        source.write_bytes(b"content")
+        verifier = Verifier()
+        verifier._file_hash(source)
+        
+        worker = pickle.loads(pickle.dumps(verifier))
+        with patch(
+            "chronoclean.core.verifier.compute_file_hash", wraps=compute_file_hash
+        ) as hashed:
+            assert worker._file_hash(source) == verifier._file_hash(source)
+            assert worker._file_hash(source) == verifier._file_hash(source)
+        
+        assert worker._hash_cache is None
+        assert len(verifier._hash_cache) == 1
+        assert hashed.call_count == 2
+
+    def test_content_search_hashes_candidates_once(self, tmp_path):
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        dest.mkdir()
+        pairs = []
+        for i in range(3):
+            (source / f"photo{i}.jpg").write_bytes(f"content{i}".encode())
+            (dest / f"renamed{i}.jpg").write_bytes(f"content{i}".encode())
+            pairs.append((source / f"photo{i}.jpg", dest / f"photo{i}.jpg"))
+        verifier = Verifier(content_search_on_reconstruct=True)
+
+        with patch(
+            "chronoclean.core.verifier.compute_file_hash", wraps=compute_file_hash
+        ) as hashed:
+            entries = list(verifier.verify_pairs(pairs, search_root=dest))
+
+        assert [e.actual_destination_path for e in entries] == [
+            str(dest / f"renamed{i}.jpg") for i in range(3)
+        ]
+        # Three sources plus three candidates, each hashed once
+        assert hashed.call_count == 6
+
+    def test_content_search_in_worker_processes(self, tmp_path):
+        source = tmp_path / "source"
+        dest = tmp_path / "dest"
+        source.mkdir()
+        (dest / "elsewhere").mkdir(parents=True)
+        pairs = []
+        for i in range(3):
+            (source / f"photo{i}.jpg").write_bytes(f"content{i}".encode())
+            (dest / "elsewhere" / f"renamed{i}.jpg").write_bytes(f"content{i}".encode())
+            pairs.append((source / f"photo{i}.jpg", dest / f"photo{i}.jpg"))
+
+        verifier = Verifier(content_search_on_reconstruct=True)
+        entries = list(verifier.verify_pairs(pairs, search_root=dest, jobs=2))
+
+        assert [e.status for e in entries] == [VerificationStatus.OK_EXISTING_DUPLICATE] * 3
+        assert [e.match_type for e in entries] == [MatchType.CONTENT_SEARCH] * 3
+
 
 class TestVerifyWithContentSearch:
     """Tests for content search verification."""
@@ -237,6 +433,7 @@ class TestVerifyWithContentSearch:
         assert entry.status == VerificationStatus.OK_EXISTING_DUPLICATE
         assert entry.actual_destination_path == str(actual_dest)
         assert entry.match_type == MatchType.CONTENT_SEARCH
+        assert entry.source_size == len(content)
     
     def test_content_search_expected_path_exists_takes_priority(self, tmp_path):
         """Test that expected path takes priority over content search."""
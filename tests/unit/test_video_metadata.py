@@ -1,13 +1,16 @@
 """Unit tests for chronoclean.core.video_metadata module (v0.3)."""
 
+import subprocess
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from chronoclean.core import video_metadata
 from chronoclean.core.video_metadata import (
     VideoMetadataReader,
+    check_ffprobe,
     parse_video_date,
     VIDEO_DATE_FORMATS,
 )
@@ -255,3 +258,22 @@ class TestVideoDateFormats:
         for date_str in test_cases:
             result = parse_video_date(date_str)
             assert result is not None, f"Failed to parse: {date_str}"
+
+
+class TestCheckFfprobe:
+    """Tests for check_ffprobe."""
+
+    def test_missing_ffprobe(self):
+        """An unresolvable ffprobe yields neither path nor version."""
+        assert check_ffprobe("/nonexistent/ffprobe") == (None, None)
+
+    def test_version_read_from_resolved_path(self):
+        """The version comes from running the path that was resolved."""
+        completed = subprocess.CompletedProcess([], 0, stdout="ffprobe version 6.1\nmore\n")
+        with patch.object(video_metadata.shutil, "which", return_value="/opt/bin/ffprobe") as which:
+            with patch.object(video_metadata.subprocess, "run", return_value=completed) as run:
+                result = video_metadata.check_ffprobe("ffprobe")
+
+        assert result == ("/opt/bin/ffprobe", "ffprobe version 6.1")
+        which.assert_called_once_with("ffprobe")
+        assert run.call_args.args[0] == ["/opt/bin/ffprobe", "-version"]